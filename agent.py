@@ -15,6 +15,7 @@ from helpers import (
     tokens,
     context as context_helper,
     dirty_json,
+    dotenv,
     subagents,
 )
 from helpers import extension
@@ -27,7 +28,7 @@ from langchain_core.messages import SystemMessage, BaseMessage
 
 import helpers.log as Log
 from helpers.dirty_json import DirtyJson
-from helpers.defer import DeferredTask
+from helpers.defer import DeferredTask, EventLoopPool
 from typing import Callable
 from helpers.localization import Localization
 from helpers import extension
@@ -42,18 +43,81 @@ from helpers.llm_result import (
 from helpers.litellm_transport import ResponsesTransport
 from helpers.responses_tools import build_responses_function_tools, original_tool_name
 
+DEFAULT_CONTEXT_EVENT_LOOPS = 4
+
+
 class AgentContextType(Enum):
     USER = "user"
     TASK = "task"
     BACKGROUND = "background"
 
 
+_NO_VALUE = object()
+
+
+class _ContextData(dict):
+    """AgentContext.data that keeps the context index in sync with indexed keys."""
+
+    _context: "AgentContext | None" = None
+
+    def __setitem__(self, key, value):
+        context = self._context
+        if context is None or key not in AgentContext._data_indexes:
+            return super().__setitem__(key, value)
+        old = self.get(key, _NO_VALUE)
+        super().__setitem__(key, value)
+        context._update_data_index(key, old, value)
+
+    def __delitem__(self, key):
+        self._tracked(super().__delitem__, key)
+
+    def pop(self, key, *default):
+        return self._tracked(super().pop, key, *default)
+
+    def popitem(self):
+        return self._tracked(super().popitem)
+
+    def setdefault(self, key, default=None):
+        return self._tracked(super().setdefault, key, default)
+
+    def update(self, *args, **kwargs):
+        self._tracked(super().update, *args, **kwargs)
+
+    def clear(self):
+        self._tracked(super().clear)
+
+    def __ior__(self, other):
+        self._tracked(super().update, other)
+        return self
+
+    def __reduce__(self):
+        # copies and pickles are plain dicts, not bound to the context
+        return (dict, (dict(self),))
+
+    def _tracked(self, operation, *args, **kwargs):
+        context = self._context
+        if context is None:
+            return operation(*args, **kwargs)
+        before = {key: self.get(key, _NO_VALUE) for key in AgentContext._data_indexes}
+        result = operation(*args, **kwargs)
+        for key, old in before.items():
+            new = self.get(key, _NO_VALUE)
+            if new is not old:
+                context._update_data_index(key, old, new)
+        return result
+
+
 class AgentContext:
 
     _contexts: dict[str, "AgentContext"] = {}
     _contexts_lock = threading.RLock()
+    # secondary indexes over _contexts: ("name", name), ("type", type) and
+    # ("data", key, value) for keys registered with register_data_index()
+    _index: dict[tuple, dict[str, "AgentContext"]] = {}
+    _data_indexes: dict[str, Callable[[Any], Any] | None] = {"project": None}
     _counter: int = 0
     _notification_manager = None
+    _loop_pool: EventLoopPool | None = None
 
     @extension.extensible
     def __init__(
@@ -71,14 +135,22 @@ class AgentContext:
         data: dict | None = None,
         output_data: dict | None = None,
         set_current: bool = False,
+        hydrator: Callable[["AgentContext"], None] | None = None,
     ):
         # initialize context
         self.id = id or AgentContext.generate_id()
+        self._indexed = False
+        # a context with a hydrator gets its agents and log on first access
+        # (see hydrate()); until then log is a placeholder without items
+        self._hydrator = hydrator
+        self._hydrating = False
+        self._hydrate_lock = threading.RLock()
         existing = None
         with AgentContext._contexts_lock:
             existing = AgentContext._contexts.get(self.id, None)
             if existing:
                 AgentContext._contexts.pop(self.id, None)
+                existing._remove_from_index()
             AgentContext._contexts[self.id] = self
         if existing and existing.task:
             existing.task.kill()
@@ -90,19 +162,25 @@ class AgentContext:
         self.config = config
         self.data = data or {}
         self.output_data = output_data or {}
-        self.log = log or Log.Log()
-        self.log.context = self
+        self._log = log or Log.Log()
+        self._log.context = self
         self.paused = paused
-        self.streaming_agent = streaming_agent
+        self._streaming_agent = streaming_agent
         self.task: DeferredTask | None = None
         self.created_at = created_at or Localization.get().now()
         self.type = type
         AgentContext._counter += 1
         self.no = AgentContext._counter
         self.last_message = last_message or Localization.get().now()
+        with AgentContext._contexts_lock:
+            if AgentContext._contexts.get(self.id) is self:
+                self._add_to_index()
 
         # initialize agent at last (context is complete now)
-        self.agent0 = agent0 or Agent(0, self.config, self)
+        if hydrator and not agent0:
+            self._agent0 = None
+        else:
+            self._agent0 = agent0 or Agent(0, self.config, self)
 
     @staticmethod
     def get(id: str):
@@ -141,6 +219,240 @@ class AgentContext:
         with AgentContext._contexts_lock:
             return list(AgentContext._contexts.values())
 
+    @staticmethod
+    def find(
+        name: str | None = None,
+        type: "AgentContextType | None" = None,
+        data: dict[str, Any] | None = None,
+    ) -> list["AgentContext"]:
+        """Contexts matching all given criteria, oldest (by created_at) first.
+
+        Name, type and data keys registered with register_data_index() are
+        looked up in the index; other data keys are checked on the candidates.
+        """
+        keys: list[tuple] = []
+        if name is not None:
+            keys.append(("name", name))
+        if type is not None:
+            keys.append(("type", type))
+        checks: dict[str, Any] = {}
+        for key, value in (data or {}).items():
+            normalize = AgentContext._data_indexes.get(key, _NO_VALUE)
+            indexed_value = AgentContext._index_value(normalize, value)
+            if indexed_value is _NO_VALUE:
+                checks[key] = value
+            else:
+                keys.append(("data", key, indexed_value))
+
+        with AgentContext._contexts_lock:
+            if keys:
+                buckets = [AgentContext._index.get(key, {}) for key in keys]
+                buckets.sort(key=len)
+                candidates = [
+                    ctx for ctx_id, ctx in buckets[0].items()
+                    if all(ctx_id in bucket for bucket in buckets[1:])
+                ]
+            else:
+                candidates = list(AgentContext._contexts.values())
+        if checks:
+            candidates = [
+                ctx for ctx in candidates
+                if all(ctx.data.get(key, _NO_VALUE) == value for key, value in checks.items())
+            ]
+        # index buckets are in (re)indexing order, not creation order
+        candidates.sort(key=lambda ctx: ctx.created_at.timestamp())
+        return candidates
+
+    @staticmethod
+    def find_first(
+        name: str | None = None,
+        type: "AgentContextType | None" = None,
+        data: dict[str, Any] | None = None,
+    ) -> "AgentContext | None":
+        found = AgentContext.find(name=name, type=type, data=data)
+        return found[0] if found else None
+
+    @staticmethod
+    def register_data_index(key: str, normalize: Callable[[Any], Any] | None = None):
+        """Index contexts by the value of data[key] (after normalize) for find()."""
+        with AgentContext._contexts_lock:
+            if key in AgentContext._data_indexes and AgentContext._data_indexes[key] is normalize:
+                return
+            AgentContext._data_indexes[key] = normalize
+            for index_key in [k for k in AgentContext._index if k[0] == "data" and k[1] == key]:
+                AgentContext._index.pop(index_key, None)
+            for ctx in AgentContext._contexts.values():
+                if ctx._indexed:
+                    ctx._update_data_index(key, _NO_VALUE, ctx.data.get(key, _NO_VALUE))
+
+    @staticmethod
+    def _index_value(normalize, value):
+        if normalize is _NO_VALUE or value is _NO_VALUE:
+            return _NO_VALUE  # not an indexed key / no value
+        try:
+            value = normalize(value) if normalize else value
+            hash(value)
+        except Exception:
+            return _NO_VALUE
+        return value
+
+    def _index_keys(self) -> list[tuple]:
+        keys: list[tuple] = [("name", self._name), ("type", self._type)]
+        for key, normalize in AgentContext._data_indexes.items():
+            value = AgentContext._index_value(normalize, self._data.get(key, _NO_VALUE))
+            if value is not _NO_VALUE:
+                keys.append(("data", key, value))
+        return keys
+
+    def _add_to_index(self):
+        # callers hold _contexts_lock
+        for key in self._index_keys():
+            AgentContext._index.setdefault(key, {})[self.id] = self
+        self._indexed = True
+
+    def _remove_from_index(self):
+        # callers hold _contexts_lock
+        if not self._indexed:
+            return
+        for key in self._index_keys():
+            AgentContext._unindex(key, self.id)
+        self._indexed = False
+
+    @staticmethod
+    def _unindex(key: tuple, ctx_id: str):
+        bucket = AgentContext._index.get(key)
+        if bucket is not None:
+            bucket.pop(ctx_id, None)
+            if not bucket:
+                AgentContext._index.pop(key, None)
+
+    def _reindex(self, old_key: tuple, new_key: tuple):
+        if not getattr(self, "_indexed", False) or old_key == new_key:
+            return
+        with AgentContext._contexts_lock:
+            AgentContext._unindex(old_key, self.id)
+            AgentContext._index.setdefault(new_key, {})[self.id] = self
+
+    def _update_data_index(self, key: str, old: Any, new: Any):
+        if not getattr(self, "_indexed", False):
+            return
+        normalize = AgentContext._data_indexes.get(key, _NO_VALUE)
+        old = AgentContext._index_value(normalize, old)
+        new = AgentContext._index_value(normalize, new)
+        if old == new and old is not _NO_VALUE:
+            return
+        with AgentContext._contexts_lock:
+            if old is not _NO_VALUE:
+                AgentContext._unindex(("data", key, old), self.id)
+            if new is not _NO_VALUE:
+                AgentContext._index.setdefault(("data", key, new), {})[self.id] = self
+
+    @property
+    def name(self) -> str | None:
+        return self._name
+
+    @name.setter
+    def name(self, value: str | None):
+        old = getattr(self, "_name", None)
+        self._name = value
+        self._reindex(("name", old), ("name", value))
+
+    @property
+    def type(self) -> "AgentContextType":
+        return self._type
+
+    @type.setter
+    def type(self, value: "AgentContextType"):
+        old = getattr(self, "_type", None)
+        self._type = value
+        self._reindex(("type", old), ("type", value))
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    @data.setter
+    def data(self, value: dict):
+        old = getattr(self, "_data", None)
+        if old is not None:
+            old._context = None
+        data = _ContextData(value)
+        data._context = self
+        self._data = data
+        if getattr(self, "_indexed", False):
+            for key in AgentContext._data_indexes:
+                self._update_data_index(
+                    key,
+                    old.get(key, _NO_VALUE) if old is not None else _NO_VALUE,
+                    data.get(key, _NO_VALUE),
+                )
+
+    @property
+    def hydrated(self) -> bool:
+        return self._hydrator is None
+
+    def hydrate(self):
+        """Run the pending hydrator once; other threads wait until it finished.
+
+        A hydrator that fails is not retried: the error is logged and the context
+        is removed with an empty agent and log, like a chat that failed to load.
+        """
+        if self._hydrator is None:
+            return
+        with self._hydrate_lock:
+            hydrator = self._hydrator
+            if hydrator is None or self._hydrating:
+                return  # done meanwhile, or accessed by the hydrator itself
+            self._hydrating = True
+            try:
+                hydrator(self)
+            except Exception as e:
+                PrintStyle.error(f"Error loading chat {self.id}: {errors.format_error(e)}")
+                self._log = Log.Log()
+                self._log.context = self
+                self._agent0 = Agent(0, self.config, self)
+                self._streaming_agent = None
+                AgentContext.remove(self.id)
+            finally:
+                self._hydrator = None
+                self._hydrating = False
+
+    @property
+    def log(self) -> Log.Log:
+        if self._hydrator is not None:
+            self.hydrate()
+        return self._log
+
+    @log.setter
+    def log(self, value: Log.Log):
+        if self._hydrator is not None:
+            self.hydrate()
+        self._log = value
+
+    @property
+    def agent0(self) -> "Agent":
+        if self._hydrator is not None:
+            self.hydrate()
+        return self._agent0  # type: ignore[return-value]
+
+    @agent0.setter
+    def agent0(self, value: "Agent"):
+        if self._hydrator is not None:
+            self.hydrate()
+        self._agent0 = value
+
+    @property
+    def streaming_agent(self) -> "Agent | None":
+        if self._hydrator is not None:
+            self.hydrate()
+        return self._streaming_agent
+
+    @streaming_agent.setter
+    def streaming_agent(self, value: "Agent | None"):
+        if self._hydrator is not None:
+            self.hydrate()
+        self._streaming_agent = value
+
     @staticmethod
     def generate_id():
         def generate_short_id():
@@ -160,13 +472,28 @@ class AgentContext:
             cls._notification_manager = NotificationManager()
         return cls._notification_manager
 
+    @classmethod
+    def get_loop_pool(cls) -> EventLoopPool:
+        # chats are spread over A0_CONTEXT_EVENT_LOOPS event loops so one blocked chat does not stall the others
+        if AgentContext._loop_pool is None:
+            size = DEFAULT_CONTEXT_EVENT_LOOPS
+            try:
+                size = int(dotenv.get_dotenv_value("A0_CONTEXT_EVENT_LOOPS", size))
+            except (TypeError, ValueError):
+                pass
+            AgentContext._loop_pool = EventLoopPool(AgentContext.__name__, size=size)
+        return AgentContext._loop_pool
+
     @staticmethod
     @extension.extensible
     def remove(id: str):
         with AgentContext._contexts_lock:
             context = AgentContext._contexts.pop(id, None)
+            if context:
+                context._remove_from_index()
         if context and context.task:
             context.task.kill()
+        AgentContext.get_loop_pool().release(id)
         return context
 
     def get_data(self, key: str, recursive: bool = True):
@@ -196,9 +523,10 @@ class AgentContext:
                 else Localization.get().serialize_datetime(datetime.fromtimestamp(0))
             ),
             "no": self.no,
-            "log_guid": self.log.guid,
-            "log_version": len(self.log.updates),
-            "log_length": len(self.log.logs),
+            # the log property would hydrate the chat; before that the placeholder is reported
+            "log_guid": self._log.guid,
+            "log_version": len(self._log.updates),
+            "log_length": len(self._log.logs),
             "paused": self.paused,
             "last_message": (
                 Localization.get().serialize_datetime(self.last_message)
@@ -222,6 +550,8 @@ class AgentContext:
     ) -> list[Log.LogItem]:
         items: list[Log.LogItem] = []
         for context in AgentContext.all():
+            if not context.hydrated:
+                continue  # saved chats nobody opened yet keep their stored log
             items.append(
                 context.log.log(
                     type, heading, content, kvps, update_progress, id, **kwargs
@@ -237,6 +567,8 @@ class AgentContext:
     @extension.extensible
     def reset(self):
         self.kill_process()
+        with self._hydrate_lock:
+            self._hydrator = None  # the saved agents and log would be discarded anyway
         self.log.reset()
         self.agent0 = Agent(0, self.config, self)
         self.streaming_agent = None
@@ -282,7 +614,7 @@ class AgentContext:
     ):
         if not self.task:
             self.task = DeferredTask(
-                thread_name=self.__class__.__name__,
+                thread_name=self.get_loop_pool().assign(self.id),
             )
         self.task.start_task(func, *args, **kwargs)
         return self.task
@@ -427,10 +759,10 @@ class Agent:
                                 printer.print("Reasoning: ")  # start of reasoning
                             # Pass chunk and full data to extensions for processing
                             stream_data = {"chunk": chunk, "full": full}
-                            await extension.call_extensions_async(
+                            await extension.call_stream_extensions(
                                 "reasoning_stream_chunk",
                                 self,
-                                loop_data=self.loop_data,
+                                self.loop_data,
                                 stream_data=stream_data,
                             )
                             # Stream masked chunk after extensions processed it
@@ -445,6 +777,10 @@ class Agent:
                             # output the agent response stream
                             if chunk == full:
                                 printer.print("Response: ")  # start of response
+                                # reasoning is over, deliver what its windowed extensions still hold
+                                await extension.flush_stream_extensions(
+                                    self, self.loop_data, "reasoning_stream_chunk", "reasoning_stream"
+                                )
                             # Pass chunk and full data to extensions for processing
                             stream_data = {"chunk": chunk, "full": full}
                             tool_request = extract_tools.extract_tool_request(full)
@@ -457,10 +793,10 @@ class Agent:
                                     await self.handle_response_stream(full)
                                     return full.strip()
 
-                            await extension.call_extensions_async(
+                            await extension.call_stream_extensions(
                                 "response_stream_chunk",
                                 self,
-                                loop_data=self.loop_data,
+                                self.loop_data,
                                 stream_data=stream_data,
                             )
                             # Stream masked chunk after extensions processed it
@@ -479,12 +815,18 @@ class Agent:
                         agent_response = llm_result.response
                         await self.handle_intervention(agent_response)
 
-                        # Notify extensions to finalize their stream filters
+                        # Deliver pending windowed stream chunks, then let extensions finalize their stream filters
+                        await extension.flush_stream_extensions(
+                            self, self.loop_data, "reasoning_stream_chunk", "reasoning_stream"
+                        )
                         await extension.call_extensions_async(
                             "reasoning_stream_end", self, loop_data=self.loop_data
                         )
                         await self.handle_intervention(agent_response)
 
+                        await extension.flush_stream_extensions(
+                            self, self.loop_data, "response_stream_chunk", "response_stream"
+                        )
                         await extension.call_extensions_async(
                             "response_stream_end", self, loop_data=self.loop_data
                         )
@@ -1515,10 +1857,10 @@ class Agent:
 
     async def handle_reasoning_stream(self, stream: str):
         await self.handle_intervention()
-        await extension.call_extensions_async(
+        await extension.call_stream_extensions(
             "reasoning_stream",
             self,
-            loop_data=self.loop_data,
+            self.loop_data,
             text=stream,
         )
 
@@ -1529,10 +1871,10 @@ class Agent:
                 return  # no reason to try
             response = DirtyJson.parse_string(stream)
             if isinstance(response, dict):
-                await extension.call_extensions_async(
+                await extension.call_stream_extensions(
                     "response_stream",
                     self,
-                    loop_data=self.loop_data,
+                    self.loop_data,
                     text=stream,
                     parsed=response,
                 )
@@ -0,0 +1,29 @@
+from helpers.api import ApiHandler, Request, Response
+from helpers import cache
+
+
+class CacheStats(ApiHandler):
+    @classmethod
+    def requires_auth(cls) -> bool:
+        return False
+
+    @classmethod
+    def requires_csrf(cls) -> bool:
+        return False
+
+    @classmethod
+    def requires_api_key(cls) -> bool:
+        return False
+
+    @classmethod
+    def requires_loopback(cls) -> bool:
+        return True
+
+    @classmethod
+    def get_methods(cls) -> list[str]:
+        return ["GET", "POST"]
+
+    async def process(self, input: dict, request: Request) -> dict | Response:
+        # GET passes the area as a query parameter, POST in the JSON body
+        area = request.args.get("area") or input.get("area") or "*"
+        return {"ok": True, "areas": cache.get_stats(area)}
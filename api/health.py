@@ -11,6 +11,10 @@ class HealthCheck(ApiHandler):
     def requires_csrf(cls) -> bool:
         return False
 
+    @classmethod
+    def requires_initialization(cls) -> bool:
+        return False
+
     @classmethod
     def get_methods(cls) -> list[str]:
         return ["GET", "POST"]
@@ -0,0 +1,27 @@
+from helpers.api import ApiHandler, Request, Response
+
+from helpers import loop_monitor
+from helpers.performance import coerce_non_negative_int
+
+DEFAULT_LIMIT = 50
+
+
+class GetLoopMonitor(ApiHandler):
+    async def process(self, input: dict, request: Request) -> dict | Response:
+        limit = min(
+            coerce_non_negative_int(input.get("limit"), default=DEFAULT_LIMIT),
+            loop_monitor.MAX_STALLS,
+        )
+        loop = input.get("loop") or None
+
+        report = loop_monitor.get_report(limit=limit, loop=loop)
+
+        # only POST clears, so a reload or prefetch of the GET URL keeps the history
+        if input.get("clear") and request.method == "POST":
+            loop_monitor.clear_stalls()
+
+        return report
+
+    @classmethod
+    def get_methods(cls) -> list[str]:
+        return ["GET", "POST"]
@@ -6,6 +6,12 @@ class RegisterWatchDogs(Extension):
     def execute(self, **kwargs):
         from helpers.plugins import register_watchdogs as register_plugins_watchdogs
         from helpers.api import register_watchdogs as register_api_watchdogs
+        from helpers.projects import register_watchdogs as register_projects_watchdogs
+        from helpers.system_prompt_cache import (
+            register_watchdogs as register_system_prompt_watchdogs,
+        )
 
         register_plugins_watchdogs()
-        register_api_watchdogs()
\ No newline at end of file
+        register_api_watchdogs()
+        register_projects_watchdogs()
+        register_system_prompt_watchdogs()
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import Any
 
 from helpers.extension import Extension, extensible
+from helpers import projects, system_prompt_cache
 from agent import Agent, LoopData
 
 
@@ -20,4 +21,15 @@ class MainPrompt(Extension):
 
 @extensible
 async def build_prompt(agent: Agent) -> str:
-    return agent.read_prompt("agent.system.main.md")
+    async def build() -> str:
+        return agent.read_prompt("agent.system.main.md")
+
+    return await system_prompt_cache.cached_section(
+        agent,
+        "main",
+        [
+            system_prompt_cache.settings_fingerprint(),
+            projects.get_context_project_name(agent.context),
+        ],
+        build,
+    )
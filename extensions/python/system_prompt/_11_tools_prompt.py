@@ -2,7 +2,7 @@ import os
 from typing import Any
 
 from helpers.extension import Extension, extensible
-from helpers import files, subagents
+from helpers import files, projects, subagents, system_prompt_cache
 from helpers.print_style import PrintStyle
 from agent import Agent, LoopData
 
@@ -26,15 +26,34 @@ class ToolsPrompt(Extension):
 
 @extensible
 async def build_prompt(agent: Agent) -> str:
+    from plugins._model_config.helpers.model_config import get_chat_model_config
+
+    # per-file kwargs registered by plugin config extensions (e.g. _09_text_editor_config)
+    all_tool_kwargs: dict[str, dict[str, Any]] = agent.get_data(TOOL_KWARGS_KEY) or {}
+    vision = bool(get_chat_model_config(agent).get("vision", False))
+
+    return await system_prompt_cache.cached_section(
+        agent,
+        "tools",
+        [
+            system_prompt_cache.settings_fingerprint(),
+            projects.get_context_project_name(agent.context),
+            all_tool_kwargs,
+            vision,
+        ],
+        lambda: _build_tools_prompt(agent, all_tool_kwargs, vision),
+    )
+
+
+async def _build_tools_prompt(
+    agent: Agent, all_tool_kwargs: dict[str, dict[str, Any]], vision: bool
+) -> str:
     # collect tool files from all prompt directories
     prompt_dirs = subagents.get_paths(agent, "prompts")
     tool_files = files.get_unique_filenames_in_dirs(
         prompt_dirs, "agent.system.tool.*.md"
     )
 
-    # per-file kwargs registered by plugin config extensions (e.g. _09_text_editor_config)
-    all_tool_kwargs: dict[str, dict[str, Any]] = agent.get_data(TOOL_KWARGS_KEY) or {}
-
     tools: list[str] = []
     for tool_file in tool_files:
         try:
@@ -49,10 +68,7 @@ async def build_prompt(agent: Agent) -> str:
     prompt = agent.read_prompt("agent.system.tools.md", tools=tools_str)
 
     # vision support
-    from plugins._model_config.helpers.model_config import get_chat_model_config
-
-    chat_cfg = get_chat_model_config(agent)
-    if chat_cfg.get("vision", False):
+    if vision:
         prompt += "\n\n" + agent.read_prompt("agent.system.tools_vision.md")
 
     return prompt
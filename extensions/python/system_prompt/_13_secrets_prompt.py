@@ -1,6 +1,7 @@
 from typing import Any
 
 from helpers.extension import Extension, extensible
+from helpers import system_prompt_cache
 from agent import Agent, LoopData
 
 
@@ -23,13 +24,19 @@ class SecretsPrompt(Extension):
 async def build_prompt(agent: Agent) -> str:
     try:
         from helpers.secrets import get_secrets_manager
-        from helpers.settings import get_settings
+        from helpers.settings import get_stored_settings
 
         secrets_manager = get_secrets_manager(agent.context)
         secrets = secrets_manager.get_secrets_for_prompt()
-        variables = get_settings()["variables"]
-        return agent.read_prompt(
-            "agent.system.secrets.md", secrets=secrets, vars=variables
+        variables = get_stored_settings().get("variables", "")
+
+        async def build() -> str:
+            return agent.read_prompt(
+                "agent.system.secrets.md", secrets=secrets, vars=variables
+            )
+
+        return await system_prompt_cache.cached_section(
+            agent, "secrets", [secrets, variables], build
         )
     except Exception:
         return ""
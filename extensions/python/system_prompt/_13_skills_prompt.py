@@ -1,7 +1,7 @@
 from typing import Any
 
 from helpers.extension import Extension, extensible
-from helpers import skills as skills_helper
+from helpers import skills as skills_helper, system_prompt_cache
 from agent import Agent, LoopData
 
 
@@ -22,6 +22,21 @@ class SkillsPrompt(Extension):
 
 @extensible
 async def build_prompt(agent: Agent) -> str:
+    # skills are discovered by walking their roots; adding or removing one changes
+    # a root's mtime, in-place edits are caught by the system prompt watchdog
+    roots = skills_helper.get_skill_roots(agent)
+    return await system_prompt_cache.cached_section(
+        agent,
+        "skills",
+        [
+            system_prompt_cache.dirs_state(roots),
+            skills_helper.get_hidden_skills(agent),
+        ],
+        lambda: _build_skills_prompt(agent),
+    )
+
+
+async def _build_skills_prompt(agent: Agent) -> str:
     available = skills_helper.list_skills(agent=agent)
     result: list[str] = []
     for skill in available:
@@ -1,7 +1,7 @@
 from typing import Any
 
 from helpers.extension import Extension, extensible
-from helpers import projects
+from helpers import projects, system_prompt_cache
 from agent import Agent, LoopData
 
 
@@ -22,27 +22,39 @@ class ProjectPrompt(Extension):
 
 @extensible
 async def build_prompt(agent: Agent, loop_data: LoopData | None = None) -> str:
-    result = agent.read_prompt("agent.system.projects.main.md")
     project_name = agent.context.get_data(projects.CONTEXT_DATA_KEY_PROJECT)
     if loop_data:
         loop_data.protocol_persistent.pop("agents_md_instructions", None)
         loop_data.protocol_persistent.pop("project_instructions", None)
+
+    project_vars: dict[str, Any] = {}
+    agents_md_protocol = ""
     if project_name:
         project_vars = projects.build_system_prompt_vars(project_name)
         if loop_data and project_vars.get("include_agents_md", True):
             agents_md_protocol = projects.build_agents_md_protocol(project_name)
-            if agents_md_protocol:
-                loop_data.protocol_persistent["agents_md_instructions"] = (
-                    agents_md_protocol
-                )
-        if loop_data and project_vars.get("project_instructions"):
-            loop_data.protocol_persistent["project_instructions"] = agent.read_prompt(
+
+    async def build() -> tuple[str, str]:
+        instructions = ""
+        if project_vars.get("project_instructions"):
+            instructions = agent.read_prompt(
                 "agent.protocol.projects.instructions.md",
                 **project_vars,
             )
-        result += "\n\n" + agent.read_prompt(
-            "agent.system.projects.active.md", **project_vars
-        )
-    else:
-        result += "\n\n" + agent.read_prompt("agent.system.projects.inactive.md")
+        result = agent.read_prompt("agent.system.projects.main.md")
+        if project_name:
+            result += "\n\n" + agent.read_prompt(
+                "agent.system.projects.active.md", **project_vars
+            )
+        else:
+            result += "\n\n" + agent.read_prompt("agent.system.projects.inactive.md")
+        return result, instructions
+
+    result, instructions = await system_prompt_cache.cached_section(
+        agent, "project", [project_name, project_vars], build
+    )
+    if loop_data and agents_md_protocol:
+        loop_data.protocol_persistent["agents_md_instructions"] = agents_md_protocol
+    if loop_data and instructions:
+        loop_data.protocol_persistent["project_instructions"] = instructions
     return result
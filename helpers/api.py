@@ -20,6 +20,7 @@ from werkzeug.wrappers.response import Response as BaseResponse
 from helpers.print_style import PrintStyle
 from helpers.errors import format_error
 from helpers import files, cache
+from helpers.server_startup import initialization
 
 ThreadLockType = Union[threading.Lock, threading.RLock]
 
@@ -55,6 +56,11 @@ class ApiHandler:
     def requires_csrf(cls) -> bool:
         return cls.requires_auth()
 
+    @classmethod
+    def requires_initialization(cls) -> bool:
+        """Whether requests wait until startup has loaded saved chats."""
+        return True
+
     @abstractmethod
     async def process(self, input: Input, request: Request) -> Output:
         pass
@@ -248,6 +254,8 @@ def register_api_route(app: Flask, lock: ThreadLockType) -> None:
 
         # Build handler call, wrapping with security decorators as required
         async def call_handler() -> BaseResponse:
+            if handler_cls.requires_initialization():
+                await initialization.wait()
             instance = handler_cls(app, lock)
             return await instance.handle_request(request=request)
 
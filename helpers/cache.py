@@ -1,20 +1,53 @@
 import fnmatch
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
+# guards the area registry (creating and dropping areas); reads do not take it
 _lock = threading.RLock()
-_cache: dict[str, dict[str, "CacheEntry"]] = {}
+_cache: dict[str, "_Area"] = {}
 
 _enabled_global: bool = True
 _enabled_areas: dict[str, bool] = {}
 
+# exact area names or glob patterns, matched when an area is created
+_policies: dict[str, "AreaPolicy"] = {}
+# statistics survive clear(), so areas dropped by watchdogs stay observable
+_stats: dict[str, "AreaStats"] = {}
+
 
 @dataclass(slots=True)
 class CacheEntry:
     value: Any
-    timestamp: float
+    timestamp: float  # last access, used by trim_cache
+    created: float = 0.0  # used by the area ttl
+
+
+@dataclass(slots=True, frozen=True)
+class AreaPolicy:
+    max_entries: int | None = None  # least recently used entries are evicted beyond this
+    ttl: float | None = None  # seconds an entry lives after it was added
+
+
+@dataclass(slots=True)
+class AreaStats:
+    # plain counters: updated without a lock, so approximate under heavy contention
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass(slots=True)
+class _Area:
+    policy: "AreaPolicy"
+    stats: "AreaStats"
+    entries: dict[Any, CacheEntry] = field(default_factory=dict)
+    # serializes writers (and LRU reordering) of this area only
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    swept: float = 0.0  # last ttl sweep
 
 
 def toggle_global(enabled: bool) -> None:
@@ -26,43 +59,81 @@ def toggle_area(area: str, enabled: bool) -> None:
     _enabled_areas[area] = enabled
 
 
+def set_area_policy(area: str, max_entries: int | None = None, ttl: float | None = None) -> None:
+    """Bound an area (or every area matching a glob pattern) by size and/or age.
+
+    Applies to existing matching areas immediately and to areas created later.
+    """
+    policy = AreaPolicy(max_entries=max_entries, ttl=ttl)
+    with _lock:
+        _policies[area] = policy
+        for name in _get_matching_areas(area):
+            store = _cache.get(name)
+            if store is None:
+                continue
+            store.policy = policy
+            if max_entries is not None and not isinstance(store.entries, OrderedDict):
+                with store.lock:
+                    store.entries = OrderedDict(store.entries)
+            with store.lock:
+                store.swept = 0.0
+                _enforce_limits(store, time.time())
+
+
+def get_area_policy(area: str) -> AreaPolicy:
+    policy = _policies.get(area)
+    if policy is not None:
+        return policy
+    for pattern, policy in _policies.items():
+        if fnmatch.fnmatchcase(area, pattern):
+            return policy
+    return AreaPolicy()
+
+
 def has(area: str, key: Any) -> bool:
     if not _is_enabled(area):
         return False
-    with _lock:
-        entry = _cache.get(area, {}).get(key)
-        if entry is None:
-            return False
-        _touch_entry(entry)
-        return True
+    store = _cache.get(area)
+    if store is None:
+        return False
+    return _lookup(store, key) is not None
 
 
 def add(area: str, key: Any, data: Any) -> None:
     if not _is_enabled(area):
         return
-    with _lock:
-        if area not in _cache:
-            _cache[area] = {}
-        _cache[area][key] = _create_entry(data)
+    store = _cache.get(area) or _create_area(area)
+    entry = _create_entry(data)
+    with store.lock:
+        store.entries[key] = entry
+        if store.policy.max_entries is not None:
+            store.entries.move_to_end(key)  # type: ignore[attr-defined]
+        _enforce_limits(store, entry.created)
 
 
 def get(area: str, key: Any, default: Any = None) -> Any:
     if not _is_enabled(area):
         return default
-    with _lock:
-        entry = _cache.get(area, {}).get(key)
-        if entry is None:
-            return default
-        _touch_entry(entry)
-        return entry.value
+    store = _cache.get(area)
+    if store is None:
+        _get_stats(area).misses += 1
+        return default
+    entry = _lookup(store, key)
+    if entry is None:
+        store.stats.misses += 1
+        return default
+    store.stats.hits += 1
+    return entry.value
 
 
 def remove(area: str, key: Any) -> None:
     if not _is_enabled(area):
         return
-    with _lock:
-        if area in _cache:
-            _cache[area].pop(key, None)
+    store = _cache.get(area)
+    if store is None:
+        return
+    with store.lock:
+        store.entries.pop(key, None)
 
 
 def clear(area: str) -> None:
@@ -80,15 +151,17 @@ def trim_cache(area: str, seconds: float = 300) -> None:
     cutoff = time.time() - seconds
     with _lock:
         for area_key in _get_matching_areas(area):
-            area_cache = _cache.get(area_key)
-            if not area_cache:
+            store = _cache.get(area_key)
+            if not store or not store.entries:
                 continue
 
-            keys_to_remove = [key for key, entry in area_cache.items() if entry.timestamp < cutoff]
-            for key in keys_to_remove:
-                area_cache.pop(key, None)
+            with store.lock:
+                keys_to_remove = [key for key, entry in store.entries.items() if entry.timestamp < cutoff]
+                for key in keys_to_remove:
+                    store.entries.pop(key, None)
+                store.stats.evictions += len(keys_to_remove)
 
-            if not area_cache:
+            if not store.entries:
                 _cache.pop(area_key, None)
 
 
@@ -97,6 +170,46 @@ def clear_all() -> None:
         _cache.clear()
 
 
+def get_stats(area: str = "*") -> dict[str, dict[str, Any]]:
+    """Per-area hit/miss/eviction/expiration counters, current size and policy.
+
+    ``area`` may be a glob pattern; areas that were cleared keep their counters
+    and report size 0.
+    """
+    with _lock:
+        if any(ch in area for ch in "*?["):
+            names = [name for name in _stats if fnmatch.fnmatch(name, area)]
+        else:
+            names = [area] if area in _stats else []
+
+        result: dict[str, dict[str, Any]] = {}
+        for name in sorted(names):
+            stats = _stats[name]
+            store = _cache.get(name)
+            policy = store.policy if store else get_area_policy(name)
+            lookups = stats.hits + stats.misses
+            result[name] = {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "hit_rate": stats.hits / lookups if lookups else 0.0,
+                "evictions": stats.evictions,
+                "expirations": stats.expirations,
+                "size": len(store.entries) if store else 0,
+                "max_entries": policy.max_entries,
+                "ttl": policy.ttl,
+            }
+        return result
+
+
+def reset_stats(area: str = "*") -> None:
+    with _lock:
+        for name in list(_stats):
+            if fnmatch.fnmatch(name, area):
+                _stats[name] = AreaStats()
+                if store := _cache.get(name):
+                    store.stats = _stats[name]
+
+
 def _is_enabled(area: str) -> bool:
     if not _enabled_global:
         return False
@@ -104,11 +217,73 @@ def _is_enabled(area: str) -> bool:
 
 
 def _create_entry(value: Any) -> CacheEntry:
-    return CacheEntry(value=value, timestamp=time.time())
+    now = time.time()
+    return CacheEntry(value=value, timestamp=now, created=now)
 
 
-def _touch_entry(entry: CacheEntry) -> None:
-    entry.timestamp = time.time()
+def _create_area(area: str) -> _Area:
+    with _lock:
+        store = _cache.get(area)
+        if store is None:
+            policy = get_area_policy(area)
+            store = _Area(
+                policy=policy,
+                stats=_get_stats(area),
+                entries=OrderedDict() if policy.max_entries is not None else {},
+            )
+            _cache[area] = store
+        return store
+
+
+def _get_stats(area: str) -> AreaStats:
+    stats = _stats.get(area)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(area, AreaStats())
+    return stats
+
+
+def _lookup(store: _Area, key: Any) -> CacheEntry | None:
+    # lock-free: single dict reads are atomic, writers swap whole entries
+    entry = store.entries.get(key)
+    if entry is None:
+        return None
+
+    now = time.time()
+    policy = store.policy
+    if policy.ttl is not None and now - entry.created > policy.ttl:
+        with store.lock:
+            if store.entries.get(key) is entry:
+                del store.entries[key]
+                store.stats.expirations += 1
+        return None
+
+    entry.timestamp = now
+    if policy.max_entries is not None:
+        with store.lock:
+            if store.entries.get(key) is entry:
+                store.entries.move_to_end(key)  # type: ignore[attr-defined]
+    return entry
+
+
+def _enforce_limits(store: _Area, now: float) -> None:
+    """Drop expired and over-limit entries; the caller holds store.lock."""
+    policy = store.policy
+    entries = store.entries
+
+    # expired entries are also dropped on lookup; sweep the rest now and then
+    if policy.ttl is not None and entries and now - store.swept >= policy.ttl / 2:
+        store.swept = now
+        cutoff = now - policy.ttl
+        expired = [key for key, entry in entries.items() if entry.created < cutoff]
+        for key in expired:
+            del entries[key]
+        store.stats.expirations += len(expired)
+
+    if policy.max_entries is not None:
+        while len(entries) > policy.max_entries:
+            entries.popitem(last=False)  # type: ignore[call-arg]
+            store.stats.evictions += 1
 
 
 def _get_matching_areas(area: str) -> list[str]:
@@ -122,4 +297,4 @@ def determine_cache_key(agent, *additional):
         profile = agent.config.profile or "none"
         project = agent.context.get_data("project") or "none"
         return (profile, project, *additional)
-    return ("none", "none", *additional)
\ No newline at end of file
+    return ("none", "none", *additional)
@@ -4,6 +4,8 @@ import threading
 from concurrent.futures import Future, InvalidStateError
 from typing import Any, Callable, Optional, Coroutine, TypeVar, Awaitable
 
+from helpers.loop_monitor import LoopLag, LoopWatch, unwatch_loop, watch_loop
+
 T = TypeVar("T")
 
 THREAD_BACKGROUND = "Background"
@@ -16,6 +18,8 @@ class EventLoopThread:
     def __init__(self, thread_name: str = THREAD_BACKGROUND) -> None:
         """Initialize the event loop thread."""
         self.thread_name = thread_name
+        if not hasattr(self, "watch"):
+            self.watch: LoopWatch | None = None
         self._start()
 
     def __new__(cls, thread_name: str = THREAD_BACKGROUND):
@@ -38,8 +42,17 @@ class EventLoopThread:
         if not self.loop:
             raise RuntimeError("Event loop is not initialized")
         asyncio.set_event_loop(self.loop)
+        self.watch = watch_loop(self.thread_name, self.loop)
         self.loop.run_forever()
 
+    def metrics(self) -> dict[str, Any]:
+        loop = getattr(self, "loop", None)
+        return {
+            "thread_name": self.thread_name,
+            "running": bool(loop and loop.is_running()),
+            **(self.watch.lag if self.watch else LoopLag()).snapshot(),
+        }
+
     def terminate(self):
         loop = getattr(self, "loop", None)
         thread = getattr(self, "thread", None)
@@ -47,6 +60,10 @@ class EventLoopThread:
         if not loop:
             return
 
+        if self.watch:
+            unwatch_loop(self.thread_name, self.watch)
+            self.watch = None
+
         if loop.is_running():
             if thread and thread is threading.current_thread():
                 loop.stop()
@@ -74,6 +91,82 @@ class EventLoopThread:
         return asyncio.run_coroutine_threadsafe(coro, self.loop)
 
 
+class EventLoopPool:
+    """Sticky assignment of keys (e.g. chat ids) to a fixed-size set of event loop threads.
+
+    A key keeps its loop until released, so loop-bound asyncio objects created by one
+    chat stay valid. New keys go to the loop with the fewest assigned keys. With size 1
+    every key maps to the plain `name` thread, the same as a single shared EventLoopThread.
+    """
+
+    _instances: dict[str, "EventLoopPool"] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, name: str, size: int | None = None):
+        with cls._lock:
+            if name not in cls._instances:
+                instance = super(EventLoopPool, cls).__new__(cls)
+                instance.name = name
+                instance.size = 1
+                instance._assignments = {}
+                cls._instances[name] = instance
+            return cls._instances[name]
+
+    def __init__(self, name: str, size: int | None = None) -> None:
+        self.name: str
+        self.size: int
+        self._assignments: dict[str, int]
+        if size is not None:
+            self.resize(size)
+
+    def resize(self, size: int) -> None:
+        """Change the number of loops; existing assignments stay where they are until released."""
+        with self.__class__._lock:
+            self.size = max(1, int(size))
+
+    def thread_name(self, index: int) -> str:
+        return self.name if index == 0 else f"{self.name}-{index}"
+
+    def assign(self, key: str) -> str:
+        """Return the event loop thread name for key, assigning the least loaded loop on first use."""
+        with self.__class__._lock:
+            index = self._assignments.get(key)
+            if index is None:
+                counts = [0] * self.size
+                for assigned in self._assignments.values():
+                    if assigned < self.size:
+                        counts[assigned] += 1
+                index = counts.index(min(counts))
+                self._assignments[key] = index
+            return self.thread_name(index)
+
+    def release(self, key: str) -> None:
+        with self.__class__._lock:
+            self._assignments.pop(key, None)
+
+    def metrics(self) -> list[dict[str, Any]]:
+        with self.__class__._lock:
+            indexes = set(range(self.size)) | set(self._assignments.values())
+            counts = {index: 0 for index in indexes}
+            for assigned in self._assignments.values():
+                counts[assigned] += 1
+        result = []
+        for index in sorted(indexes):
+            name = self.thread_name(index)
+            thread = EventLoopThread._instances.get(name)
+            entry = thread.metrics() if thread else {"thread_name": name, "running": False, **LoopLag().snapshot()}
+            entry["assigned"] = counts[index]
+            result.append(entry)
+        return result
+
+
+def loop_metrics() -> list[dict[str, Any]]:
+    """Lag metrics of every live EventLoopThread."""
+    with EventLoopThread._lock:
+        threads = list(EventLoopThread._instances.values())
+    return [thread.metrics() for thread in threads]
+
+
 @dataclass
 class ChildTask:
     task: "DeferredTask"
@@ -114,6 +207,12 @@ class DeferredTask:
         if self._future:
             self._future.add_done_callback(self._on_task_done)
 
+    def add_done_callback(self, callback: Callable[["DeferredTask"], Any]) -> None:
+        """Call callback(task) once the current run finishes, is cancelled or killed."""
+        if not self._future:
+            raise RuntimeError("Task hasn't been started")
+        self._future.add_done_callback(lambda _future: callback(self))
+
     def _on_task_done(self, future: Future):
         # Ensure child background tasks are always cleaned up once the parent finishes
         if future is self._future:
@@ -21,6 +21,13 @@ def get_dotenv_value(key: str, default: Any = None):
     # load_dotenv()       
     return os.getenv(key, default)
 
+def get_dotenv_int(key: str, default: int, minimum: int = 0) -> int:
+    """Integer value of key, at least minimum; default when unset or not a number."""
+    try:
+        return max(minimum, int(os.getenv(key, str(default))))
+    except (TypeError, ValueError):
+        return default
+
 def save_dotenv_value(key: str, value: str):
     if value is None:
         value = ""
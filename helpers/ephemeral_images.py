@@ -1,26 +1,38 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import threading
 import time
 import uuid
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from helpers.dotenv import get_dotenv_int
 
 
 REF_PREFIX = "a0-ephemeral-image://"
 DEFAULT_TTL_SECONDS = 15 * 60
 
 
+# Total decoded bytes kept across all contexts; least recently used images go first
+MAX_TOTAL_BYTES = get_dotenv_int("A0_EPHEMERAL_IMAGE_MAX_BYTES", 256 * 1024 * 1024, minimum=1)
+
+
 @dataclass(frozen=True)
 class EphemeralImage:
     ref: str
     context_id: str
     mime: str
-    data: str
+    payload: bytes = field(repr=False)
     name: str
     created_at: float
     expires_at: float
 
+    @property
+    def data(self) -> str:
+        return base64.b64encode(self.payload).decode("ascii")
+
     @property
     def data_url(self) -> str:
         return f"data:{self.mime};base64,{self.data}"
@@ -30,8 +42,16 @@ class EphemeralImage:
         return self.name or display_ref(self.ref)
 
 
-_store: dict[str, EphemeralImage] = {}
+# ref -> image in least-recently-used order, plus a per-context index and an
+# expiry heap of (expires_at, ref) that the sweeper thread drains
+_store: OrderedDict[str, EphemeralImage] = OrderedDict()
+_by_context: dict[str, set[str]] = {}
+_expiry: list[tuple[float, str]] = []
+_total_bytes = 0
+_evictions = 0
 _lock = threading.RLock()
+_sweep_wakeup = threading.Condition(_lock)
+_sweeper: threading.Thread | None = None
 
 
 def put_image_bytes(
@@ -42,14 +62,28 @@ def put_image_bytes(
     name: str = "",
     ttl_seconds: float = DEFAULT_TTL_SECONDS,
 ) -> str:
-    data = base64.b64encode(bytes(payload or b"")).decode("ascii")
-    return put_image(
-        context_id=context_id,
-        mime=mime,
-        data=data,
-        name=name,
-        ttl_seconds=ttl_seconds,
+    data = bytes(payload or b"")
+    if not data:
+        raise ValueError("ephemeral image data is empty")
+
+    now = time.time()
+    ref = f"{REF_PREFIX}{uuid.uuid4().hex}"
+    image = EphemeralImage(
+        ref=ref,
+        context_id=str(context_id or "").strip(),
+        mime=_normalize_mime(mime),
+        payload=data,
+        name=str(name or "").strip(),
+        created_at=now,
+        expires_at=now + max(1.0, float(ttl_seconds or DEFAULT_TTL_SECONDS)),
     )
+    with _lock:
+        _add_locked(image)
+        _evict_over_budget_locked()
+        if _expiry[0][1] == ref:
+            _sweep_wakeup.notify()
+        _ensure_sweeper_locked()
+    return ref
 
 
 def put_image(
@@ -63,24 +97,14 @@ def put_image(
     compact_data = _compact_base64(data)
     if not compact_data:
         raise ValueError("ephemeral image data is empty")
-    base64.b64decode(compact_data, validate=True)
-
-    normalized_mime = _normalize_mime(mime)
-    now = time.time()
-    ref = f"{REF_PREFIX}{uuid.uuid4().hex}"
-    image = EphemeralImage(
-        ref=ref,
-        context_id=str(context_id or "").strip(),
-        mime=normalized_mime,
-        data=compact_data,
-        name=str(name or "").strip(),
-        created_at=now,
-        expires_at=now + max(1.0, float(ttl_seconds or DEFAULT_TTL_SECONDS)),
+    payload = base64.b64decode(compact_data, validate=True)
+    return put_image_bytes(
+        context_id=context_id,
+        mime=mime,
+        payload=payload,
+        name=name,
+        ttl_seconds=ttl_seconds,
     )
-    with _lock:
-        _prune_expired_locked(now)
-        _store[ref] = image
-    return ref
 
 
 def is_ref(value: object) -> bool:
@@ -104,15 +128,26 @@ def consume_image(ref: str, *, context_id: str = "") -> EphemeralImage | None:
 
 def delete_image(ref: str) -> None:
     with _lock:
-        _store.pop(str(ref or "").strip(), None)
+        _remove_locked(str(ref or "").strip())
 
 
 def clear_context(context_id: str) -> None:
     normalized_context = str(context_id or "").strip()
     with _lock:
-        for ref, image in list(_store.items()):
-            if image.context_id == normalized_context:
-                _store.pop(ref, None)
+        for ref in list(_by_context.get(normalized_context, ())):
+            _remove_locked(ref)
+
+
+def get_stats() -> dict[str, int]:
+    with _lock:
+        return {
+            "images": len(_store),
+            "contexts": len(_by_context),
+            "bytes": _total_bytes,
+            "max_bytes": MAX_TOTAL_BYTES,
+            "evictions": _evictions,
+            "pending_expiries": len(_expiry),
+        }
 
 
 def _resolve_image(ref: str, *, context_id: str = "", consume: bool) -> EphemeralImage | None:
@@ -120,17 +155,21 @@ def _resolve_image(ref: str, *, context_id: str = "", consume: bool) -> Ephemera
     if not is_ref(value):
         return None
 
-    now = time.time()
     with _lock:
-        _prune_expired_locked(now)
         image = _store.get(value)
         if image is None:
             return None
+        if image.expires_at <= time.time():
+            # expired but not swept yet
+            _remove_locked(value)
+            return None
         requested_context = str(context_id or "").strip()
         if requested_context and image.context_id and image.context_id != requested_context:
             return None
         if consume:
-            _store.pop(value, None)
+            _remove_locked(value)
+        else:
+            _store.move_to_end(value)
         return image
 
 
@@ -143,8 +182,65 @@ def _normalize_mime(mime: str) -> str:
     return value if value.startswith("image/") else "image/jpeg"
 
 
-def _prune_expired_locked(now: float | None = None) -> None:
-    current = time.time() if now is None else float(now)
-    for ref, image in list(_store.items()):
-        if image.expires_at <= current:
-            _store.pop(ref, None)
+def _add_locked(image: EphemeralImage) -> None:
+    global _total_bytes
+    _store[image.ref] = image
+    _by_context.setdefault(image.context_id, set()).add(image.ref)
+    heapq.heappush(_expiry, (image.expires_at, image.ref))
+    _total_bytes += len(image.payload)
+
+
+def _remove_locked(ref: str) -> EphemeralImage | None:
+    global _total_bytes
+    image = _store.pop(ref, None)
+    if image is None:
+        return None
+    _total_bytes -= len(image.payload)
+    refs = _by_context.get(image.context_id)
+    if refs is not None:
+        refs.discard(ref)
+        if not refs:
+            del _by_context[image.context_id]
+    # the heap entry stays until it is due; rebuild when mostly stale
+    if len(_expiry) > 2 * len(_store) + 64:
+        _expiry[:] = [(item.expires_at, item.ref) for item in _store.values()]
+        heapq.heapify(_expiry)
+    return image
+
+
+def _evict_over_budget_locked() -> None:
+    global _evictions
+    # the newest image always stays, even when it alone exceeds the budget
+    while _total_bytes > MAX_TOTAL_BYTES and len(_store) > 1:
+        _remove_locked(next(iter(_store)))
+        _evictions += 1
+
+
+def _expire_due_locked(now: float) -> float | None:
+    """Drop images whose expiry is due; return the next expiry time, if any."""
+    while _expiry:
+        expires_at, ref = _expiry[0]
+        if expires_at > now:
+            return expires_at
+        heapq.heappop(_expiry)
+        image = _store.get(ref)
+        if image is not None and image.expires_at <= now:
+            _remove_locked(ref)
+    return None
+
+
+def _ensure_sweeper_locked() -> None:
+    global _sweeper
+    if _sweeper is None or not _sweeper.is_alive():
+        _sweeper = threading.Thread(
+            target=_sweep, name="ephemeral-images-sweeper", daemon=True
+        )
+        _sweeper.start()
+
+
+def _sweep() -> None:
+    with _sweep_wakeup:
+        while True:
+            next_expiry = _expire_due_locked(time.time())
+            timeout = None if next_expiry is None else max(0.0, next_expiry - time.time())
+            _sweep_wakeup.wait(timeout)
@@ -1,11 +1,12 @@
 from abc import abstractmethod
 from typing import Any, Awaitable, Type, cast
 from helpers import modules, files
-from helpers import cache
+from helpers import cache, lazy_import
 from typing import TYPE_CHECKING
 from functools import wraps
 import inspect
 import os
+import time
 
 from helpers.print_style import PrintStyle
 
@@ -18,6 +19,14 @@ USER_EXTENSIONS_FOLDER = "usr/extensions"
 
 _EXTENSIONS_CACHE_AREA = "extension_folder_classes(extensions)"
 _CLASSES_CACHE_AREA = "extension_classes(extensions)"
+_FUNCTION_POINTS_DIR = "_functions"
+# points of @extensible functions that have an extension folder anywhere; kept
+# outside helpers.cache so disabling the cache does not rescan on every call
+_function_points: frozenset[str] | None = None
+# loop_data.params_temporary key holding windowed stream state for the iteration
+_STREAM_WINDOWS_KEY = "_stream_windows"
+# one entry per profile, project and extension point
+cache.set_area_policy(_CLASSES_CACHE_AREA, max_entries=4096)
 # cache.toggle_area(_EXTENSIONS_CACHE_AREA, False)
 # cache.toggle_area(_CLASSES_CACHE_AREA, False)
 
@@ -96,10 +105,17 @@ def extensible(func):
 
     Finally, if ``data["exception"]`` contains an exception it is raised;
     otherwise ``data["result"]`` is returned.
+
+    Both points are computed once, at decoration time. While no extension
+    folder exists for either of them (see ``_has_function_extensions``), the
+    wrapper calls the function directly without building ``data``.
     """
 
     def _get_agent(args, kwargs):
-        from agent import Agent
+        # no Agent can exist before the agent module is loaded; don't import it here
+        Agent = lazy_import.loaded_attr("agent", "Agent")
+        if Agent is None:
+            return None
 
         candidate = kwargs.get("agent")
         if isinstance(candidate, Agent) and bool(getattr(candidate, "__dict__", None)):
@@ -112,20 +128,6 @@ def extensible(func):
         return None
 
     def _prepare_inputs(args, kwargs):
-        module_name = getattr(func, "__module__", "")
-        qual_name = getattr(func, "__qualname__", "")
-        if not module_name or not qual_name:
-            return None
-
-        module_parts = [part for part in module_name.split(".") if part]
-        qual_parts = [part for part in qual_name.split(".") if part and part != "<locals>"]
-        if not module_parts or not qual_parts:
-            return None
-
-        base_path = os.path.join("_functions", *module_parts, *qual_parts)
-        start_point = os.path.join(base_path, "start")
-        end_point = os.path.join(base_path, "end")
-
         agent = _get_agent(args, kwargs)
 
         data = {
@@ -135,7 +137,7 @@ def extensible(func):
             "exception": None,
         }
 
-        return start_point, end_point, agent, data
+        return agent, data
 
     def _process_result(data):
         exc = data.get("exception")
@@ -160,11 +162,10 @@ def extensible(func):
             return _UNSET
 
     async def _run_async(*args, **kwargs):
-        prepared = _prepare_inputs(args, kwargs)
-        if prepared is None:
+        if not _has_function_extensions(start_point, end_point):
             return await func(*args, **kwargs)
 
-        start_point, end_point, agent, data = prepared
+        agent, data = _prepare_inputs(args, kwargs)
 
         # call pre-extensions
         await call_extensions_async(start_point, agent=agent, data=data)
@@ -184,11 +185,10 @@ def extensible(func):
         return None if result is _UNSET else result
 
     def _run_sync(*args, **kwargs):
-        prepared = _prepare_inputs(args, kwargs)
-        if prepared is None:
+        if not _has_function_extensions(start_point, end_point):
             return func(*args, **kwargs)
 
-        start_point, end_point, agent, data = prepared
+        agent, data = _prepare_inputs(args, kwargs)
 
         # call pre-extensions
         call_extensions_sync(start_point, agent=agent, data=data)
@@ -203,14 +203,89 @@ def extensible(func):
         result = _process_result(data)
         return None if result is _UNSET else result
 
+    points = _get_function_points(func)
+    if points is None:
+        return func
+    start_point, end_point = points
+
     if inspect.iscoroutinefunction(func):
         return wraps(func)(_run_async)
 
     return wraps(func)(_run_sync)
 
 
+def _get_function_points(func) -> tuple[str, str] | None:
+    module_name = getattr(func, "__module__", "")
+    qual_name = getattr(func, "__qualname__", "")
+    if not module_name or not qual_name:
+        return None
+
+    module_parts = [part for part in module_name.split(".") if part]
+    qual_parts = [part for part in qual_name.split(".") if part and part != "<locals>"]
+    if not module_parts or not qual_parts:
+        return None
+
+    base_path = os.path.join(_FUNCTION_POINTS_DIR, *module_parts, *qual_parts)
+    return os.path.join(base_path, "start"), os.path.join(base_path, "end")
+
+
+def _has_function_extensions(start_point: str, end_point: str) -> bool:
+    global _function_points
+    points = _function_points
+    if points is None:
+        points = _function_points = _scan_function_points()
+    return start_point in points or end_point in points
+
+
+def clear_function_points() -> None:
+    """Forget which @extensible functions have extensions; the next call scans the folders again."""
+    global _function_points
+    _function_points = None
+
+
+def _scan_function_points() -> frozenset[str]:
+    """Function extension points with files in any root any agent could search.
+
+    Covers every profile, project and plugin (enabled or not), so a point missing
+    here has no extensions for any agent. The extension and plugin watchdogs
+    reset it through clear_function_points().
+    """
+    from helpers import plugins, projects, subagents
+
+    # the roots subagents.get_paths() searches, with "*" for every profile and project
+    roots = [
+        projects.get_project_meta("*", subagents.DEFAULT_AGENTS_DIR, "*"),
+        projects.get_project_meta("*"),
+        files.get_abs_path(subagents.USER_AGENTS_DIR, "*"),
+        *plugins.get_plugin_paths(subagents.DEFAULT_AGENTS_DIR, "*"),
+        files.get_abs_path(subagents.DEFAULT_AGENTS_DIR, "*"),
+        files.get_abs_path(subagents.USER_DIR),
+        *plugins.get_plugin_paths(),
+        files.get_abs_path(subagents.GLOBAL_DIR),
+    ]
+
+    points: set[str] = set()
+    for root in roots:
+        pattern = files.get_abs_path(root, files.EXTENSIONS_DIR, "python", _FUNCTION_POINTS_DIR)
+        for folder in files.find_existing_paths_by_pattern(pattern):
+            base = os.path.dirname(folder)
+            for dirpath, _dirnames, filenames in os.walk(folder):
+                if filenames:
+                    points.add(os.path.relpath(dirpath, base))
+    return frozenset(points)
+
+
 class Extension:
 
+    # Windowed dispatch, honored by call_stream_extensions() (stream chunk points):
+    # set either to be called at most once per time window and/or once enough
+    # characters arrived, with the deltas since the previous call joined into
+    # stream_data["chunk"] and the latest stream_data["full"]. Pending deltas are
+    # flushed before the stream ends. Changes made to stream_data are not seen
+    # by other extensions or the output.
+    stream_window_seconds: float | None = None
+    stream_window_chars: int | None = None
+
     def __init__(self, agent: "Agent|None", **kwargs):
         self.agent: "Agent|None" = agent
         self.kwargs = kwargs
@@ -250,6 +325,106 @@ def call_extensions_sync(extension_point: str, agent: "Agent|None" = None, **kwa
             )
 
 
+async def call_stream_extensions(
+    extension_point: str, agent: "Agent", loop_data: Any, **kwargs
+):
+    """Call a per-chunk stream extension point.
+
+    Extensions run in file order. Regular extensions run for every chunk.
+    Windowed extensions (``stream_window_seconds`` / ``stream_window_chars``)
+    collect the chunks and run when their window is due. Call
+    flush_stream_extensions() before the stream's end point.
+    """
+    _log_extension_call(extension_point)
+
+    classes = _get_extension_classes(extension_point, agent=agent)
+    windows: dict[type, _StreamWindow] | None = None
+    now = 0.0
+
+    for cls in classes:
+        if not _is_stream_windowed(cls):
+            result = cls(agent=agent).execute(loop_data=loop_data, **kwargs)
+            if isinstance(result, Awaitable):
+                await result
+            continue
+
+        if windows is None:
+            windows = _get_stream_windows(loop_data, extension_point)
+            now = time.monotonic()
+        window = windows.get(cls)
+        if window is None:
+            window = windows[cls] = _StreamWindow(cls)
+        window.collect(kwargs)
+        if window.is_due(now):
+            await window.flush(agent, loop_data, now)
+
+
+async def flush_stream_extensions(agent: "Agent", loop_data: Any, *extension_points: str):
+    """Deliver pending windowed chunks of the given stream points (all if none given)."""
+    state: dict[str, dict[type, _StreamWindow]] = loop_data.params_temporary.get(
+        _STREAM_WINDOWS_KEY, {}
+    )
+    points = extension_points or tuple(state)
+    now = time.monotonic()
+    for point in points:
+        for window in list(state.get(point, {}).values()):
+            await window.flush(agent, loop_data, now)
+
+
+class _StreamWindow:
+    __slots__ = ("cls", "parts", "chars", "kwargs", "last_call")
+
+    def __init__(self, cls: Type[Extension]):
+        self.cls = cls
+        self.parts: list[str] = []
+        self.chars = 0
+        self.kwargs: dict[str, Any] | None = None
+        self.last_call = float("-inf")
+
+    def collect(self, kwargs: dict[str, Any]):
+        stream_data = kwargs.get("stream_data")
+        if isinstance(stream_data, dict):
+            chunk = stream_data.get("chunk") or ""
+            if chunk:
+                self.parts.append(chunk)
+                self.chars += len(chunk)
+        self.kwargs = kwargs
+
+    def is_due(self, now: float) -> bool:
+        seconds = self.cls.stream_window_seconds
+        chars = self.cls.stream_window_chars
+        if chars is not None and self.chars >= chars:
+            return True
+        return seconds is not None and now - self.last_call >= seconds
+
+    async def flush(self, agent: "Agent", loop_data: Any, now: float):
+        if self.kwargs is None:
+            return  # nothing since the last call
+
+        kwargs = self.kwargs
+        stream_data = kwargs.get("stream_data")
+        if isinstance(stream_data, dict):
+            kwargs = {
+                **kwargs,
+                "stream_data": {**stream_data, "chunk": "".join(self.parts)},
+            }
+        self.parts, self.chars, self.kwargs = [], 0, None
+        self.last_call = now
+
+        result = self.cls(agent=agent).execute(loop_data=loop_data, **kwargs)
+        if isinstance(result, Awaitable):
+            await result
+
+
+def _is_stream_windowed(cls: Type[Extension]) -> bool:
+    return cls.stream_window_seconds is not None or cls.stream_window_chars is not None
+
+
+def _get_stream_windows(loop_data: Any, extension_point: str) -> dict[type, _StreamWindow]:
+    state = loop_data.params_temporary.setdefault(_STREAM_WINDOWS_KEY, {})
+    return state.setdefault(extension_point, {})
+
+
 def get_webui_extensions(
     agent: "Agent | None", extension_point: str, filters: list[str] | None = None
 ):
@@ -331,6 +506,7 @@ def register_extensions_watchdogs():
     def extensions_changed(items: list[watchdog.WatchItem]):
         cache.clear(_EXTENSIONS_CACHE_AREA)
         cache.clear(_CLASSES_CACHE_AREA)
+        clear_function_points()
         PrintStyle.debug("Extensions watchdog triggered:", items)
 
     # extensions and usr/extensions
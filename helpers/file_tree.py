@@ -4,7 +4,8 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 import os
-from typing import Any, Callable, Iterable, Literal, Optional, Sequence
+import threading
+from typing import Any, Callable, Iterable, Literal, Optional, Sequence, cast
 
 from pathspec import PathSpec
 
@@ -88,6 +89,112 @@ def file_tree(
                 epoch = item[\"created\"].timestamp()
 
     """
+    abs_root, output_root = _resolve_root(relative_path)
+    _validate_options(sort, output_mode, max_depth, max_lines)
+    scanner = _DirectoryScanner(abs_root, _resolve_ignore_patterns(ignore, abs_root))
+    return _render_tree(
+        scanner,
+        output_root,
+        max_depth=max_depth,
+        max_lines=max_lines,
+        folders_first=folders_first,
+        max_folders=max_folders,
+        max_files=max_files,
+        sort=sort,
+        output_mode=output_mode,
+    )
+
+
+class FileTreeModel:
+    """A directory tree kept in memory between renders.
+
+    Directory listings are scanned once and reused until :meth:`invalidate` reports a
+    change below them, so re-rendering an unchanged tree touches no files and only the
+    directories around a change are scanned again. Feed it filesystem watch events.
+    :meth:`render` returns the same output as :func:`file_tree` with the same arguments.
+    """
+
+    def __init__(self, relative_path: str, *, ignore: str | None = None):
+        self.abs_root, self.output_root = _resolve_root(relative_path)
+        self.ignore = ignore
+        self._scanner = _DirectoryScanner(self.abs_root, _resolve_ignore_patterns(ignore, self.abs_root))
+        self._rendered: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def render(
+        self,
+        *,
+        max_depth: int = 0,
+        max_lines: int = 0,
+        folders_first: bool = True,
+        max_folders: int = 0,
+        max_files: int = 0,
+        sort: tuple[Literal["name", "created", "modified"], Literal["asc", "desc"]] = ("modified", "desc"),
+        output_mode: Literal["string", "flat", "nested"] = OUTPUT_MODE_STRING,
+    ) -> str | list[dict]:
+        _validate_options(sort, output_mode, max_depth, max_lines)
+        options = (max_depth, max_lines, folders_first, max_folders, max_files, tuple(sort))
+        with self._lock:
+            # structured outputs are mutable, only strings are reused as they are
+            if output_mode == OUTPUT_MODE_STRING and options in self._rendered:
+                return self._rendered[options]
+            result = _render_tree(
+                self._scanner,
+                self.output_root,
+                max_depth=max_depth,
+                max_lines=max_lines,
+                folders_first=folders_first,
+                max_folders=max_folders,
+                max_files=max_files,
+                sort=sort,
+                output_mode=output_mode,
+            )
+            if output_mode == OUTPUT_MODE_STRING:
+                self._rendered[options] = cast(str, result)
+            return result
+
+    def invalidate(self, path: str) -> None:
+        """Forget listings affected by a created, modified, deleted or moved path."""
+        path = os.path.abspath(path)
+        if not _is_same_or_nested(path, self.abs_root):
+            return
+        scanner = self._scanner
+        with self._lock:
+            self._rendered.clear()
+
+            # a removed folder takes its cached subfolders with it
+            if path in scanner.children or path in scanner.visible:
+                prefix = path + os.sep
+                for cache in (scanner.children, scanner.visible):
+                    for directory in [d for d in cache if d.startswith(prefix)]:
+                        del cache[directory]
+
+            # the path's own listing, its parent's entries and the parent's
+            # modification time as listed by the grandparent
+            directory = path
+            for _ in range(3):
+                scanner.children.pop(directory, None)
+                if directory == self.abs_root:
+                    break
+                directory = os.path.dirname(directory)
+
+            # ignored folders are listed only while something below them is visible
+            directory = path
+            while True:
+                if scanner.visible.pop(directory, None) is not None and directory != self.abs_root:
+                    scanner.children.pop(os.path.dirname(directory), None)
+                if directory == self.abs_root:
+                    break
+                directory = os.path.dirname(directory)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rendered.clear()
+            self._scanner.children.clear()
+            self._scanner.visible.clear()
+
+
+def _resolve_root(relative_path: str) -> tuple[str, str]:
     abs_root = files_helper.get_abs_path(relative_path)
     output_root = files_helper.get_abs_path_dockerized(relative_path)
 
@@ -95,7 +202,10 @@ def file_tree(
         raise FileNotFoundError(f"Path does not exist: {relative_path!r}")
     if not os.path.isdir(abs_root):
         raise NotADirectoryError(f"Expected a directory, received: {relative_path!r}")
+    return abs_root, output_root
+
 
+def _validate_options(sort: tuple[str, str], output_mode: str, max_depth: int, max_lines: int) -> None:
     sort_key, sort_direction = sort
     if sort_key not in {SORT_BY_NAME, SORT_BY_CREATED, SORT_BY_MODIFIED}:
         raise ValueError(f"Unsupported sort key: {sort_key!r}")
@@ -108,8 +218,20 @@ def file_tree(
     if max_lines < 0:
         raise ValueError("max_lines must be >= 0")
 
-    ignore_spec = _resolve_ignore_patterns(ignore, abs_root)
 
+def _render_tree(
+    scanner: "_DirectoryScanner",
+    output_root: str,
+    *,
+    max_depth: int,
+    max_lines: int,
+    folders_first: bool,
+    max_folders: int,
+    max_files: int,
+    sort: tuple[Literal["name", "created", "modified"], Literal["asc", "desc"]],
+    output_mode: Literal["string", "flat", "nested"],
+) -> str | list[dict]:
+    abs_root = scanner.abs_root
     root_stat = os.stat(abs_root, follow_symlinks=False)
     root_name = os.path.basename(os.path.normpath(abs_root)) or os.path.basename(abs_root)
     root_node = _TreeEntry(
@@ -127,21 +249,17 @@ def file_tree(
     nodes_in_order: list[_TreeEntry] = []
     rendered_count = 0
     limit_reached = False
-    visibility_cache: dict[str, bool] = {}
 
-    def make_entry(entry: os.DirEntry, parent: _TreeEntry, level: int, item_type: Literal["file", "folder"]) -> _TreeEntry:
-        stat = entry.stat(follow_symlinks=False)
-        rel_path = os.path.relpath(entry.path, abs_root)
-        rel_posix = _normalize_relative_path(rel_path)
+    def make_entry(entry: _ScannedEntry, parent: _TreeEntry, level: int, item_type: Literal["file", "folder"]) -> _TreeEntry:
         return _TreeEntry(
             name=entry.name,
             level=level,
             item_type=item_type,
-            created=_from_timestamp(stat.st_ctime),
-            modified=_from_timestamp(stat.st_mtime),
+            created=entry.created,
+            modified=entry.modified,
             parent=parent,
             items=[] if item_type == "folder" else None,
-            rel_path=rel_posix,
+            rel_path=entry.rel_path,
         )
 
     while queue and not limit_reached:
@@ -151,13 +269,7 @@ def file_tree(
             continue
 
         remaining_depth = max_depth - level if max_depth else -1
-        folders, files = _list_directory_children(
-            current_dir,
-            abs_root,
-            ignore_spec,
-            max_depth_remaining=remaining_depth,
-            cache=visibility_cache,
-        )
+        folders, files = scanner.list_children(current_dir, remaining_depth)
 
         folder_entries = [make_entry(folder, parent_node, level, "folder") for folder in folders]
         file_entries = [make_entry(file_entry, parent_node, level, "file") for file_entry in files]
@@ -220,8 +332,7 @@ def file_tree(
             summary = _create_folder_unprocessed_comment(
                 folder_node,
                 folder_path,
-                abs_root,
-                ignore_spec,
+                scanner,
             )
             if summary is None:
                 continue
@@ -288,6 +399,64 @@ class _TreeEntry:
         }
 
 
+@dataclass(slots=True)
+class _ScannedEntry:
+    name: str
+    rel_path: str
+    created: datetime
+    modified: datetime
+
+
+class _DirectoryScanner:
+    """Filtered directory listings and ignored-folder visibility, cached by path."""
+
+    def __init__(self, abs_root: str, ignore_spec: Optional[PathSpec]):
+        self.abs_root = abs_root
+        self.ignore_spec = ignore_spec
+        # directory -> max_depth_remaining -> (folders, files)
+        self.children: dict[str, dict[int, tuple[list[_ScannedEntry], list[_ScannedEntry]]]] = {}
+        # directory -> max_depth_remaining -> has visible entries
+        self.visible: dict[str, dict[int, bool]] = {}
+
+    def list_children(
+        self, directory: str, max_depth_remaining: int
+    ) -> tuple[list[_ScannedEntry], list[_ScannedEntry]]:
+        by_depth = self.children.setdefault(directory, {})
+        listing = by_depth.get(max_depth_remaining)
+        if listing is None:
+            folders, files = _list_directory_children(
+                directory,
+                self.abs_root,
+                self.ignore_spec,
+                max_depth_remaining=max_depth_remaining,
+                cache=self.visible,
+            )
+            listing = (self._scan(folders), self._scan(files))
+            by_depth[max_depth_remaining] = listing
+        return listing
+
+    def _scan(self, entries: list[os.DirEntry]) -> list[_ScannedEntry]:
+        scanned = []
+        for entry in entries:
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            scanned.append(
+                _ScannedEntry(
+                    name=entry.name,
+                    rel_path=_normalize_relative_path(os.path.relpath(entry.path, self.abs_root)),
+                    created=_from_timestamp(stat.st_ctime),
+                    modified=_from_timestamp(stat.st_mtime),
+                )
+            )
+        return scanned
+
+
+def _is_same_or_nested(path: str, root: str) -> bool:
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
 def _normalize_relative_path(path: str) -> str:
     normalized = path.replace(os.sep, "/")
     if normalized in {".", ""}:
@@ -301,13 +470,14 @@ def _directory_has_visible_entries(
     directory: str,
     root_abs_path: str,
     ignore_spec: PathSpec,
-    cache: dict[str, bool],
+    cache: dict[str, dict[int, bool]],
     max_depth_remaining: int,
 ) -> bool:
     if max_depth_remaining == 0:
         return False
 
-    cached = cache.get(directory)
+    by_depth = cache.setdefault(directory, {})
+    cached = by_depth.get(max_depth_remaining)
     if cached is not None:
         return cached
 
@@ -331,20 +501,20 @@ def _directory_has_visible_entries(
                             cache,
                             next_depth,
                         ):
-                            cache[directory] = True
+                            by_depth[max_depth_remaining] = True
                             return True
                         continue
                 else:
                     if ignore_spec.match_file(rel_posix):
                         continue
 
-                cache[directory] = True
+                by_depth[max_depth_remaining] = True
                 return True
     except FileNotFoundError:
-        cache[directory] = False
+        by_depth[max_depth_remaining] = False
         return False
 
-    cache[directory] = False
+    by_depth[max_depth_remaining] = False
     return False
 
 
@@ -396,49 +566,25 @@ def _create_global_limit_comment(parent: _TreeEntry, hidden_children: Sequence[_
 def _create_folder_unprocessed_comment(
     folder_node: _TreeEntry,
     folder_path: str,
-    abs_root: str,
-    ignore_spec: Optional[PathSpec],
+    scanner: _DirectoryScanner,
 ) -> Optional[_TreeEntry]:
-    try:
-        folders, files = _list_directory_children(
-            folder_path,
-            abs_root,
-            ignore_spec,
-            max_depth_remaining=-1,
-            cache={},
-        )
-    except FileNotFoundError:
-        return None
+    folders, files = scanner.list_children(folder_path, -1)
 
     hidden_entries: list[_TreeEntry] = []
-    for entry in folders:
-        stat = entry.stat(follow_symlinks=False)
-        hidden_entries.append(
-            _TreeEntry(
-                name=entry.name,
-                level=folder_node.level + 1,
-                item_type="folder",
-                created=_from_timestamp(stat.st_ctime),
-                modified=_from_timestamp(stat.st_mtime),
-                parent=folder_node,
-                items=None,
-                rel_path=os.path.join(folder_node.rel_path, entry.name),
-            )
-        )
-    for entry in files:
-        stat = entry.stat(follow_symlinks=False)
-        hidden_entries.append(
-            _TreeEntry(
-                name=entry.name,
-                level=folder_node.level + 1,
-                item_type="file",
-                created=_from_timestamp(stat.st_ctime),
-                modified=_from_timestamp(stat.st_mtime),
-                parent=folder_node,
-                items=None,
-                rel_path=os.path.join(folder_node.rel_path, entry.name),
+    for item_type, entries in (("folder", folders), ("file", files)):
+        for entry in entries:
+            hidden_entries.append(
+                _TreeEntry(
+                    name=entry.name,
+                    level=folder_node.level + 1,
+                    item_type=item_type,
+                    created=entry.created,
+                    modified=entry.modified,
+                    parent=folder_node,
+                    items=None,
+                    rel_path=os.path.join(folder_node.rel_path, entry.name),
+                )
             )
-        )
 
     if not hidden_entries:
         return None
@@ -516,7 +662,7 @@ def _list_directory_children(
     ignore_spec: Optional[PathSpec],
     *,
     max_depth_remaining: int,
-    cache: dict[str, bool],
+    cache: dict[str, dict[int, bool]],
 ) -> tuple[list[os.DirEntry], list[os.DirEntry]]:
     folders: list[os.DirEntry] = []
     files: list[os.DirEntry] = []
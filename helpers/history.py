@@ -48,6 +48,34 @@ class OutputMessage(TypedDict, total=False):
     sequence: int
 
 
+# message attributes that change the rendered output; assigning any of them drops the render cache
+_RENDER_FIELDS = frozenset(("ai", "content", "summary", "metadata", "sequence", "id"))
+
+
+class _Rendered:
+    """Cached output of one message (or summary) plus its lazily stringified content.
+
+    Rendered outputs are shared between calls, callers must treat them as read-only.
+    """
+
+    __slots__ = ("output", "_content_text", "_embeds")
+
+    def __init__(self, output: OutputMessage):
+        self.output = output
+        self._content_text: str | None = None
+        self._embeds: int | None = None
+
+    def text(self, ai_label: str, human_label: str) -> str:
+        if self._content_text is None:
+            self._content_text = _stringify_content(self.output["content"])
+        return f'{ai_label if self.output["ai"] else human_label}: {self._content_text}'
+
+    def embeds(self) -> int:
+        if self._embeds is None:
+            self._embeds = _count_embeds(self.output["content"])
+        return self._embeds
+
+
 class Record:
     def __init__(self):
         pass
@@ -94,6 +122,7 @@ class Message(Record):
         metadata: dict[str, Any] | None = None,
         sequence: int = 0,
     ):
+        self._rendered: _Rendered | None = None
         self.id = id or str(uuid.uuid4())
         self.ai = ai
         self.content = content
@@ -102,6 +131,26 @@ class Message(Record):
         self.summary: str = ""
         self.tokens: int = tokens or self.calculate_tokens()
 
+    def __setattr__(self, name: str, value: Any):
+        if name in _RENDER_FIELDS:
+            self.__dict__["_rendered"] = None
+        super().__setattr__(name, value)
+
+    def _render(self) -> _Rendered:
+        rendered = self._rendered
+        if rendered is None:
+            rendered = _Rendered(
+                OutputMessage(
+                    ai=self.ai,
+                    content=self.summary or self.content,
+                    metadata=self.metadata,
+                    id=self.id,
+                    sequence=self.sequence,
+                )
+            )
+            self.__dict__["_rendered"] = rendered
+        return rendered
+
     def get_tokens(self) -> int:
         if not self.tokens:
             self.tokens = self.calculate_tokens()
@@ -119,21 +168,13 @@ class Message(Record):
         return False
 
     def output(self):
-        return [
-            OutputMessage(
-                ai=self.ai,
-                content=self.summary or self.content,
-                metadata=self.metadata,
-                id=self.id,
-                sequence=self.sequence,
-            )
-        ]
+        return [self._render().output]
 
     def output_langchain(self):
         return output_langchain(self.output())
 
     def output_text(self, human_label="user", ai_label="ai"):
-        return output_text(self.output(), ai_label, human_label)
+        return self._render().text(ai_label, human_label)
 
     def to_dict(self):
         return {
@@ -175,6 +216,10 @@ class Topic(Record):
         self.history = history
         self.summary: str = ""
         self.messages: list[Message] = []
+        # append-only render cache, revalidated against message identity and render state
+        self._render_sources: list[tuple[Message, _Rendered]] = []
+        self._render_items: list[_Rendered] = []
+        self._summary_rendered: _Rendered | None = None
 
     def get_tokens(self):
         if self.summary:
@@ -203,11 +248,33 @@ class Topic(Record):
         return msg
 
     def output(self) -> list[OutputMessage]:
+        return [r.output for r in self._rendered_items()]
+
+    def output_text(self, human_label="user", ai_label="ai"):
+        return "\n".join(r.text(ai_label, human_label) for r in self._rendered_items())
+
+    def _rendered_items(self) -> list[_Rendered]:
         if self.summary:
-            return [OutputMessage(ai=False, content=self.summary)]
-        else:
-            msgs = [m for r in self.messages for m in r.output()]
-            return msgs
+            self._summary_rendered = _render_summary(self.summary, self._summary_rendered)
+            return [self._summary_rendered]
+
+        sources, items, messages = self._render_sources, self._render_items, self.messages
+        # keep the longest still-valid prefix, re-render only new or changed messages
+        valid = 0
+        limit = min(len(sources), len(messages))
+        while valid < limit:
+            msg, rendered = sources[valid]
+            if msg is not messages[valid] or msg._rendered is not rendered:
+                break
+            valid += 1
+        if valid < len(sources):
+            del sources[valid:]
+            del items[valid:]
+        for msg in messages[valid:]:
+            rendered = msg._render()
+            sources.append((msg, rendered))
+            items.append(rendered)
+        return items
 
     async def summarize(self):
         self.summary = await self.summarize_messages(self.messages)
@@ -309,6 +376,7 @@ class Bulk(Record):
         self.history = history
         self.summary: str = ""
         self.records: list[Record] = []
+        self._summary_rendered: _Rendered | None = None
 
     def get_tokens(self):
         if self.summary:
@@ -319,11 +387,19 @@ class Bulk(Record):
     def output(
         self, human_label: str = "user", ai_label: str = "ai"
     ) -> list[OutputMessage]:
+        return [r.output for r in self._rendered_items()]
+
+    def output_text(self, human_label="user", ai_label="ai"):
+        return "\n".join(r.text(ai_label, human_label) for r in self._rendered_items())
+
+    def _rendered_items(self) -> list[_Rendered]:
         if self.summary:
-            return [OutputMessage(ai=False, content=self.summary)]
-        else:
-            msgs = [m for r in self.records for m in r.output()]
-            return msgs
+            self._summary_rendered = _render_summary(self.summary, self._summary_rendered)
+            return [self._summary_rendered]
+        items: list[_Rendered] = []
+        for record in self.records:
+            items += _rendered_items(record)
+        return items
 
     async def compress(self):
         return False
@@ -409,11 +485,20 @@ class History(Record):
 
     def output(self) -> list[OutputMessage]:
         self.trim_embeds(self._get_max_embeds())
-        result: list[OutputMessage] = []
-        result += [m for b in self.bulks for m in b.output()]
-        result += [m for t in self.topics for m in t.output()]
-        result += self.current.output()
-        return result
+        return [r.output for r in self._rendered_items()]
+
+    def output_text(self, human_label="user", ai_label="ai"):
+        self.trim_embeds(self._get_max_embeds())
+        return "\n".join(r.text(ai_label, human_label) for r in self._rendered_items())
+
+    def _rendered_items(self) -> list[_Rendered]:
+        items: list[_Rendered] = []
+        for bulk in self.bulks:
+            items += bulk._rendered_items()
+        for topic in self.topics:
+            items += topic._rendered_items()
+        items += self.current._rendered_items()
+        return items
 
     def messages_since(self, sequence: int) -> list[Message]:
         return [
@@ -451,56 +536,23 @@ class History(Record):
         embeds_count = 0
         removed = 0
 
-        for record in reversed(self.bulks + self.topics + [self.current]):
-            embeds_count, removed_now = self._trim_embeds_in_record(record, embeds_count, max_embeds)
-            removed += removed_now
+        # newest first; embed counts are cached per message revision, see _Rendered.embeds
+        for message in reversed(self.all_messages()):
+            if message.summary:
+                continue
+            embeds_in_message = message._render().embeds()
+            if embeds_in_message <= 0:
+                continue
+            embeds_count += embeds_in_message
+            if embeds_count > max_embeds:
+                message.set_summary("embedded data removed")
+                removed += embeds_in_message
 
         return removed
 
     def remove_all_embeds(self) -> int:
         return self.trim_embeds(0)
 
-    def _trim_embeds_in_record(
-        self, record: Record, embeds_count: int, max_embeds: int
-    ) -> tuple[int, int]:
-        if isinstance(record, Message):
-            if record.summary:
-                return embeds_count, 0
-
-            if not _is_raw_message(record.content):
-                return embeds_count, 0
-
-            raw_message = cast(dict[str, Any], record.content)
-            raw_content = raw_message.get("raw_content", [])
-            if not isinstance(raw_content, list):
-                return embeds_count, 0
-
-            embeds_in_message = sum(1 for item in raw_content if _is_embedded_data(item))
-            if embeds_in_message <= 0:
-                return embeds_count, 0
-
-            if embeds_count + embeds_in_message > max_embeds:
-                record.set_summary("embedded data removed")
-                return embeds_count + embeds_in_message, embeds_in_message
-
-            return embeds_count + embeds_in_message, 0
-
-        if isinstance(record, Topic):
-            removed = 0
-            for message in reversed(record.messages):
-                embeds_count, removed_now = self._trim_embeds_in_record(message, embeds_count, max_embeds)
-                removed += removed_now
-            return embeds_count, removed
-
-        if isinstance(record, Bulk):
-            removed = 0
-            for nested in reversed(record.records):
-                embeds_count, removed_now = self._trim_embeds_in_record(nested, embeds_count, max_embeds)
-                removed += removed_now
-            return embeds_count, removed
-
-        return embeds_count, 0
-
     @staticmethod
     def from_dict(data: dict, history: "History"):
         history.counter = data.get("counter", 0)
@@ -792,6 +844,29 @@ def _is_embedded_data(obj: object) -> bool:
     return isinstance(obj, Mapping) and obj.get("type") == "image_url"
 
 
+def _count_embeds(content: MessageContent) -> int:
+    if not _is_raw_message(content):
+        return 0
+    raw_content = cast(dict[str, Any], content).get("raw_content", [])
+    if not isinstance(raw_content, list):
+        return 0
+    return sum(1 for item in raw_content if _is_embedded_data(item))
+
+
+def _render_summary(summary: str, rendered: _Rendered | None) -> _Rendered:
+    if rendered is not None and rendered.output["content"] is summary:
+        return rendered
+    return _Rendered(OutputMessage(ai=False, content=summary))
+
+
+def _rendered_items(record: Record) -> list[_Rendered]:
+    if isinstance(record, (Topic, Bulk)):
+        return record._rendered_items()
+    if isinstance(record, Message):
+        return [record._render()]
+    return [_Rendered(out) for out in record.output()]
+
+
 def _messages_from_record(record: Record) -> list[Message]:
     if isinstance(record, Message):
         return [record]
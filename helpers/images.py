@@ -2,16 +2,31 @@ import base64
 import io
 import math
 import mimetypes
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote, urlparse
 
 from PIL import Image
 
+from helpers.dotenv import get_dotenv_int
 
-def prepare_content(content: Any) -> Any:
+
+# Encoded data URLs kept in memory; local images are re-sent with every LLM request
+DATA_URL_CACHE_MAX_BYTES = get_dotenv_int("A0_IMAGE_DATA_URL_CACHE_BYTES", 64 * 1024 * 1024)
+DOWNSCALE_QUALITY = 85
+
+_data_url_cache: OrderedDict[tuple, str] = OrderedDict()
+_data_url_cache_bytes = 0
+_data_url_cache_lock = threading.Lock()
+_data_url_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def prepare_content(content: Any, *, max_pixels: int = 0) -> Any:
+    """Inline local image refs as data URLs, downscaled to max_pixels when set (> 0)."""
     if isinstance(content, list):
-        return [prepare_content(item) for item in content]
+        return [prepare_content(item, max_pixels=max_pixels) for item in content]
     if not isinstance(content, dict):
         return content
 
@@ -20,13 +35,14 @@ def prepare_content(content: Any) -> Any:
         if isinstance(image_url, dict):
             url = str(image_url.get("url", "") or "").strip()
             if is_local_ref(url):
-                return {**content, "image_url": {**image_url, "url": to_data_url(url)}}
+                data_url = to_data_url(url, max_pixels=max_pixels)
+                return {**content, "image_url": {**image_url, "url": data_url}}
         elif isinstance(image_url, str):
             url = image_url.strip()
             if is_local_ref(url):
-                return {**content, "image_url": {"url": to_data_url(url)}}
+                return {**content, "image_url": {"url": to_data_url(url, max_pixels=max_pixels)}}
 
-    return {key: prepare_content(value) for key, value in content.items()}
+    return {key: prepare_content(value, max_pixels=max_pixels) for key, value in content.items()}
 
 
 def is_local_ref(url: str) -> bool:
@@ -38,13 +54,73 @@ def is_local_ref(url: str) -> bool:
     return lowered.startswith("file://") or url.startswith(("/", "./", "../", "~"))
 
 
-def to_data_url(url: str) -> str:
+def to_data_url(url: str, *, max_pixels: int = 0) -> str:
     path = resolve_ref(url)
     mime_type = mimetypes.guess_type(path.name)[0]
     if not mime_type or not mime_type.startswith("image/"):
         raise ValueError(f"Image attachment must have an image MIME type: {path}")
-    encoded = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return f"data:{mime_type};base64,{encoded}"
+
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size, max(0, max_pixels))
+    with _data_url_cache_lock:
+        cached = _data_url_cache.get(key)
+        if cached is not None:
+            _data_url_cache.move_to_end(key)
+            _data_url_cache_stats["hits"] += 1
+            return cached
+        _data_url_cache_stats["misses"] += 1
+
+    data = path.read_bytes()
+    if max_pixels > 0 and _exceeds_pixels(data, max_pixels):
+        data = compress_image(data, max_pixels=max_pixels, quality=DOWNSCALE_QUALITY)
+        mime_type = "image/jpeg"
+    encoded = base64.b64encode(data).decode("utf-8")
+    data_url = f"data:{mime_type};base64,{encoded}"
+    _cache_data_url(key, data_url)
+    return data_url
+
+
+def get_data_url_cache_stats() -> dict[str, int]:
+    with _data_url_cache_lock:
+        return {
+            **_data_url_cache_stats,
+            "entries": len(_data_url_cache),
+            "bytes": _data_url_cache_bytes,
+            "max_bytes": DATA_URL_CACHE_MAX_BYTES,
+        }
+
+
+def clear_data_url_cache() -> None:
+    global _data_url_cache_bytes
+    with _data_url_cache_lock:
+        _data_url_cache.clear()
+        _data_url_cache_bytes = 0
+        _data_url_cache_stats.update(hits=0, misses=0, evictions=0)
+
+
+def _cache_data_url(key: tuple, data_url: str) -> None:
+    global _data_url_cache_bytes
+    size = len(data_url)
+    if size > DATA_URL_CACHE_MAX_BYTES:
+        return
+    with _data_url_cache_lock:
+        previous = _data_url_cache.pop(key, None)
+        if previous is not None:
+            _data_url_cache_bytes -= len(previous)
+        _data_url_cache[key] = data_url
+        _data_url_cache_bytes += size
+        while _data_url_cache_bytes > DATA_URL_CACHE_MAX_BYTES:
+            _, evicted = _data_url_cache.popitem(last=False)
+            _data_url_cache_bytes -= len(evicted)
+            _data_url_cache_stats["evictions"] += 1
+
+
+def _exceeds_pixels(image_data: bytes, max_pixels: int) -> bool:
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:  # reads the header only
+            return img.width * img.height > max_pixels
+    except Exception:
+        return False
 
 
 def resolve_ref(url: str) -> Path:
@@ -95,7 +171,7 @@ def compress_image(image_data: bytes, *, max_pixels: int = 256_000, quality: int
         img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
     
     # convert to RGB if needed (for JPEG)
-    if img.mode in ('RGBA', 'P'):
+    if img.mode not in ('RGB', 'L'):
         img = img.convert('RGB')
     
     # save as JPEG with compression
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from helpers.dotenv import get_dotenv_int
+from helpers.print_style import PrintStyle
+
+
+# Jobs waiting for one worker thread before new submissions are rejected
+INFERENCE_QUEUE_LIMIT = get_dotenv_int("A0_INFERENCE_QUEUE_LIMIT", 16, minimum=1)
+# Model slots kept loaded per worker; the least recently used slot is unloaded first
+INFERENCE_MAX_RESIDENT_MODELS = get_dotenv_int("A0_INFERENCE_MAX_RESIDENT_MODELS", 2, minimum=1)
+
+
+class InferenceQueueFull(Exception):
+    pass
+
+
+@dataclass
+class _Job:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    slot: str | None
+    version: str
+    loader: Callable[[], Any] | None
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Resident:
+    version: str
+    model: Any
+
+
+class InferenceWorker:
+    """Runs blocking model work (load and inference) on one dedicated thread.
+
+    Jobs wait in a bounded queue and run one at a time, so the event loop only awaits
+    a future. Models live in named slots (one model per slot, e.g. "whisper"); asking
+    for a different version of a slot replaces its model, and at most max_resident
+    slots stay loaded. Cancelling the awaiting coroutine drops a job that has not
+    started yet; a running job finishes and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_queue: int = INFERENCE_QUEUE_LIMIT,
+        max_resident: int = INFERENCE_MAX_RESIDENT_MODELS,
+    ) -> None:
+        self.name = name
+        self.max_queue = max_queue
+        self.max_resident = max_resident
+        self._queue: queue.Queue[_Job | None] = queue.Queue()
+        self._models: OrderedDict[str, _Resident] = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loading: tuple[str, str] | None = None
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "rejected": 0,
+            "loads": 0,
+            "unloads": 0,
+            "max_queue_depth": 0,
+            "wait_seconds": 0.0,
+            "busy_seconds": 0.0,
+        }
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        slot: str | None = None,
+        version: str = "",
+        loader: Callable[[], Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run fn on the worker thread and await its result.
+
+        With a slot, the slot's model (loaded with loader when missing or of another
+        version) is passed as the first argument: fn(model, *args, **kwargs).
+        """
+        future = self.submit(fn, *args, slot=slot, version=version, loader=loader, **kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    async def load(self, slot: str, version: str, loader: Callable[[], Any]) -> None:
+        """Make the slot resident with the given version."""
+        await self.run(_noop_with_model, slot=slot, version=version, loader=loader)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        slot: str | None = None,
+        version: str = "",
+        loader: Callable[[], Any] | None = None,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        if slot is not None and loader is None:
+            raise ValueError("a model slot needs a loader")
+        job = _Job(fn, args, kwargs, slot, version, loader)
+        with self._lock:
+            depth = self._queue.qsize()
+            if depth >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise InferenceQueueFull(
+                    f"{self.name} inference queue is full ({depth} jobs waiting)"
+                )
+            self._stats["submitted"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], depth + 1)
+            self._ensure_thread()
+            self._queue.put(job)
+        return job.future
+
+    def is_loading(self, slot: str | None = None) -> bool:
+        loading = self._loading
+        return loading is not None and (slot is None or loading[0] == slot)
+
+    def resident_version(self, slot: str) -> str | None:
+        with self._lock:
+            resident = self._models.get(slot)
+            return resident.version if resident else None
+
+    def unload(self, slot: str) -> concurrent.futures.Future:
+        """Unload a slot on the worker thread (after the jobs queued before it)."""
+        return self.submit(self._unload, slot)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queue_depth"] = self._queue.qsize()
+            stats["resident"] = {slot: r.version for slot, r in self._models.items()}
+        stats["loading"] = "/".join(self._loading) if self._loading else None
+        stats["name"] = self.name
+        return stats
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._work, name=f"inference-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                with self._lock:
+                    self._stats["cancelled"] += 1
+                continue
+            started = time.monotonic()
+            result: Any = None
+            error: BaseException | None = None
+            try:
+                if job.slot is None:
+                    result = job.fn(*job.args, **job.kwargs)
+                else:
+                    model = self._model_for(job.slot, job.version, job.loader)  # type: ignore[arg-type]
+                    result = job.fn(model, *job.args, **job.kwargs)
+            except BaseException as e:
+                error = e
+            # metrics first, so an awaiting caller already sees its job counted
+            with self._lock:
+                self._stats["failed" if error else "completed"] += 1
+                self._stats["wait_seconds"] += started - job.enqueued_at
+                self._stats["busy_seconds"] += time.monotonic() - started
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    def _model_for(self, slot: str, version: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            resident = self._models.get(slot)
+            if resident is not None and resident.version == version:
+                self._models.move_to_end(slot)
+                return resident.model
+        # release the old version before loading the new one to keep peak memory low
+        self._unload(slot)
+        self._loading = (slot, version)
+        try:
+            model = loader()
+        finally:
+            self._loading = None
+        with self._lock:
+            self._models[slot] = _Resident(version, model)
+            self._stats["loads"] += 1
+            evicted = []
+            while len(self._models) > self.max_resident:
+                evicted.append(self._models.popitem(last=False)[0])
+            self._stats["unloads"] += len(evicted)
+        for name in evicted:
+            PrintStyle.standard(f"Inference ({self.name}): unloaded {name} model")
+        return model
+
+    def _unload(self, slot: str) -> None:
+        with self._lock:
+            if self._models.pop(slot, None) is not None:
+                self._stats["unloads"] += 1
+
+
+def _noop_with_model(model: Any) -> None:
+    return None
+
+
+_workers: dict[str, InferenceWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_inference_worker(name: str) -> InferenceWorker:
+    """Shared worker by name; plugins that should not run inference concurrently share one."""
+    with _workers_lock:
+        worker = _workers.get(name)
+        if worker is None:
+            worker = InferenceWorker(name)
+            _workers[name] = worker
+        return worker
+
+
+def inference_metrics() -> list[dict[str, Any]]:
+    with _workers_lock:
+        workers = list(_workers.values())
+    return [worker.metrics() for worker in workers]
@@ -0,0 +1,158 @@
+import asyncio
+from dataclasses import dataclass
+import importlib
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Awaitable, Callable
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    name: str
+    started_at: float  # time.monotonic()
+    seconds: float
+    trigger: str | None = None
+
+
+_timings: list[ImportTiming] = []
+_listeners: list[Callable[[ImportTiming], None]] = []
+_lock = threading.RLock()
+
+
+def timed_import(name: str, trigger: str | None = None) -> ModuleType:
+    """Import a module and record how long the first import took."""
+    module = sys.modules.get(name)
+    if module is not None and not isinstance(module, LazyModule):
+        return module
+
+    started_at = time.monotonic()
+    module = importlib.import_module(name)
+    record_timing(name, started_at, time.monotonic() - started_at, trigger)
+    return module
+
+
+def record_timing(
+    name: str, started_at: float, seconds: float, trigger: str | None = None
+) -> ImportTiming:
+    timing = ImportTiming(name, started_at, seconds, trigger)
+    with _lock:
+        _timings.append(timing)
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(timing)
+        except Exception:
+            pass
+    return timing
+
+
+def get_import_timings() -> list[ImportTiming]:
+    with _lock:
+        return list(_timings)
+
+
+def add_import_listener(listener: Callable[[ImportTiming], None]) -> None:
+    with _lock:
+        _listeners.append(listener)
+
+
+def remove_import_listener(listener: Callable[[ImportTiming], None]) -> None:
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+class LazyModule(ModuleType):
+    """Module placeholder that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, trigger: str | None = None) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_trigger"] = trigger
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = timed_import(self.__name__, self.__dict__["_lazy_trigger"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_module(name: str, trigger: str | None = None) -> Any:
+    """Return name as a module that is imported on first use.
+
+    Already imported modules are returned directly. trigger names the importer in timings.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name, trigger)
+
+
+def loaded_attr(module_name: str, name: str) -> Any:
+    """Return module_name.name if that module is already imported, else None.
+
+    For instance checks and lookups that are meaningless before the module was loaded
+    (no AgentContext can exist before the agent module is imported).
+    """
+    return getattr(sys.modules.get(module_name), name, None)
+
+
+def is_loaded(module: Any) -> bool:
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return True
+
+
+class LazyAsgiApp:
+    """ASGI app that builds the wrapped app on the first request.
+
+    The factory runs in a worker thread so its imports do not block the event loop.
+    before_load, when given, is awaited first (e.g. to wait for application initialization).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        before_load: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
+        self.name = name
+        self.factory = factory
+        self.before_load = before_load
+        self.app: Any = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Any:
+        with self._lock:
+            if self.app is None:
+                started_at = time.monotonic()
+                self.app = self.factory()
+                record_timing(self.name, started_at, time.monotonic() - started_at, "first request")
+            return self.app
+
+    async def __call__(self, scope, receive, send) -> None:
+        app = self.app
+        if app is None:
+            if self.before_load:
+                await self.before_load()
+            app = await asyncio.to_thread(self.load)
+        await app(scope, receive, send)
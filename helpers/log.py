@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import json
 import threading
@@ -216,6 +217,90 @@ class LogOutput:
     end: int
 
 
+class LogSubscription:
+    """Cursor into Log.updates that is woken when new updates arrive.
+
+    The log itself keeps every update, so a subscriber only holds its cursor and
+    one pending wake-up; a slow reader never accumulates a backlog here. Wake-ups
+    are delivered to the subscriber's event loop from whichever thread logs.
+    """
+
+    def __init__(self, log: "Log", cursor: int, loop: asyncio.AbstractEventLoop):
+        self.log = log
+        self.cursor = max(int(cursor or 0), 0)
+        self.guid = log.guid
+        self.reset = False  # set when the log was reset since the last read
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._wake_pending = False
+        self.closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of updates past the cursor."""
+        with self.log._lock:
+            if self.guid != self.log.guid:
+                return len(self.log.updates)
+            return max(len(self.log.updates) - self.cursor, 0)
+
+    def read(self, limit: int | None = None) -> LogOutput:
+        """Return items updated since the cursor (at most limit updates) and advance it."""
+        log = self.log
+        with log._lock:
+            if self.guid != log.guid:
+                self.guid = log.guid
+                self.cursor = 0
+                self.reset = True
+            end = len(log.updates)
+            if limit is not None and limit > 0:
+                end = min(self.cursor + limit, end)
+            output = log.output(start=min(self.cursor, end), end=end)
+            self.cursor = max(self.cursor, end)
+        return output
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait until there are updates past the cursor; False on timeout or close."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not self.closed:
+            self._event.clear()
+            with self.log._lock:
+                # re-arm under the lock so an update racing with this check is not lost
+                self._wake_pending = False
+                if self.pending:
+                    return True
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return not self.closed and self.pending > 0
+        return False
+
+    def close(self) -> None:
+        self.closed = True
+        self.log._unsubscribe(self)
+        self._notify()
+
+    def __enter__(self) -> "LogSubscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _notify(self) -> bool:
+        # called with the log lock held; one scheduled wake-up per subscriber at most
+        if self._wake_pending:
+            return True
+        self._wake_pending = True
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:  # subscriber loop closed
+            return False
+        return True
+
+
 class Log:
 
     def __init__(self):
@@ -224,6 +309,7 @@ class Log:
         self.guid: str = str(uuid.uuid4())
         self.updates: list[int] = []
         self.logs: list[LogItem] = []
+        self._subscribers: list[LogSubscription] = []
         self.progress: str = ""
         self.progress_no: int = 0
         self.progress_active: bool = False
@@ -339,6 +425,8 @@ class Log:
                 item.kvps.update(kwargs_out)
 
             self.updates.append(item.no)
+            if self._subscribers:
+                self._wake_subscribers()
 
             if item.heading and item.update_progress != "none":
                 if item.no >= self.progress_no:
@@ -414,8 +502,25 @@ class Log:
             self.guid = str(uuid.uuid4())
             self.updates = []
             self.logs = []
+            self._wake_subscribers()
         self.set_initial_progress()
 
+    def subscribe(self, cursor: int = 0) -> LogSubscription:
+        """Subscribe the running event loop to updates past cursor (a log output cursor)."""
+        subscription = LogSubscription(self, cursor, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: LogSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def _wake_subscribers(self) -> None:
+        with self._lock:
+            self._subscribers = [sub for sub in self._subscribers if sub._notify()]
+
     def _mask_recursive(self, obj: T) -> T:
         """Recursively mask secrets in nested objects."""
         try:
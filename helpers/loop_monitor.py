@@ -0,0 +1,326 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import os
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default))))
+    except (TypeError, ValueError):
+        return default
+
+
+PROBE_INTERVAL = 0.1  # seconds between heartbeat timers on every watched loop
+STALL_THRESHOLD = _env_float("A0_LOOP_STALL_MS", 250) / 1000  # heartbeat delay that counts as a stall
+MAX_STALLS = 200  # ring buffer size of captured stalls
+MAX_STACK_FRAMES = 12
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (attribution key, module, class name) - only checked when the module is already imported
+_ATTRIBUTION_TARGETS = (
+    ("extension", "helpers.extension", "Extension"),
+    ("tool", "helpers.tool", "Tool"),
+    ("handler", "helpers.api", "ApiHandler"),
+    ("handler", "helpers.ws", "WsHandler"),
+)
+
+
+@dataclass
+class LoopLag:
+    """Running lag statistics of one event loop, sampled by a periodic timer."""
+
+    samples: int = 0
+    last: float = 0.0
+    max: float = 0.0
+    total: float = 0.0
+
+    def record(self, lag: float) -> None:
+        lag = max(0.0, lag)
+        self.samples += 1
+        self.last = lag
+        self.total += lag
+        if lag > self.max:
+            self.max = lag
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "lag_ms": round(self.last * 1000, 3),
+            "lag_max_ms": round(self.max * 1000, 3),
+            "lag_avg_ms": round(self.total / self.samples * 1000, 3) if self.samples else 0.0,
+        }
+
+
+@dataclass
+class LoopStall:
+    """One period during which a watched loop did not run its heartbeat timer."""
+
+    loop: str
+    started_at: float
+    duration: float
+    extension: str | None = None
+    tool: str | None = None
+    handler: str | None = None
+    location: str | None = None
+    stack: list[str] = field(default_factory=list)
+    finished: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "loop": self.loop,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "finished": self.finished,
+            "extension": self.extension,
+            "tool": self.tool,
+            "handler": self.handler,
+            "location": self.location,
+            "stack": list(self.stack),
+        }
+
+
+class LoopWatch:
+    def __init__(self, monitor: "LoopMonitor", name: str, loop: asyncio.AbstractEventLoop, thread_id: int):
+        self.monitor = monitor
+        self.name = name
+        self.loop = loop
+        self.thread_id = thread_id
+        self.lag = LoopLag()
+        self.due: float | None = None  # time.monotonic() when the pending heartbeat should fire
+        self.stall: LoopStall | None = None
+        self.closed = False
+
+    def start(self) -> None:
+        self.loop.call_soon_threadsafe(self._schedule)
+
+    def _schedule(self) -> None:
+        if self.closed or self.loop.is_closed():
+            return
+        # monotonic clock instead of loop.time() so the sampler thread can compare without the loop
+        self.due = time.monotonic() + PROBE_INTERVAL
+        self.loop.call_later(PROBE_INTERVAL, self._probe)
+
+    def _probe(self) -> None:
+        due = self.due
+        if due is not None:
+            # a timer fires late by exactly as long as the loop was blocked by other callbacks
+            lag = time.monotonic() - due
+            self.lag.record(lag)
+            self.monitor._finish_stall(self, lag)
+        self._schedule()
+
+
+class LoopMonitor:
+    """Heartbeat lag sampler with slow-callback capture for a set of asyncio loops.
+
+    Every watched loop runs a cheap heartbeat timer. A background sampler thread checks
+    whether any heartbeat is overdue by more than STALL_THRESHOLD; if so it captures the
+    stack of the loop's thread and attributes the stall to the innermost Extension, Tool,
+    and API/WebSocket handler found on it. Stalls are kept in a ring buffer.
+    """
+
+    def __init__(self, max_stalls: int = MAX_STALLS):
+        self._watches: dict[str, LoopWatch] = {}
+        self._stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self._lock = threading.Lock()
+        self._sampler: threading.Thread | None = None
+
+    def watch(
+        self,
+        name: str,
+        loop: asyncio.AbstractEventLoop | None = None,
+        thread_id: int | None = None,
+    ) -> LoopWatch:
+        loop = loop or asyncio.get_running_loop()
+        watch = LoopWatch(self, name, loop, thread_id or threading.get_ident())
+        with self._lock:
+            previous = self._watches.get(name)
+            if previous:
+                previous.closed = True
+            self._watches[name] = watch
+        watch.start()
+        self._ensure_sampler()
+        return watch
+
+    def unwatch(self, name: str, watch: LoopWatch | None = None) -> None:
+        with self._lock:
+            current = self._watches.get(name)
+            if current and (watch is None or current is watch):
+                current.closed = True
+                del self._watches[name]
+
+    def get_watch(self, name: str) -> LoopWatch | None:
+        with self._lock:
+            return self._watches.get(name)
+
+    def loops(self) -> list[dict[str, Any]]:
+        with self._lock:
+            watches = list(self._watches.values())
+        return [
+            {
+                "loop": watch.name,
+                "running": watch.loop.is_running(),
+                "stalled": watch.stall is not None,
+                **watch.lag.snapshot(),
+            }
+            for watch in watches
+        ]
+
+    def stalls(self, limit: int | None = None, loop: str | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            stalls = [stall for stall in self._stalls if loop is None or stall.loop == loop]
+        stalls.reverse()  # newest first
+        if limit is not None:
+            stalls = stalls[: max(0, limit)]
+        return [stall.to_dict() for stall in stalls]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stalls.clear()
+
+    def report(self, limit: int | None = None, loop: str | None = None) -> dict[str, Any]:
+        return {
+            "threshold_ms": round(STALL_THRESHOLD * 1000, 3),
+            "probe_interval_ms": round(PROBE_INTERVAL * 1000, 3),
+            "loops": self.loops(),
+            "stalls": self.stalls(limit=limit, loop=loop),
+        }
+
+    def _ensure_sampler(self) -> None:
+        with self._lock:
+            if self._sampler and self._sampler.is_alive():
+                return
+            self._sampler = threading.Thread(
+                target=self._sample_forever, daemon=True, name="LoopMonitor"
+            )
+            self._sampler.start()
+
+    def _sample_forever(self) -> None:
+        while True:
+            time.sleep(min(PROBE_INTERVAL, STALL_THRESHOLD) / 2 or 0.01)
+            self.sample()
+
+    def sample(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            overdue = [
+                (watch, watch.due)
+                for watch in self._watches.values()
+                if watch.due is not None
+                and watch.stall is None
+                and now - watch.due >= STALL_THRESHOLD
+            ]
+        for watch, due in overdue:
+            frame = sys._current_frames().get(watch.thread_id)
+            stall = LoopStall(
+                loop=watch.name,
+                started_at=time.time() - (now - due),
+                duration=now - due,
+                **_attribute(frame),
+            )
+            with self._lock:
+                # the heartbeat may have fired meanwhile, then there is nothing to report
+                if watch.due != due or watch.stall is not None or watch.closed:
+                    continue
+                watch.stall = stall
+                self._stalls.append(stall)
+
+    def _finish_stall(self, watch: LoopWatch, lag: float) -> None:
+        with self._lock:
+            watch.due = None
+            stall = watch.stall
+            if stall is None:
+                return
+            watch.stall = None
+            stall.duration = max(stall.duration, lag)
+            stall.finished = True
+
+
+def _attribute(frame: FrameType | None) -> dict[str, Any]:
+    result: dict[str, Any] = {"stack": []}
+    targets = []
+    for key, module_name, class_name in _ATTRIBUTION_TARGETS:
+        module = sys.modules.get(module_name)
+        cls = getattr(module, class_name, None) if module else None
+        if isinstance(cls, type):
+            targets.append((key, cls))
+
+    # walk innermost to outermost so the closest extension/tool/handler wins
+    while frame is not None:
+        code = frame.f_code
+        formatted = _format_frame(frame)
+        if len(result["stack"]) < MAX_STACK_FRAMES:
+            result["stack"].append(formatted)
+        if "location" not in result and _is_project_file(code.co_filename):
+            result["location"] = formatted
+        # f_locals of another thread's running frame is unsafe to read; the
+        # defining class is found from the code's qualified name instead
+        owner = _defining_class(frame.f_globals.get("__name__"), code.co_qualname)
+        if owner is not None:
+            for key, cls in targets:
+                if key not in result and owner is not cls and issubclass(owner, cls):
+                    result[key] = f"{owner.__module__}.{owner.__qualname__}"
+        frame = frame.f_back
+    return result
+
+
+def _defining_class(module_name: str | None, qualname: str) -> type | None:
+    parts = qualname.split(".")
+    if len(parts) < 2 or not module_name:
+        return None
+    owner: Any = sys.modules.get(module_name)
+    for part in parts[:-1]:
+        if owner is None or part == "<locals>":
+            return None  # classes defined inside functions cannot be resolved
+        owner = getattr(owner, part, None)
+    return owner if isinstance(owner, type) else None
+
+
+def _format_frame(frame: FrameType) -> str:
+    path = frame.f_code.co_filename
+    if _is_project_file(path):
+        path = os.path.relpath(path, _PROJECT_ROOT)
+    return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def _is_project_file(path: str) -> bool:
+    return path.startswith(_PROJECT_ROOT) and "site-packages" not in path
+
+
+_monitor = LoopMonitor()
+
+
+def get_monitor() -> LoopMonitor:
+    return _monitor
+
+
+def watch_loop(
+    name: str,
+    loop: asyncio.AbstractEventLoop | None = None,
+    thread_id: int | None = None,
+) -> LoopWatch:
+    """Start lag sampling and stall capture for loop (default: the running loop on this thread)."""
+    return _monitor.watch(name, loop, thread_id)
+
+
+def unwatch_loop(name: str, watch: LoopWatch | None = None) -> None:
+    _monitor.unwatch(name, watch)
+
+
+def get_report(limit: int | None = None, loop: str | None = None) -> dict[str, Any]:
+    return _monitor.report(limit=limit, loop=loop)
+
+
+def get_stalls(limit: int | None = None, loop: str | None = None) -> list[dict[str, Any]]:
+    return _monitor.stalls(limit=limit, loop=loop)
+
+
+def clear_stalls() -> None:
+    _monitor.clear()
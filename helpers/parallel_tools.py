@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field, replace
@@ -30,7 +31,6 @@ CHILD_PARALLEL_TOOL_NAME_KEY = "parallel_tool_name"
 
 DEFAULT_MAX_CALLS = 8
 DEFAULT_TIMEOUT_SECONDS = 300
-POLL_INTERVAL_SECONDS = 0.5
 DISALLOWED_PARALLEL_TOOLS = {"document_query"}
 
 TERMINAL_STATES = {"success", "error", "cancelled", "timeout"}
@@ -63,6 +63,7 @@ class ParallelJob:
     log_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     log_item: "LogItem | None" = field(default=None, repr=False)
     deferred_task: DeferredTask | None = field(default=None, repr=False)
+    waiters: set["_JobWaiter"] = field(default_factory=set, repr=False, compare=False)
 
     def elapsed(self) -> float:
         end = self.completed_at or time.time()
@@ -70,6 +71,27 @@ class ParallelJob:
         return max(0.0, end - start)
 
 
+class _JobWaiter:
+    """Wakes one await_parallel_jobs call when any of its jobs finishes.
+
+    Jobs finish on the background loop while the waiter sits on the parent chat's loop,
+    so the wake-up is handed over with call_soon_threadsafe.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+
+    def wake(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            pass  # waiter loop already closed
+
+
+_waiters_lock = threading.Lock()
+
+
 def extract_tool_calls(args: dict[str, Any]) -> Any:
     for key in ("tool_calls", "calls", "items"):
         if key in args:
@@ -219,6 +241,8 @@ async def start_parallel_jobs(
             task = DeferredTask(thread_name=THREAD_BACKGROUND)
             job.deferred_task = task
             task.start_task(_run_parallel_job, context.id, job.id)
+            # a job killed before its body runs never reaches _finish_job
+            task.add_done_callback(lambda _task, job=job: _wake_waiters(job))
         except Exception as exc:
             _finish_job(job, "error", error=str(exc))
 
@@ -239,22 +263,44 @@ async def await_parallel_jobs(
     deadline = time.time() + timeout
     known_job_ids = set(job_ids)
     wait_timed_out_job_ids: set[str] = set()
-    while True:
-        await refresh_parallel_jobs(agent)
-        jobs = [_jobs_for_context(agent.context).get(job_id) for job_id in job_ids]
-        missing = [job_id for job_id, job in zip(job_ids, jobs) if job is None]
-        if missing:
-            raise ValueError(f"Unknown parallel job id(s): {', '.join(missing)}")
-
-        active = [job for job in jobs if job and job.state not in TERMINAL_STATES]
-        if not wait or not active:
-            break
-
-        if time.time() >= deadline:
-            wait_timed_out_job_ids = {job.id for job in active}
-            break
+    waiter = _JobWaiter() if wait else None
+    watched: list[ParallelJob] = []
+    try:
+        while True:
+            if waiter:
+                # cleared before the state check so a finish after it is never missed
+                waiter.event.clear()
+            await refresh_parallel_jobs(agent)
+            jobs = [_jobs_for_context(agent.context).get(job_id) for job_id in job_ids]
+            missing = [job_id for job_id, job in zip(job_ids, jobs) if job is None]
+            if missing:
+                raise ValueError(f"Unknown parallel job id(s): {', '.join(missing)}")
+
+            if waiter:
+                with _waiters_lock:
+                    for job in jobs:
+                        if job and waiter not in job.waiters:
+                            job.waiters.add(waiter)
+                            watched.append(job)
+
+            active = [job for job in jobs if job and job.state not in TERMINAL_STATES]
+            if not waiter or not active:
+                break
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                wait_timed_out_job_ids = {job.id for job in active}
+                break
 
-        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            try:
+                await asyncio.wait_for(waiter.event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if waiter:
+            with _waiters_lock:
+                for job in watched:
+                    job.waiters.discard(waiter)
 
     snapshots = []
     for job_id in job_ids:
@@ -624,6 +670,14 @@ def _finish_job(
     if error is not None:
         job.error = error
     _update_parallel_child_log(job)
+    _wake_waiters(job)
+
+
+def _wake_waiters(job: ParallelJob) -> None:
+    with _waiters_lock:
+        waiters = list(job.waiters)
+    for waiter in waiters:
+        waiter.wake()
 
 
 async def _remove_context(context_id: str | None) -> None:
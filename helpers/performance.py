@@ -1,6 +1,8 @@
 import functools
 import inspect
-from pyinstrument import Profiler
+
+from helpers import loop_monitor
+
 
 def trace_performance(*, show_all=False, color=True, unicode=True):
     """
@@ -8,6 +10,8 @@ def trace_performance(*, show_all=False, color=True, unicode=True):
 
     Works with both synchronous and asynchronous functions.
     """
+    # pyinstrument is a dev dependency, only needed once something is actually traced
+    from pyinstrument import Profiler
 
     def decorator(func):
         is_coro = inspect.iscoroutinefunction(func)
@@ -48,4 +52,48 @@ def trace_performance(*, show_all=False, color=True, unicode=True):
 
         return async_wrapper if is_coro else sync_wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def coerce_non_negative_int(value, default=0):
+    """Convert a request value such as a stall limit to an int; invalid or negative values give default."""
+    try:
+        as_int = int(value)
+    except (TypeError, ValueError):
+        return default
+    return as_int if as_int >= 0 else default
+
+
+def loop_stall_report(limit=20, loop=None):
+    """
+    Format event loop lag metrics and the most recent captured stalls as plain text.
+
+    Stalls come from helpers.loop_monitor, which records them offline in a ring buffer.
+    """
+    report = loop_monitor.get_report(limit=limit, loop=loop)
+    lines = [
+        f"=== Event loops (stall threshold {report['threshold_ms']:.0f} ms) ===",
+    ]
+    for entry in report["loops"]:
+        lines.append(
+            f"{entry['loop']}: lag {entry['lag_ms']:.1f} ms, "
+            f"avg {entry['lag_avg_ms']:.1f} ms, max {entry['lag_max_ms']:.1f} ms"
+            + (" [STALLED]" if entry["stalled"] else "")
+        )
+    lines.append(f"=== Recent stalls ({len(report['stalls'])}) ===")
+    for stall in report["stalls"]:
+        culprit = ", ".join(
+            f"{key}={stall[key]}" for key in ("extension", "tool", "handler") if stall[key]
+        )
+        lines.append(
+            f"{stall['loop']}: {stall['duration_ms']:.0f} ms"
+            + ("" if stall["finished"] else " (ongoing)")
+            + (f" {culprit}" if culprit else "")
+            + (f" at {stall['location']}" if stall["location"] else "")
+        )
+    return "\n".join(lines)
+
+
+def print_loop_stalls(limit=20, loop=None):
+    """Print loop_stall_report() to stdout."""
+    print(loop_stall_report(limit=limit, loop=loop))
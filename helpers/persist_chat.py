@@ -1,9 +1,13 @@
 import json
 import os
 import tempfile
+import threading
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from agent import Agent, AgentConfig, AgentContext, AgentContextType
@@ -18,6 +22,27 @@ CHATS_FOLDER = "usr/chats"
 LOG_SIZE = 1000
 CHAT_FILE_NAME = "chat.json"
 SAVED_CHAT_CONTEXT_DATA_KEY = "_persist_chat_saved"
+# chat.json stores these bulky fields last, so the header before them can be read alone
+BODY_KEYS = ("agents", "log")
+HEADER_READ_SIZE = 16 * 1024
+HEADER_READ_WORKERS = 16
+
+
+@dataclass
+class _SavedBody:
+    """Where the saved agents and log start in a chat file, for chats not opened yet."""
+
+    offset: int  # bytes before the first BODY_KEYS key
+    stamp: tuple[int, int]  # size and mtime of the file the offset belongs to
+    profile: str
+    streaming_agent: int
+
+
+# saving a chat nobody opened copies its agents and log from the file as they are
+_saved_bodies: dict[str, _SavedBody] = {}
+_saved_bodies_lock = threading.Lock()
+# chats whose file failed to load on first use; their file is left as it is
+_unloadable_chats: set[str] = set()
 
 
 def _fallback_datetime_iso() -> str:
@@ -52,11 +77,14 @@ def save_tmp_chat(context: AgentContext):
     # Skip saving BACKGROUND contexts as they should be ephemeral
     if context.type == AgentContextType.BACKGROUND:
         return
+    if context.id in _unloadable_chats:
+        return
 
     path = _get_chat_file_path(context.id)
-    data = _serialize_context(context)
-    js = _safe_json_serialize(data, ensure_ascii=False)
-    _write_atomic(path, js)
+    if not _save_with_saved_body(context, path):
+        data = _serialize_context(context)
+        js = _safe_json_serialize(data, ensure_ascii=False)
+        _write_atomic(path, js)
     mark_chat_saved(context)
 
 
@@ -70,7 +98,11 @@ def save_tmp_chats():
 
 
 def load_tmp_chats():
-    """Load all contexts from the chats folder"""
+    """Load all contexts from the chats folder
+
+    Only chat headers are read here, in parallel; agents, history and log of
+    each chat are hydrated when its context is first used.
+    """
     _convert_v080_chats()
     folders = files.list_files(CHATS_FOLDER, "*")
     json_files = []
@@ -79,12 +111,32 @@ def load_tmp_chats():
         if files.exists(chat_file):
             json_files.append(chat_file)
 
+    def read_header(file: str):
+        try:
+            return _read_chat_header(file)
+        except Exception as e:
+            return e
+
+    if len(json_files) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(HEADER_READ_WORKERS, len(json_files)),
+            thread_name_prefix="chat-headers",
+        ) as pool:
+            headers = list(pool.map(read_header, json_files))
+    else:
+        headers = [read_header(file) for file in json_files]
+
     ctxids = []
-    for file in json_files:
+    configs: dict[str, AgentConfig] = {}  # one config per profile, settings do not change meanwhile
+    for file, header in zip(json_files, headers):
         try:
-            js = files.read_file(file)
-            data = json.loads(js)
-            ctx = _deserialize_context(data)
+            if isinstance(header, Exception):
+                raise header
+            header, saved_body = header
+            ctx = _deserialize_lazy_context(header, file, configs)
+            if saved_body is not None:
+                with _saved_bodies_lock:
+                    _saved_bodies[ctx.id] = saved_body
             mark_chat_saved(ctx)
             ctxids.append(ctx.id)
         except Exception as e:
@@ -96,6 +148,117 @@ def _get_chat_file_path(ctxid: str):
     return files.get_abs_path(CHATS_FOLDER, ctxid, CHAT_FILE_NAME)
 
 
+def _read_chat_header(path: str) -> tuple[dict[str, Any], _SavedBody | None]:
+    """Top-level fields of a chat file saved before its agents and log, and where those start.
+
+    Chats saved by older versions store agents and log first and are parsed whole.
+    """
+    decoder = json.JSONDecoder()
+    # newline="" keeps character offsets in step with the bytes on disk
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        stamp = _file_stamp(os.fstat(handle.fileno()))
+        text = handle.read(HEADER_READ_SIZE)
+        while True:
+            header, complete, body_start = _parse_chat_header(decoder, text)
+            if complete:
+                saved_body = None
+                if body_start is not None:
+                    saved_body = _SavedBody(
+                        offset=len(text[:body_start].encode("utf-8")),
+                        stamp=stamp,
+                        profile=str(header.get("agent_profile") or ""),  # type: ignore[union-attr]
+                        streaming_agent=header.get("streaming_agent", 0),  # type: ignore[union-attr]
+                    )
+                return header, saved_body  # type: ignore[return-value]
+            if header is not None:
+                text += handle.read()
+                break
+            chunk = handle.read(len(text))
+            if not chunk:
+                break
+            text += chunk
+    return json.loads(text), None
+
+
+def _parse_chat_header(
+    decoder: json.JSONDecoder, text: str
+) -> tuple[dict[str, Any] | None, bool, int | None]:
+    """(header, True, body start) when parsed, (partial, False, _) for old field order,
+    (None, False, None) when text is cut short. The body start is None without agents and log."""
+    header: dict[str, Any] = {}
+    try:
+        idx = _skip_whitespace(text, 0)
+        if text[idx] != "{":
+            raise ValueError("chat file is not a JSON object")
+        idx = _skip_whitespace(text, idx + 1)
+        while text[idx] != "}":
+            key_start = idx
+            key, idx = decoder.raw_decode(text, idx)
+            if key in BODY_KEYS:
+                return header, "output_data" in header, key_start
+            idx = _skip_whitespace(text, idx)
+            if text[idx] != ":":
+                raise ValueError("malformed chat file")
+            value, idx = decoder.raw_decode(text, _skip_whitespace(text, idx + 1))
+            header[key] = value
+            idx = _skip_whitespace(text, idx)
+            if text[idx] == ",":
+                idx = _skip_whitespace(text, idx + 1)
+        return header, True, None
+    except (ValueError, IndexError):
+        # cut short (or malformed, reported by the final json.loads)
+        return None, False, None
+
+
+def _file_stamp(stat: os.stat_result) -> tuple[int, int]:
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _save_with_saved_body(context: AgentContext, path: str) -> bool:
+    """Write a new header in front of the saved agents and log of a chat not opened yet.
+
+    The body is copied as bytes, without parsing it. False when the context was
+    hydrated, or the file changed since its body was located.
+    """
+    with _saved_bodies_lock:
+        saved = _saved_bodies.get(context.id)
+        if saved is None:
+            return False
+        if context.hydrated:
+            del _saved_bodies[context.id]
+            return False
+        try:
+            with open(path, "rb") as handle:
+                if _file_stamp(os.fstat(handle.fileno())) != saved.stamp:
+                    del _saved_bodies[context.id]
+                    return False
+                handle.seek(saved.offset)
+                body = handle.read().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            del _saved_bodies[context.id]
+            return False
+
+        header = _safe_json_serialize(
+            _serialize_context_header(
+                context,
+                str(getattr(context.config, "profile", None) or saved.profile),
+                saved.streaming_agent,
+            ),
+            ensure_ascii=False,
+        )
+        prefix = header[:-1] + ", "
+        _write_atomic(path, prefix + body)
+        saved.offset = len(prefix.encode("utf-8"))
+        saved.stamp = _file_stamp(os.stat(path))
+        return True
+
+
+def _skip_whitespace(text: str, idx: int) -> int:
+    while text[idx] in " \t\n\r":
+        idx += 1
+    return idx
+
+
 def _write_atomic(path: str, content: str) -> None:
     directory = os.path.dirname(path)
     os.makedirs(directory, exist_ok=True)
@@ -161,6 +324,8 @@ def export_json_chat(context: AgentContext):
 
 def remove_chat(ctxid):
     """Remove a chat or task context"""
+    with _saved_bodies_lock:
+        _saved_bodies.pop(ctxid, None)
     _delete_provider_responses_for_chat(ctxid)
     path = get_chat_folder_path(ctxid)
     files.delete_dir(path)
@@ -186,7 +351,19 @@ def _serialize_context(context: AgentContext):
         agents.append(_serialize_agent(agent))
         agent = agent.data.get(Agent.DATA_NAME_SUBORDINATE, None)
 
+    return {
+        **_serialize_context_header(
+            context,
+            profile,
+            context.streaming_agent.number if context.streaming_agent else 0,
+        ),
+        # keep these last, see BODY_KEYS
+        "agents": agents,
+        "log": _serialize_log(context.log),
+    }
+
 
+def _serialize_context_header(context: AgentContext, profile: str, streaming_agent: int):
     data = {k: v for k, v in context.data.items() if not k.startswith("_")}
     output_data = {k: v for k, v in context.output_data.items() if not k.startswith("_")}
 
@@ -204,12 +381,8 @@ def _serialize_context(context: AgentContext):
             if context.last_message
             else _fallback_datetime_iso()
         ),
-        "agents": agents,
-        "streaming_agent": (
-            context.streaming_agent.number if context.streaming_agent else 0
-        ),
+        "streaming_agent": streaming_agent,
         "agent_profile": profile,
-        "log": _serialize_log(context.log),
         "data": data,
         "output_data": output_data,
     }
@@ -244,12 +417,46 @@ def _serialize_log(log: Log):
 
 
 def _deserialize_context(data):
+    config = _deserialize_context_config(data)
+    log = _deserialize_log(data.get("log", None))
+    context = _create_context(data, config, log=log)
+    _deserialize_context_agents(context, data)
+    return context
+
+
+def _deserialize_lazy_context(
+    header: dict[str, Any], path: str, configs: dict[str, AgentConfig]
+) -> AgentContext:
+    profile = str(header.get("agent_profile") or "")
+    config = configs.get(profile)
+    if config is None:
+        config = configs[profile] = _deserialize_context_config(header)
+    return _create_context(header, config, hydrator=partial(_hydrate_context, path=path))
+
+
+def _hydrate_context(context: AgentContext, path: str) -> None:
+    try:
+        data = json.loads(files.read_file(path))
+        log = _deserialize_log(data.get("log", None))
+        log.context = context
+        context.log = log
+        _deserialize_context_agents(context, data)
+    except Exception:
+        # AgentContext.hydrate() logs the error and drops the context
+        _unloadable_chats.add(context.id)
+        with _saved_bodies_lock:
+            _saved_bodies.pop(context.id, None)
+        raise
+
+
+def _deserialize_context_config(data: dict[str, Any]) -> AgentConfig:
     profile = data.get("agent_profile")
     override_settings = {"agent_profile": profile} if profile else None
-    config = initialize_agent(override_settings=override_settings)
-    log = _deserialize_log(data.get("log", None))
+    return initialize_agent(override_settings=override_settings)
+
 
-    context = AgentContext(
+def _create_context(data: dict[str, Any], config: AgentConfig, **kwargs) -> AgentContext:
+    return AgentContext(
         config=config,
         id=data.get("id", None),  # get new id
         name=data.get("name", None),
@@ -260,14 +467,17 @@ def _deserialize_context(data):
         last_message=(
             _parse_persisted_datetime(data.get("last_message"))
         ),
-        log=log,
         paused=False,
         data=data.get("data", {}),
         output_data=data.get("output_data", {}),
         # agent0=agent0,
         # streaming_agent=straming_agent,
+        **kwargs,
     )
 
+
+def _deserialize_context_agents(context: AgentContext, data: dict[str, Any]) -> None:
+    config = context.config
     agents = data.get("agents", [])
     agent0 = _deserialize_agents(agents, config, context)
     streaming_agent = agent0
@@ -278,8 +488,6 @@ def _deserialize_context(data):
     context.config = agent0.config
     context.streaming_agent = streaming_agent
 
-    return context
-
 
 def _deserialize_agent_config(
     agent_data: dict[str, Any], fallback_config: AgentConfig
@@ -65,6 +65,9 @@ HOOKS_CACHE_AREA = "plugin_hooks(plugins)"
 PLUGINS_LIST_CACHE_AREA = "plugins_list(plugins)"
 ENABLED_PLUGINS_LIST_CACHE_AREA = "enabled_plugins(plugins)"
 ENABLED_PLUGINS_PATHS_CACHE_AREA = "enabled_plugins_paths(plugins)"
+# keyed by profile and project (and subpaths), so bound them
+cache.set_area_policy(ENABLED_PLUGINS_LIST_CACHE_AREA, max_entries=256)
+cache.set_area_policy(ENABLED_PLUGINS_PATHS_CACHE_AREA, max_entries=2048)
 
 
 _last_frontend_reload_notification_at = 0.0
@@ -201,6 +204,7 @@ def clear_plugin_cache(plugin_names: list[str] | None = None):
     areas = ["*(plugins)*", "*(extensions)*", "*(api)*"]
     for area in areas:
         cache.clear(area)
+    extension.clear_function_points()
 
     from helpers.ws_manager import send_data
 
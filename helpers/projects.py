@@ -1,9 +1,13 @@
 import os
+import threading
 from typing import NotRequired, TypedDict, TYPE_CHECKING, cast
 
-from helpers import files, dirty_json, persist_chat, file_tree, extension
+from helpers import cache, files, dirty_json, file_tree, extension, lazy_import
 from helpers.print_style import PrintStyle
 
+# persist_chat imports the agent runtime; only chat-bound project functions need it
+persist_chat = lazy_import.lazy_module("helpers.persist_chat", "helpers.projects")
+
 
 if TYPE_CHECKING:
     from agent import AgentContext
@@ -26,6 +30,15 @@ DEFAULT_MCP_SERVERS_CONFIG = '{\n    "mcpServers": {}\n}'
 
 CONTEXT_DATA_KEY_PROJECT = "project"
 
+# prompt vars and AGENTS.md chains per project, one cache area per project
+INSTRUCTIONS_CACHE_AREA = "project_instructions"
+# the caches below are only used once register_watchdogs() keeps them fresh
+_watchdogs_registered = False
+
+# in-memory file trees per project, kept current by a watchdog on the project folder
+_file_structure_models: dict[str, file_tree.FileTreeModel] = {}
+_file_structure_lock = threading.Lock()
+
 
 class FileStructureInjectionSettings(TypedDict):
     enabled: bool
@@ -101,6 +114,8 @@ def validate_project_name(name: str | None) -> str:
 def delete_project(name: str):
     abs_path = files.get_abs_path(PROJECTS_PARENT_DIR, name)
     files.delete_dir(abs_path)
+    clear_instructions_cache(name)
+    _drop_file_structure_model(name)
     deactivate_project_in_chats(name)
     return name
 
@@ -322,6 +337,7 @@ def save_project_header(name: str, data: BasicProjectData):
     )
 
     files.write_file(abs_path, header)
+    clear_instructions_cache(name)
 
 
 @extension.extensible
@@ -470,6 +486,10 @@ def deactivate_project_in_chats(name: str):
 
 
 def build_system_prompt_vars(name: str):
+    return dict(_cached_instructions(name, "prompt_vars", lambda: _build_system_prompt_vars(name)))
+
+
+def _build_system_prompt_vars(name: str):
     project_data = load_basic_project_data(name)
     main_instructions = project_data.get("instructions", "") or ""
     include_agents_md = project_data.get("include_agents_md", True)
@@ -495,28 +515,8 @@ def build_system_prompt_vars(name: str):
 
 
 def get_agents_md_chain(root: str, target: str) -> list[tuple[str, str]]:
-    root_real = os.path.realpath(files.fix_dev_path(root))
-    target_real = os.path.realpath(files.fix_dev_path(target))
-    if os.path.isfile(target_real):
-        target_real = os.path.dirname(target_real)
-
-    if files.is_in_dir(target_real, root_real):
-        dirs = []
-        cursor = target_real
-        while True:
-            dirs.append(cursor)
-            if cursor == root_real:
-                break
-            parent = os.path.dirname(cursor)
-            if parent == cursor:
-                break
-            cursor = parent
-        dirs.reverse()
-    else:
-        dirs = [root_real]
-
     chain = []
-    for dir_path in dirs:
+    for dir_path in _agents_md_dirs(root, target):
         for filename in PROJECT_AGENTS_MD_FILES:
             matches = files.read_text_files_in_dir(dir_path, pattern=filename)
             if filename not in matches:
@@ -527,6 +527,28 @@ def get_agents_md_chain(root: str, target: str) -> list[tuple[str, str]]:
 
 
 def build_agents_md_protocol(name: str, target: str | None = None) -> str:
+    entries = _cached_instructions(
+        name,
+        ("agents_md", target),
+        lambda: _agents_md_protocol_entries(name, target),
+        stamp=_outside_agents_md_stamp(name, target),
+    )
+    if not entries:
+        return ""
+
+    instructions = []
+    for path, content in entries:
+        instructions.append(
+            f"### path: {files.normalize_a0_path(path)}\n\n{content.strip()}"
+        )
+    return files.read_prompt_file(
+        "agent.protocol.projects.agents_md.md",
+        _directories=["prompts"],
+        agents_md_instructions="\n\n".join(instructions),
+    ).strip()
+
+
+def _agents_md_protocol_entries(name: str, target: str | None) -> list[tuple[str, str]]:
     project_folder = get_project_folder(name)
     project_agents_md = get_project_agents_md_instruction_file(name)
     project_agents_md_path = (
@@ -534,7 +556,7 @@ def build_agents_md_protocol(name: str, target: str | None = None) -> str:
         if project_agents_md
         else ""
     )
-    entries = [
+    return [
         (path, content)
         for path, content in get_agents_md_chain(
             files.get_abs_path(""),
@@ -542,19 +564,95 @@ def build_agents_md_protocol(name: str, target: str | None = None) -> str:
         )
         if os.path.realpath(path) != project_agents_md_path
     ]
-    if not entries:
-        return ""
 
-    instructions = []
-    for path, content in entries:
-        instructions.append(
-            f"### path: {files.normalize_a0_path(path)}\n\n{content.strip()}"
-        )
-    return files.read_prompt_file(
-        "agent.protocol.projects.agents_md.md",
-        _directories=["prompts"],
-        agents_md_instructions="\n\n".join(instructions),
-    ).strip()
+
+def _agents_md_dirs(root: str, target: str) -> list[str]:
+    root_real = os.path.realpath(files.fix_dev_path(root))
+    target_real = os.path.realpath(files.fix_dev_path(target))
+    if os.path.isfile(target_real):
+        target_real = os.path.dirname(target_real)
+
+    if not files.is_in_dir(target_real, root_real):
+        return [root_real]
+    dirs = []
+    cursor = target_real
+    while True:
+        dirs.append(cursor)
+        if cursor == root_real:
+            break
+        parent = os.path.dirname(cursor)
+        if parent == cursor:
+            break
+        cursor = parent
+    dirs.reverse()
+    return dirs
+
+
+def _outside_agents_md_stamp(name: str, target: str | None) -> tuple:
+    """AGENTS.md files above the project folder are not watched; stat them instead."""
+    project_real = os.path.realpath(get_project_folder(name))
+    stamp = []
+    for dir_path in _agents_md_dirs(files.get_abs_path(""), target or project_real):
+        if files.is_in_dir(dir_path, project_real):
+            continue
+        for filename in PROJECT_AGENTS_MD_FILES:
+            try:
+                stat = os.stat(os.path.join(dir_path, filename))
+            except OSError:
+                continue
+            stamp.append((dir_path, filename, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _cached_instructions(name: str, key: object, build, stamp: object = None):
+    if not _watchdogs_registered:
+        return build()
+    area = f"{INSTRUCTIONS_CACHE_AREA}:{name}"
+    cached = cache.get(area, key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = build()
+    cache.add(area, key, (stamp, value))
+    return value
+
+
+def clear_instructions_cache(name: str | None = None):
+    if name is None:
+        cache.clear(f"{INSTRUCTIONS_CACHE_AREA}:*")
+    else:
+        cache.clear(f"{INSTRUCTIONS_CACHE_AREA}:{name}")
+
+
+def register_watchdogs():
+    from helpers import watchdog
+
+    global _watchdogs_registered
+    parent_folder = get_projects_parent_folder()
+
+    def on_instructions_change(items: list[watchdog.WatchItem]):
+        names = set()
+        for path, _event in items:
+            relative = os.path.relpath(path, parent_folder)
+            names.add(relative.split(os.sep, 1)[0])
+        for name in names:
+            clear_instructions_cache(name if name not in {".", ".."} else None)
+        PrintStyle.debug("Project instructions watchdog triggered:", sorted(names))
+
+    # AGENTS.md at any depth (build_agents_md_protocol may target subfolders),
+    # the project header and the instructions folder in .a0proj
+    watchdog.add_watchdog(
+        id="project_instructions",
+        roots=[parent_folder],
+        patterns=[
+            *PROJECT_AGENTS_MD_FILES,
+            f"{PROJECT_META_DIR}/{PROJECT_HEADER_FILE}",
+            f"{PROJECT_META_DIR}/{PROJECT_INSTRUCTIONS_DIR}",
+            f"{PROJECT_META_DIR}/{PROJECT_INSTRUCTIONS_DIR}/*",
+        ],
+        handler=on_instructions_change,
+    )
+    clear_instructions_cache()
+    _watchdogs_registered = True
 
 
 def get_additional_instructions_files(name: str):
@@ -716,21 +814,62 @@ def get_knowledge_files_count(name: str):
 
 def get_file_structure(name: str, basic_data: BasicProjectData|None=None) -> str:
     project_folder = get_project_folder(name)
+    saved_settings = basic_data is None
     if basic_data is None:
         basic_data = load_basic_project_data(name)
 
-    tree = str(file_tree.file_tree(
-        project_folder,
-        max_depth=basic_data["file_structure"]["max_depth"],
-        max_files=basic_data["file_structure"]["max_files"],
-        max_folders=basic_data["file_structure"]["max_folders"],
-        max_lines=basic_data["file_structure"]["max_lines"],
-        ignore=basic_data["file_structure"]["gitignore"],
-        output_mode=file_tree.OUTPUT_MODE_STRING
-    ))
+    settings = basic_data["file_structure"]
+    limits = dict(
+        max_depth=settings["max_depth"],
+        max_files=settings["max_files"],
+        max_folders=settings["max_folders"],
+        max_lines=settings["max_lines"],
+        output_mode=file_tree.OUTPUT_MODE_STRING,
+    )
+    model = _get_file_structure_model(name, settings["gitignore"], create=saved_settings)
+    if model is not None:
+        tree = str(model.render(**limits))
+    else:
+        # previews of unsaved settings render once without replacing the model
+        tree = str(file_tree.file_tree(project_folder, ignore=settings["gitignore"], **limits))
 
     # empty?
     if "\n" not in tree:
         tree += "\n # Empty"
 
     return tree
+
+
+def _get_file_structure_model(name: str, gitignore: str, create: bool) -> file_tree.FileTreeModel | None:
+    from helpers import watchdog
+
+    with _file_structure_lock:
+        model = _file_structure_models.get(name)
+        if model is not None and model.ignore == gitignore:
+            return model
+        # without the watchdogs nothing would ever invalidate the model
+        if not create or not _watchdogs_registered:
+            return None
+
+        model = file_tree.FileTreeModel(get_project_folder(name), ignore=gitignore)
+
+        def on_project_change(items: list[watchdog.WatchItem]):
+            for path, _event in items:
+                model.invalidate(path)
+
+        # default ignore patterns skip bytecode churn, which the project gitignore hides anyway
+        watchdog.add_watchdog(
+            id=f"project_file_structure:{name}",
+            roots=[model.abs_root],
+            handler=on_project_change,
+        )
+        _file_structure_models[name] = model
+        return model
+
+
+def _drop_file_structure_model(name: str):
+    from helpers import watchdog
+
+    with _file_structure_lock:
+        if _file_structure_models.pop(name, None) is not None:
+            watchdog.remove_watchdog(f"project_file_structure:{name}")
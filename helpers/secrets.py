@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, List, Literal, Set, Callable, Tuple, TYPE_CHECKING
 from dotenv.parser import parse_stream
 from helpers.errors import RepairableException
-from helpers import dotenv, files
+from helpers import dotenv, files, lazy_import
 from helpers.extension import extensible
 
 if TYPE_CHECKING:
@@ -528,8 +528,8 @@ def get_secrets_manager(context: "AgentContext|None" = None) -> SecretsManager:
 
     # use AgentContext from contextvars if no context provided
     if not context:
-        from agent import AgentContext
-        context = AgentContext.current()
+        AgentContext = lazy_import.loaded_attr("agent", "AgentContext")
+        context = AgentContext.current() if AgentContext else None
 
     # merged with project secrets if active
     if context:
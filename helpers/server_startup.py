@@ -12,10 +12,14 @@ import urllib.request
 
 import uvicorn
 
-from helpers import process
+from helpers import lazy_import, loop_monitor, process
 from helpers.print_style import PrintStyle
 
 
+# reference point for time-to-first-byte; run_ui imports this module before anything heavy
+PROCESS_STARTED_AT = time.monotonic()
+
+
 def _env_int(name: str, default: int, minimum: int = 0) -> int:
     try:
         return max(minimum, int(os.getenv(name, str(default))))
@@ -30,11 +34,61 @@ def _env_float(name: str, default: float, minimum: float = 0.0) -> float:
         return default
 
 
+class InitializationGate:
+    """Open unless begin() was called; requests that need loaded chats await it.
+
+    run_ui closes it before the server starts listening and opens it once chats are loaded,
+    so static assets and the health probe are served while initialization continues.
+    """
+
+    def __init__(self) -> None:
+        self._open = True
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        with self._lock:
+            self._open = False
+
+    def finish(self) -> None:
+        with self._lock:
+            self._open = True
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, future)
+            except RuntimeError:
+                pass  # waiter loop already closed
+
+    def is_open(self) -> bool:
+        return self._open
+
+    async def wait(self) -> None:
+        if self._open:
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._open:
+                return
+            self._waiters.append((loop, future))
+        await future
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+initialization = InitializationGate()
+
+
 @dataclass(frozen=True)
 class StartupConfig:
     timeout_seconds: int
     max_attempts: int
     retry_delay_seconds: float
+    ttfb_budget_seconds: float = 30.0
 
     @classmethod
     def from_env(cls) -> "StartupConfig":
@@ -44,6 +98,9 @@ class StartupConfig:
             retry_delay_seconds=_env_float(
                 "A0_STARTUP_RETRY_DELAY_SECONDS", 2.0, minimum=0.0
             ),
+            ttfb_budget_seconds=_env_float(
+                "A0_STARTUP_TTFB_BUDGET_SECONDS", 30.0, minimum=0.0
+            ),
         )
 
 
@@ -52,6 +109,7 @@ class StartupStageRecord:
     name: str
     timestamp: float
     detail: str | None = None
+    duration: float | None = None
 
 
 class StartupMonitor:
@@ -63,6 +121,7 @@ class StartupMonitor:
         attempt: int,
         max_attempts: int,
         timeout_seconds: int,
+        ttfb_budget_seconds: float | None = None,
     ) -> None:
         self.bind_host = bind_host
         self.probe_host = probe_host
@@ -70,6 +129,8 @@ class StartupMonitor:
         self.attempt = attempt
         self.max_attempts = max_attempts
         self.timeout_seconds = timeout_seconds
+        self.ttfb_budget_seconds = ttfb_budget_seconds
+        self.ttfb_seconds: float | None = None
         self.start_time = time.monotonic()
         self._stage = "created"
         self._stage_detail: str | None = None
@@ -81,6 +142,11 @@ class StartupMonitor:
         self._lock = threading.RLock()
         self._server: uvicorn.Server | None = None
         self._watchdog_thread: threading.Thread | None = None
+        self._durations: dict[str, float] = {}
+        # imports that ran before this attempt (e.g. at module load) belong to its budget too
+        for timing in lazy_import.get_import_timings():
+            self._record_import(timing)
+        lazy_import.add_import_listener(self._on_import)
 
     def _prefix(self) -> str:
         return f"[startup attempt {self.attempt}/{self.max_attempts}]"
@@ -100,6 +166,7 @@ class StartupMonitor:
     @contextmanager
     def stage(self, stage: str, detail: str | None = None) -> Iterator[None]:
         self.mark(f"{stage}.start", detail)
+        started_at = time.monotonic()
         try:
             yield
         except BaseException as e:
@@ -108,14 +175,51 @@ class StartupMonitor:
             raise
         else:
             self.mark(f"{stage}.done", detail)
+        finally:
+            with self._lock:
+                self._durations[stage] = time.monotonic() - started_at
+
+    def record_stage(
+        self, stage: str, started_at: float, duration: float, detail: str | None = None
+    ) -> None:
+        """Record a stage measured elsewhere, e.g. a module import."""
+        with self._lock:
+            self._durations[stage] = duration
+            self._history.append(
+                StartupStageRecord(stage, started_at + duration, detail, duration)
+            )
+
+    def _record_import(self, timing: lazy_import.ImportTiming) -> None:
+        self.record_stage(
+            f"import.{timing.name}", timing.started_at, timing.seconds, timing.trigger
+        )
+
+    def _on_import(self, timing: lazy_import.ImportTiming) -> None:
+        if not self._ready.is_set():
+            self._record_import(timing)
+
+    def stage_durations(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._durations)
+
+    def report(self) -> dict[str, object]:
+        durations = self.stage_durations()
+        return {
+            "ttfb_seconds": self.ttfb_seconds,
+            "ttfb_budget_seconds": self.ttfb_budget_seconds,
+            "stages": dict(sorted(durations.items(), key=lambda item: -item[1])),
+        }
 
     def lifespan(self):
         @asynccontextmanager
         async def _lifespan(_app):
             self.mark("starlette.lifespan.startup")
+            # the uvicorn loop serves every HTTP and Socket.IO request, watch it for stalls
+            watch = loop_monitor.watch_loop("uvicorn")
             try:
                 yield
             finally:
+                loop_monitor.unwatch_loop("uvicorn", watch)
                 self.mark("starlette.lifespan.shutdown")
 
         return _lifespan
@@ -137,15 +241,32 @@ class StartupMonitor:
     def mark_ready(self, source: str = "health_check") -> None:
         if self._ready.is_set():
             return
+        self.ttfb_seconds = time.monotonic() - PROCESS_STARTED_AT
         self.mark("ready", source)
         self._ready.set()
         self._stop.set()
+        lazy_import.remove_import_listener(self._on_import)
+        self._report_ttfb()
+
+    def _report_ttfb(self) -> None:
+        slowest = sorted(self.stage_durations().items(), key=lambda item: -item[1])[:5]
+        summary = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest)
+        message = (
+            f"{self._prefix()} first byte {self.ttfb_seconds:.2f}s after process start"
+            + (f"; slowest stages: {summary}" if summary else "")
+        )
+        budget = self.ttfb_budget_seconds
+        if budget and self.ttfb_seconds is not None and self.ttfb_seconds > budget:
+            PrintStyle.warning(f"{message} (over the {budget:.1f}s budget)")
+        else:
+            PrintStyle.debug(message)
 
     def is_ready(self) -> bool:
         return self._ready.is_set()
 
     def close(self) -> None:
         self._stop.set()
+        lazy_import.remove_import_listener(self._on_import)
 
     def stop_event(self) -> threading.Event:
         return self._stop
@@ -245,6 +366,7 @@ def run_uvicorn_with_retries(
     log_level: str = "info",
     ws: str = "wsproto",
     startup_config: StartupConfig | None = None,
+    on_ready: Callable[[], None] | None = None,
 ) -> None:
     startup_config = startup_config or StartupConfig.from_env()
     health_host = get_health_probe_host(host)
@@ -261,6 +383,7 @@ def run_uvicorn_with_retries(
             attempt=attempt,
             max_attempts=startup_config.max_attempts,
             timeout_seconds=startup_config.timeout_seconds,
+            ttfb_budget_seconds=startup_config.ttfb_budget_seconds,
         )
         try:
             if _run_server_attempt(
@@ -273,6 +396,7 @@ def run_uvicorn_with_retries(
                 access_log=access_log,
                 log_level=log_level,
                 ws=ws,
+                on_ready=on_ready,
             ):
                 return
         except BaseException as e:
@@ -318,6 +442,7 @@ def _run_server_attempt(
     access_log: bool,
     log_level: str,
     ws: str,
+    on_ready: Callable[[], None] | None = None,
 ) -> bool:
     startup_monitor.start_watchdog()
     try:
@@ -342,7 +467,7 @@ def _run_server_attempt(
         startup_monitor.mark("health.thread.start")
         threading.Thread(
             target=wait_for_health,
-            args=(health_host, port, startup_monitor),
+            args=(health_host, port, startup_monitor, on_ready),
             daemon=True,
             name=f"StartupHealth-{startup_monitor.attempt}",
         ).start()
@@ -365,7 +490,12 @@ def _run_server_attempt(
         flush_callback("server_exit")
 
 
-def wait_for_health(host: str, port: int, startup_monitor: StartupMonitor) -> None:
+def wait_for_health(
+    host: str,
+    port: int,
+    startup_monitor: StartupMonitor,
+    on_ready: Callable[[], None] | None = None,
+) -> None:
     url = f"http://{host}:{port}/api/health"
     while not startup_monitor.stop_event().is_set():
         try:
@@ -373,10 +503,15 @@ def wait_for_health(host: str, port: int, startup_monitor: StartupMonitor) -> No
                 if resp.status == 200:
                     startup_monitor.mark_ready("health_probe")
                     PrintStyle().print("Agent Zero is running.")
-                    return
+                    break
         except Exception:
             pass
-        startup_monitor.stop_event().wait(1)
+        startup_monitor.stop_event().wait(0.1)
+    else:
+        return
+
+    if on_ready:
+        on_ready()
 
 
 class _UvicornServerWrapper:
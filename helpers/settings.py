@@ -6,9 +6,8 @@ import re
 import subprocess
 from typing import Any, Literal, TypedDict, cast, TypeVar
 
-import models
 import pytz  # type: ignore
-from helpers import runtime, defer, git, subagents
+from helpers import runtime, defer, git, subagents, lazy_import
 from . import files, dotenv
 from helpers.print_style import PrintStyle
 from helpers.providers import get_providers, FieldOption as ProvidersFO
@@ -16,6 +15,9 @@ from helpers.secrets import get_default_secrets_manager
 from helpers import dirty_json
 from helpers.notification import NotificationManager, NotificationType, NotificationPriority
 
+# models pulls in litellm and langchain; only get_api_key is needed here, so load on first use
+models = lazy_import.lazy_module("models", "helpers.settings")
+
 
 T = TypeVar('T')
 
@@ -354,14 +356,22 @@ def convert_in(settings: Settings) -> Settings:
 
 
 def get_settings() -> Settings:
+    norm = normalize_settings(get_stored_settings())
+    _load_sensitive_settings(norm)
+    return norm
+
+
+def get_stored_settings() -> Settings:
+    """Settings as stored, before normalization and without loading sensitive values.
+
+    Cheap enough for change detection; use get_settings() for the values themselves.
+    """
     global _settings
     if not _settings:
         _settings = _read_settings_file()
     if not _settings:
         _settings = get_default_settings()
-    norm = normalize_settings(_settings)
-    _load_sensitive_settings(norm)
-    return norm
+    return _settings
 
 
 def reload_settings() -> Settings:
@@ -614,6 +624,8 @@ def _apply_settings(previous: Settings | None, browser_timezone: str | None = No
                 getattr(ctx.config, "profile", "") or _settings["agent_profile"]
             )
             ctx.config = initialize_agent(override_settings={"agent_profile": profile})
+            if not ctx.hydrated:
+                continue  # its agents are created from ctx.config when hydrated
             agent = ctx.agent0
             while agent:
                 agent_profile = str(
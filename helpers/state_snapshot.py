@@ -130,7 +130,9 @@ def _apply_agent_profile_metadata(
     ctx: AgentContext,
     labels: dict[str, str],
 ) -> None:
-    agent_config = getattr(getattr(ctx, "agent0", None), "config", None)
+    # agent0 of a chat that was not opened yet would be hydrated just for its profile
+    agent0 = getattr(ctx, "agent0", None) if getattr(ctx, "hydrated", True) else None
+    agent_config = getattr(agent0, "config", None)
     profile = str(
         getattr(agent_config, "profile", None)
         or getattr(getattr(ctx, "config", None), "profile", "")
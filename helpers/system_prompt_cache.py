@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, TypeVar
+
+from helpers import cache, files, subagents
+from helpers.print_style import PrintStyle
+
+if TYPE_CHECKING:
+    from agent import Agent
+
+
+T = TypeVar("T")
+
+# "(plugins)" areas are also cleared whenever a plugin changes
+CACHE_AREA = "system_prompt_sections(plugins)"
+# Sections not requested for this long are dropped (contexts come and go)
+STALE_SECONDS = 60 * 60
+cache.set_area_policy(CACHE_AREA, max_entries=1024)
+# .a0proj/agents/<profile>/prompts/<file> and plugin prompts sit a few levels deep
+PROJECT_META_WATCH_DEPTH = 6
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def fingerprint(*inputs: Any) -> str:
+    payload = json.dumps(inputs, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def dirs_state(dirs: Iterable[str]) -> list[tuple[str, int]]:
+    """Directory mtimes: catch files added, removed or replaced (editors save by rename)."""
+    state = []
+    for path in dirs:
+        try:
+            state.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            state.append((path, 0))
+    return state
+
+
+def settings_fingerprint() -> str:
+    # stored settings: normalizing them loads API keys through extensions, which
+    # costs more than the prompt sections themselves
+    from helpers.settings import get_stored_settings
+
+    return fingerprint(get_stored_settings())
+
+
+async def cached_section(
+    agent: "Agent",
+    section: str,
+    inputs: Iterable[Any],
+    build: Callable[[], Awaitable[T]],
+) -> T:
+    """Return the section built for the same inputs before, or build and remember it.
+
+    Every section implicitly depends on the agent's prompt directories (profile,
+    project and enabled plugins) and their mtimes. Edits inside them are picked up
+    by the watchdog from register_watchdogs(), which clears the whole area.
+    """
+    prompt_dirs = subagents.get_paths(agent, "prompts")
+    key = (section, fingerprint(dirs_state(prompt_dirs), list(inputs)))
+
+    cached = cache.get(CACHE_AREA, key)
+    if cached is not None:
+        _count("hits")
+        return cached
+
+    _count("misses")
+    value = await build()
+    cache.trim_cache(CACHE_AREA, STALE_SECONDS)
+    cache.add(CACHE_AREA, key, value)
+    return value
+
+
+def clear() -> None:
+    cache.clear(CACHE_AREA)
+
+
+def get_stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def register_watchdogs() -> None:
+    from helpers import projects, watchdog
+
+    def prompts_changed(items: list[watchdog.WatchItem]):
+        clear()
+        PrintStyle.debug("System prompt watchdog triggered:", items)
+
+    # prompt templates, their variable plugins, and skill descriptions
+    watchdog.add_watchdog(
+        id="system_prompt_base",
+        roots=[
+            files.get_abs_path("prompts"),
+            files.get_abs_path(files.USER_DIR, "prompts"),
+            files.get_abs_path("skills"),
+            files.get_abs_path(files.USER_DIR, "skills"),
+        ],
+        patterns=["*.md", "*.py"],
+        handler=prompts_changed,
+    )
+
+    watchdog.add_watchdog(
+        id="system_prompt_agents",
+        roots=[
+            files.get_abs_path(files.AGENTS_DIR),
+            files.get_abs_path(files.USER_DIR, files.AGENTS_DIR),
+            files.get_abs_path(files.PLUGINS_DIR),
+            files.get_abs_path(files.USER_DIR, files.PLUGINS_DIR),
+        ],
+        # profile and plugin prompts, skills and agent.yaml files
+        patterns=["*.md", "agent.yaml"],
+        handler=prompts_changed,
+    )
+
+    watchdog.add_watchdog(
+        id="system_prompt_projects",
+        roots=[files.get_abs_path(projects.PROJECTS_PARENT_DIR)],
+        patterns=_project_prompt_patterns(),
+        handler=prompts_changed,
+    )
+
+
+def _project_prompt_patterns() -> list[str]:
+    """Project files prompts read: .a0proj metadata and AGENTS.md files.
+
+    Other files agents write in project workdirs (READMEs, package.json, ...) must
+    not clear the cache. Watch patterns match path suffixes and "**" is not
+    recursive there, so every .a0proj depth is listed.
+    """
+    from helpers import projects
+
+    meta = [
+        f"*/{projects.PROJECT_META_DIR}/{'*/' * depth}*.{ext}"
+        for depth in range(PROJECT_META_WATCH_DEPTH)
+        for ext in ("md", "json", "yaml")
+    ]
+    return [*meta, *projects.PROJECT_AGENTS_MD_FILES]
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
@@ -26,12 +26,12 @@ from uvicorn.middleware.wsgi import WSGIMiddleware
 from werkzeug.wrappers.request import Request as WerkzeugRequest
 import socketio  # type: ignore[import-untyped]
 
-from helpers import dotenv, fasta2a_server, files, git, login, mcp_server, runtime
+from helpers import dotenv, files, git, lazy_import, login, runtime
 from helpers.api import get_safe_next_url, register_api_route, requires_auth
 from helpers.extension import extensible
 from helpers.files import get_abs_path
 from helpers.print_style import PrintStyle
-from helpers.server_startup import StartupMonitor
+from helpers.server_startup import StartupMonitor, initialization
 from helpers import settings as settings_helper
 from helpers.ws import register_ws_namespace, validate_ws_origin
 from helpers.ws_manager import WsManager, set_shared_ws_manager
@@ -53,6 +53,25 @@ def _positive_int_env(name: str, default: int) -> int:
     return value if value > 0 else default
 
 
+def _load_mcp_proxy():
+    mcp_server = lazy_import.timed_import("helpers.mcp_server", "first /mcp request")
+    return mcp_server.DynamicMcpProxy.get_instance()
+
+
+def _load_a2a_proxy():
+    fasta2a_server = lazy_import.timed_import("helpers.fasta2a_server", "first /a2a request")
+    return fasta2a_server.DynamicA2AProxy.get_instance()
+
+
+def create_mcp_app() -> lazy_import.LazyAsgiApp:
+    # the MCP and A2A stacks import the agent runtime, so they load on first use
+    return lazy_import.LazyAsgiApp("mcp.proxy", _load_mcp_proxy, initialization.wait)
+
+
+def create_a2a_app() -> lazy_import.LazyAsgiApp:
+    return lazy_import.LazyAsgiApp("a2a.proxy", _load_a2a_proxy, initialization.wait)
+
+
 def configure_process_environment() -> None:
     logging.getLogger().setLevel(logging.WARNING)
     os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -191,10 +210,10 @@ class UiServerRuntime:
             wsgi_app = WSGIMiddleware(self.webapp)
 
         with startup_monitor.stage("mcp.proxy.init"):
-            mcp_app = mcp_server.DynamicMcpProxy.get_instance()
+            mcp_app = create_mcp_app()
 
         with startup_monitor.stage("a2a.proxy.init"):
-            a2a_app = fasta2a_server.DynamicA2AProxy.get_instance()
+            a2a_app = create_a2a_app()
 
         with startup_monitor.stage("starlette.app.create"):
             starlette_app = Starlette(
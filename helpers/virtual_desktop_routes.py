@@ -410,16 +410,16 @@ def install_route_hooks() -> None:
         from starlette.routing import Mount
         from uvicorn.middleware.wsgi import WSGIMiddleware
 
-        from helpers import fasta2a_server, mcp_server
+        from helpers.ui_server import create_a2a_app, create_mcp_app
 
         with startup_monitor.stage("wsgi.middleware.create"):
             wsgi_app = WSGIMiddleware(self.webapp)
 
         with startup_monitor.stage("mcp.proxy.init"):
-            mcp_app = mcp_server.DynamicMcpProxy.get_instance()
+            mcp_app = create_mcp_app()
 
         with startup_monitor.stage("a2a.proxy.init"):
-            a2a_app = fasta2a_server.DynamicA2AProxy.get_instance()
+            a2a_app = create_a2a_app()
 
         with startup_monitor.stage("starlette.app.create"):
             starlette_app = Starlette(
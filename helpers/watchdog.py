@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import concurrent.futures
+import heapq
 import os
+import re
 import threading
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import PurePosixPath
 from typing import Any, Callable, Iterable, Literal, cast
 from watchdog.observers import Observer as _WatchdogObserver
 
+from helpers.print_style import PrintStyle
+
 
 class _DispatchHandler:
     def __init__(self, registry: "_WatchRegistry", scheduled_root: str):
@@ -30,6 +36,11 @@ _DEFAULT_IGNORE_PATTERNS = [
     "**/*.pyc",
     "**/*.pyo",
 ]
+# Threads running debounced handlers, so a slow handler (a project rescan) does not
+# hold up the other watches; batches of one watch still run one at a time
+HANDLER_WORKERS = 4
+_GLOB_CLASS = re.compile(r"\[[^\]]*\]")
+_GLOB_WILDCARDS = re.compile(r"[*?]+")
 _VALID_EVENTS: frozenset[WatchEvent] = frozenset(["create", "modify", "delete", "move"])
 _EVENT_ALIASES: dict[str, WatchEvent] = {
     "create": "create",
@@ -47,7 +58,6 @@ _EVENT_ALIASES: dict[str, WatchEvent] = {
 class _Watch:
     id: str
     root: str
-    root_with_sep: str
     patterns: list[str]
     ignore_patterns: list[str]
     matcher: PatternMatcher
@@ -59,7 +69,36 @@ class _Watch:
 @dataclass
 class _PendingBatch:
     items_by_path: dict[str, WatchItem]
-    timer: threading.Timer | None = None
+    deadline: float = 0.0
+
+
+@dataclass
+class _WatchIndex:
+    """Watches by root path components; a lookup walks only the event path's ancestors."""
+
+    children: dict[str, "_WatchIndex"] = field(default_factory=dict)
+    watches: list[_Watch] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, watches: Iterable[_Watch]) -> "_WatchIndex":
+        index = cls()
+        for watch in watches:
+            node = index
+            for part in _path_parts(watch.root):
+                node = node.children.setdefault(part, cls())
+            node.watches.append(watch)
+        return index
+
+    def lookup(self, path: str) -> list[_Watch]:
+        found = list(self.watches)
+        node = self
+        for part in _path_parts(path):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            found.extend(node.watches)
+        return found
 
 
 class _WatchRegistry:
@@ -70,6 +109,19 @@ class _WatchRegistry:
         self._watch_ids_by_group: dict[str, set[str]] = {}
         self._scheduled_roots: set[str] = set()
         self._pending_batches: dict[str, _PendingBatch] = {}
+        # replaced, never mutated, so dispatch reads it without the lock
+        self._index = _WatchIndex()
+        # (deadline, watch id) of pending batches, drained by one flusher thread
+        self._flush_queue: list[tuple[float, str]] = []
+        self._flush_wakeup = threading.Condition(self._lock)
+        self._flusher: threading.Thread | None = None
+        self._handler_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=HANDLER_WORKERS, thread_name_prefix="watchdog-handler"
+        )
+        # watches whose handler is running; their next batch waits for it
+        self._running_handlers: set[str] = set()
+        self._stats_lock = threading.Lock()
+        self._stats = {"events": 0, "dropped": 0, "matched": 0, "batched": 0, "flushed": 0}
 
     def add(
         self,
@@ -94,7 +146,6 @@ class _WatchRegistry:
             watch_id: _Watch(
                 id=watch_id,
                 root=normalized_root,
-                root_with_sep=normalized_root + os.sep,
                 patterns=normalized_patterns,
                 ignore_patterns=normalized_ignore_patterns,
                 matcher=_compile_matcher(
@@ -112,11 +163,10 @@ class _WatchRegistry:
             previous_watch_ids = self._watch_ids_by_group.pop(id, set())
             for watch_id in previous_watch_ids:
                 self._watches.pop(watch_id, None)
-                pending = self._pending_batches.pop(watch_id, None)
-                if pending and pending.timer:
-                    pending.timer.cancel()
+                self._pending_batches.pop(watch_id, None)
             self._watches.update(watches)
             self._watch_ids_by_group[id] = set(watches)
+            self._index = _WatchIndex.build(self._watches.values())
             self._refresh_observer()
 
     def remove(self, id: str) -> bool:
@@ -125,10 +175,9 @@ class _WatchRegistry:
             removed = False
             for watch_id in watch_ids:
                 removed = self._watches.pop(watch_id, None) is not None or removed
-                pending = self._pending_batches.pop(watch_id, None)
-                if pending and pending.timer:
-                    pending.timer.cancel()
+                self._pending_batches.pop(watch_id, None)
             if removed:
+                self._index = _WatchIndex.build(self._watches.values())
                 self._refresh_observer()
             return removed
 
@@ -136,12 +185,9 @@ class _WatchRegistry:
         with self._lock:
             self._watches.clear()
             self._watch_ids_by_group.clear()
-            pending_batches = list(self._pending_batches.values())
+            self._index = _WatchIndex()
             self._pending_batches.clear()
             self._refresh_observer()
-        for pending in pending_batches:
-            if pending.timer:
-                pending.timer.cancel()
 
     def start(self) -> None:
         with self._lock:
@@ -157,10 +203,10 @@ class _WatchRegistry:
         self._stop_observer()
 
     def dispatch(self, scheduled_root: str, event: Any) -> None:
+        self._count("events")
         event_type = _map_event_type(str(getattr(event, "event_type", "")))
-        if event_type is None:
-            return
-        if bool(getattr(event, "is_synthetic", False)):
+        if event_type is None or bool(getattr(event, "is_synthetic", False)):
+            self._count("dropped")
             return
         paths: list[str] = []
         src_path = getattr(event, "src_path", None)
@@ -169,19 +215,34 @@ class _WatchRegistry:
         dest_path = getattr(event, "dest_path", None)
         if event_type == "move" and isinstance(dest_path, str) and dest_path:
             paths.append(os.path.abspath(dest_path))
-        with self._lock:
-            watches = list(self._watches.values())
+        index = self._index
+        matched = 0
         for path in paths:
             if not _is_same_or_nested(path, scheduled_root):
                 continue
-            for watch in watches:
+            for watch in index.lookup(path):
                 if event_type not in watch.events:
                     continue
-                if not _is_under_watch(path, watch):
-                    continue
                 if not watch.matcher(path):
                     continue
+                matched += 1
                 self._queue_event(watch, path, event_type)
+        if matched:
+            self._count("matched", matched)
+        else:
+            self._count("dropped")
+
+    def get_stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self._lock:
+            stats["watches"] = len(self._watches)
+            stats["pending_batches"] = len(self._pending_batches)
+        return stats
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += amount
 
     def _ensure_watchdog_available(self) -> None:
         return None
@@ -189,35 +250,77 @@ class _WatchRegistry:
     def _queue_event(self, watch: _Watch, path: str, event_type: WatchEvent) -> None:
         item: WatchItem = [path, event_type]
         if watch.debounce <= 0:
+            self._count("flushed")
             watch.handler([item])
             return
         with self._lock:
+            deadline = time.monotonic() + watch.debounce
             pending = self._pending_batches.get(watch.id)
             if pending is None:
                 pending = _PendingBatch(items_by_path={})
                 self._pending_batches[watch.id] = pending
+                heapq.heappush(self._flush_queue, (deadline, watch.id))
+                self._ensure_flusher()
+                self._flush_wakeup.notify()
+            else:
+                # the flusher re-queues the batch when it finds a later deadline
+                self._count("batched")
             pending.items_by_path[path] = item
-            timer = pending.timer
-            if timer:
-                timer.cancel()
-            pending.timer = threading.Timer(watch.debounce, self._flush_watch_batch, args=(watch.id,))
-            pending.timer.daemon = True
-            pending.timer.start()
-
-    def _flush_watch_batch(self, watch_id: str) -> None:
-        items: list[WatchItem] = []
-        handler: WatchHandler | None = None
-        with self._lock:
-            watch = self._watches.get(watch_id)
-            pending = self._pending_batches.pop(watch_id, None)
-            if watch is None or pending is None:
-                return
-            if pending.timer:
-                pending.timer.cancel()
-            items = list(pending.items_by_path.values())
-            handler = watch.handler
-        if items:
+            pending.deadline = deadline
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(target=self._run_flusher, name="watchdog-flusher", daemon=True)
+        self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        """Hand due batches to the handler pool; one thread tracks all debounce deadlines."""
+        while True:
+            with self._lock:
+                due = self._pop_due_batches()
+                while not due:
+                    timeout = self._flush_queue[0][0] - time.monotonic() if self._flush_queue else None
+                    self._flush_wakeup.wait(timeout)
+                    due = self._pop_due_batches()
+                self._running_handlers.update(watch_id for watch_id, _handler, _items in due)
+            for watch_id, handler, items in due:
+                try:
+                    self._handler_pool.submit(self._run_handler, watch_id, handler, items)
+                except RuntimeError:
+                    return  # interpreter shutdown
+
+    def _run_handler(self, watch_id: str, handler: WatchHandler, items: list[WatchItem]) -> None:
+        self._count("flushed")
+        try:
             handler(items)
+        except Exception as e:
+            PrintStyle.error(f"Watchdog handler {watch_id} failed: {e}")
+        finally:
+            with self._lock:
+                self._running_handlers.discard(watch_id)
+                # events that arrived meanwhile were held back in a pending batch
+                pending = self._pending_batches.get(watch_id)
+                if pending is not None:
+                    heapq.heappush(self._flush_queue, (pending.deadline, watch_id))
+                    self._flush_wakeup.notify()
+
+    def _pop_due_batches(self) -> list[tuple[str, WatchHandler, list[WatchItem]]]:
+        due = []
+        now = time.monotonic()
+        while self._flush_queue and self._flush_queue[0][0] <= now:
+            _deadline, watch_id = heapq.heappop(self._flush_queue)
+            pending = self._pending_batches.get(watch_id)
+            if pending is None or watch_id in self._running_handlers:
+                continue
+            if pending.deadline > now:
+                heapq.heappush(self._flush_queue, (pending.deadline, watch_id))
+                continue
+            del self._pending_batches[watch_id]
+            watch = self._watches.get(watch_id)
+            if watch is not None and pending.items_by_path:
+                due.append((watch_id, watch.handler, list(pending.items_by_path.values())))
+        return due
 
     def _refresh_observer(self) -> None:
         target_roots = _covering_roots(watch.root for watch in self._watches.values())
@@ -316,8 +419,14 @@ def _is_same_or_nested(path: str, root: str) -> bool:
     return path == root or path.startswith(root + os.sep)
 
 
-def _is_under_watch(path: str, watch: _Watch) -> bool:
-    return path == watch.root or path.startswith(watch.root_with_sep)
+def _path_parts(path: str) -> list[str]:
+    return [part for part in path.split(os.sep) if part]
+
+
+def _literal_hint(pattern: str) -> str:
+    """Longest literal run of a glob; every path the glob matches contains it."""
+    literal = _GLOB_CLASS.sub("*", pattern)
+    return max(_GLOB_WILDCARDS.split(literal), key=len)
 
 
 def _compile_matcher(
@@ -341,17 +450,27 @@ def _compile_single_matcher(root: str, patterns: list[str]) -> PatternMatcher:
     if any(pattern in {"**", "**/*", "*"} for pattern in patterns):
         return lambda path: True
 
-    relative_patterns = [pattern for pattern in patterns if "/" in pattern]
+    # parsed once; PurePath.match() would parse string patterns on every call
+    relative_patterns = [PurePosixPath(pattern) for pattern in patterns if "/" in pattern]
     name_patterns = [
-        pattern for pattern in patterns if "/" not in pattern and pattern not in {"**", "**/*", "*"}
+        PurePosixPath(pattern)
+        for pattern in patterns
+        if "/" not in pattern and pattern not in {"**", "**/*", "*"}
     ]
+    # paths without any pattern's literal part cannot match; skip pathlib for them
+    hints = [_literal_hint(pattern) for pattern in patterns]
+    if not all(hints):
+        hints = []
+    root_prefix_length = len(root.rstrip(os.sep)) + 1
 
     def matches(path: str) -> bool:
-        relative = os.path.relpath(path, root).replace("\\", "/")
-        if relative == ".":
-            relative = ""
+        # callers only pass paths at or below root
+        relative = path[root_prefix_length:].replace("\\", "/") if len(path) >= root_prefix_length else ""
+        name = os.path.basename(path)
+        if hints and not any(hint in relative or hint in name for hint in hints):
+            return False
         relative_path = PurePosixPath(relative) if relative else PurePosixPath("")
-        name_path = PurePosixPath(os.path.basename(path))
+        name_path = PurePosixPath(name)
 
         for pattern in relative_patterns:
             if relative and relative_path.match(pattern):
@@ -408,6 +527,10 @@ def stop_watchdog_daemon() -> None:
     _registry.stop()
 
 
+def get_watchdog_stats() -> dict[str, int]:
+    return _registry.get_stats()
+
+
 __all__ = [
     "WatchEvent",
     "WatchEvents",
@@ -418,5 +541,6 @@ __all__ = [
     "clear_watchdogs",
     "start_watchdog_daemon",
     "stop_watchdog_daemon",
+    "get_watchdog_stats",
 ]
 
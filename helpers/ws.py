@@ -13,6 +13,7 @@ from flask import Flask, session, request
 from helpers import files, cache
 from helpers.print_style import PrintStyle
 from helpers.errors import format_error
+from helpers.server_startup import initialization
 from helpers.tunnel_origins import get_active_tunnel_origins, origin_key
 
 if TYPE_CHECKING:
@@ -274,11 +275,15 @@ class WsHandler:
         data: dict,
         *,
         correlation_id: str | None = None,
+        coalesce_key: str | None = None,
+        droppable: bool = False,
     ) -> None:
         await self.manager.emit_to(
             self._namespace, sid, event, data,
             handler_id=self.identifier,
             correlation_id=correlation_id,
+            coalesce_key=coalesce_key,
+            droppable=droppable,
         )
 
     async def broadcast(
@@ -288,12 +293,16 @@ class WsHandler:
         *,
         exclude_sids: str | Iterable[str] | None = None,
         correlation_id: str | None = None,
+        coalesce_key: str | None = None,
+        droppable: bool = False,
     ) -> None:
         await self.manager.broadcast(
             self._namespace, event, data,
             exclude_sids=exclude_sids,
             handler_id=self.identifier,
             correlation_id=correlation_id,
+            coalesce_key=coalesce_key,
+            droppable=droppable,
         )
 
     # Aggregation helper
@@ -510,6 +519,9 @@ def register_ws_namespace(
         if manager is not None:
             await manager.handle_connect(NAMESPACE, sid, user_id=user_id)
 
+        # Handlers read chat state, which is loaded after the server starts listening
+        await initialization.wait()
+
         # Activate handlers declared in auth.handlers
         handler_paths: list[str] = []
         if isinstance(auth, dict):
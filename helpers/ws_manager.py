@@ -11,8 +11,12 @@ from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
 
 import socketio
 import uuid
+from engineio import async_socket as eio_async_socket
+from engineio import packet as eio_packet
+from socketio import packet as sio_packet
 
 from helpers.defer import DeferredTask
+from helpers.dotenv import get_dotenv_int
 from helpers.print_style import PrintStyle
 from helpers import runtime
 from helpers.ws import ConnectionIdentity, ConnectionNotFoundError, WsHandler, _ws_debug_enabled, ws_debug
@@ -170,6 +174,10 @@ def validate_event_type(event_type: str) -> str:
 
 BUFFER_MAX_SIZE = 100
 BUFFER_TTL = timedelta(hours=1)
+# Events waiting in one connection's outbound queue before the overflow policy applies
+OUTBOUND_QUEUE_LIMIT = get_dotenv_int("A0_WS_OUTBOUND_QUEUE_LIMIT", 500, minimum=1)
+# Engine.IO packets queued on a socket before its outbound writer waits for the transport
+OUTBOUND_TRANSPORT_HIGH_WATER = 32
 _shared_ws_manager: WsManager | None = None
 
 
@@ -213,6 +221,7 @@ class BufferedEvent:
     handler_id: str | None = None
     correlation_id: str | None = None
     timestamp: datetime = field(default_factory=_utcnow)
+    coalesce_key: str | None = None
 
 
 @dataclass
@@ -223,6 +232,62 @@ class ConnectionInfo:
     last_activity: datetime = field(default_factory=_utcnow)
 
 
+@dataclass
+class _OutboundItem:
+    event_type: str
+    packets: list[Any]  # encoded Engine.IO packets, shared by all recipients of one emit
+    coalesce_key: str | None = None
+    droppable: bool = False
+
+
+@dataclass
+class _OutboundQueue:
+    """Events waiting to be written to one connection, drained by a single writer task."""
+
+    identity: ConnectionIdentity
+    eio_sid: str
+    items: Deque[_OutboundItem] = field(default_factory=deque)
+    task: asyncio.Task | None = None
+    max_depth: int = 0
+    closed: bool = False
+
+
+@dataclass
+class _OutboundStats:
+    encodes: int = 0
+    encode_seconds: float = 0.0
+    encode_max: float = 0.0
+    encode_last: float = 0.0
+    recipients: int = 0
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    overflow_disconnects: int = 0
+
+    def record_encode(self, seconds: float, recipients: int) -> None:
+        self.encodes += 1
+        self.encode_seconds += seconds
+        self.encode_last = seconds
+        self.recipients += recipients
+        if seconds > self.encode_max:
+            self.encode_max = seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "encodes": self.encodes,
+            "encode_ms_last": round(self.encode_last * 1000, 3),
+            "encode_ms_max": round(self.encode_max * 1000, 3),
+            "encode_ms_avg": (
+                round(self.encode_seconds / self.encodes * 1000, 3) if self.encodes else 0.0
+            ),
+            "recipients": self.recipients,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "overflow_disconnects": self.overflow_disconnects,
+        }
+
+
 @dataclass
 class _HandlerExecution:
     handler: WsHandler
@@ -245,6 +310,45 @@ ERR_CONNECTION_NOT_FOUND = "CONNECTION_NOT_FOUND"
 ERR_TIMEOUT = "TIMEOUT"
 
 
+# Event types whose buffered (offline) events supersede each other: event type -> key function.
+# Only the newest buffered event per key is kept; events without a key keep every entry.
+_buffer_coalescing: Dict[str, Callable[[dict[str, Any]], str | None]] = {}
+
+
+def register_buffer_coalescing(
+    event_type: str, key: Callable[[dict[str, Any]], str | None] | None = None
+) -> None:
+    """Keep only the newest buffered event of event_type per key while a client is offline.
+
+    key receives the event data and returns the coalescing key (None: do not coalesce);
+    without it all events of the type share one key.
+    """
+    _buffer_coalescing[validate_event_type(event_type)] = key or (lambda _data: "")
+
+
+def _buffer_coalesce_key(
+    event_type: str, data: dict[str, Any], explicit: str | None
+) -> str | None:
+    if explicit is not None:
+        return explicit
+    key_fn = _buffer_coalescing.get(event_type)
+    if key_fn is None:
+        return None
+    key = key_fn(data)
+    return None if key is None else f"{event_type}:{key}"
+
+
+def _state_push_context(data: dict[str, Any]) -> str | None:
+    snapshot = data.get("snapshot") if isinstance(data, dict) else None
+    if not isinstance(snapshot, dict):
+        return None
+    return str(snapshot.get("context") or "")
+
+
+# State pushes carry a seq; the client resyncs on a gap, so a dropped stale push is safe
+register_buffer_coalescing(STATE_PUSH_EVENT, _state_push_context)
+
+
 class WsManager:
     def __init__(self, socketio: socketio.AsyncServer, lock) -> None:
         self.socketio = socketio
@@ -267,6 +371,11 @@ class WsManager:
         self._dispatcher_loop: asyncio.AbstractEventLoop | None = None
         self._handler_worker: DeferredTask | None = None
         self._lifecycle_tasks: Set[asyncio.Task] = set()
+        # Outbound queues live on the dispatcher loop; only touched from there
+        self._outbound: Dict[ConnectionIdentity, _OutboundQueue] = {}
+        self._outbound_stats = _OutboundStats()
+        self._outbound_server: Any = None  # server _outbound_supported was computed for
+        self._outbound_supported = False
 
     # Internal: development-only debug logging to avoid noise in production
     def _debug(self, message: str) -> None:
@@ -781,6 +890,7 @@ class WsManager:
                 1 for conn_identity in self.connections if conn_identity[0] == namespace
             )
         self.unregister_diagnostic_watcher(namespace, sid)
+        self._close_outbound(identity)
         PrintStyle.info(f"WebSocket disconnected: namespace={namespace} sid={sid}")
         await self._run_lifecycle(namespace, lambda h: h.on_disconnect(sid))
         lifecycle_payload = {
@@ -1208,6 +1318,8 @@ class WsManager:
         handler_id: str | None = None,
         correlation_id: str | None = None,
         diagnostic: bool = False,
+        coalesce_key: str | None = None,
+        droppable: bool = False,
     ) -> None:
         envelope = self._wrap_envelope(
             handler_id,
@@ -1242,8 +1354,13 @@ class WsManager:
                     envelope.get("handlerId"),
                 )
             )
-            await self._run_on_dispatcher_loop(
-                self.socketio.emit(event_type, envelope, to=sid, namespace=namespace)
+            await self._deliver(
+                namespace,
+                [sid],
+                event_type,
+                envelope,
+                coalesce_key=coalesce_key,
+                droppable=droppable or diagnostic,
             )
             delivered = True
         else:
@@ -1256,6 +1373,7 @@ class WsManager:
                     data,
                     handler_id,
                     envelope["correlationId"],
+                    coalesce_key=coalesce_key,
                 )
             buffered = True
 
@@ -1298,6 +1416,8 @@ class WsManager:
         handler_id: str | None = None,
         correlation_id: str | None = None,
         diagnostic: bool = False,
+        coalesce_key: str | None = None,
+        droppable: bool = False,
     ) -> None:
         excluded = self._normalize_sid_filter(exclude_sids)
 
@@ -1318,13 +1438,14 @@ class WsManager:
                 data,
                 correlation_id=correlation_id,
             )
-            coros = [
-                self._run_on_dispatcher_loop(
-                    self.socketio.emit(event_type, envelope, to=sid, namespace=namespace)
-                )
-                for sid in targets
-            ]
-            await asyncio.gather(*coros)
+            await self._deliver(
+                namespace,
+                targets,
+                event_type,
+                envelope,
+                coalesce_key=coalesce_key,
+                droppable=droppable or diagnostic,
+            )
 
         if not diagnostic:
             await self._publish_diagnostic_event(
@@ -1342,6 +1463,240 @@ class WsManager:
                 }
             )
 
+    def _use_outbound_queue(self) -> bool:
+        """Whether the server exposes the Engine.IO internals the outbound queues write to.
+
+        The queues use socket.io/engine.io internals (packet_class, eio_sid_from_sid,
+        eio.sockets, socket.send/queue); without them events go through public emit().
+        """
+        server = self.socketio
+        if server is not self._outbound_server:
+            self._outbound_server = server
+            self._outbound_supported = isinstance(server, socketio.AsyncServer) and all(
+                (
+                    callable(getattr(server, "packet_class", None)),
+                    callable(getattr(getattr(server, "manager", None), "eio_sid_from_sid", None)),
+                    isinstance(getattr(getattr(server, "eio", None), "sockets", None), dict),
+                    callable(getattr(eio_async_socket.AsyncSocket, "send", None)),
+                )
+            )
+            if isinstance(server, socketio.AsyncServer) and not self._outbound_supported:
+                PrintStyle.warning(
+                    "python-socketio/python-engineio internals changed; "
+                    "WebSocket events fall back to per-client emit without outbound queues"
+                )
+        return self._outbound_supported
+
+    async def _deliver(
+        self,
+        namespace: str,
+        sids: list[str],
+        event_type: str,
+        envelope: dict[str, Any],
+        *,
+        coalesce_key: str | None = None,
+        droppable: bool = False,
+    ) -> None:
+        if self._use_outbound_queue():
+            await self._run_on_dispatcher_loop(
+                self._enqueue_outbound(
+                    namespace,
+                    sids,
+                    event_type,
+                    envelope,
+                    coalesce_key=coalesce_key,
+                    droppable=droppable,
+                )
+            )
+            return
+        # Servers without usable Engine.IO sockets (custom, test doubles, changed internals): one emit per sid
+        coros = [
+            self._run_on_dispatcher_loop(
+                self.socketio.emit(event_type, envelope, to=sid, namespace=namespace)
+            )
+            for sid in sids
+        ]
+        if len(coros) == 1:
+            await coros[0]
+        else:
+            await asyncio.gather(*coros)
+
+    async def _deliver_batch(
+        self, namespace: str, sid: str, events: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Deliver several events to one sid in order with a single dispatcher hop."""
+        if self._use_outbound_queue():
+            await self._run_on_dispatcher_loop(
+                self._enqueue_outbound_batch(namespace, sid, events)
+            )
+            return
+        for event_type, envelope in events:
+            await self._run_on_dispatcher_loop(
+                self.socketio.emit(event_type, envelope, to=sid, namespace=namespace)
+            )
+
+    def _encode_event(
+        self, namespace: str, event_type: str, envelope: dict[str, Any], recipients: int
+    ) -> list[Any]:
+        start = time.perf_counter()
+        pkt = self.socketio.packet_class(
+            sio_packet.EVENT, namespace=namespace, data=[event_type, envelope]
+        )
+        encoded = pkt.encode()
+        if not isinstance(encoded, list):
+            encoded = [encoded]
+        packets = [eio_packet.Packet(eio_packet.MESSAGE, part) for part in encoded]
+        self._outbound_stats.record_encode(time.perf_counter() - start, recipients)
+        return packets
+
+    def _outbound_queue(self, namespace: str, sid: str) -> _OutboundQueue | None:
+        eio_sid = self.socketio.manager.eio_sid_from_sid(sid, namespace)
+        if eio_sid is None:
+            return None
+        identity: ConnectionIdentity = (namespace, sid)
+        queue = self._outbound.get(identity)
+        if queue is None or (queue.eio_sid != eio_sid and not queue.closed):
+            queue = _OutboundQueue(identity=identity, eio_sid=eio_sid)
+            self._outbound[identity] = queue
+        return queue
+
+    async def _enqueue_outbound(
+        self,
+        namespace: str,
+        sids: list[str],
+        event_type: str,
+        envelope: dict[str, Any],
+        *,
+        coalesce_key: str | None,
+        droppable: bool,
+    ) -> None:
+        """Encode the event once and queue the packets for every target (dispatcher loop only)."""
+        packets = self._encode_event(namespace, event_type, envelope, len(sids))
+        for sid in sids:
+            queue = self._outbound_queue(namespace, sid)
+            if queue is not None:
+                self._queue_outbound_item(
+                    queue, _OutboundItem(event_type, packets, coalesce_key, droppable)
+                )
+
+    async def _enqueue_outbound_batch(
+        self, namespace: str, sid: str, events: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        queue = self._outbound_queue(namespace, sid)
+        if queue is None:
+            return
+        for event_type, envelope in events:
+            packets = self._encode_event(namespace, event_type, envelope, 1)
+            self._queue_outbound_item(queue, _OutboundItem(event_type, packets))
+
+    def _queue_outbound_item(self, queue: _OutboundQueue, item: _OutboundItem) -> None:
+        if queue.closed:
+            return
+        items = queue.items
+        if item.coalesce_key is not None:
+            for index, pending in enumerate(items):
+                if pending.coalesce_key == item.coalesce_key:
+                    # the newer event supersedes the pending one and takes its turn at the tail
+                    del items[index]
+                    self._outbound_stats.coalesced += 1
+                    break
+        if len(items) >= OUTBOUND_QUEUE_LIMIT and not self._make_outbound_room(queue, item):
+            return
+        items.append(item)
+        if len(items) > queue.max_depth:
+            queue.max_depth = len(items)
+        if queue.task is None:
+            queue.task = asyncio.create_task(self._drain_outbound(queue))
+
+    def _make_outbound_room(self, queue: _OutboundQueue, item: _OutboundItem) -> bool:
+        """Apply the overflow policy of a full queue; return whether item may still be queued."""
+        namespace, sid = queue.identity
+        for index, pending in enumerate(queue.items):
+            if pending.droppable:
+                del queue.items[index]
+                self._outbound_stats.dropped += 1
+                self._debug(
+                    f"Dropped outbound event '{pending.event_type}' for namespace={namespace} sid={sid} (queue full)"
+                )
+                return True
+        if item.droppable:
+            self._outbound_stats.dropped += 1
+            return False
+        # Nothing can be dropped without losing ordered state: disconnect the slow client,
+        # it reconnects and resyncs instead of growing the queue without bound.
+        PrintStyle.warning(
+            f"WebSocket client namespace={namespace} sid={sid} is not reading; "
+            f"{len(queue.items)} outbound events pending, disconnecting"
+        )
+        # the closed queue stays registered so later emits are ignored until handle_disconnect
+        self._close_outbound(queue.identity, remove=False)
+        self._outbound_stats.overflow_disconnects += 1
+        task = asyncio.create_task(self.socketio.disconnect(sid, namespace=namespace))
+        self._lifecycle_tasks.add(task)
+        task.add_done_callback(self._lifecycle_tasks.discard)
+        return False
+
+    async def _drain_outbound(self, queue: _OutboundQueue) -> None:
+        eio = self.socketio.eio
+        try:
+            while queue.items and not queue.closed:
+                socket = eio.sockets.get(queue.eio_sid)
+                if socket is None or socket.closed:
+                    queue.items.clear()
+                    break
+                item = queue.items.popleft()
+                for pkt in item.packets:
+                    await socket.send(pkt)
+                self._outbound_stats.sent += 1
+                transport_queue = getattr(socket, "queue", None)
+                if transport_queue is not None and transport_queue.qsize() >= OUTBOUND_TRANSPORT_HIGH_WATER:
+                    # the transport writer is behind; let our own queue absorb (and coalesce) the rest
+                    await transport_queue.join()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            namespace, sid = queue.identity
+            self._debug(f"Outbound writer failed namespace={namespace} sid={sid}: {exc}")
+        finally:
+            queue.task = None
+
+    def _close_outbound(self, identity: ConnectionIdentity, remove: bool = True) -> None:
+        queue = self._outbound.pop(identity, None) if remove else self._outbound.get(identity)
+        if queue is None:
+            return
+        queue.closed = True
+        queue.items.clear()
+        task = queue.task
+        if task is not None and not task.done():
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+    def outbound_metrics(self) -> dict[str, Any]:
+        """Outbound queue depth and broadcast encode timings."""
+        queues = [queue for queue in list(self._outbound.values()) if not queue.closed]
+        depths = sorted(
+            ((len(queue.items), queue) for queue in queues),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        return {
+            "queue_limit": OUTBOUND_QUEUE_LIMIT,
+            "connections": len(queues),
+            "queue_depth_total": sum(depth for depth, _ in depths),
+            "queue_depth_max": depths[0][0] if depths else 0,
+            "queue_depth_peak": max((queue.max_depth for queue in queues), default=0),
+            **self._outbound_stats.snapshot(),
+            "deepest": [
+                {
+                    "namespace": queue.identity[0],
+                    "sid": queue.identity[1],
+                    "depth": depth,
+                    "max_depth": queue.max_depth,
+                }
+                for depth, queue in depths[:10]
+                if depth
+            ],
+        }
+
     async def _run_lifecycle(
         self, namespace: str, fn: Callable[[WsHandler], Any]
     ) -> None:
@@ -1362,15 +1717,25 @@ class WsManager:
         data: dict[str, Any],
         handler_id: str | None,
         correlation_id: str | None,
+        *,
+        coalesce_key: str | None = None,
     ) -> None:
         namespace, sid = identity
         buffer = self.buffers[identity]
+        key = _buffer_coalesce_key(event_type, data, coalesce_key)
+        if key is not None:
+            for index, pending in enumerate(buffer):
+                if pending.coalesce_key == key:
+                    # superseded: the newest event takes the place at the tail
+                    del buffer[index]
+                    break
         buffer.append(
             BufferedEvent(
                 event_type=event_type,
                 data=data,
                 handler_id=handler_id,
                 correlation_id=correlation_id,
+                coalesce_key=key,
             )
         )
         while len(buffer) > BUFFER_MAX_SIZE:
@@ -1389,7 +1754,7 @@ class WsManager:
             return
         namespace, sid = identity
         now = _utcnow()
-        delivered = 0
+        events: list[tuple[str, dict[str, Any]]] = []
         while buffer:
             event = buffer.popleft()
             if now - event.timestamp > BUFFER_TTL:
@@ -1412,17 +1777,13 @@ class WsManager:
                     envelope.get("handlerId"),
                 )
             )
-            await self._run_on_dispatcher_loop(
-                self.socketio.emit(
-                    event.event_type, envelope, to=sid, namespace=namespace
-                )
-            )
-            delivered += 1
+            events.append((event.event_type, envelope))
         if identity in self.buffers:
             self.buffers.pop(identity, None)
-        if delivered:
+        if events:
+            await self._deliver_batch(namespace, sid, events)
             PrintStyle.info(
-                f"Flushed {delivered} buffered event(s) to namespace={namespace} sid={sid}"
+                f"Flushed {len(events)} buffered event(s) to namespace={namespace} sid={sid}"
             )
 
     def _build_error_result(
@@ -1,10 +1,11 @@
-from agent import AgentConfig
 from helpers import runtime, settings, defer, extension
 from helpers.print_style import PrintStyle
 
 
 @extension.extensible
 def initialize_agent(override_settings: dict | None = None):
+    from agent import AgentConfig
+
     current_settings = settings.get_settings()
     if override_settings:
         current_settings = settings.merge_settings(current_settings, override_settings)
@@ -41,7 +41,6 @@ from langchain_core.messages import (
     SystemMessage,
 )
 from langchain.embeddings.base import Embeddings
-from sentence_transformers import SentenceTransformer
 from pydantic import ConfigDict
 
 
@@ -146,6 +145,7 @@ class ModelConfig:
     limit_input: int = 0
     limit_output: int = 0
     vision: bool = False
+    max_image_pixels: int = 0
     kwargs: dict = field(default_factory=dict)
 
     def build_kwargs(self):
@@ -398,9 +398,14 @@ class LiteLLMChatWrapper(SimpleChatModel):
             "system": "system",
             "tool": "tool",
         }
+        model_conf = getattr(self, "a0_model_conf", None)
+        max_image_pixels = model_conf.max_image_pixels if model_conf else 0
         for m in messages:
             role = role_mapping.get(m.type, m.type)
-            message_dict = {"role": role, "content": images.prepare_content(m.content)}
+            message_dict = {
+                "role": role,
+                "content": images.prepare_content(m.content, max_pixels=max_image_pixels),
+            }
 
             # Handle tool calls for AI messages
             tool_calls = getattr(m, "tool_calls", None)
@@ -853,6 +858,9 @@ class LocalSentenceTransformerWrapper(Embeddings):
         }
         st_kwargs = {k: v for k, v in (kwargs or {}).items() if k in st_allowed_keys}
 
+        # imported here: sentence_transformers pulls in torch, which only local embeddings need
+        from sentence_transformers import SentenceTransformer
+
         self.model = SentenceTransformer(model, **st_kwargs)
         self.model_name = model
         self.a0_model_conf = model_config
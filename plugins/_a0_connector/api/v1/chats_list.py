@@ -16,6 +16,13 @@ def _project_metadata(context, data: dict[str, object]) -> object:
     )
 
 
+def _agent_profile(context) -> str:
+    # chats not opened yet are not hydrated; their agent0 gets context.config
+    if not context.hydrated:
+        return getattr(context.config, "profile", "default")
+    return getattr(context.agent0.config, "profile", "default") if context.agent0 else "default"
+
+
 class ChatsList(connector_base.ProtectedConnectorApiHandler):
     async def process(self, input: dict, request: Request) -> dict | Response:
         from agent import AgentContext
@@ -34,9 +41,7 @@ class ChatsList(connector_base.ProtectedConnectorApiHandler):
                     "running": data.get("running", False),
                     "project": project,
                     "project_name": context.get_data("project") or "",
-                    "agent_profile": getattr(context.agent0.config, "profile", "default")
-                    if context.agent0
-                    else "default",
+                    "agent_profile": _agent_profile(context),
                 }
             )
 
@@ -10,6 +10,7 @@ from helpers.ws_manager import WsResult
 
 from plugins._a0_connector.helpers.exec_config import build_exec_config
 from plugins._a0_connector.helpers.event_bridge import (
+    ContextLogFeed,
     get_context_log_entries,
     get_context_log_entry_count,
 )
@@ -73,6 +74,8 @@ WS_FEATURES = [
 _SNAPSHOT_REPLAY_PAGE_SIZE = 50
 _TAIL_HISTORY_PAGE_SIZE = 100
 _LIVE_STREAM_PAGE_SIZE = 100
+# Log updates wake the stream immediately; the timeout re-checks queue and run state
+_LIVE_STREAM_IDLE_SECONDS = 0.5
 
 
 class WsConnector(WsHandler):
@@ -1054,6 +1057,7 @@ class WsConnector(WsHandler):
         cursor = max(int(from_sequence or 0), 0)
         last_queue_signature, _ = self._queue_state_for_context_id(context_id)
         was_running = self._context_is_running(context_id)
+        feed: ContextLogFeed | None = None
         try:
             if replay_history:
                 cursor = await self._replay_history_snapshots(
@@ -1062,15 +1066,13 @@ class WsConnector(WsHandler):
                     from_sequence=cursor,
                 )
 
+            feed = ContextLogFeed(
+                context_id, after=cursor, poll_interval=_LIVE_STREAM_IDLE_SECONDS
+            )
             while context_id in subscribed_contexts_for_sid(sid):
-                events, next_cursor = get_context_log_entries(
-                    context_id,
-                    after=cursor,
-                    limit=_LIVE_STREAM_PAGE_SIZE,
-                )
+                events, _ = feed.read(limit=_LIVE_STREAM_PAGE_SIZE)
                 for event in events:
                     await self.emit_to(sid, "connector_context_event", event)
-                cursor = max(cursor, int(next_cursor or cursor))
                 queue_signature, queue_items = self._queue_state_for_context_id(context_id)
                 if queue_signature != last_queue_signature:
                     last_queue_signature = queue_signature
@@ -1093,7 +1095,10 @@ class WsConnector(WsHandler):
                         },
                     )
                 was_running = is_running
-                await asyncio.sleep(0 if events else 0.5)
+                if events:
+                    await asyncio.sleep(0)
+                else:
+                    await feed.wait(_LIVE_STREAM_IDLE_SECONDS)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
@@ -1101,6 +1106,8 @@ class WsConnector(WsHandler):
                 f"[a0-connector] stream error sid={sid} context={context_id}: {exc}"
             )
         finally:
+            if feed is not None:
+                feed.close()
             self._streaming_tasks.pop((sid, context_id), None)
 
     async def _replay_history_snapshots(
@@ -76,6 +76,14 @@ def log_entry_to_connector_event(
     }
 
 
+def _log_output_to_events(log_output: Any, context_id: str) -> list[dict[str, Any]]:
+    return [
+        log_entry_to_connector_event(entry, context_id)
+        for entry in log_output.items
+        if isinstance(entry, dict)
+    ]
+
+
 def get_context_log_entries(
     context_id: str,
     after: int = 0,
@@ -103,12 +111,7 @@ def get_context_log_entries(
                     end = start + limit
 
         log_output = context.log.output(start=start, end=end)
-        events = [
-            log_entry_to_connector_event(entry, context_id)
-            for entry in log_output.items
-            if isinstance(entry, dict)
-        ]
-        return events, int(log_output.end)
+        return _log_output_to_events(log_output, context_id), int(log_output.end)
     except Exception as exc:
         PrintStyle.error(
             f"[a0-connector] event_bridge error for context {context_id}: {exc}"
@@ -142,6 +145,62 @@ def get_context_log_entry_count(context_id: str) -> int:
         return 0
 
 
+class ContextLogFeed:
+    """Push-based reader of a context's log for connector streams.
+
+    Subscribes to the context `Log` and wakes on new updates instead of polling.
+    The subscription follows the context when it is replaced (e.g. chat reload);
+    while the context does not exist, waits fall back to poll_interval sleeps.
+    """
+
+    def __init__(self, context_id: str, after: int = 0, poll_interval: float = 0.5) -> None:
+        self.context_id = context_id
+        self.cursor = max(int(after or 0), 0)
+        self.poll_interval = poll_interval
+        self._subscription: Any = None
+
+    def read(self, limit: int | None = None) -> tuple[list[dict[str, Any]], int]:
+        """Return connector events past the cursor and the advanced cursor."""
+        try:
+            subscription = self._subscribe()
+            if subscription is None:
+                return [], self.cursor
+            log_output = subscription.read(limit)
+            self.cursor = subscription.cursor
+            return _log_output_to_events(log_output, self.context_id), self.cursor
+        except Exception as exc:
+            PrintStyle.error(
+                f"[a0-connector] event_bridge error for context {self.context_id}: {exc}"
+            )
+            return [], self.cursor
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to timeout for new log updates; True when there is something to read."""
+        subscription = self._subscribe()
+        if subscription is None:
+            await asyncio.sleep(min(timeout, self.poll_interval))
+            return False
+        return await subscription.wait(timeout)
+
+    def close(self) -> None:
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+
+    def _subscribe(self) -> Any:
+        from agent import AgentContext
+
+        context = AgentContext.get(self.context_id)
+        log = getattr(context, "log", None)
+        if self._subscription is not None and self._subscription.log is log:
+            return self._subscription
+        self.close()
+        if log is None or not hasattr(log, "subscribe"):
+            return None
+        self._subscription = log.subscribe(self.cursor)
+        return self._subscription
+
+
 async def stream_context_events(
     context_id: str,
     from_sequence: int = 0,
@@ -149,20 +208,24 @@ async def stream_context_events(
     timeout: float = 300.0,
     emit_fn: Callable[[dict[str, Any]], Any] | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
-    cursor = max(int(from_sequence or 0), 0)
+    # poll_interval only applies while the context does not exist yet
+    feed = ContextLogFeed(context_id, after=from_sequence, poll_interval=poll_interval)
     deadline = time.monotonic() + timeout
 
-    while time.monotonic() < deadline:
-        events, next_cursor = get_context_log_entries(context_id, after=cursor)
-        for event in events:
-            if emit_fn is not None:
-                try:
-                    result = emit_fn(event)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as exc:
-                    PrintStyle.error(f"[a0-connector] emit_fn error: {exc}")
-            yield event
-
-        cursor = max(cursor, next_cursor)
-        await asyncio.sleep(poll_interval)
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            events, _ = feed.read()
+            for event in events:
+                if emit_fn is not None:
+                    try:
+                        result = emit_fn(event)
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as exc:
+                        PrintStyle.error(f"[a0-connector] emit_fn error: {exc}")
+                yield event
+
+            if not events:
+                await feed.wait(remaining)
+    finally:
+        feed.close()
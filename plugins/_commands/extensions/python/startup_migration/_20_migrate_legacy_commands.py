@@ -4,7 +4,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
-from helpers import cache, files, plugins
+from helpers import cache, extension, files, plugins
 from helpers.extension import Extension
 from helpers.print_style import PrintStyle
 
@@ -122,3 +122,4 @@ def _disable_legacy_plugin_root(plugin_root: Path) -> bool:
 def _clear_runtime_caches() -> None:
     cache.clear("*(plugins)*")
     cache.clear("*(extensions)*")
+    extension.clear_function_points()
@@ -1,4 +1,4 @@
-"""Per-handler email poll loop with configurable seconds/cron intervals."""
+"""Per-handler email poll loop with configurable seconds/cron intervals and IMAP IDLE push."""
 
 import asyncio
 from typing import Any
@@ -49,12 +49,23 @@ class EmailAutoPoll(Extension):
 # ------------------------------------------------------------------
 
 async def _handler_poll_loop(handler_name: str) -> None:
+    from plugins._email_integration.helpers.handler import close_imap_session
+
+    try:
+        await _run_poll_loop(handler_name)
+    finally:
+        await close_imap_session(handler_name)
+
+
+async def _run_poll_loop(handler_name: str) -> None:
     from plugins._email_integration.helpers.handler import (
+        _imap_sessions,
         _load_state,
         _poll_single_handler,
         _save_state,
         _state_lock,
     )
+    from plugins._email_integration.helpers.imap_client import IDLE_REFRESH_SECONDS
 
     last_unread_days = 0
 
@@ -82,8 +93,20 @@ async def _handler_poll_loop(handler_name: str) -> None:
         except Exception as e:
             PrintStyle.error(f"Email poll error ({handler_name}): {format_error(e)}")
 
-        sleep_sec = _get_sleep_seconds(handler_cfg)
-        await asyncio.sleep(sleep_sec)
+        session = _imap_sessions.get(handler_name)
+        if session is None:
+            await asyncio.sleep(_get_sleep_seconds(handler_cfg))
+        elif _uses_idle(handler_cfg) and session.idle_supported and session.connected:
+            # new mail ends the wait early; the wait holds the session, so it stays within
+            # the interval and config changes or other session calls are not held up longer
+            await session.wait_for_changes(min(_get_sleep_seconds(handler_cfg), IDLE_REFRESH_SECONDS))
+        else:
+            await asyncio.sleep(max(_get_sleep_seconds(handler_cfg), session.backoff_seconds))
+
+
+def _uses_idle(handler_cfg: dict) -> bool:
+    # cron mode keeps its schedule; IDLE replaces the fixed seconds interval
+    return handler_cfg.get("poll_mode", "seconds") != "cron" and handler_cfg.get("imap_idle", True)
 
 
 # ------------------------------------------------------------------
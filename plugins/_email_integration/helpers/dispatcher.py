@@ -11,6 +11,10 @@ from typing import Literal, TypedDict
 # Pattern for extracting chat thread ID from email subject
 # Matches: [a0-xxxxxxxx] at end of subject
 _THREAD_ID_RE = re.compile(r"\[a0-([a-zA-Z0-9]+)\]")
+# Batch dispatcher line: "<n> ACTION context_id reason", n may be written "n." or "n)"
+_BATCH_LINE_RE = re.compile(r"^\s*(\d+)[.):]?\s+(\S+)(?:\s+(\S+))?(?:\s+(.*))?$")
+# Reference to the chat started for an earlier email of the same batch: "#n"
+_BATCH_REF_RE = re.compile(r"^#(\d+)$")
 
 # Context data keys (no underscore prefix — must persist across restarts)
 CTX_EMAIL_HANDLER = "email_handler"
@@ -93,6 +97,18 @@ def format_chats_list(existing_chats: list[ChatSummary]) -> str:
     return "\n".join(sections)
 
 
+def format_emails_list(emails: list[dict]) -> str:
+    sections = []
+    for number, email in enumerate(emails, start=1):
+        sections.append(
+            f"### Email {number}\n"
+            f"From: {email.get('sender', '')}\n"
+            f"Subject: {email.get('subject', '')}\n\n"
+            f"{email.get('body', '')}"
+        )
+    return "\n\n".join(sections)
+
+
 def parse_dispatcher_response(response: str) -> DispatchDecision:
     line = response.strip().split("\n")[0].strip()
     parts = line.split(None, 2)
@@ -110,3 +126,37 @@ def parse_dispatcher_response(response: str) -> DispatchDecision:
     }
     action = action_map.get(action_raw, "new_chat")
     return DispatchDecision(action=action, context_id=ctx_id, reason=reason)
+
+
+def parse_batch_dispatcher_response(response: str, count: int) -> list[DispatchDecision]:
+    """One decision per email, in order; emails the response skips start new chats."""
+    action_map: dict[str, DispatchAction] = {
+        "NEW_CHAT": "new_chat",
+        "CONTINUE": "continue_chat",
+    }
+    decisions: dict[int, DispatchDecision] = {}
+    for line in response.strip().splitlines():
+        match = _BATCH_LINE_RE.match(line)
+        if not match:
+            continue
+        number = int(match.group(1))
+        if not 1 <= number <= count or number in decisions:
+            continue
+        ctx_id = match.group(3) or ""
+        decisions[number] = DispatchDecision(
+            action=action_map.get(match.group(2).upper(), "new_chat"),
+            context_id="" if ctx_id == "_" else ctx_id,
+            reason=match.group(4) or "",
+        )
+
+    return [
+        decisions.get(number)
+        or DispatchDecision(action="new_chat", reason="missing in batch response")
+        for number in range(1, count + 1)
+    ]
+
+
+def batch_reference(context_id: str) -> int | None:
+    """Position of the earlier batch email whose new chat "#n" points to."""
+    match = _BATCH_REF_RE.match(context_id or "")
+    return int(match.group(1)) if match else None
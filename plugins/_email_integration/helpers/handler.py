@@ -22,9 +22,8 @@ from initialize import initialize_agent
 from plugins._email_integration.helpers import dispatcher as disp
 from plugins._model_config.helpers import model_config
 from plugins._email_integration.helpers.imap_client import (
+    ImapSession,
     InboundMessage,
-    connect_imap,
-    disconnect_imap,
     fetch_new,
     fetch_unread_since,
     get_highest_uid,
@@ -37,6 +36,18 @@ from plugins._email_integration.helpers.smtp_client import SmtpConfig, send_repl
 PLUGIN_NAME = "_email_integration"
 DOWNLOAD_FOLDER = "usr/email/attachments"
 STATE_FILE = "usr/email/state.json"
+# dispatcher decisions: emails per model call, senders dispatched at once
+DISPATCHER_BATCH_SIZE: int = 10
+DISPATCHER_CONCURRENCY: int = 4
+
+
+def _lower(value) -> str:
+    return str(value).lower()
+
+
+# every inbound email looks up the chats of its handler and sender
+AgentContext.register_data_index(disp.CTX_EMAIL_HANDLER)
+AgentContext.register_data_index(disp.CTX_EMAIL_SENDER, _lower)
 
 
 # ------------------------------------------------------------------
@@ -50,6 +61,34 @@ _state_lock = asyncio.Lock()
 # which would reset module-level state and orphan running tasks.
 _poll_tasks: dict[str, asyncio.Task] = {}  # type: ignore[type-arg]
 
+# Long-lived IMAP sessions per handler name, same lifetime reasoning as _poll_tasks
+_imap_sessions: dict[str, ImapSession] = {}
+
+
+async def get_imap_session(handler_cfg: dict) -> ImapSession:
+    """Return the handler's IMAP session, replacing it when the account settings changed."""
+    name = handler_cfg.get("name", "default")
+    session = ImapSession(
+        server=handler_cfg.get("imap_server", ""),
+        port=int(handler_cfg.get("imap_port", 993)),
+        username=handler_cfg.get("username", ""),
+        password=handler_cfg.get("password", ""),
+    )
+    current = _imap_sessions.get(name)
+    if current is not None:
+        if current.settings == session.settings:
+            return current
+        await current.close()
+    _imap_sessions[name] = session
+    return session
+
+
+async def close_imap_session(name: str) -> None:
+    session = _imap_sessions.pop(name, None)
+    if session is not None:
+        await session.close()
+
+
 def _load_state() -> dict:
     path = files.get_abs_path(STATE_FILE)
     if os.path.isfile(path):
@@ -83,50 +122,43 @@ async def _poll_single_handler(handler_cfg: dict, state: dict):
             await _dispatch_all(handler_cfg, messages)
         return
 
-    client = await connect_imap(
-        server=handler_cfg.get("imap_server", ""),
-        port=int(handler_cfg.get("imap_port", 993)),
-        username=handler_cfg.get("username", ""),
-        password=handler_cfg.get("password", ""),
-    )
-    try:
-        # First run: optionally process unread from last N days
-        if last_uid == 0:
-            if process_unread_days > 0:
-                messages, highest = await fetch_unread_since(
-                    client, DOWNLOAD_FOLDER, process_unread_days, whitelist or None,
+    session = await get_imap_session(handler_cfg)
+    # First run: optionally process unread from last N days
+    if last_uid == 0:
+        if process_unread_days > 0:
+            messages, highest = await session.call(
+                fetch_unread_since, DOWNLOAD_FOLDER, process_unread_days, whitelist or None,
+                attempts=session.fetch_attempts,
+            )
+            highest = highest or await session.call(get_highest_uid)
+            state[name] = {"last_uid": highest}
+            if messages:
+                PrintStyle.info(
+                    f"Email ({name}): processing {len(messages)} unread"
+                    f" from last {process_unread_days} days"
                 )
-                highest = highest or await get_highest_uid(client)
-                state[name] = {"last_uid": highest}
-                if messages:
-                    PrintStyle.info(
-                        f"Email ({name}): processing {len(messages)} unread"
-                        f" from last {process_unread_days} days"
-                    )
-                    await _dispatch_all(handler_cfg, messages)
-                else:
-                    PrintStyle.info(
-                        f"Email ({name}): no unread in last {process_unread_days} days"
-                    )
+                await _dispatch_all(handler_cfg, messages)
             else:
-                highest = await get_highest_uid(client)
-                state[name] = {"last_uid": highest}
-                PrintStyle.info(f"Email ({name}): initialized, tracking from UID {highest}")
-            return
-
-        messages, new_uid = await fetch_new(
-            client, DOWNLOAD_FOLDER, last_uid, whitelist or None,
-        )
+                PrintStyle.info(
+                    f"Email ({name}): no unread in last {process_unread_days} days"
+                )
+        else:
+            highest = await session.call(get_highest_uid)
+            state[name] = {"last_uid": highest}
+            PrintStyle.info(f"Email ({name}): initialized, tracking from UID {highest}")
+        return
 
-        if new_uid > last_uid:
-            state[name] = {"last_uid": new_uid}
+    messages, new_uid = await session.call(
+        fetch_new, DOWNLOAD_FOLDER, last_uid, whitelist or None,
+        attempts=session.fetch_attempts,
+    )
 
-        if messages:
-            PrintStyle.info(f"Email ({name}): {len(messages)} new messages")
-            await _dispatch_all(handler_cfg, messages)
+    if new_uid > last_uid:
+        state[name] = {"last_uid": new_uid}
 
-    finally:
-        await disconnect_imap(client)
+    if messages:
+        PrintStyle.info(f"Email ({name}): {len(messages)} new messages")
+        await _dispatch_all(handler_cfg, messages)
 
 
 async def _fetch_exchange(
@@ -147,11 +179,7 @@ async def _dispatch_all(handler_cfg: dict, messages: list[InboundMessage]):
 
     # Need an agent for dispatcher AI calls 
     # find existing dispatcher or create new background context
-    ctx = None
-    for c in AgentContext._contexts.values():
-        if isinstance(c, AgentContext) and c.name == "Email Dispatcher":
-            ctx = c
-            break
+    ctx = AgentContext.find_first(name="Email Dispatcher")
 
     if not ctx:
         agent_config = initialize_agent()
@@ -159,28 +187,88 @@ async def _dispatch_all(handler_cfg: dict, messages: list[InboundMessage]):
                            type=AgentContextType.BACKGROUND)
     agent = ctx.agent0
 
+    # group by sender, keeping arrival order within each group
+    by_sender: dict[str, list[InboundMessage]] = {}
     for msg in messages:
         if own_address and _is_own_email(msg.sender, own_address):
             PrintStyle.info(f"Email: skipping self-sent from {msg.sender}")
             continue
+        by_sender.setdefault(msg.sender.lower(), []).append(msg)
+
+    # senders have separate chats, so they can be dispatched in parallel
+    limit = asyncio.Semaphore(
+        _int_option(handler_cfg, "dispatcher_concurrency", DISPATCHER_CONCURRENCY)
+    )
+
+    async def dispatch_sender(sender_messages: list[InboundMessage]):
+        async with limit:
+            await _dispatch_sender(agent, handler_cfg, sender_messages)
+
+    await asyncio.gather(*(dispatch_sender(group) for group in by_sender.values()))
+
+
+def _int_option(handler_cfg: dict, key: str, default: int) -> int:
+    try:
+        return max(1, int(handler_cfg.get(key, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+# ------------------------------------------------------------------
+# Dispatch the messages of one sender
+# ------------------------------------------------------------------
+
+async def _dispatch_sender(agent: Agent, handler_cfg: dict, messages: list[InboundMessage]):
+    """Handle one sender's messages in arrival order.
+
+    Control emails and thread replies are handled one by one; runs of other
+    emails go to the dispatcher in batches of dispatcher_batch_size, one model
+    call each. Pending emails are dispatched before the next control email or
+    thread reply, so it sees the chats they started.
+    """
+    batch_size = _int_option(handler_cfg, "dispatcher_batch_size", DISPATCHER_BATCH_SIZE)
+    pending: list[InboundMessage] = []
+
+    async def flush():
+        for start in range(0, len(pending), batch_size):
+            try:
+                await _dispatch_batch(agent, handler_cfg, pending[start:start + batch_size])
+            except Exception as e:
+                PrintStyle.error(f"Email dispatch error: {format_error(e)}")
+        pending.clear()
+
+    for msg in messages:
+        if not _may_skip_dispatcher(msg):
+            pending.append(msg)
+            continue
+        await flush()
         try:
-            await _dispatch_message(agent, handler_cfg, msg)
+            if not await _dispatch_without_model(agent, handler_cfg, msg):
+                pending.append(msg)
         except Exception as e:
             PrintStyle.error(f"Email dispatch error: {format_error(e)}")
+    await flush()
 
 
-# ------------------------------------------------------------------
-# Dispatch a single inbound message
-# ------------------------------------------------------------------
+def _may_skip_dispatcher(msg: InboundMessage) -> bool:
+    """Only control emails and replies in a known thread can skip the dispatcher."""
+    return bool(
+        integration_commands.parse_command(msg.body)
+        or disp.extract_thread_id(msg.subject)
+    )
+
 
-async def _dispatch_message(agent: Agent, handler_cfg: dict, msg: InboundMessage):
+async def _dispatch_without_model(
+    agent: Agent, handler_cfg: dict, msg: InboundMessage,
+) -> bool:
+    """Handle control emails and known thread replies; False if the dispatcher must decide."""
     handler_name = handler_cfg.get("name", "default")
     thread_id = disp.extract_thread_id(msg.subject)
 
     existing = _find_handler_chats(handler_name, msg.sender)
 
     if await _handle_control_email(handler_cfg, msg, existing, thread_id):
-        return
+        return True
 
     # Fast path: thread ID in subject matches a known chat
     if thread_id:
@@ -189,22 +277,54 @@ async def _dispatch_message(agent: Agent, handler_cfg: dict, msg: InboundMessage
                 await _route_to_chat(
                     agent, handler_cfg, msg, chat["context_id"],
                 )
-                return
+                return True
+
+    return False
+
+
+async def _dispatch_batch(agent: Agent, handler_cfg: dict, batch: list[InboundMessage]):
+    handler_name = handler_cfg.get("name", "default")
+    existing = _find_handler_chats(handler_name, batch[0].sender)
 
     # Dispatcher AI decides
-    decision = await _call_dispatcher(agent, handler_cfg, msg, existing)
-    reason = decision.reason or ""
+    if len(batch) == 1:
+        decisions = [await _call_dispatcher(agent, handler_cfg, batch[0], existing)]
+    else:
+        decisions = await _call_batch_dispatcher(agent, handler_cfg, batch, existing)
+
+    # chats the earlier emails of the batch went to, by 1-based position
+    started: dict[int, str] = {}
+    for position, (msg, decision) in enumerate(zip(batch, decisions), start=1):
+        try:
+            context_id = await _apply_decision(agent, handler_cfg, msg, decision, started)
+            started[position] = context_id
+        except Exception as e:
+            PrintStyle.error(f"Email dispatch error: {format_error(e)}")
 
-    if decision.action == "continue_chat" and decision.context_id:
-        ctx = AgentContext.get(decision.context_id)
+
+async def _apply_decision(
+    agent: Agent,
+    handler_cfg: dict,
+    msg: InboundMessage,
+    decision: disp.DispatchDecision,
+    started: dict[int, str],
+) -> str:
+    """Route or start a chat as decided; returns the id of the chat the email went to."""
+    context_id = decision.context_id
+    reference = disp.batch_reference(context_id)
+    if reference is not None:
+        context_id = started.get(reference, "")
+
+    if decision.action == "continue_chat" and context_id:
+        ctx = AgentContext.get(context_id)
         if ctx:
-            await _route_to_chat(agent, handler_cfg, msg, decision.context_id)
-            return
+            await _route_to_chat(agent, handler_cfg, msg, context_id)
+            return context_id
         PrintStyle.warning(
             f"Dispatcher referenced unknown context {decision.context_id}, starting new chat"
         )
 
-    await _start_new_chat(agent, handler_cfg, msg)
+    return await _start_new_chat(agent, handler_cfg, msg)
 
 
 async def _call_model(
@@ -252,11 +372,51 @@ async def _call_dispatcher(
         return disp.DispatchDecision(action="new_chat", reason="dispatcher error")
 
 
+async def _call_batch_dispatcher(
+    agent: Agent,
+    handler_cfg: dict,
+    batch: list[InboundMessage],
+    existing_chats: list[disp.ChatSummary],
+) -> list[disp.DispatchDecision]:
+    emails_text = disp.format_emails_list(
+        [
+            {"sender": msg.sender, "subject": msg.subject, "body": disp.truncate_body(msg.body)}
+            for msg in batch
+        ]
+    )
+    chats_text = disp.format_chats_list(existing_chats)
+
+    prompt = agent.read_prompt(
+        "fw.email.dispatcher_batch_prompt.md",
+        emails=emails_text,
+        chats=chats_text,
+    )
+
+    extra = handler_cfg.get("dispatcher_instructions", "")
+    if extra:
+        prompt += agent.read_prompt(
+            "fw.email.dispatcher_extra.md", instructions=extra,
+        )
+
+    system = agent.read_prompt("fw.email.dispatcher_batch_system.md")
+
+    try:
+        response = await _call_model(agent, handler_cfg, system, prompt)
+        return disp.parse_batch_dispatcher_response(str(response), len(batch))
+
+    except Exception as e:
+        PrintStyle.error(f"Dispatcher error: {format_error(e)}")
+        return [
+            disp.DispatchDecision(action="new_chat", reason="dispatcher error")
+            for _ in batch
+        ]
+
+
 # ------------------------------------------------------------------
 # Chat creation and routing
 # ------------------------------------------------------------------
 
-async def _start_new_chat(agent: Agent, handler_cfg: dict, msg: InboundMessage):
+async def _start_new_chat(agent: Agent, handler_cfg: dict, msg: InboundMessage) -> str:
     from helpers import projects
 
     handler_name = handler_cfg.get("name", "default")
@@ -302,6 +462,7 @@ async def _start_new_chat(agent: Agent, handler_cfg: dict, msg: InboundMessage):
     ))
 
     PrintStyle.success(f"Email: new chat {context.id} for '{msg.subject}' from {msg.sender}")
+    return context.id
 
 
 async def _route_to_chat(
@@ -478,24 +639,24 @@ HISTORY_PREVIEW_MAX_CHARS: int = 500
 
 
 def _find_handler_chats(handler_name: str, sender: str) -> list[disp.ChatSummary]:
+    chats = AgentContext.find(
+        data={disp.CTX_EMAIL_HANDLER: handler_name, disp.CTX_EMAIL_SENDER: sender},
+    )
+    chats.sort(key=lambda ctx: ctx.id, reverse=True)
+
+    # history previews are costly, build them only for the chats returned
     results = []
-    for ctx_id, ctx in AgentContext._contexts.items():
-        if not isinstance(ctx, AgentContext):
-            continue
-        data = ctx.data
-        if data.get(disp.CTX_EMAIL_HANDLER) != handler_name:
-            continue
-        if data.get(disp.CTX_EMAIL_SENDER, "").lower() != sender.lower():
-            continue
-        summary = disp.build_chat_summary(ctx_id, data)
+    for ctx in chats[:20]:
+        summary = disp.build_chat_summary(ctx.id, ctx.data)
         summary["history_preview"] = _get_history_preview(ctx)
         results.append(summary)
-
-    results.sort(key=lambda c: c["context_id"], reverse=True)
-    return results[:20]
+    return results
 
 
 def _get_history_preview(ctx: AgentContext) -> str:
+    # reading agent0 would load a saved chat that nobody opened since startup
+    if not ctx.hydrated:
+        return "(not loaded)"
     try:
         history = ctx.agent0.history
         text = history.output_text(human_label="user", ai_label="agent")
@@ -8,6 +8,7 @@ import asyncio
 import email
 import os
 import re
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -24,6 +25,18 @@ from helpers.errors import format_error
 from helpers.print_style import PrintStyle
 
 
+# Messages per UID FETCH command; one round-trip fetches the whole chunk
+FETCH_BATCH_SIZE: int = 25
+# Polls that may fail on the same message before it is skipped
+FETCH_MAX_ATTEMPTS: int = 3
+# RFC 2177: clients should re-issue IDLE at least every 29 minutes
+IDLE_REFRESH_SECONDS: float = 300.0
+# idle_check blocks a worker thread; short slices keep cancellation responsive
+IDLE_CHECK_SECONDS: float = 10.0
+RECONNECT_BACKOFF_SECONDS: float = 5.0
+RECONNECT_BACKOFF_MAX_SECONDS: float = 300.0
+
+
 # ------------------------------------------------------------------
 # Data models
 # ------------------------------------------------------------------
@@ -70,33 +83,180 @@ async def disconnect_imap(client: IMAPClient) -> None:
         PrintStyle.error(f"IMAP disconnect error: {format_error(e)}")
 
 
+def _select_inbox(client: IMAPClient) -> None:
+    # a long-lived session keeps INBOX selected between polls
+    if client._imap.state != "SELECTED":  # type: ignore[attr-defined]
+        client.select_folder("INBOX")
+
+
+class ImapSession:
+    """Long-lived IMAP connection for one handler, with IDLE push and reconnect backoff.
+
+    Commands are serialized through the session. A failed command drops the
+    connection and the next call reconnects; failed connection attempts back off
+    exponentially up to RECONNECT_BACKOFF_MAX_SECONDS.
+    """
+
+    def __init__(
+        self,
+        server: str,
+        port: int = 993,
+        username: str = "",
+        password: str = "",
+        ssl: bool = True,
+        timeout: int = 30,
+    ) -> None:
+        self.settings = (server, port, username, password, ssl, timeout)
+        self.idle_supported = False
+        self._client: IMAPClient | None = None
+        self._lock = asyncio.Lock()
+        self._failures = 0
+        self._retry_at = 0.0
+        # failed fetch/parse attempts per UID, passed to fetch_new as attempts=
+        self.fetch_attempts: dict[int, int] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None
+
+    @property
+    def backoff_seconds(self) -> float:
+        """Seconds until the next connection attempt is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    async def call(self, fn, *args, **kwargs):
+        """Run an IMAP coroutine of this module (fetch_new, get_highest_uid, ...) on the session connection."""
+        async with self._lock:
+            client = await self._ensure_client()
+            try:
+                return await fn(client, *args, **kwargs)
+            except (IMAPClient.Error, OSError):
+                self._abandon()
+                raise
+
+    async def wait_for_changes(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the server to announce new mail.
+
+        Uses IDLE when the server supports it and returns True on EXISTS/RECENT.
+        Without IDLE (or without a connection) it just sleeps and returns False.
+        """
+        if not (self.idle_supported and self.connected):
+            await asyncio.sleep(timeout)
+            return False
+
+        loop = asyncio.get_event_loop()
+        async with self._lock:
+            client = self._client
+            if client is None:
+                return False
+            deadline = time.monotonic() + timeout
+            try:
+                await loop.run_in_executor(None, client.idle)
+                changed = False
+                while not changed and (remaining := deadline - time.monotonic()) > 0:
+                    responses = await loop.run_in_executor(
+                        None, client.idle_check, min(remaining, IDLE_CHECK_SECONDS)
+                    )
+                    changed = _announces_mail(responses)
+                _, responses = await loop.run_in_executor(None, client.idle_done)
+                return changed or _announces_mail(responses)
+            except asyncio.CancelledError:
+                # a worker thread may still be reading the socket mid-IDLE
+                self._abandon()
+                raise
+            except Exception as e:
+                PrintStyle.error(f"IMAP IDLE error: {format_error(e)}")
+                self._abandon()
+                return False
+
+    async def close(self) -> None:
+        async with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            await disconnect_imap(client)
+
+    async def _ensure_client(self) -> IMAPClient:
+        if self._client is not None:
+            return self._client
+        if self.backoff_seconds > 0:
+            raise ConnectionError(
+                f"IMAP reconnect backing off for {self.backoff_seconds:.0f}s"
+            )
+        server, port, username, password, ssl, timeout = self.settings
+        try:
+            client = await connect_imap(server, port, username, password, ssl, timeout)
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, _select_inbox, client)
+            self.idle_supported = await loop.run_in_executor(
+                None, client.has_capability, "IDLE"
+            )
+        except Exception:
+            self._failures += 1
+            delay = RECONNECT_BACKOFF_SECONDS * 2 ** (self._failures - 1)
+            self._retry_at = time.monotonic() + min(delay, RECONNECT_BACKOFF_MAX_SECONDS)
+            raise
+        self._failures = 0
+        self._retry_at = 0.0
+        self._client = client
+        return client
+
+    def _abandon(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            asyncio.get_event_loop().run_in_executor(None, _shutdown_quietly, client)
+
+
+def _shutdown_quietly(client: IMAPClient) -> None:
+    try:
+        client.shutdown()
+    except Exception:
+        pass
+
+
+def _announces_mail(responses: list) -> bool:
+    return any(
+        isinstance(response, tuple) and len(response) > 1
+        and response[1] in (b"EXISTS", b"RECENT")
+        for response in responses
+    )
+
+
 # ------------------------------------------------------------------
 # Fetch messages
 # ------------------------------------------------------------------
 
+def _search_unread(client: IMAPClient, criteria: list) -> list[int]:
+    # Gmail: only the primary category; elsewhere plain UNSEEN
+    if client.has_capability("X-GM-EXT-1"):
+        return client.search([*criteria, "X-GM-RAW", "category:primary is:unread"])
+    return client.search([*criteria, "UNSEEN"])
+
+
 async def fetch_new(
     client: IMAPClient,
     download_folder: str,
     last_uid: int = 0,
     sender_whitelist: list[str] | None = None,
     max_messages: int = 10,
+    attempts: dict[int, int] | None = None,
 ) -> tuple[list[InboundMessage], int]:
-    """Fetch emails newer than last_uid. Returns (messages, new_last_uid)."""
+    """Fetch emails newer than last_uid. Returns (messages, new_last_uid).
+
+    attempts carries failed attempts per UID across polls; a message that keeps
+    failing is skipped after FETCH_MAX_ATTEMPTS polls and left unread.
+    """
     loop = asyncio.get_event_loop()
 
     def _search():
-        client.select_folder("INBOX")
-        # Use Gmail category filter if supported, otherwise plain UNSEEN
-        try:
-            return client.gmail_search("category:primary is:unread")
-        except Exception:
-            return client.search(["UNSEEN"])  # type: ignore[arg-type]
+        _select_inbox(client)
+        # UID range: the server only reports messages newer than last_uid
+        return _search_unread(client, ["UID", f"{last_uid + 1}:*"] if last_uid > 0 else [])
 
     msg_ids = await loop.run_in_executor(None, _search)
     if not msg_ids:
         return [], last_uid
 
-    # Filter out already-seen UIDs
+    # "n:*" always matches the newest message, even when its UID is below n
     if last_uid > 0:
         msg_ids = [uid for uid in msg_ids if uid > last_uid]
 
@@ -114,15 +274,10 @@ async def fetch_new(
     else:
         PrintStyle.standard(f"Email: found {len(msg_ids)} new messages")
 
-    results: list[InboundMessage] = []
-
-    for msg_id in msg_ids:
-        try:
-            msg = await _fetch_single(client, msg_id, download_folder, sender_whitelist)
-            if msg:
-                results.append(msg)
-        except Exception as e:
-            PrintStyle.error(f"Email: error processing message {msg_id}: {format_error(e)}")
+    results, failed = await _fetch_batch(client, msg_ids, download_folder, sender_whitelist, attempts)
+    if failed:
+        # keep failed messages above last_uid so the next poll retries them
+        new_last_uid = min(failed) - 1
     return results, new_last_uid
 
 
@@ -131,7 +286,7 @@ async def get_highest_uid(client: IMAPClient) -> int:
     loop = asyncio.get_event_loop()
 
     def _search():
-        client.select_folder("INBOX")
+        _select_inbox(client)
         uids = client.search(["ALL"])  # type: ignore[arg-type]
         return max(uids) if uids else 0
 
@@ -144,19 +299,15 @@ async def fetch_unread_since(
     days: int,
     sender_whitelist: list[str] | None = None,
     max_messages: int = 10,
+    attempts: dict[int, int] | None = None,
 ) -> tuple[list[InboundMessage], int]:
     """Fetch unread emails from the last N days. Returns (messages, highest_uid)."""
     loop = asyncio.get_event_loop()
     since_date = datetime.now() - timedelta(days=days)
 
     def _search():
-        client.select_folder("INBOX")
-        try:
-            return client.gmail_search(
-                f"category:primary is:unread after:{since_date.strftime('%Y/%m/%d')}"
-            )
-        except Exception:
-            return client.search(["UNSEEN", "SINCE", since_date.date()])  # type: ignore[arg-type]
+        _select_inbox(client)
+        return _search_unread(client, ["SINCE", since_date.date()])
 
     msg_ids = await loop.run_in_executor(None, _search)
     if not msg_ids:
@@ -174,35 +325,81 @@ async def fetch_unread_since(
             f"Email: found {len(msg_ids)} unread messages from last {days} days"
         )
 
+    results, failed = await _fetch_batch(client, msg_ids, download_folder, sender_whitelist, attempts)
+    if failed:
+        highest_uid = min(failed) - 1
+    return results, highest_uid
+
+
+async def _fetch_batch(
+    client: IMAPClient,
+    msg_ids: list[int],
+    download_folder: str,
+    sender_whitelist: list[str] | None,
+    attempts: dict[int, int] | None = None,
+) -> tuple[list[InboundMessage], list[int]]:
+    """Fetch and parse msg_ids in chunks. Returns (messages, ids to retry on the next poll).
+
+    Only messages that were parsed are marked read, so a failed message stays
+    unread. A message that failed FETCH_MAX_ATTEMPTS times is given up on and
+    not retried. Connection errors propagate so ImapSession drops the connection.
+    """
+    loop = asyncio.get_event_loop()
+    attempts = {} if attempts is None else attempts
     results: list[InboundMessage] = []
-    for msg_id in msg_ids:
+    parsed: list[int] = []
+    failed: list[int] = []
+
+    def _failed(msg_id: int) -> None:
+        attempts[msg_id] = attempts.get(msg_id, 0) + 1
+        if attempts[msg_id] < FETCH_MAX_ATTEMPTS:
+            failed.append(msg_id)
+            return
+        attempts.pop(msg_id)
+        PrintStyle.error(f"Email: skipping message {msg_id} after {FETCH_MAX_ATTEMPTS} failed attempts")
+
+    for start in range(0, len(msg_ids), FETCH_BATCH_SIZE):
+        chunk = msg_ids[start:start + FETCH_BATCH_SIZE]
         try:
-            msg = await _fetch_single(client, msg_id, download_folder, sender_whitelist)
+            raw = await loop.run_in_executor(None, client.fetch, chunk, ["RFC822"])
+        except (IMAPClient.AbortError, OSError):
+            raise
+        except Exception as e:
+            # the server refused this chunk; the connection itself is still usable
+            PrintStyle.error(f"Email: error fetching messages {chunk[0]}-{chunk[-1]}: {format_error(e)}")
+            for msg_id in chunk:
+                _failed(msg_id)
+            continue
+
+        for msg_id in chunk:
+            try:
+                msg = await _parse_message(raw.get(msg_id, {}), download_folder, sender_whitelist)
+            except Exception as e:
+                PrintStyle.error(f"Email: error processing message {msg_id}: {format_error(e)}")
+                _failed(msg_id)
+                continue
+            attempts.pop(msg_id, None)
+            parsed.append(msg_id)
             if msg:
                 results.append(msg)
-        except Exception as e:
-            PrintStyle.error(
-                f"Email: error processing message {msg_id}: {format_error(e)}"
-            )
 
-    return results, highest_uid
+    if parsed:
+        # Explicitly mark as read — RFC822 fetch doesn't always set \Seen on all servers.
+        # One command after all chunks, so a dropped connection leaves nothing marked read.
+        try:
+            await loop.run_in_executor(None, client.add_flags, parsed, [b"\\Seen"])
+        except (IMAPClient.AbortError, OSError):
+            raise
+        except Exception as e:
+            PrintStyle.error(f"Email: error marking messages read: {format_error(e)}")
+    return results, failed
 
 
-async def _fetch_single(
-    client: IMAPClient,
-    msg_id: int,
+async def _parse_message(
+    raw: dict,
     download_folder: str,
     sender_whitelist: list[str] | None,
 ) -> InboundMessage | None:
-    loop = asyncio.get_event_loop()
-
-    def _sync_fetch():
-        data = client.fetch([msg_id], ["RFC822"])[msg_id]
-        # Explicitly mark as read — RFC822 fetch doesn't always set \Seen on all servers
-        client.add_flags([msg_id], [b"\\Seen"])
-        return data
-
-    raw = await loop.run_in_executor(None, _sync_fetch)
     email_data = raw.get(b"RFC822")
     if not email_data:
         return None
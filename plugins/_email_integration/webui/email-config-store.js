@@ -196,6 +196,8 @@ export const store = createStore("emailConfig", {
       sender_whitelist: [],
       project: "",
       dispatcher_model: "utility",
+      dispatcher_batch_size: 10,
+      dispatcher_concurrency: 4,
       chat_model_preset: "",
       dispatcher_instructions: "",
       agent_instructions: "",
@@ -12,4 +12,6 @@ class InfectionAnalyzeThoughts(Extension):
             return
         # Start background analysis once thoughts are complete
         if parsed.get("heading") or parsed.get("tool_name"):
+            # the windowed collector may lag behind the stream
+            checker.collect_response(text)
             checker.start_analysis(self.agent)
@@ -4,6 +4,9 @@ from plugins._infection_check.helpers.checker import get_checker
 
 
 class InfectionCollectResponse(Extension):
+    # only the latest full text is kept, no need to run for every delta
+    stream_window_seconds = 0.25
+
     async def execute(self, loop_data=LoopData(), stream_data=None, **kwargs):
         if not self.agent or stream_data is None:
             return
@@ -23,6 +23,8 @@ class Status(ApiHandler):
                 "ready": await runtime.is_downloaded(),
                 "loading": await runtime.is_downloading(),
             },
+            "inference": runtime.get_inference_metrics(),
+            "audio_cache": runtime.get_audio_cache_stats(),
             "package": {
                 "version": package_version,
                 "error": package_error,
@@ -0,0 +1,33 @@
+import json
+
+from helpers.api import ApiHandler, Request, Response
+from plugins._kokoro_tts.helpers import runtime
+
+
+class SynthesizeStream(ApiHandler):
+    """Newline-delimited JSON: one WAV per sentence as soon as it is synthesized."""
+
+    async def process(self, input: dict, request: Request) -> dict | Response:
+        if not runtime.is_globally_enabled():
+            return Response(status=409, response="Kokoro TTS plugin is disabled")
+
+        text = str(input.get("text") or "").strip()
+        if not text:
+            return Response(status=400, response="Missing text")
+
+        sentences = runtime.split_sentences(text)
+        config = runtime.get_config()
+
+        def generate():
+            try:
+                for index, audio in runtime.iter_sentences(sentences, config):
+                    yield _line({"index": index, "audio": audio, "mime_type": "audio/wav"})
+                yield _line({"done": True})
+            except Exception as e:
+                yield _line({"error": str(e)})
+
+        return Response(generate(), mimetype="application/x-ndjson")
+
+
+def _line(data: dict) -> str:
+    return json.dumps(data) + "\n"
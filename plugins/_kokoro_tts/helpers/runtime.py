@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import io
+import json
+import re
+import threading
 import warnings
-from typing import Any
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Iterator
 
+import numpy as np
 import soundfile as sf
 
 from helpers import plugins
+from helpers.inference_worker import get_inference_worker
 from helpers.notification import (
     NotificationManager,
     NotificationPriority,
@@ -28,8 +35,21 @@ DEFAULT_CONFIG = {
     "speed": 1.1,
 }
 
-_pipeline = None
-is_updating_model = False
+# Whisper and Kokoro share one inference thread; the pipeline lives in this slot
+MODEL_SLOT = "kokoro"
+MODEL_VERSION = "hexgrad/Kokoro-82M"
+
+SAMPLE_RATE = 24000
+# Synthesized sentences kept as 16-bit PCM, keyed by (text, voice, speed, model)
+AUDIO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+_worker = get_inference_worker("speech")
+_audio_cache: OrderedDict[str, bytes] = OrderedDict()
+_audio_cache_bytes = 0
+_audio_cache_lock = threading.Lock()
+_audio_cache_stats = {"hits": 0, "misses": 0}
 
 
 def normalize_config(config: dict[str, Any] | None) -> dict[str, Any]:
@@ -68,42 +88,64 @@ async def preload(config: dict[str, Any] | None = None):
 
 
 async def _preload():
-    global _pipeline, is_updating_model
+    await _worker.load(MODEL_SLOT, MODEL_VERSION, _load_pipeline)
 
-    while is_updating_model:
-        await asyncio.sleep(0.1)
 
-    try:
-        is_updating_model = True
-        if not _pipeline:
-            NotificationManager.send_notification(
-                NotificationType.INFO,
-                NotificationPriority.NORMAL,
-                "Loading Kokoro TTS model...",
-                display_time=99,
-                group="kokoro-preload",
-            )
-            PrintStyle.standard("Loading Kokoro TTS model...")
-            from kokoro import KPipeline
-
-            _pipeline = KPipeline(lang_code="a", repo_id="hexgrad/Kokoro-82M")
-            NotificationManager.send_notification(
-                NotificationType.INFO,
-                NotificationPriority.NORMAL,
-                "Kokoro TTS model loaded.",
-                display_time=2,
-                group="kokoro-preload",
-            )
-    finally:
-        is_updating_model = False
+def _load_pipeline():
+    # runs on the inference worker thread
+    NotificationManager.send_notification(
+        NotificationType.INFO,
+        NotificationPriority.NORMAL,
+        "Loading Kokoro TTS model...",
+        display_time=99,
+        group="kokoro-preload",
+    )
+    PrintStyle.standard("Loading Kokoro TTS model...")
+    from kokoro import KPipeline
+
+    pipeline = KPipeline(lang_code="a", repo_id=MODEL_VERSION)
+    NotificationManager.send_notification(
+        NotificationType.INFO,
+        NotificationPriority.NORMAL,
+        "Kokoro TTS model loaded.",
+        display_time=2,
+        group="kokoro-preload",
+    )
+    return pipeline
 
 
 async def is_downloading() -> bool:
-    return is_updating_model
+    return _worker.is_loading(MODEL_SLOT)
 
 
 async def is_downloaded() -> bool:
-    return _pipeline is not None
+    return _worker.resident_version(MODEL_SLOT) is not None
+
+
+def get_inference_metrics() -> dict[str, Any]:
+    """Queue depth, timings and resident models of the shared speech inference worker."""
+    return _worker.metrics()
+
+
+def get_audio_cache_stats() -> dict[str, int]:
+    with _audio_cache_lock:
+        return {
+            **_audio_cache_stats,
+            "entries": len(_audio_cache),
+            "bytes": _audio_cache_bytes,
+            "max_bytes": AUDIO_CACHE_MAX_BYTES,
+        }
+
+
+def clear_audio_cache() -> None:
+    global _audio_cache_bytes
+    with _audio_cache_lock:
+        _audio_cache.clear()
+        _audio_cache_bytes = 0
+
+
+def split_sentences(text: str) -> list[str]:
+    return [part.strip() for part in _SENTENCE_END.split(text) if part.strip()]
 
 
 async def synthesize_sentences(
@@ -117,30 +159,137 @@ async def synthesize_sentences(
     )
 
 
+async def stream_sentences(
+    sentences: list[str], config: dict[str, Any] | None = None
+) -> AsyncIterator[tuple[int, str]]:
+    """Yield (index, base64 WAV) for each sentence as soon as it is synthesized."""
+    cfg = normalize_config(config or get_config())
+    voice, speed = str(cfg["voice"]), float(cfg["speed"])
+    for index, sentence in _clean_sentences(sentences):
+        pcm = await _sentence_pcm(sentence, voice, speed)
+        if pcm:
+            yield index, _encode_wav(pcm)
+
+
+def iter_sentences(
+    sentences: list[str], config: dict[str, Any] | None = None
+) -> Iterator[tuple[int, str]]:
+    """stream_sentences for streamed HTTP responses, whose body is read on a WSGI thread.
+
+    The async stream is driven on a private event loop of the calling thread, so
+    inference results are awaited rather than blocked on; never call it on a loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("iter_sentences blocks; use stream_sentences on an event loop")
+
+    loop = asyncio.new_event_loop()
+    stream = stream_sentences(sentences, config)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.close()
+
+
 async def _synthesize_sentences(
     sentences: list[str], *, voice: str, speed: float
 ) -> str:
-    await _preload()
-
-    combined_audio: list[float] = []
-
     try:
-        for sentence in sentences:
-            if not sentence.strip():
-                continue
-
-            segments = _pipeline(sentence.strip(), voice=voice, speed=speed)  # type: ignore[misc]
-            for segment in list(segments):
-                audio_tensor = segment.audio
-                audio_numpy = audio_tensor.detach().cpu().numpy()  # type: ignore[union-attr]
-                combined_audio.extend(audio_numpy.tolist())
-
-        if not combined_audio:
-            return ""
-
-        buffer = io.BytesIO()
-        sf.write(buffer, combined_audio, 24000, format="WAV")
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+        parts = [
+            await _sentence_pcm(sentence, voice, speed)
+            for _, sentence in _clean_sentences(sentences)
+        ]
     except Exception as e:
         PrintStyle.error(f"Error in Kokoro TTS synthesis: {e}")
         raise
+
+    pcm = b"".join(parts)
+    if not pcm:
+        return ""
+    return _encode_wav(pcm)
+
+
+async def _sentence_pcm(sentence: str, voice: str, speed: float) -> bytes:
+    key = _audio_cache_key(sentence, voice, speed)
+    pcm = _cached_pcm(key)
+    if pcm is None:
+        pcm = await _worker.run(
+            _synthesize_pcm,
+            sentence,
+            voice,
+            speed,
+            slot=MODEL_SLOT,
+            version=MODEL_VERSION,
+            loader=_load_pipeline,
+        )
+        _store_pcm(key, pcm)
+    return pcm
+
+
+def _synthesize_pcm(pipeline, sentence: str, voice: str, speed: float) -> bytes:
+    # runs on the inference worker thread; keeps samples in numpy end to end
+    chunks = [
+        segment.audio.detach().cpu().numpy()  # type: ignore[union-attr]
+        for segment in pipeline(sentence, voice=voice, speed=speed)
+    ]
+    if not chunks:
+        return b""
+    audio = np.clip(np.concatenate(chunks), -1.0, 1.0)
+    return (audio * 32767).astype("<i2").tobytes()
+
+
+def _encode_wav(pcm: bytes) -> str:
+    buffer = io.BytesIO()
+    sf.write(
+        buffer,
+        np.frombuffer(pcm, dtype="<i2"),
+        SAMPLE_RATE,
+        format="WAV",
+        subtype="PCM_16",
+    )
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def _clean_sentences(sentences: list[str]) -> Iterator[tuple[int, str]]:
+    for index, sentence in enumerate(sentences):
+        if sentence.strip():
+            yield index, sentence.strip()
+
+
+def _audio_cache_key(sentence: str, voice: str, speed: float) -> str:
+    payload = json.dumps([MODEL_VERSION, voice, round(speed, 3), sentence])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_pcm(key: str) -> bytes | None:
+    with _audio_cache_lock:
+        pcm = _audio_cache.get(key)
+        if pcm is None:
+            _audio_cache_stats["misses"] += 1
+            return None
+        _audio_cache.move_to_end(key)
+        _audio_cache_stats["hits"] += 1
+        return pcm
+
+
+def _store_pcm(key: str, pcm: bytes) -> None:
+    global _audio_cache_bytes
+    if len(pcm) > AUDIO_CACHE_MAX_BYTES:
+        return
+    with _audio_cache_lock:
+        previous = _audio_cache.pop(key, None)
+        if previous is not None:
+            _audio_cache_bytes -= len(previous)
+        _audio_cache[key] = pcm
+        _audio_cache_bytes += len(pcm)
+        while _audio_cache_bytes > AUDIO_CACHE_MAX_BYTES:
+            _, evicted = _audio_cache.popitem(last=False)
+            _audio_cache_bytes -= len(evicted)
@@ -1,6 +1,6 @@
 import { createStore } from "/js/AlpineStore.js";
 import { toastFrontendError } from "/components/notifications/notification-store.js";
-import { callJsonApi } from "/js/api.js";
+import { callJsonApi, fetchApi } from "/js/api.js";
 import { ttsService } from "/js/tts-service.js";
 
 const PLUGIN_NAME = "_kokoro_tts";
@@ -68,16 +68,21 @@ const model = {
 
     this.providerCleanup = ttsService.registerProvider(PLUGIN_NAME, {
       synthesize: async (text) => {
-        const result = await callJsonApi(`/plugins/${PLUGIN_NAME}/synthesize`, {
-          text,
+        const response = await fetchApi(`/plugins/${PLUGIN_NAME}/synthesize_stream`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          credentials: "same-origin",
+          body: JSON.stringify({ text }),
         });
-        if (!result?.success) {
-          throw new Error(result?.error || "Kokoro TTS synthesis failed.");
+        if (!response?.ok || !response.body) {
+          throw new Error(
+            (await response?.text()) || "Kokoro TTS synthesis failed.",
+          );
         }
 
         return {
-          audioBase64: result.audio || "",
-          mimeType: result.mime_type || "audio/wav",
+          audioStream: readSentenceAudio(response),
+          mimeType: "audio/wav",
         };
       },
     });
@@ -113,4 +118,36 @@ const model = {
   },
 };
 
+// Yields base64 WAV clips from the newline-delimited JSON stream, one per sentence.
+async function* readSentenceAudio(response) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  try {
+    while (true) {
+      const { value, done } = await reader.read();
+      buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+      let newline;
+      while ((newline = buffer.indexOf("\n")) >= 0) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (!line) continue;
+
+        const message = JSON.parse(line);
+        if (message.error) {
+          throw new Error(message.error);
+        }
+        if (message.done) return;
+        if (message.audio) yield message.audio;
+      }
+
+      if (done) return;
+    }
+  } finally {
+    reader.cancel().catch(() => {});
+  }
+}
+
 export const store = createStore("kokoroTts", model);
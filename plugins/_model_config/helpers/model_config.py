@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 import os
 from copy import deepcopy
 
-import models
-from helpers import defer, plugins, files
+from helpers import defer, plugins, files, lazy_import
 from helpers.extension import call_extensions_async
 from helpers import yaml as yaml_helper
 from helpers.providers import get_provider_config, get_providers
 
+# startup migration imports this module; models (litellm, langchain) loads on first use
+models = lazy_import.lazy_module("models", "model_config")
+
 PRESETS_FILE = "presets.yaml"
 FALLBACK_PRESETS_FILE = "mode_presets_fallback.yaml"
 PROVIDER_METADATA_FILE = "provider_metadata.yaml"
@@ -810,6 +814,7 @@ def build_model_config(cfg: dict, model_type: models.ModelType) -> models.ModelC
         api_base=cfg.get("api_base", ""),
         ctx_length=int(cfg.get("ctx_length", 0)),
         vision=bool(cfg.get("vision", False)),
+        max_image_pixels=int(cfg.get("max_image_pixels", 0) or 0),
         limit_requests=int(cfg.get("rl_requests", 0)),
         limit_input=int(cfg.get("rl_input", 0)),
         limit_output=int(cfg.get("rl_output", 0)),
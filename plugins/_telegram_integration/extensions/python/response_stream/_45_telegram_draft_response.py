@@ -4,6 +4,8 @@ from plugins._telegram_integration.helpers.constants import CTX_TG_BOT
 
 
 class TelegramDraftResponse(Extension):
+    # drafts are throttled to one edit per second anyway
+    stream_window_seconds = 0.5
 
     async def execute(
         self,
@@ -11,6 +11,7 @@ from helpers import integration_commands
 
 from helpers.errors import format_error
 from helpers.print_style import PrintStyle
+from plugins._telegram_integration.helpers.outbound import close_outbound
 
 # Data models
 
@@ -228,6 +229,7 @@ async def stop_bot(name: str):
         await instance.bot.session.close()
     except Exception:
         pass
+    await close_outbound(instance.bot.token)
     PrintStyle.info(f"Telegram ({name}): stopped")
 
 
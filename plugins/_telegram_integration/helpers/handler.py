@@ -630,8 +630,8 @@ def _inherit_model_override(ctx: AgentContext):
     except Exception:
         return
     source = max(
-        (c for c in AgentContext.all()
-         if c.id != ctx.id and c.get_data("project") == project and c.get_data("chat_model_override")),
+        (c for c in AgentContext.find(data={"project": project})
+         if c.id != ctx.id and c.get_data("chat_model_override")),
         key=lambda c: c.last_message,
         default=None,
     )
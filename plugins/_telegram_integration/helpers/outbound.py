@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from helpers.errors import format_error
+from helpers.print_style import PrintStyle
+
+# Telegram Bot API limits: about 30 messages per second per bot, one per second in a
+# private chat and 20 per minute in a group. Edits count like messages.
+GLOBAL_INTERVAL_SECONDS: float = 1 / 30
+PRIVATE_CHAT_INTERVAL_SECONDS: float = 1.0
+GROUP_CHAT_INTERVAL_SECONDS: float = 3.0
+MAX_RATE_LIMIT_RETRIES: int = 2
+REQUEST_TIMEOUT_SECONDS: float = 10.0
+CONNECTIONS_PER_SESSION: int = 8
+
+# Bot API methods whose pending calls for the same message collapse into the newest one
+COALESCED_METHODS: frozenset[str] = frozenset({"editMessageText"})
+
+
+@dataclass
+class _PendingCall:
+    payload: dict[str, object]
+    result: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+    sending: bool = False
+
+
+class TelegramOutbound:
+    """Pooled HTTP sessions and a rate-limited send queue for one bot token.
+
+    aiohttp sessions are bound to their event loop, so one session is kept per loop the
+    bot is used from. Rate limiting reserves time slots under a thread lock and works
+    across loops. Pending edits of the same message are coalesced: the newest payload is
+    sent once in the slot of the oldest, and every waiting caller gets its result.
+    """
+
+    def __init__(self, token: str, api_base: str) -> None:
+        self.token = token
+        self.api_base = api_base
+        self.global_interval = GLOBAL_INTERVAL_SECONDS
+        self.private_chat_interval = PRIVATE_CHAT_INTERVAL_SECONDS
+        self.group_chat_interval = GROUP_CHAT_INTERVAL_SECONDS
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._pending: dict[tuple[str, object, object], _PendingCall] = {}
+        self._next_global = 0.0
+        self._next_chat: dict[object, float] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "coalesced": 0, "rate_limited": 0, "sessions": 0}
+
+    async def post(self, method: str, payload: dict[str, object]) -> dict:
+        chat_id = payload.get("chat_id")
+        if method not in COALESCED_METHODS or "message_id" not in payload:
+            await self._wait_turn(chat_id)
+            return await self._send(method, payload)
+
+        key = (method, chat_id, payload.get("message_id"))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None and not pending.sending:
+                pending.payload = payload
+                self.stats["coalesced"] += 1
+                owner = False
+            else:
+                pending = _PendingCall(payload)
+                self._pending[key] = pending
+                owner = True
+        if not owner:
+            return await asyncio.wrap_future(pending.result)
+
+        try:
+            await self._wait_turn(chat_id)
+            with self._lock:
+                pending.sending = True
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+                payload = pending.payload
+            data = await self._send(method, payload)
+        except BaseException:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+            if not pending.result.done():
+                pending.result.set_result({})  # coalesced callers see a failed call
+            raise
+        pending.result.set_result(data)
+        return data
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _chat_interval(self, chat_id: object) -> float:
+        try:
+            # group and channel ids are negative
+            return self.group_chat_interval if int(chat_id) < 0 else self.private_chat_interval  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return self.private_chat_interval
+
+    def _reserve(self, chat_id: object) -> float:
+        """Reserve the next send slot for chat_id; return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_chat.get(chat_id, 0.0))
+            if chat_id is not None:
+                self._next_chat[chat_id] = start + self._chat_interval(chat_id)
+            return start - now
+
+    def _reserve_global(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_global)
+            self._next_global = start + self.global_interval
+            return start - now
+
+    async def _wait_turn(self, chat_id: object) -> None:
+        # the chat slot is waited for first so a busy chat does not hold up the others
+        delay = self._reserve(chat_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        delay = self._reserve_global()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _back_off(self, chat_id: object, seconds: float) -> None:
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._next_global = max(self._next_global, until)
+            if chat_id is not None:
+                self._next_chat[chat_id] = max(self._next_chat.get(chat_id, 0.0), until)
+
+    async def _send(self, method: str, payload: dict[str, object]) -> dict:
+        url = f"{self.api_base}/bot{self.token}/{method}"
+        data: dict = {}
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                session = self._session()
+                self._count("requests")
+                async with session.post(url, json=payload) as response:
+                    data = await response.json(content_type=None)
+                    if not isinstance(data, dict):
+                        data = {}
+                    if response.status == 200 and data.get("ok"):
+                        return data
+            except Exception as e:
+                PrintStyle.debug(f"Telegram {method} failed: {format_error(e)}")
+                return {}
+
+            retry_after = _retry_after(data)
+            if retry_after is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            self._count("rate_limited")
+            self._back_off(payload.get("chat_id"), retry_after)
+            await self._wait_turn(payload.get("chat_id"))
+        PrintStyle.debug(f"Telegram {method} failed: {data}")
+        return data
+
+    def _session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                for stale_loop in [l for l in self._sessions if l.is_closed()]:
+                    del self._sessions[stale_loop]
+                session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+                    connector=aiohttp.TCPConnector(limit=CONNECTIONS_PER_SESSION),
+                )
+                self._sessions[loop] = session
+                self.stats["sessions"] += 1
+            return session
+
+    async def close(self) -> None:
+        """Close the pooled sessions; each is closed on the loop it belongs to."""
+        with self._lock:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+        current = asyncio.get_running_loop()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                try:
+                    await asyncio.wait_for(
+                        asyncio.wrap_future(
+                            asyncio.run_coroutine_threadsafe(session.close(), loop)
+                        ),
+                        REQUEST_TIMEOUT_SECONDS,
+                    )
+                except Exception:
+                    pass
+
+
+def _retry_after(data: dict) -> float | None:
+    if data.get("error_code") != 429:
+        return None
+    parameters = data.get("parameters")
+    try:
+        return float(parameters.get("retry_after", 1)) if isinstance(parameters, dict) else 1.0
+    except (TypeError, ValueError):
+        return 1.0
+
+
+# One outbound per bot token, shared by every caller of the raw Bot API helpers
+
+_outbounds: dict[str, TelegramOutbound] = {}
+_outbounds_lock = threading.Lock()
+
+
+def get_outbound(token: str, api_base: str) -> TelegramOutbound:
+    with _outbounds_lock:
+        outbound = _outbounds.get(token)
+        if outbound is None or outbound.api_base != api_base:
+            outbound = TelegramOutbound(token, api_base)
+            _outbounds[token] = outbound
+        return outbound
+
+
+async def close_outbound(token: str) -> None:
+    with _outbounds_lock:
+        outbound = _outbounds.pop(token, None)
+    if outbound is not None:
+        await outbound.close()
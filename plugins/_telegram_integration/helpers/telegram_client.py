@@ -1,7 +1,6 @@
 import os
 import re
 
-import aiohttp
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import (
@@ -12,6 +11,7 @@ from aiogram.types import (
 
 from helpers.errors import format_error
 from helpers.print_style import PrintStyle
+from plugins._telegram_integration.helpers import outbound
 
 _UNSET = object()  # sentinel: "not provided" (lets Bot default apply)
 
@@ -317,18 +317,8 @@ async def raw_edit_reply_markup(
 
 
 async def _raw_post(token: str, method: str, payload: dict[str, object]) -> dict:
-    url = f"{TELEGRAM_API_BASE}/bot{token}/{method}"
-    try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(url, json=payload) as response:
-                data = await response.json(content_type=None)
-                if response.status != 200 or not data.get("ok"):
-                    PrintStyle.debug(f"Telegram {method} failed: {data}")
-                return data if isinstance(data, dict) else {}
-    except Exception as e:
-        PrintStyle.debug(f"Telegram {method} failed: {format_error(e)}")
-        return {}
+    # pooled per-bot session with Telegram rate limits and coalesced message edits
+    return await outbound.get_outbound(token, TELEGRAM_API_BASE).post(method, payload)
 
 # File download
 
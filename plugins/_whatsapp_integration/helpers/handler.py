@@ -42,6 +42,10 @@ CTX_WA_ATTACHMENTS = "_wa_response_attachments"
 CTX_WA_REPLY_TO = "_wa_reply_to"
 CTX_WA_TYPING_ACTIVE = "_wa_typing_active"
 
+# inbound messages find their chats by JID, typing refresh by the active flag
+AgentContext.register_data_index(CTX_WA_CHAT_ID)
+AgentContext.register_data_index(CTX_WA_TYPING_ACTIVE, bool)
+
 # Poll task — lives here (not in extension module) because
 # extension modules are re-executed on each job_loop tick,
 # which would reset module-level state and orphan running tasks.
@@ -54,11 +58,7 @@ _poll_task: asyncio.Task | None = None  # type: ignore[type-arg]
 
 async def _refresh_typing(base_url: str) -> None:
     """Re-send composing for all contexts with active typing flag."""
-    for ctx in AgentContext._contexts.values():
-        if not isinstance(ctx, AgentContext):
-            continue
-        if not ctx.data.get(CTX_WA_TYPING_ACTIVE):
-            continue
+    for ctx in AgentContext.find(data={CTX_WA_TYPING_ACTIVE: True}):
         chat_id = ctx.data.get(CTX_WA_CHAT_ID, "")
         if chat_id:
             await wa_client.send_typing(base_url, chat_id)
@@ -276,14 +276,7 @@ async def _handle_control_message(
 
 def _find_chats_by_jid(chat_id: str) -> list[str]:
     """Return context IDs for chats matching the given WhatsApp JID, newest first."""
-    results = []
-    for ctx_id, ctx in AgentContext._contexts.items():
-        if not isinstance(ctx, AgentContext):
-            continue
-        if ctx.data.get(CTX_WA_CHAT_ID) != chat_id:
-            continue
-        results.append(ctx_id)
-
+    results = [ctx.id for ctx in AgentContext.find(data={CTX_WA_CHAT_ID: chat_id})]
     results.sort(reverse=True)
     return results
 
@@ -24,6 +24,7 @@ class Status(ApiHandler):
                 "loading": await runtime.is_downloading(),
                 "loaded_model": runtime.get_loaded_model_name(),
             },
+            "inference": runtime.get_inference_metrics(),
             "package": {
                 "version": package_version,
                 "error": package_error,
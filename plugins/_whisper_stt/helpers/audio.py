@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import tempfile
+import wave
+
+import numpy as np
+
+
+# Whisper works on 16 kHz mono float32 samples
+SAMPLE_RATE = 16000
+# Voice activity trimming: 30 ms frames, 200 ms of context kept around speech
+VAD_FRAME_SECONDS = 0.03
+VAD_PADDING_SECONDS = 0.2
+# Frames quieter than this RMS level (or than a fraction of the loudest frame) are silence
+VAD_MIN_RMS = 0.01
+VAD_RELATIVE_RMS = 0.1
+
+_PIPE_FORMATS = (
+    b"\x1a\x45\xdf\xa3",  # WebM / Matroska (Chrome, Firefox MediaRecorder)
+    b"OggS",  # Ogg / Opus
+)
+
+
+def decode(audio_bytes: bytes) -> np.ndarray:
+    """Decode recorded audio to 16 kHz mono float32 samples.
+
+    PCM WAV is decoded in memory. Streamable containers (WebM, Ogg) are piped
+    through ffmpeg without a temp file; anything else (e.g. MP4, whose index may
+    sit at the end) goes through a temp file like Whisper's own loader.
+    """
+    samples = decode_wav(audio_bytes)
+    if samples is not None:
+        return samples
+    if audio_bytes.startswith(_PIPE_FORMATS):
+        return _ffmpeg_decode(["-i", "pipe:0"], audio_bytes)
+    return _decode_file(audio_bytes)
+
+
+def decode_wav(audio_bytes: bytes) -> np.ndarray | None:
+    """Decode 8/16/32-bit PCM WAV in memory; None when the bytes are not such a WAV."""
+    if audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+    try:
+        with wave.open(io.BytesIO(audio_bytes)) as wav:
+            width = wav.getsampwidth()
+            channels = wav.getnchannels()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        return None
+
+    if channels > 1:
+        samples = samples[: len(samples) // channels * channels]
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return _resample(samples, rate)
+
+
+def trim_silence(samples: np.ndarray) -> np.ndarray:
+    """Drop leading and trailing silence; an all-silent clip becomes empty."""
+    frame = int(SAMPLE_RATE * VAD_FRAME_SECONDS)
+    count = len(samples) // frame
+    if count == 0:
+        return samples
+
+    frames = samples[: count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    threshold = max(VAD_MIN_RMS, float(rms.max()) * VAD_RELATIVE_RMS)
+    voiced = np.flatnonzero(rms >= threshold)
+    if voiced.size == 0:
+        return samples[:0]
+
+    padding = int(SAMPLE_RATE * VAD_PADDING_SECONDS)
+    start = max(0, int(voiced[0]) * frame - padding)
+    end = min(len(samples), (int(voiced[-1]) + 1) * frame + padding)
+    return samples[start:end]
+
+
+def _resample(samples: np.ndarray, rate: int) -> np.ndarray:
+    if rate == SAMPLE_RATE or samples.size == 0:
+        return samples.astype(np.float32, copy=False)
+    # linear interpolation is plenty for speech recognition input
+    duration = samples.size / rate
+    target = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    source = np.arange(samples.size) / rate
+    return np.interp(target, source, samples).astype(np.float32)
+
+
+def _ffmpeg_decode(input_args: list[str], audio_bytes: bytes | None = None) -> np.ndarray:
+    command = [
+        "ffmpeg",
+        "-threads", "0",
+        *input_args,
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-",
+    ]
+    try:
+        output = subprocess.run(
+            command,
+            input=audio_bytes,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to decode audio: {e.stderr.decode(errors='replace')}") from e
+    return np.frombuffer(output, dtype="<i2").astype(np.float32) / 32768
+
+
+def _decode_file(audio_bytes: bytes) -> np.ndarray:
+    with tempfile.NamedTemporaryFile(suffix=".audio", delete=False) as audio_file:
+        audio_file.write(audio_bytes)
+        temp_path = audio_file.name
+    try:
+        return _ffmpeg_decode(["-nostdin", "-i", temp_path])
+    finally:
+        try:
+            os.remove(temp_path)
+        except Exception:
+            pass
@@ -1,22 +1,20 @@
 from __future__ import annotations
 
-import asyncio
 import base64
-import os
-import tempfile
 import warnings
 from typing import Any
 
 import whisper
 
 from helpers import files, plugins
+from helpers.inference_worker import get_inference_worker
 from helpers.notification import (
     NotificationManager,
     NotificationPriority,
     NotificationType,
 )
 from helpers.print_style import PrintStyle
-from plugins._whisper_stt.helpers import migration
+from plugins._whisper_stt.helpers import audio, migration
 
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -33,10 +31,10 @@ DEFAULT_CONFIG = {
 }
 VALID_MODEL_SIZES = {"tiny", "base", "small", "medium", "large", "turbo"}
 VALID_MESSAGE_MODES = {"send", "draft"}
+# Whisper and Kokoro share one inference thread; the model lives in this slot
+MODEL_SLOT = "whisper"
 
-_model = None
-_model_name = ""
-is_updating_model = False
+_worker = get_inference_worker("speech")
 
 
 def normalize_config(config: dict[str, Any] | None) -> dict[str, Any]:
@@ -94,7 +92,7 @@ def get_config() -> dict[str, Any]:
 
 
 def get_loaded_model_name() -> str:
-    return _model_name
+    return _worker.resident_version(MODEL_SLOT) or ""
 
 
 def is_globally_enabled() -> bool:
@@ -110,44 +108,44 @@ async def preload(model_name: str | None = None):
 
 
 async def _preload(model_name: str):
-    global _model, _model_name, is_updating_model
+    await _worker.load(MODEL_SLOT, model_name, lambda: _load_model(model_name))
 
-    while is_updating_model:
-        await asyncio.sleep(0.1)
 
-    try:
-        is_updating_model = True
-        if not _model or _model_name != model_name:
-            NotificationManager.send_notification(
-                NotificationType.INFO,
-                NotificationPriority.NORMAL,
-                "Loading Whisper model...",
-                display_time=99,
-                group="whisper-preload",
-            )
-            PrintStyle.standard(f"Loading Whisper model: {model_name}")
-            _model = whisper.load_model(
-                name=model_name,
-                download_root=files.get_abs_path("/tmp/models/whisper"),
-            )
-            _model_name = model_name
-            NotificationManager.send_notification(
-                NotificationType.INFO,
-                NotificationPriority.NORMAL,
-                "Whisper model loaded.",
-                display_time=2,
-                group="whisper-preload",
-            )
-    finally:
-        is_updating_model = False
+def _load_model(model_name: str):
+    # runs on the inference worker thread
+    NotificationManager.send_notification(
+        NotificationType.INFO,
+        NotificationPriority.NORMAL,
+        "Loading Whisper model...",
+        display_time=99,
+        group="whisper-preload",
+    )
+    PrintStyle.standard(f"Loading Whisper model: {model_name}")
+    model = whisper.load_model(
+        name=model_name,
+        download_root=files.get_abs_path("/tmp/models/whisper"),
+    )
+    NotificationManager.send_notification(
+        NotificationType.INFO,
+        NotificationPriority.NORMAL,
+        "Whisper model loaded.",
+        display_time=2,
+        group="whisper-preload",
+    )
+    return model
 
 
 async def is_downloading() -> bool:
-    return is_updating_model
+    return _worker.is_loading(MODEL_SLOT)
 
 
 async def is_downloaded() -> bool:
-    return _model is not None
+    return _worker.resident_version(MODEL_SLOT) is not None
+
+
+def get_inference_metrics() -> dict[str, Any]:
+    """Queue depth, timings and resident models of the shared speech inference worker."""
+    return _worker.metrics()
 
 
 async def transcribe(
@@ -164,26 +162,29 @@ async def transcribe(
 async def _transcribe(
     model_name: str, audio_bytes_b64: str, *, language: str | None = None
 ) -> dict[str, Any]:
-    await _preload(model_name)
-
     audio_bytes = base64.b64decode(audio_bytes_b64)
+    return await _worker.run(
+        _transcribe_sync,
+        audio_bytes,
+        language,
+        slot=MODEL_SLOT,
+        version=model_name,
+        loader=lambda: _load_model(model_name),
+    )
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as audio_file:
-        audio_file.write(audio_bytes)
-        temp_path = audio_file.name
 
-    try:
-        kwargs: dict[str, Any] = {"fp16": False}
-        if language:
-            kwargs["language"] = language
-
-        result = _model.transcribe(temp_path, **kwargs)  # type: ignore[union-attr]
-        return result if isinstance(result, dict) else {}
-    finally:
-        try:
-            os.remove(temp_path)
-        except Exception:
-            pass
+def _transcribe_sync(model, audio_bytes: bytes, language: str | None) -> dict[str, Any]:
+    samples = audio.trim_silence(audio.decode(audio_bytes))
+    if samples.size == 0:
+        # nothing but silence: skip inference
+        return {"text": "", "segments": [], "language": language or ""}
+
+    kwargs: dict[str, Any] = {"fp16": False}
+    if language:
+        kwargs["language"] = language
+
+    result = model.transcribe(samples, **kwargs)
+    return result if isinstance(result, dict) else {}
 
 
 def _resolve_language(language: str) -> str | None:
@@ -6,6 +6,8 @@ import { ttsService } from "/js/tts-service.js";
 import { sendMessage, updateChatInput } from "/index.js";
 
 const PLUGIN_NAME = "_whisper_stt";
+// Whisper's input rate; recordings are sent as 16 kHz mono PCM WAV when the browser can decode them
+const WAV_SAMPLE_RATE = 16000;
 
 const Status = {
   INACTIVE: "inactive",
@@ -615,7 +617,10 @@ class MicrophoneInput {
       return;
     }
 
-    const audioBlob = new Blob(this.audioChunks, { type: "audio/wav" });
+    const recording = new Blob(this.audioChunks, {
+      type: this.mediaRecorder?.mimeType || "audio/webm",
+    });
+    const audioBlob = await this.toPcmWav(recording);
     const audio = await this.convertBlobToBase64(audioBlob);
 
     try {
@@ -637,6 +642,30 @@ class MicrophoneInput {
     }
   }
 
+  async toPcmWav(recording) {
+    // the server decodes PCM WAV in memory; other formats need ffmpeg there
+    const OfflineContext =
+      window.OfflineAudioContext || window.webkitOfflineAudioContext;
+    if (!this.audioContext || !OfflineContext) return recording;
+
+    try {
+      const decoded = await this.audioContext.decodeAudioData(
+        await recording.arrayBuffer(),
+      );
+      const length = Math.max(1, Math.ceil(decoded.duration * WAV_SAMPLE_RATE));
+      const offline = new OfflineContext(1, length, WAV_SAMPLE_RATE);
+      const source = offline.createBufferSource();
+      source.buffer = decoded;
+      source.connect(offline.destination);
+      source.start();
+      const rendered = await offline.startRendering();
+      return encodeWav(rendered.getChannelData(0), WAV_SAMPLE_RATE);
+    } catch (error) {
+      console.warn("[Whisper STT] Sending the recording undecoded", error);
+      return recording;
+    }
+  }
+
   convertBlobToBase64(audioBlob) {
     return new Promise((resolve, reject) => {
       const reader = new FileReader();
@@ -718,4 +747,35 @@ class MicrophoneInput {
   }
 }
 
+function encodeWav(samples, sampleRate) {
+  const buffer = new ArrayBuffer(44 + samples.length * 2);
+  const view = new DataView(buffer);
+  const writeText = (offset, text) => {
+    for (let index = 0; index < text.length; index += 1) {
+      view.setUint8(offset + index, text.charCodeAt(index));
+    }
+  };
+
+  writeText(0, "RIFF");
+  view.setUint32(4, 36 + samples.length * 2, true);
+  writeText(8, "WAVE");
+  writeText(12, "fmt ");
+  view.setUint32(16, 16, true);
+  view.setUint16(20, 1, true); // PCM
+  view.setUint16(22, 1, true); // mono
+  view.setUint32(24, sampleRate, true);
+  view.setUint32(28, sampleRate * 2, true);
+  view.setUint16(32, 2, true);
+  view.setUint16(34, 16, true);
+  writeText(36, "data");
+  view.setUint32(40, samples.length * 2, true);
+
+  for (let index = 0; index < samples.length; index += 1) {
+    const sample = Math.max(-1, Math.min(1, samples[index]));
+    view.setInt16(44 + index * 2, sample < 0 ? sample * 0x8000 : sample * 0x7fff, true);
+  }
+
+  return new Blob([buffer], { type: "audio/wav" });
+}
+
 export const store = createStore("whisperStt", model);
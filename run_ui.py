@@ -1,10 +1,12 @@
-import initialize
-from helpers import dotenv, extension, runtime
+from helpers.server_startup import initialization, run_uvicorn_with_retries
+from helpers import dotenv, extension, lazy_import, runtime
 from helpers.api import csrf_protect, requires_auth
 from helpers.print_style import PrintStyle
-from helpers.server_startup import run_uvicorn_with_retries
 from helpers.ui_server import UiServerRuntime, configure_process_environment
 
+# initialize imports the agent runtime (models, litellm, langchain); it loads after the server listens
+initialize = lazy_import.lazy_module("initialize", "run_ui")
+
 
 def run():
     configure_process_environment()
@@ -15,9 +17,6 @@ def run():
     PrintStyle().print("Preparing web server runtime...")
     server_runtime, host, port = prepare_web_runtime()
 
-    PrintStyle().print("Initializing Agent Zero components...")
-    init_a0()
-
     PrintStyle().print("Starting UI/API server...")
     start_web_server(server_runtime, host, port)
 
@@ -39,6 +38,8 @@ def prepare_web_runtime() -> tuple[UiServerRuntime, str, int]:
 
 
 def start_web_server(server_runtime: UiServerRuntime, host: str, port: int) -> None:
+    # API and WebSocket requests wait for init_a0; static assets and health do not
+    initialization.begin()
     run_uvicorn_with_retries(
         host=host,
         port=port,
@@ -46,9 +47,18 @@ def start_web_server(server_runtime: UiServerRuntime, host: str, port: int) -> N
         flush_callback=create_flush_callback(),
         access_log=server_runtime.access_log_enabled(),
         ws="wsproto",
+        on_ready=initialize_after_listening,
     )
 
 
+def initialize_after_listening() -> None:
+    PrintStyle().print("Initializing Agent Zero components...")
+    try:
+        init_a0()
+    finally:
+        initialization.finish()
+
+
 def create_flush_callback():
     def flush_and_shutdown_callback() -> None:
         """
@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from agent import AgentConfig, AgentContext, AgentContextType
+
+HANDLER = "test_index_handler"
+SENDER = "test_index_sender"
+
+
+@pytest.fixture
+def make_context(monkeypatch):
+    # an empty registry and index, so contexts left by other tests do not show up in lookups
+    monkeypatch.setattr(AgentContext, "_contexts", {})
+    monkeypatch.setattr(AgentContext, "_index", {})
+    monkeypatch.setattr(AgentContext, "_data_indexes", dict(AgentContext._data_indexes))
+    created = []
+    config = AgentConfig(profile="agent0", mcp_servers='{"mcpServers": {}}')
+    AgentContext.register_data_index(HANDLER)
+    AgentContext.register_data_index(SENDER, lambda value: str(value).lower())
+
+    def make(**kwargs):
+        ctx = AgentContext(config=config, set_current=False, **kwargs)
+        created.append(ctx)
+        return ctx
+
+    yield make
+    for ctx in created:
+        AgentContext.remove(ctx.id)
+
+
+def _ids(contexts):
+    return [ctx.id for ctx in contexts]
+
+
+def test_find_by_name_type_and_data_tags(make_context):
+    first = make_context(name="Inbox", data={HANDLER: "support", SENDER: "Ann@Example.com"})
+    second = make_context(name="Inbox", type=AgentContextType.BACKGROUND, data={HANDLER: "support"})
+    make_context(name="Other", data={HANDLER: "sales", SENDER: "ann@example.com"})
+
+    assert _ids(AgentContext.find(name="Inbox")) == [first.id, second.id]
+    assert _ids(AgentContext.find(name="Inbox", type=AgentContextType.BACKGROUND)) == [second.id]
+    # the sender index is case-insensitive, like the email handler's comparison
+    assert _ids(AgentContext.find(data={HANDLER: "support", SENDER: "ANN@example.com"})) == [first.id]
+    # keys without an index are checked on the candidates
+    assert _ids(AgentContext.find(name="Inbox", data={"unindexed": None})) == []
+    assert AgentContext.find_first(name="missing") is None
+
+
+def test_index_follows_changes_and_removal(make_context):
+    ctx = make_context(name="Before", data={HANDLER: "a"})
+
+    ctx.name = "After"
+    ctx.data[HANDLER] = "b"
+    assert _ids(AgentContext.find(name="After", data={HANDLER: "b"})) == [ctx.id]
+    assert AgentContext.find(name="Before") == []
+    assert AgentContext.find(data={HANDLER: "a"}) == []
+
+    ctx.set_data(SENDER, "x@y")
+    ctx.data.update({HANDLER: "c"})
+    assert _ids(AgentContext.find(data={HANDLER: "c", SENDER: "X@Y"})) == [ctx.id]
+    ctx.data.pop(SENDER)
+    assert AgentContext.find(data={SENDER: "x@y"}) == []
+
+    ctx.data = {HANDLER: "d"}
+    assert _ids(AgentContext.find(data={HANDLER: "d"})) == [ctx.id]
+    assert AgentContext.find(data={HANDLER: "c"}) == []
+
+    # a context re-created under the same id replaces the old one in the index
+    replacement = make_context(id=ctx.id, name="After")
+    assert AgentContext.find(name="After") == [replacement]
+    assert AgentContext.find(data={HANDLER: "d"}) == []
+
+    AgentContext.remove(ctx.id)
+    assert AgentContext.find(name="After") == []
+
+
+def test_find_returns_oldest_first_after_reindexing(make_context):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    older = make_context(name="Inbox", created_at=now - timedelta(minutes=5), data={HANDLER: "a"})
+    newer = make_context(name="Inbox", created_at=now, data={HANDLER: "b"})
+
+    # moving the older chat into the other bucket puts it after the newer one there
+    older.data[HANDLER] = "b"
+    assert _ids(AgentContext.find(data={HANDLER: "b"})) == [older.id, newer.id]
+    assert AgentContext.find_first(name="Inbox") is older
+
+
+def test_index_registered_after_contexts_exist(make_context):
+    ctx = make_context(data={"late_key": 7})
+    AgentContext.register_data_index("late_key")
+    assert AgentContext.find(data={"late_key": 7}) == [ctx]
+
+
+@pytest.mark.skipif(not os.getenv("A0_RUN_BENCHMARKS"), reason="wall-clock benchmark; set A0_RUN_BENCHMARKS=1")
+def test_benchmark_lookups_across_2000_chats(make_context):
+    for idx in range(2000):
+        make_context(name=f"chat {idx}", data={HANDLER: f"h{idx % 10}", SENDER: f"user{idx}@example.com"})
+
+    def scan(handler, sender):
+        return [
+            ctx for ctx in AgentContext.all()
+            if ctx.data.get(HANDLER) == handler and ctx.data.get(SENDER, "").lower() == sender.lower()
+        ]
+
+    lookups = 1000
+    started = time.perf_counter()
+    for idx in range(lookups):
+        scanned = scan(f"h{idx % 10}", f"user{idx}@example.com")
+    scan_seconds = (time.perf_counter() - started) / lookups
+
+    started = time.perf_counter()
+    for idx in range(lookups):
+        found = AgentContext.find(data={HANDLER: f"h{idx % 10}", SENDER: f"USER{idx}@example.com"})
+        assert len(found) == 1
+    index_seconds = (time.perf_counter() - started) / lookups
+
+    print(
+        f"\ncontext lookup over {len(AgentContext.all())} chats: "
+        f"scan {scan_seconds * 1e6:.1f} us, index {index_seconds * 1e6:.1f} us"
+    )
+    assert _ids(scanned) == _ids(found)
+    assert index_seconds * 10 < scan_seconds
+
+
+def test_email_chat_lookup_does_not_load_unopened_chats(make_context):
+    from plugins._email_integration.helpers import dispatcher as disp
+    from plugins._email_integration.helpers import handler
+
+    hydrated = []
+    tags = {disp.CTX_EMAIL_HANDLER: "support", disp.CTX_EMAIL_SENDER: "user@example.com"}
+    ctx = make_context(name="saved", data=dict(tags), hydrator=hydrated.append)
+
+    chats = handler._find_handler_chats("support", "user@example.com")
+    assert [chat["history_preview"] for chat in chats] == ["(not loaded)"]
+    assert hydrated == [] and not ctx.hydrated
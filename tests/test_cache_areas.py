@@ -0,0 +1,148 @@
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import cache
+
+
+@pytest.fixture
+def area(request):
+    name = f"test_{request.node.name}(tests)"
+    yield name
+    cache.clear(name)
+    cache._policies.pop(name, None)
+    cache._stats.pop(name, None)
+
+
+def test_lru_policy_evicts_least_recently_used(area):
+    cache.set_area_policy(area, max_entries=3)
+    for key in "abc":
+        cache.add(area, key, key.upper())
+
+    assert cache.get(area, "a") == "A"  # b is now the oldest
+    cache.add(area, "d", "D")
+
+    assert cache.get(area, "b") is None
+    assert [cache.get(area, key) for key in "acd"] == ["A", "C", "D"]
+    stats = cache.get_stats(area)[area]
+    assert stats["size"] == 3
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 4
+    assert stats["misses"] == 1
+    assert stats["max_entries"] == 3
+
+
+def test_ttl_policy_expires_entries(area):
+    cache.set_area_policy(area, ttl=0.05)
+    cache.add(area, "key", "value")
+    assert cache.has(area, "key")
+
+    time.sleep(0.1)
+    assert cache.get(area, "key") is None
+    assert cache.get_stats(area)[area]["expirations"] == 1
+
+
+def test_pattern_policy_applies_to_existing_and_new_areas(area):
+    first, second = f"{area}:1", f"{area}:2"
+    try:
+        for key in range(5):
+            cache.add(first, key, key)
+        cache.set_area_policy(f"{area}:*", max_entries=2)
+        for key in range(5):
+            cache.add(second, key, key)
+
+        stats = cache.get_stats(f"{area}:*")
+        assert [stats[name]["size"] for name in (first, second)] == [2, 2]
+    finally:
+        cache.clear(f"{area}:*")
+        cache._policies.pop(f"{area}:*", None)
+        cache._stats.pop(first, None)
+        cache._stats.pop(second, None)
+
+
+def test_stats_survive_clear_and_keys_are_unchanged(area):
+    cache.add(area, "key", 1)
+    assert cache.get(area, "key") == 1
+    cache.clear("*(tests)")
+    assert cache.get(area, "key") is None
+
+    stats = cache.get_stats(area)[area]
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 0)
+
+    agent = SimpleNamespace(
+        config=SimpleNamespace(profile="dev"),
+        context=SimpleNamespace(get_data=lambda key: "demo" if key == "project" else None),
+    )
+    assert cache.determine_cache_key(agent, "point") == ("dev", "demo", "point")
+    assert cache.determine_cache_key(None, "point") == ("none", "none", "point")
+
+
+@pytest.mark.parametrize(
+    "query, body",
+    [({"area": "{area}"}, {}), ({}, {"area": "{area}"}), ({"area": "{area}"}, {"area": "other"})],
+)
+def test_stats_api_reads_area_from_query_or_body(query, body):
+    import asyncio
+
+    from api.cache_stats import CacheStats
+
+    # the fixture's name holds the parameters in brackets, which read as a glob
+    area = "test_stats_api(tests)"
+    cache.add(area, "key", 1)
+    handler = CacheStats(None, threading.Lock())  # type: ignore[arg-type]
+    request = SimpleNamespace(args={k: v.format(area=area) for k, v in query.items()})
+    input = {k: v.format(area=area) for k, v in body.items()}
+    try:
+        result = asyncio.run(handler.process(input, request))  # type: ignore[arg-type]
+    finally:
+        cache.clear(area)
+        cache._stats.pop(area, None)
+
+    assert list(result["areas"]) == [area]
+
+
+def test_benchmark_concurrent_reads_and_writes(area):
+    cache.set_area_policy(area, max_entries=500)
+    for key in range(500):
+        cache.add(area, key, key)
+    threads, iterations = 8, 20_000
+    errors = []
+
+    def worker(seed: int):
+        try:
+            for n in range(iterations):
+                key = (seed * 7919 + n) % 1000
+                if n % 10 == 0:
+                    cache.add(area, key, key)
+                else:
+                    value = cache.get(area, key)
+                    assert value is None or value == key
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(idx,)) for idx in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stats = cache.get_stats(area)[area]
+    operations = threads * iterations
+    print(
+        f"\ncache areas: {operations / elapsed:,.0f} ops/s over {threads} threads, "
+        f"hit rate {stats['hit_rate']:.2f}, evictions {stats['evictions']}"
+    )
+    assert not errors
+    assert stats["size"] <= 500
+    assert stats["evictions"] > 0
+    assert elapsed < 30
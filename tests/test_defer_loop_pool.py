@@ -0,0 +1,109 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from helpers.defer import DeferredTask, EventLoopPool, EventLoopThread
+
+
+BLOCK_SECONDS = 0.8
+
+
+@pytest.fixture
+def pool_name():
+    name = f"defer-pool-{uuid.uuid4()}"
+    yield name
+    pool = EventLoopPool._instances.pop(name, None)
+    indexes = range(max(pool.size if pool else 1, 4))
+    for index in indexes:
+        thread_name = name if index == 0 else f"{name}-{index}"
+        thread = EventLoopThread._instances.get(thread_name)
+        if thread:
+            thread.terminate()
+
+
+def test_assignment_is_sticky_and_balanced(pool_name):
+    pool = EventLoopPool(pool_name, size=3)
+
+    names = [pool.assign(f"chat-{index}") for index in range(6)]
+
+    assert names == [
+        pool_name,
+        f"{pool_name}-1",
+        f"{pool_name}-2",
+        pool_name,
+        f"{pool_name}-1",
+        f"{pool_name}-2",
+    ]
+    assert pool.assign("chat-1") == f"{pool_name}-1"
+
+    pool.release("chat-1")
+    pool.release("chat-4")
+    assert pool.assign("chat-new") == f"{pool_name}-1"
+    assert [entry["assigned"] for entry in pool.metrics()] == [2, 1, 2]
+
+
+def test_single_loop_pool_keeps_the_shared_thread_name(pool_name):
+    pool = EventLoopPool(pool_name, size=1)
+
+    assert {pool.assign(f"chat-{index}") for index in range(5)} == {pool_name}
+
+
+def _run_chats(pool: EventLoopPool) -> tuple[float, DeferredTask]:
+    async def cpu_bound_chat():
+        # stands in for a blocking extension or a large DirtyJson parse
+        end = time.perf_counter() + BLOCK_SECONDS
+        while time.perf_counter() < end:
+            pass
+
+    async def quick_chat(started: float):
+        await asyncio.sleep(0)
+        return time.perf_counter() - started
+
+    busy = DeferredTask(thread_name=pool.assign("busy-chat")).start_task(cpu_bound_chat)
+    time.sleep(0.05)
+    quick = DeferredTask(thread_name=pool.assign("quick-chat"))
+    quick.start_task(quick_chat, time.perf_counter())
+    delay = quick.result_sync(timeout=5)
+    busy.result_sync(timeout=5)
+    return delay, busy
+
+
+def test_cpu_bound_chat_does_not_delay_chat_on_another_loop(pool_name):
+    delay, busy = _run_chats(EventLoopPool(pool_name, size=2))
+
+    assert delay < BLOCK_SECONDS / 2
+
+    # the blocked loop reports its lag, the other one stays responsive
+    time.sleep(0.6)
+    metrics = {entry["thread_name"]: entry for entry in EventLoopPool(pool_name).metrics()}
+    busy_name = busy.event_loop_thread.thread_name
+    quiet_name = next(name for name in metrics if name != busy_name)
+    assert metrics[busy_name]["lag_max_ms"] >= 200
+    assert metrics[quiet_name]["lag_max_ms"] < 200
+
+
+def test_shared_loop_is_delayed_by_cpu_bound_chat(pool_name):
+    delay, _ = _run_chats(EventLoopPool(pool_name, size=1))
+
+    assert delay >= BLOCK_SECONDS / 2
+
+
+def test_shared_rate_limiter_is_safe_across_pool_loops(pool_name):
+    from helpers.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(seconds=60, requests=0)
+    pool = EventLoopPool(pool_name, size=4)
+
+    async def chat():
+        for _ in range(500):
+            limiter.add(requests=1)
+            await limiter.cleanup()
+            await limiter.get_total("requests")
+
+    tasks = [DeferredTask(thread_name=pool.assign(f"chat-{index}")).start_task(chat) for index in range(4)]
+    for task in tasks:
+        task.result_sync(timeout=10)
+
+    assert asyncio.run(limiter.get_total("requests")) == 2000
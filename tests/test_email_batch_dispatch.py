@@ -0,0 +1,174 @@
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from plugins._email_integration.helpers import dispatcher as disp
+from plugins._email_integration.helpers import handler
+from plugins._email_integration.helpers.imap_client import InboundMessage
+
+MODEL_SECONDS = 0.05
+
+
+class StubRouting:
+    """Stub dispatcher model plus recorded routing side effects."""
+
+    def __init__(self, monkeypatch, answer=None):
+        self.calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.new_chats: list[tuple[str, str]] = []
+        self.routed: list[tuple[str, str]] = []
+        self.answer = answer or (lambda count: "\n".join(f"{n} NEW_CHAT _ new" for n in range(1, count + 1)))
+        self.agent = SimpleNamespace(
+            read_prompt=lambda name, **kwargs: "\n".join([name, *map(str, kwargs.values())])
+        )
+
+        monkeypatch.setattr(handler, "_call_model", self.call_model)
+        monkeypatch.setattr(handler, "_find_handler_chats", lambda name, sender: [])
+        monkeypatch.setattr(handler, "_start_new_chat", self.start_new_chat)
+        monkeypatch.setattr(handler, "_route_to_chat", self.route_to_chat)
+        monkeypatch.setattr(
+            handler.AgentContext,
+            "get",
+            staticmethod(lambda ctx_id: object() if any(ctx_id == c for c, _ in self.new_chats) else None),
+        )
+        monkeypatch.setattr(
+            handler.AgentContext, "find_first", staticmethod(lambda **kwargs: SimpleNamespace(agent0=self.agent))
+        )
+
+    async def call_model(self, agent, handler_cfg, system, prompt):
+        count = len(re.findall(r"^### Email \d+$", prompt, re.M)) or 1
+        self.calls.append(count)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(MODEL_SECONDS)
+        self.active -= 1
+        if "dispatcher_batch" not in system:
+            return "NEW_CHAT _ single"
+        return self.answer(count)
+
+    async def start_new_chat(self, agent, handler_cfg, msg):
+        ctx_id = f"new{len(self.new_chats) + 1}"
+        self.new_chats.append((ctx_id, msg.subject))
+        return ctx_id
+
+    async def route_to_chat(self, agent, handler_cfg, msg, context_id):
+        self.routed.append((context_id, msg.subject))
+
+
+def _burst(senders: int, per_sender: int) -> list[InboundMessage]:
+    return [
+        InboundMessage(sender=f"user{s}@example.com", subject=f"s{s} m{m}", body="hello")
+        for m in range(per_sender)
+        for s in range(senders)
+    ]
+
+
+def test_batch_response_parsing():
+    decisions = disp.parse_batch_dispatcher_response(
+        "1. CONTINUE ctx_a same topic\nnoise\n3) CONTINUE #1 follow-up\n9 NEW_CHAT _ out of range", 3
+    )
+    assert [(d.action, d.context_id) for d in decisions] == [
+        ("continue_chat", "ctx_a"),
+        ("new_chat", ""),
+        ("continue_chat", "#1"),
+    ]
+    assert decisions[1].reason == "missing in batch response"
+    assert disp.batch_reference("#1") == 1
+    assert disp.batch_reference("ctx_a") is None
+
+
+@pytest.mark.asyncio
+async def test_followups_in_a_batch_join_the_chat_started_for_an_earlier_email(monkeypatch):
+    stub = StubRouting(monkeypatch, answer=lambda count: "1 NEW_CHAT _ new\n2 CONTINUE #1 same\n3 CONTINUE #3 self")
+    messages = _burst(senders=1, per_sender=3)
+
+    await handler._dispatch_all({"name": "support"}, messages)
+
+    assert stub.calls == [3]
+    assert stub.new_chats == [("new1", "s0 m0"), ("new2", "s0 m2")]
+    assert stub.routed == [("new1", "s0 m1")]
+
+
+@pytest.mark.asyncio
+async def test_continue_of_a_continued_email_joins_the_same_chat(monkeypatch):
+    stub = StubRouting(monkeypatch, answer=lambda count: "1 CONTINUE ctx_x earlier topic\n2 CONTINUE #1 same")
+    monkeypatch.setattr(handler.AgentContext, "get", staticmethod(lambda ctx_id: object() if ctx_id == "ctx_x" else None))
+
+    await handler._dispatch_all({"name": "support"}, _burst(senders=1, per_sender=2))
+
+    assert stub.new_chats == []
+    assert stub.routed == [("ctx_x", "s0 m0"), ("ctx_x", "s0 m1")]
+
+
+@pytest.mark.asyncio
+async def test_control_emails_run_after_the_earlier_emails_are_dispatched(monkeypatch):
+    stub = StubRouting(monkeypatch)
+    events: list[str] = []
+
+    async def dispatch_without_model(agent, handler_cfg, msg):
+        events.append(f"control {msg.subject} after {len(stub.new_chats)} chats")
+        return True
+
+    async def start_new_chat(agent, handler_cfg, msg):
+        events.append(f"new chat {msg.subject}")
+        stub.new_chats.append((f"new{len(stub.new_chats) + 1}", msg.subject))
+        return stub.new_chats[-1][0]
+
+    monkeypatch.setattr(handler, "_dispatch_without_model", dispatch_without_model)
+    monkeypatch.setattr(handler, "_start_new_chat", start_new_chat)
+    messages = [
+        InboundMessage(sender="ann@example.com", subject="request", body="please help"),
+        InboundMessage(sender="ann@example.com", subject="switch", body="/project demo"),
+        InboundMessage(sender="ann@example.com", subject="Re: request [a0-abc123]", body="more"),
+        InboundMessage(sender="ann@example.com", subject="another", body="new topic"),
+    ]
+
+    await handler._dispatch_all({"name": "support"}, messages)
+
+    assert events == [
+        "new chat request",
+        "control switch after 1 chats",
+        "control Re: request [a0-abc123] after 1 chats",
+        "new chat another",
+    ]
+    assert stub.calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_burst_of_50_emails(monkeypatch):
+    messages = _burst(senders=10, per_sender=5)
+
+    serial = StubRouting(monkeypatch)
+    started = time.perf_counter()
+    await handler._dispatch_all({"name": "support", "dispatcher_batch_size": 1, "dispatcher_concurrency": 1}, messages)
+    serial_seconds = time.perf_counter() - started
+
+    batched = StubRouting(monkeypatch)
+    started = time.perf_counter()
+    await handler._dispatch_all({"name": "support"}, messages)
+    batched_seconds = time.perf_counter() - started
+
+    print(
+        f"\nemail burst of 50: one by one {len(serial.calls)} model calls {serial_seconds * 1000:.0f} ms, "
+        f"batched {len(batched.calls)} calls {batched_seconds * 1000:.0f} ms"
+    )
+    assert len(serial.calls) == 50
+    assert serial.max_active == 1
+    assert batched.calls == [5] * 10
+    assert batched.max_active == handler.DISPATCHER_CONCURRENCY
+    assert len(batched.new_chats) == 50
+    # arrival order is kept per sender
+    for s in range(10):
+        assert [subject for _, subject in batched.new_chats if subject.startswith(f"s{s} ")] == [
+            f"s{s} m{m}" for m in range(5)
+        ]
@@ -0,0 +1,354 @@
+import asyncio
+import re
+import socketserver
+import sys
+import threading
+from email.message import EmailMessage
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from plugins._email_integration.helpers import imap_client
+from plugins._email_integration.helpers.imap_client import (
+    ImapSession,
+    fetch_new,
+    get_highest_uid,
+)
+
+
+def _message(uid: int) -> bytes:
+    msg = EmailMessage()
+    msg["From"] = f"Sender {uid} <sender{uid}@example.com>"
+    msg["Subject"] = f"Message {uid}"
+    msg["Message-ID"] = f"<{uid}@example.com>"
+    msg.set_content(f"body {uid}")
+    return msg.as_bytes()
+
+
+class FakeMailbox:
+    def __init__(self):
+        self.messages: list[tuple[int, bytes]] = []  # (uid, rfc822)
+        self.seen: set[int] = set()
+        self.commands: list[str] = []
+        self.logins = 0
+        self.reject_login = False
+        self.fail_fetch: set[int] = set()
+        self.idle_waiters: list[threading.Event] = []
+        self.lock = threading.Lock()
+
+    def add(self, uid: int) -> None:
+        with self.lock:
+            self.messages.append((uid, _message(uid)))
+            waiters = list(self.idle_waiters)
+        for waiter in waiters:
+            waiter.set()
+
+    def count(self, command: str) -> int:
+        return sum(1 for line in self.commands if line.startswith(command))
+
+
+class FakeImapHandler(socketserver.StreamRequestHandler):
+    """Just enough IMAP4rev1 + IDLE for IMAPClient: LOGIN, SELECT, UID SEARCH/FETCH/STORE."""
+
+    mailbox: FakeMailbox
+
+    def send(self, line: str | bytes) -> None:
+        data = line if isinstance(line, bytes) else line.encode()
+        self.wfile.write(data + b"\r\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        self.server.connections.append(self.request)
+        self.send("* OK [CAPABILITY IMAP4rev1 IDLE] fake ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            tag, _, rest = line.decode().strip().partition(" ")
+            command = rest.upper()
+            self.mailbox.commands.append(command)
+            if command.startswith("CAPABILITY"):
+                self.send("* CAPABILITY IMAP4rev1 IDLE")
+                self.send(f"{tag} OK done")
+            elif command.startswith("LOGIN"):
+                if self.mailbox.reject_login:
+                    self.send(f"{tag} NO bad credentials")
+                    continue
+                self.mailbox.logins += 1
+                self.send(f"{tag} OK logged in")
+            elif command.startswith("SELECT"):
+                self.send(f"* {len(self.mailbox.messages)} EXISTS")
+                self.send("* OK [UIDVALIDITY 1] ok")
+                self.send(f"{tag} OK [READ-WRITE] selected")
+            elif command.startswith("UID SEARCH"):
+                uids = self.search(command[len("UID SEARCH "):])
+                self.send("* SEARCH " + " ".join(str(uid) for uid in uids))
+                self.send(f"{tag} OK done")
+            elif command.startswith("UID FETCH"):
+                wanted = self.uid_set(command.split()[2])
+                if wanted & self.mailbox.fail_fetch:
+                    self.send(f"{tag} NO fetch failed")
+                    continue
+                for seq, (uid, body) in enumerate(self.mailbox.messages, 1):
+                    if uid in wanted:
+                        self.send(f"* {seq} FETCH (UID {uid} RFC822 {{{len(body)}}}".encode())
+                        self.wfile.write(body + b")\r\n")
+                self.send(f"{tag} OK done")
+            elif command.startswith("UID STORE"):
+                self.mailbox.seen.update(self.uid_set(command.split()[2]))
+                self.send(f"{tag} OK done")
+            elif command.startswith("IDLE"):
+                self.idle(tag)
+            elif command.startswith("LOGOUT"):
+                self.send("* BYE")
+                self.send(f"{tag} OK bye")
+                return
+            else:
+                self.send(f"{tag} OK done")
+
+    def idle(self, tag: str) -> None:
+        known = len(self.mailbox.messages)
+        waiter = threading.Event()
+        self.mailbox.idle_waiters.append(waiter)
+        self.send("+ idling")
+        done = threading.Event()
+
+        def _push():
+            while not done.is_set():
+                if waiter.wait(0.05):
+                    waiter.clear()
+                    if len(self.mailbox.messages) > known:
+                        self.send(f"* {len(self.mailbox.messages)} EXISTS")
+
+        pusher = threading.Thread(target=_push, daemon=True)
+        pusher.start()
+        self.rfile.readline()  # DONE
+        done.set()
+        pusher.join()
+        self.mailbox.idle_waiters.remove(waiter)
+        self.send(f"{tag} OK idle done")
+
+    def search(self, criteria: str) -> list[int]:
+        uids = [uid for uid, _ in self.mailbox.messages]
+        match = re.search(r"UID (\d+):\*", criteria)
+        if match:
+            lower = int(match.group(1))
+            # RFC 3501: "n:*" includes the newest message even below n
+            uids = [uid for uid in uids if uid >= lower] or uids[-1:]
+        if "UNSEEN" in criteria:
+            uids = [uid for uid in uids if uid not in self.mailbox.seen]
+        return uids
+
+    @staticmethod
+    def uid_set(text: str) -> set[int]:
+        result: set[int] = set()
+        for part in text.split(","):
+            low, _, high = part.partition(":")
+            result.update(range(int(low), int(high or low) + 1))
+        return result
+
+
+class FakeImapServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, mailbox: FakeMailbox):
+        handler = type("Handler", (FakeImapHandler,), {"mailbox": mailbox})
+        super().__init__(("127.0.0.1", 0), handler)
+        self.connections: list = []
+
+    def drop_connections(self) -> None:
+        import socket
+
+        for conn in self.connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@pytest.fixture
+def imap_server():
+    mailbox = FakeMailbox()
+    server = FakeImapServer(mailbox)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, mailbox
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _session(server) -> ImapSession:
+    return ImapSession("127.0.0.1", port=server.server_address[1], username="u", password="p", ssl=False)
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_connection_and_fetches_new_uids_in_one_batch(imap_server):
+    server, mailbox = imap_server
+    for uid in (1, 2):
+        mailbox.add(uid)
+    session = _session(server)
+    try:
+        last_uid = await session.call(get_highest_uid)
+        assert last_uid == 2
+
+        for uid in (3, 4, 5):
+            mailbox.add(uid)
+        messages, last_uid = await session.call(fetch_new, "tmp/email-test", last_uid)
+        assert [m.subject for m in messages] == ["Message 3", "Message 4", "Message 5"]
+        assert last_uid == 5
+        assert mailbox.count("UID FETCH") == 1
+        assert mailbox.seen == {3, 4, 5}
+        assert any("UID 3:*" in cmd for cmd in mailbox.commands if cmd.startswith("UID SEARCH"))
+
+        # nothing new: the "n:*" match of the newest message is filtered out
+        messages, last_uid = await session.call(fetch_new, "tmp/email-test", last_uid)
+        assert messages == [] and last_uid == 5
+
+        assert mailbox.logins == 1
+        assert mailbox.count("SELECT") == 1
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_stays_unread_and_keeps_the_other_chunks(imap_server, monkeypatch):
+    monkeypatch.setattr(imap_client, "FETCH_BATCH_SIZE", 2)
+    server, mailbox = imap_server
+    for uid in range(1, 7):
+        mailbox.add(uid)
+    mailbox.fail_fetch = {3}
+    session = _session(server)
+    try:
+        messages, last_uid = await session.call(fetch_new, "tmp/email-test", 0)
+        assert [m.subject for m in messages] == ["Message 1", "Message 2", "Message 5", "Message 6"]
+        assert mailbox.seen == {1, 2, 5, 6}
+        assert last_uid == 2
+
+        # the next poll retries the failed chunk
+        mailbox.fail_fetch = set()
+        messages, last_uid = await session.call(fetch_new, "tmp/email-test", last_uid)
+        assert [m.subject for m in messages] == ["Message 3", "Message 4"]
+        assert last_uid == 4
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_message_that_keeps_failing_is_skipped_unread(imap_server, monkeypatch):
+    server, mailbox = imap_server
+    for uid in range(1, 4):
+        mailbox.add(uid)
+    parse_message = imap_client._parse_message
+
+    async def _parse(raw, *args):
+        if b"Message 2" in raw.get(b"RFC822", b""):
+            raise ValueError("broken message")
+        return await parse_message(raw, *args)
+
+    monkeypatch.setattr(imap_client, "_parse_message", _parse)
+    session = _session(server)
+    try:
+        last_uid = 0
+        for _ in range(imap_client.FETCH_MAX_ATTEMPTS - 1):
+            messages, last_uid = await session.call(
+                fetch_new, "tmp/email-test", last_uid, attempts=session.fetch_attempts,
+            )
+            assert last_uid == 1
+            # only parsed messages are marked read
+            assert mailbox.seen == {1, 3}
+        assert session.fetch_attempts == {2: imap_client.FETCH_MAX_ATTEMPTS - 1}
+
+        messages, last_uid = await session.call(
+            fetch_new, "tmp/email-test", last_uid, attempts=session.fetch_attempts,
+        )
+        assert messages == [] and last_uid == 2
+        assert mailbox.seen == {1, 3}
+        assert session.fetch_attempts == {}
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_during_fetch_drops_the_session(imap_server, monkeypatch):
+    server, mailbox = imap_server
+    for uid in range(1, 4):
+        mailbox.add(uid)
+    session = _session(server)
+    try:
+        await session.call(get_highest_uid)
+
+        def _fetch(*args, **kwargs):
+            raise OSError("connection reset")
+
+        monkeypatch.setattr(imap_client.IMAPClient, "fetch", _fetch)
+        with pytest.raises(OSError):
+            await session.call(fetch_new, "tmp/email-test", 0)
+        assert not session.connected
+        assert mailbox.seen == set()
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_wakes_when_new_mail_arrives(imap_server, monkeypatch):
+    monkeypatch.setattr(imap_client, "IDLE_CHECK_SECONDS", 0.2)
+    server, mailbox = imap_server
+    mailbox.add(1)
+    session = _session(server)
+    try:
+        await session.call(get_highest_uid)
+        assert session.idle_supported
+
+        # no mail: IDLE ends at the timeout
+        assert await session.wait_for_changes(0.3) is False
+
+        threading.Timer(0.2, mailbox.add, args=(2,)).start()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await session.wait_for_changes(10) is True
+        assert loop.time() - started < 5
+
+        messages, _ = await session.call(fetch_new, "tmp/email-test", 1)
+        assert [m.subject for m in messages] == ["Message 2"]
+        assert mailbox.logins == 1
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_session_reconnects_after_drop_and_backs_off_failed_logins(imap_server):
+    server, mailbox = imap_server
+    mailbox.add(1)
+    session = _session(server)
+    try:
+        await session.call(get_highest_uid)
+        server.drop_connections()
+
+        with pytest.raises(Exception):
+            await session.call(get_highest_uid)
+        assert not session.connected
+
+        # a dropped connection reconnects right away
+        assert await session.call(get_highest_uid) == 1
+        assert mailbox.logins == 2
+
+        await session.close()
+        mailbox.reject_login = True
+        with pytest.raises(Exception):
+            await session.call(get_highest_uid)
+        assert session.backoff_seconds > 0
+
+        # during the backoff no connection is attempted
+        commands = len(mailbox.commands)
+        with pytest.raises(ConnectionError):
+            await session.call(get_highest_uid)
+        assert len(mailbox.commands) == commands
+    finally:
+        await session.close()
@@ -0,0 +1,100 @@
+import base64
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import ephemeral_images
+
+
+@pytest.fixture(autouse=True)
+def _empty_store():
+    for context_id in list(ephemeral_images._by_context):
+        ephemeral_images.clear_context(context_id)
+    yield
+    for context_id in list(ephemeral_images._by_context):
+        ephemeral_images.clear_context(context_id)
+
+
+def test_images_keep_raw_bytes_and_base64_round_trips():
+    ref = ephemeral_images.put_image(context_id="ctx", mime="image/png", data="aGVs\nbG8=", name="a.png")
+    image = ephemeral_images.get_image(ref, context_id="ctx")
+
+    assert image is not None
+    assert image.payload == b"hello"
+    assert image.data == base64.b64encode(b"hello").decode()
+    assert image.data_url == "data:image/png;base64,aGVsbG8="
+    assert ephemeral_images.get_image(ref, context_id="other") is None
+
+    assert ephemeral_images.consume_image(ref) is not None
+    assert ephemeral_images.get_image(ref) is None
+    assert ephemeral_images.get_stats()["bytes"] == 0
+
+    with pytest.raises(ValueError):
+        ephemeral_images.put_image(context_id="ctx", mime="image/png", data="not base64!")
+
+
+def test_clear_context_only_touches_that_context():
+    kept = ephemeral_images.put_image_bytes(context_id="keep", mime="image/png", payload=b"k")
+    dropped = [
+        ephemeral_images.put_image_bytes(context_id="drop", mime="image/png", payload=b"d")
+        for _ in range(3)
+    ]
+
+    ephemeral_images.clear_context("drop")
+
+    assert ephemeral_images.get_image(kept) is not None
+    assert all(ephemeral_images.get_image(ref) is None for ref in dropped)
+    assert ephemeral_images.get_stats()["contexts"] == 1
+
+
+def test_memory_cap_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(ephemeral_images, "MAX_TOTAL_BYTES", 25)
+    first = ephemeral_images.put_image_bytes(context_id="ctx", mime="image/png", payload=b"1" * 10)
+    second = ephemeral_images.put_image_bytes(context_id="ctx", mime="image/png", payload=b"2" * 10)
+    assert ephemeral_images.get_image(first) is not None  # second is now the oldest
+
+    third = ephemeral_images.put_image_bytes(context_id="ctx", mime="image/png", payload=b"3" * 10)
+
+    assert ephemeral_images.get_image(second) is None
+    assert ephemeral_images.get_image(first) is not None
+    assert ephemeral_images.get_image(third) is not None
+    stats = ephemeral_images.get_stats()
+    assert stats["bytes"] == 20
+    assert stats["evictions"] == 1
+
+
+def test_background_sweeper_expires_images_without_lookups():
+    short = ephemeral_images.put_image_bytes(context_id="ctx", mime="image/png", payload=b"s", ttl_seconds=0.01)
+    # ttl is clamped to one second
+    long = ephemeral_images.put_image_bytes(context_id="ctx", mime="image/png", payload=b"l", ttl_seconds=60)
+
+    deadline = time.time() + 5
+    while short in ephemeral_images._store and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert short not in ephemeral_images._store
+    assert long in ephemeral_images._store
+
+
+def test_put_and_get_do_not_scan_the_whole_store(monkeypatch):
+    refs = [
+        ephemeral_images.put_image_bytes(context_id=f"ctx-{idx % 10}", mime="image/png", payload=b"x")
+        for idx in range(2000)
+    ]
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError("whole-store scan")
+
+    monkeypatch.setattr(ephemeral_images._store, "items", _no_scan, raising=False)
+    started = time.perf_counter()
+    for _ in range(500):
+        ref = ephemeral_images.put_image_bytes(context_id="ctx-hot", mime="image/png", payload=b"frame")
+        assert ephemeral_images.consume_image(ref, context_id="ctx-hot") is not None
+    assert time.perf_counter() - started < 2
+    assert ephemeral_images.get_image(refs[0]) is not None
@@ -2,6 +2,7 @@ import cProfile
 import io
 import pstats
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from agent import Agent, AgentContext
+from helpers import cache, extension, files
 from helpers.extension import extensible
 from initialize import initialize_agent
 
@@ -48,3 +50,87 @@ def test_extensible_method_performance_trace(iterations: int):
     finally:
         if context:
             AgentContext.remove(context.id)
+
+
+def _plain_hook(value: int):
+    return value + 1
+
+
+@extensible
+def _wrapped_hook(value: int):
+    return value + 1
+
+
+def test_extensible_without_extensions_costs_close_to_plain_call():
+    iterations = 100_000
+    extension.clear_function_points()
+
+    def per_call(fn) -> float:
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for i in range(iterations):
+                fn(i)
+            best = min(best, time.perf_counter() - started)
+        return best / iterations
+
+    assert _wrapped_hook(1) == 2
+    plain = per_call(_plain_hook)
+    wrapped = per_call(_wrapped_hook)
+
+    print(
+        f"\n[extensible fast path] plain {plain * 1e9:.0f} ns, "
+        f"wrapped {wrapped * 1e9:.0f} ns per call"
+    )
+    assert wrapped < plain + 5e-6
+
+
+def test_extension_added_to_empty_point_is_picked_up(monkeypatch, tmp_path):
+    monkeypatch.setattr(files, "_base_dir", str(tmp_path))
+    for folder in ("usr/plugins", "plugins"):
+        (tmp_path / folder).mkdir(parents=True, exist_ok=True)
+    cache.clear("*(extensions)*")
+    cache.clear("*(plugins)*")
+    extension.clear_function_points()
+
+    try:
+        assert _wrapped_hook(1) == 2
+
+        start_point, _ = extension._get_function_points(_wrapped_hook.__wrapped__)
+        folder = tmp_path / "usr" / "extensions" / "python" / start_point
+        folder.mkdir(parents=True)
+        (folder / "_10_override.py").write_text(
+            "from helpers.extension import Extension\n\n"
+            "class Override(Extension):\n"
+            "    def execute(self, data=None, **kwargs):\n"
+            "        data['result'] = 'overridden'\n"
+        )
+
+        # the negative cache holds until the watchdog resets the function points
+        assert _wrapped_hook(1) == 2
+        extension.clear_function_points()
+        assert _wrapped_hook(1) == "overridden"
+    finally:
+        monkeypatch.undo()
+        cache.clear("*(extensions)*")
+        cache.clear("*(plugins)*")
+        extension.clear_function_points()
+
+
+def test_function_points_are_scanned_once_with_the_cache_disabled(monkeypatch):
+    scans = []
+    scan = extension._scan_function_points
+    monkeypatch.setattr(extension, "_scan_function_points", lambda: scans.append(1) or scan())
+    extension.clear_function_points()
+    cache.toggle_global(False)
+    try:
+        for i in range(10):
+            assert _plain_hook(i) == _wrapped_hook(i)
+        assert len(scans) == 1
+
+        extension.clear_function_points()
+        _wrapped_hook(1)
+        assert len(scans) == 2
+    finally:
+        cache.toggle_global(True)
+        extension.clear_function_points()
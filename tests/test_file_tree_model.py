@@ -0,0 +1,139 @@
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import file_tree, files, projects
+
+GITIGNORE = "*.pyc\n__pycache__/\nnode_modules/\n!important.py\n*.log"
+LIMITS = dict(max_depth=4, max_files=3, max_folders=3, max_lines=40)
+
+
+def _touch(path: Path, mtime: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _fixture(root: Path) -> None:
+    for idx in range(5):
+        _touch(root / "src" / f"pkg{idx}" / f"mod{idx}.py", 1_600_000_000 + idx)
+        _touch(root / "src" / f"pkg{idx}" / f"mod{idx}.pyc", 1_600_000_000 + idx)
+    _touch(root / "node_modules" / "lib" / "index.js", 1_600_000_100)
+    _touch(root / "node_modules" / "keep" / "important.py", 1_600_000_200)
+    _touch(root / "debug.log", 1_600_000_300)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_model_matches_file_tree_after_invalidated_changes(tmp_path):
+    _fixture(tmp_path)
+    model = file_tree.FileTreeModel(str(tmp_path), ignore=GITIGNORE)
+
+    def expected():
+        return file_tree.file_tree(str(tmp_path), ignore=GITIGNORE, **LIMITS)
+
+    assert model.render(**LIMITS) == expected()
+
+    changes = []
+    changes.append(_touch(tmp_path / "src" / "pkg0" / "new.py", 1_700_000_000))
+    changes.append(_touch(tmp_path / "node_modules" / "lib" / "important.py", 1_700_000_001))
+    (tmp_path / "src" / "pkg1" / "mod1.py").unlink()
+    changes.append(tmp_path / "src" / "pkg1" / "mod1.py")
+    shutil.move(tmp_path / "src" / "pkg2", tmp_path / "pkg2")
+    changes += [tmp_path / "src" / "pkg2", tmp_path / "pkg2"]
+    shutil.rmtree(tmp_path / "node_modules" / "keep")
+    changes.append(tmp_path / "node_modules" / "keep")
+
+    # without events the model keeps serving the old listings
+    assert model.render(**LIMITS) != expected()
+    for path in changes:
+        model.invalidate(str(path))
+    assert model.render(**LIMITS) == expected()
+    assert model.render(**LIMITS, output_mode=file_tree.OUTPUT_MODE_FLAT) == file_tree.file_tree(
+        str(tmp_path), ignore=GITIGNORE, output_mode=file_tree.OUTPUT_MODE_FLAT, **LIMITS
+    )
+
+
+def test_project_file_structure_follows_watch_events(monkeypatch, tmp_path):
+    monkeypatch.setattr(files, "_base_dir", str(tmp_path))
+    for folder in ("usr/projects", "usr/plugins", "plugins"):
+        (tmp_path / folder).mkdir(parents=True, exist_ok=True)
+    projects.create_project("demo", {"title": "Demo"})
+    project_root = tmp_path / "usr" / "projects" / "demo"
+    _touch(project_root / "first.py", 1_600_000_000)
+
+    # until the watchdogs are registered every call scans the folder
+    monkeypatch.setattr(projects, "_watchdogs_registered", False)
+    assert "first.py" in projects.get_file_structure("demo")
+    assert "demo" not in projects._file_structure_models
+    monkeypatch.setattr(projects, "_watchdogs_registered", True)
+
+    try:
+        assert "first.py" in projects.get_file_structure("demo")
+        _touch(project_root / "second.py", 1_600_000_001)
+        assert _wait_for(lambda: "second.py" in projects.get_file_structure("demo"))
+
+        # unsaved settings (the settings preview) do not replace the model
+        preview = projects.load_basic_project_data("demo")
+        preview["file_structure"]["gitignore"] = "second.py"
+        assert "second.py" not in projects.get_file_structure("demo", preview)
+        assert projects._file_structure_models["demo"].ignore != "second.py"
+    finally:
+        projects._drop_file_structure_model("demo")
+    assert "demo" not in projects._file_structure_models
+
+
+@pytest.mark.skipif(not os.getenv("A0_RUN_BENCHMARKS"), reason="creates 100k files; set A0_RUN_BENCHMARKS=1")
+def test_benchmark_100k_file_project_tree(tmp_path):
+    for pkg in range(100):
+        # 60k files in ignored dependencies, 40k in sources
+        top = "node_modules" if pkg < 60 else "src"
+        for sub in range(10):
+            folder = tmp_path / top / f"pkg{pkg}" / f"mod{sub}"
+            folder.mkdir(parents=True)
+            for idx in range(100):
+                (folder / f"f{idx}.js").touch()
+    gitignore = files.read_file("conf/projects.default.gitignore")
+    limits = dict(max_depth=5, max_files=20, max_folders=20, max_lines=250)
+
+    started = time.perf_counter()
+    full_scan = file_tree.file_tree(str(tmp_path), ignore=gitignore, **limits)
+    full_seconds = time.perf_counter() - started
+
+    model = file_tree.FileTreeModel(str(tmp_path), ignore=gitignore)
+    assert model.render(**limits) == full_scan
+    started = time.perf_counter()
+    for _ in range(10):
+        assert model.render(**limits) == full_scan
+    unchanged_seconds = (time.perf_counter() - started) / 10
+
+    changed = tmp_path / "src" / "pkg99" / "mod9" / "new.js"
+    changed.touch()
+    model.invalidate(str(changed))
+    started = time.perf_counter()
+    rendered = model.render(**limits)
+    changed_seconds = time.perf_counter() - started
+
+    assert rendered == file_tree.file_tree(str(tmp_path), ignore=gitignore, **limits)
+    print(
+        f"\n100k file tree: full scan {full_seconds * 1000:.1f} ms, "
+        f"unchanged {unchanged_seconds * 1000:.3f} ms, after one change {changed_seconds * 1000:.1f} ms"
+    )
+    assert unchanged_seconds * 100 < full_seconds
+    assert changed_seconds * 5 < full_seconds
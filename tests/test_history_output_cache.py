@@ -0,0 +1,205 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import history as history_module
+from helpers.history import Bulk, History, Message, OutputMessage, Topic
+
+
+# --- reference implementation: the uncached rendering the cache must reproduce ---
+
+
+def _reference_record_output(record) -> list[OutputMessage]:
+    if isinstance(record, Message):
+        return [
+            OutputMessage(
+                ai=record.ai,
+                content=record.summary or record.content,
+                metadata=record.metadata,
+                id=record.id,
+                sequence=record.sequence,
+            )
+        ]
+    if isinstance(record, Topic):
+        if record.summary:
+            return [OutputMessage(ai=False, content=record.summary)]
+        return [m for r in record.messages for m in _reference_record_output(r)]
+    if isinstance(record, Bulk):
+        if record.summary:
+            return [OutputMessage(ai=False, content=record.summary)]
+        return [m for r in record.records for m in _reference_record_output(r)]
+    return []
+
+
+def _reference_trim_record(record, embeds_count: int, max_embeds: int) -> tuple[int, int]:
+    if isinstance(record, Message):
+        if record.summary or not history_module._is_raw_message(record.content):
+            return embeds_count, 0
+        raw_content = record.content.get("raw_content", [])
+        if not isinstance(raw_content, list):
+            return embeds_count, 0
+        embeds = sum(1 for item in raw_content if history_module._is_embedded_data(item))
+        if embeds <= 0:
+            return embeds_count, 0
+        if embeds_count + embeds > max_embeds:
+            record.set_summary("embedded data removed")
+            return embeds_count + embeds, embeds
+        return embeds_count + embeds, 0
+    nested = record.messages if isinstance(record, Topic) else getattr(record, "records", [])
+    removed = 0
+    for item in reversed(nested):
+        embeds_count, removed_now = _reference_trim_record(item, embeds_count, max_embeds)
+        removed += removed_now
+    return embeds_count, removed
+
+
+def _reference_output(hist: History, max_embeds: int) -> list[OutputMessage]:
+    if max_embeds != -1:
+        embeds_count = 0
+        for record in reversed(hist.bulks + hist.topics + [hist.current]):
+            embeds_count, _ = _reference_trim_record(record, embeds_count, max_embeds)
+    result: list[OutputMessage] = []
+    for record in hist.bulks + hist.topics + [hist.current]:
+        result += _reference_record_output(record)
+    return result
+
+
+# --- fixtures ---
+
+
+class _Embeds:
+    value = 2
+
+
+@pytest.fixture
+def max_embeds(monkeypatch):
+    monkeypatch.setattr(History, "_get_max_embeds", lambda self: _Embeds.value)
+    _Embeds.value = 2
+    return _Embeds
+
+
+def _image_message(name: str) -> dict:
+    return {
+        "raw_content": [
+            {"type": "text", "text": name},
+            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{name}"}},
+        ],
+        "preview": f"<image {name}>",
+    }
+
+
+def _populate(hist: History) -> None:
+    hist.add_message(False, "hello")
+    hist.add_message(True, {"tool_name": "response", "tool_args": {"text": "hi ✓"}})
+    hist.add_message(False, _image_message("one"))
+    hist.new_topic()
+    hist.add_message(False, "second topic")
+    hist.add_message(False, {"raw_content": "plain raw", "preview": None})
+    hist.add_message(True, ["a", {"b": 1}], metadata={"k": "v"})
+    hist.add_message(False, _image_message("two"))
+
+
+def _twin(hist: History) -> History:
+    return history_module.deserialize_history(hist.serialize(), agent=None)
+
+
+def _assert_identical(cached: History, reference: History, max_embeds: int) -> None:
+    expected = _reference_output(reference, max_embeds)
+    actual = cached.output()
+    assert json.dumps(actual, ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+    for ai_label, human_label in (("ai", "human"), ("assistant", "user")):
+        assert cached.output_text(human_label=human_label, ai_label=ai_label) == history_module.output_text(
+            expected, ai_label, human_label
+        )
+    assert cached.serialize() == reference.serialize()
+
+
+def _apply(hist: History, step: int) -> None:
+    if step == 0:
+        hist.add_message(True, "appended", id="appended")
+    elif step == 1:
+        hist.add_message(False, _image_message("late"), id="late-image")
+    elif step == 2:
+        hist.current.messages[0].set_summary("first message summarized")
+    elif step == 3:
+        hist.new_topic()
+        hist.add_message(False, "fresh topic", id="fresh")
+    elif step == 4:
+        hist.topics[0].summary = "topic summary"
+    elif step == 5:
+        bulk = Bulk(history=hist)
+        bulk.records.extend(hist.topics[:1])
+        hist.topics[:1] = []
+        hist.bulks.append(bulk)
+    elif step == 6:
+        hist.bulks[0].summary = "bulk summary"
+    elif step == 7:
+        topic = hist.topics[-1] if hist.topics else hist.current
+        topic.messages[1:2] = [Message(False, "attention summary", id="attention")]
+    elif step == 8:
+        message = hist.current.messages[-1]
+        message.content = "content reassigned"
+        message.summary = ""
+    elif step == 9:
+        hist.current.messages.pop()
+
+
+def test_output_is_byte_identical_across_mutations(max_embeds):
+    cached = History(agent=None)
+    _populate(cached)
+    reference = _twin(cached)
+
+    _assert_identical(cached, reference, max_embeds.value)
+    for step in range(10):
+        _apply(cached, step)
+        _apply(reference, step)
+        _assert_identical(cached, reference, max_embeds.value)
+        # a second pass must hit the cache and still match
+        _assert_identical(cached, reference, max_embeds.value)
+
+
+@pytest.mark.parametrize("limit", [0, 1, 3, -1])
+def test_trim_embeds_matches_reference_for_all_limits(max_embeds, limit):
+    max_embeds.value = limit
+    cached = History(agent=None)
+    _populate(cached)
+    for index in range(5):
+        cached.add_message(False, _image_message(f"extra-{index}"))
+    reference = _twin(cached)
+
+    _assert_identical(cached, reference, limit)
+
+
+def test_only_changed_messages_are_rerendered(max_embeds, monkeypatch):
+    hist = History(agent=None)
+    _populate(hist)
+    hist.output()
+
+    rendered = []
+    original = Message._render
+
+    def counting_render(self):
+        if self._rendered is None:
+            rendered.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Message, "_render", counting_render)
+
+    hist.output()
+    hist.output_text()
+    assert rendered == []
+
+    added = hist.add_message(True, "new")
+    hist.output()
+    assert rendered == [added]
+
+    rendered.clear()
+    hist.topics[0].messages[0].set_summary("changed")
+    hist.output()
+    assert rendered == [hist.topics[0].messages[0]]
@@ -0,0 +1,100 @@
+import base64
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import images
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    images.clear_data_url_cache()
+    yield
+    images.clear_data_url_cache()
+
+
+def _png(path: Path, size: tuple[int, int], color=(255, 0, 0)) -> Path:
+    Image.new("RGB", size, color).save(path, format="PNG")
+    return path
+
+
+def _decoded(data_url: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1])))
+
+
+def test_repeated_requests_reuse_the_encoded_image(tmp_path, monkeypatch):
+    path = _png(tmp_path / "shot.png", (64, 48))
+    reads = 0
+    original = Path.read_bytes
+
+    def counting(self):
+        nonlocal reads
+        reads += 1
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting)
+    content = [
+        {"type": "text", "text": "look"},
+        {"type": "image_url", "image_url": {"url": str(path)}},
+    ]
+
+    first = images.prepare_content(content)
+    for _ in range(5):
+        assert images.prepare_content(content) == first
+
+    assert reads == 1
+    assert first[1]["image_url"]["url"].startswith("data:image/png;base64,")
+    stats = images.get_data_url_cache_stats()
+    assert (stats["hits"], stats["entries"]) == (5, 1)
+
+
+def test_changed_file_is_re_encoded(tmp_path):
+    path = _png(tmp_path / "shot.png", (10, 10))
+    before = images.to_data_url(str(path))
+
+    _png(path, (12, 12), color=(0, 0, 255))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    after = images.to_data_url(str(path))
+    assert after != before
+    assert _decoded(after).size == (12, 12)
+
+
+def test_large_images_are_downscaled_when_a_pixel_limit_is_set(tmp_path):
+    path = _png(tmp_path / "big.png", (400, 300))
+
+    original = images.to_data_url(str(path))
+    scaled = images.to_data_url(str(path), max_pixels=30_000)
+
+    assert original.startswith("data:image/png;base64,")
+    assert scaled.startswith("data:image/jpeg;base64,")
+    width, height = _decoded(scaled).size
+    assert width * height <= 30_000 and width / height == pytest.approx(4 / 3, rel=0.02)
+
+    # images already within the limit are sent unchanged
+    assert images.to_data_url(str(path), max_pixels=200_000) == original
+    assert images.get_data_url_cache_stats()["entries"] == 3
+
+
+def test_cache_is_bounded_by_bytes(tmp_path, monkeypatch):
+    paths = [_png(tmp_path / f"img{idx}.png", (32, 32), color=(idx * 40, 0, 0)) for idx in range(3)]
+    entry = len(images.to_data_url(str(paths[0])))
+    images.clear_data_url_cache()
+    monkeypatch.setattr(images, "DATA_URL_CACHE_MAX_BYTES", entry * 2 + entry // 2)
+
+    for path in paths:
+        images.to_data_url(str(path))
+
+    stats = images.get_data_url_cache_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= images.DATA_URL_CACHE_MAX_BYTES
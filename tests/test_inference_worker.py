@@ -0,0 +1,173 @@
+import asyncio
+import base64
+import importlib
+import io
+import sys
+import threading
+import time
+import types
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.inference_worker import InferenceQueueFull, InferenceWorker
+
+
+class StubModel:
+    def __init__(self, version: str, delay: float = 0.0):
+        self.version = version
+        self.delay = delay
+        self.threads: list[str] = []
+
+    def infer(self, text: str) -> str:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)  # blocking, like real inference
+        return f"{self.version}:{text}"
+
+
+def _infer(model: StubModel, text: str) -> str:
+    return model.infer(text)
+
+
+@pytest.mark.asyncio
+async def test_blocking_inference_does_not_stall_the_event_loop():
+    worker = InferenceWorker("test", max_queue=4)
+    model = StubModel("v1", delay=0.3)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    tick_task = asyncio.create_task(ticker())
+    try:
+        result = await worker.run(_infer, "hello", slot="stub", version="v1", loader=lambda: model)
+    finally:
+        tick_task.cancel()
+        worker.stop()
+
+    assert result == "v1:hello"
+    assert model.threads == ["inference-test"]
+    assert ticks >= 10  # the loop kept running while the model worked
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_cancelled_jobs_are_skipped():
+    worker = InferenceWorker("bounded", max_queue=2)
+    gate = threading.Event()
+    calls: list[str] = []
+
+    def blocking(name: str) -> str:
+        gate.wait(5)
+        calls.append(name)
+        return name
+
+    try:
+        running = asyncio.create_task(worker.run(blocking, "running"))
+        await asyncio.sleep(0.05)  # picked up by the worker thread
+        queued = asyncio.create_task(worker.run(blocking, "queued"))
+        kept = asyncio.create_task(worker.run(blocking, "kept"))
+        await asyncio.sleep(0.01)
+
+        assert worker.metrics()["queue_depth"] == 2
+        with pytest.raises(InferenceQueueFull):
+            await worker.run(blocking, "rejected")
+
+        queued.cancel()
+        await asyncio.sleep(0)  # let the cancellation reach the job future
+        gate.set()
+        assert await running == "running"
+        assert await kept == "kept"
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        metrics = worker.metrics()
+        assert calls == ["running", "kept"]
+        assert metrics["cancelled"] == 1
+        assert metrics["rejected"] == 1
+        assert metrics["completed"] == 2
+        assert metrics["max_queue_depth"] == 2
+    finally:
+        gate.set()
+        worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_model_slots_are_reused_swapped_and_evicted():
+    worker = InferenceWorker("resident", max_resident=1)
+    loads: list[str] = []
+
+    def loader(version: str):
+        def _load():
+            loads.append(version)
+            return StubModel(version)
+
+        return _load
+
+    try:
+        assert await worker.run(_infer, "a", slot="stt", version="base", loader=loader("base")) == "base:a"
+        assert await worker.run(_infer, "b", slot="stt", version="base", loader=loader("base")) == "base:b"
+        assert loads == ["base"]
+
+        # another version of the same slot replaces the model
+        await worker.load("stt", "small", loader("small"))
+        assert worker.resident_version("stt") == "small"
+
+        # a second slot evicts the least recently used one
+        await worker.load("tts", "kokoro", loader("kokoro"))
+        assert worker.resident_version("stt") is None
+        assert worker.metrics()["resident"] == {"tts": "kokoro"}
+        assert loads == ["base", "small", "kokoro"]
+    finally:
+        worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_whisper_runtime_transcribes_on_the_inference_worker(monkeypatch):
+    loaded: list[str] = []
+
+    class StubWhisper:
+        def __init__(self, name: str):
+            self.name = name
+
+        def transcribe(self, samples, **kwargs):
+            assert samples.dtype == np.float32 and samples.size > 0
+            return {
+                "text": f"{self.name} heard",
+                "language": kwargs.get("language"),
+                "thread": threading.current_thread().name,
+            }
+
+    def load_model(name: str, download_root: str):
+        loaded.append(name)
+        return StubWhisper(name)
+
+    monkeypatch.setitem(sys.modules, "whisper", types.SimpleNamespace(load_model=load_model))
+    sys.modules.pop("plugins._whisper_stt.helpers.runtime", None)
+    runtime = importlib.import_module("plugins._whisper_stt.helpers.runtime")
+    monkeypatch.setattr(runtime, "NotificationManager", types.SimpleNamespace(send_notification=lambda *a, **k: None))
+
+    tone = (np.sin(np.arange(8000) / 5) * 12000).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(tone.tobytes())
+    audio_b64 = base64.b64encode(buffer.getvalue()).decode()
+
+    result = await runtime._transcribe("tiny", audio_b64, language="en")
+
+    assert result == {"text": "tiny heard", "language": "en", "thread": "inference-speech"}
+    assert loaded == ["tiny"]
+    assert runtime.get_loaded_model_name() == "tiny"
+    assert await runtime.is_downloaded()
+    assert runtime.get_inference_metrics()["completed"] >= 1
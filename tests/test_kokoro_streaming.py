@@ -0,0 +1,132 @@
+import asyncio
+import base64
+import importlib
+import io
+import sys
+import threading
+import types
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _write_wav(buffer, data, samplerate, format=None, subtype=None):
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(samplerate)
+        out.writeframes(np.asarray(data, dtype="<i2").tobytes())
+
+
+class FakeSegment:
+    def __init__(self, samples: np.ndarray):
+        self.audio = types.SimpleNamespace(
+            detach=lambda: types.SimpleNamespace(cpu=lambda: types.SimpleNamespace(numpy=lambda: samples))
+        )
+
+
+class FakePipeline:
+    calls: list[tuple[str, str]] = []
+
+    def __init__(self, lang_code: str, repo_id: str):
+        pass
+
+    def __call__(self, sentence: str, voice: str, speed: float):
+        self.calls.append((sentence, threading.current_thread().name))
+        # one segment of len(sentence) samples, two for longer sentences
+        samples = np.full(len(sentence), 0.5, dtype=np.float32)
+        yield FakeSegment(samples)
+        if len(sentence) > 10:
+            yield FakeSegment(samples)
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    FakePipeline.calls = []
+    monkeypatch.setitem(sys.modules, "soundfile", types.SimpleNamespace(write=_write_wav))
+    monkeypatch.setitem(sys.modules, "kokoro", types.SimpleNamespace(KPipeline=FakePipeline))
+    sys.modules.pop("plugins._kokoro_tts.helpers.runtime", None)
+    module = importlib.import_module("plugins._kokoro_tts.helpers.runtime")
+    monkeypatch.setattr(module, "NotificationManager", types.SimpleNamespace(send_notification=lambda *a, **k: None))
+    module.clear_audio_cache()
+    yield module
+    module.clear_audio_cache()
+    sys.modules.pop("plugins._kokoro_tts.helpers.runtime", None)
+
+
+def _frames(audio_b64: str) -> int:
+    with wave.open(io.BytesIO(base64.b64decode(audio_b64))) as wav:
+        assert wav.getframerate() == 24000
+        return wav.getnframes()
+
+
+CONFIG = {"voice": "am_puck", "speed": 1.0}
+
+
+def test_split_sentences(runtime):
+    assert runtime.split_sentences("Hello there. How are you?\nFine!  ") == [
+        "Hello there.",
+        "How are you?",
+        "Fine!",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_sentence_as_it_is_synthesized(runtime):
+    stream = runtime.stream_sentences(["Hi.", "Second sentence."], CONFIG)
+
+    index, audio = await asyncio.wait_for(stream.__anext__(), 5)
+    assert (index, _frames(audio)) == (0, 3)
+    assert [sentence for sentence, _ in FakePipeline.calls] == ["Hi."]
+
+    index, audio = await asyncio.wait_for(stream.__anext__(), 5)
+    assert (index, _frames(audio)) == (1, 32)  # two segments concatenated
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    assert {thread for _, thread in FakePipeline.calls} == {"inference-speech"}
+
+
+@pytest.mark.asyncio
+async def test_repeated_sentences_are_served_from_the_audio_cache(runtime):
+    combined = await runtime.synthesize_sentences(["Done.", "", "Working on it."], CONFIG)
+    assert _frames(combined) == 5 + 28
+
+    # the blocking iterator (used by the HTTP stream) shares the cache
+    parts = await asyncio.to_thread(lambda: list(runtime.iter_sentences(["Done.", "Again."], CONFIG)))
+    assert [index for index, _ in parts] == [0, 1]
+    assert [sentence for sentence, _ in FakePipeline.calls] == ["Done.", "Working on it.", "Again."]
+
+    # another voice is another cache entry
+    await runtime.synthesize_sentences(["Done."], {"voice": "af_bella", "speed": 1.0})
+    assert len(FakePipeline.calls) == 4
+
+    stats = runtime.get_audio_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 4
+    assert stats["bytes"] == 2 * (5 + 28 + 6 + 5)
+
+
+@pytest.mark.asyncio
+async def test_blocking_iterator_refuses_to_run_on_an_event_loop(runtime):
+    with pytest.raises(RuntimeError):
+        next(runtime.iter_sentences(["Hi."], CONFIG))
+    assert FakePipeline.calls == []
+
+
+def test_audio_cache_evicts_least_recently_used_entries(runtime, monkeypatch):
+    monkeypatch.setattr(runtime, "AUDIO_CACHE_MAX_BYTES", 10)
+    runtime._store_pcm("a", b"1234")
+    runtime._store_pcm("b", b"1234")
+    assert runtime._cached_pcm("a") == b"1234"  # "b" is now the oldest
+    runtime._store_pcm("c", b"1234")
+    runtime._store_pcm("huge", b"x" * 11)  # larger than the whole cache: not stored
+
+    assert runtime._cached_pcm("b") is None
+    assert runtime._cached_pcm("huge") is None
+    assert runtime.get_audio_cache_stats()["bytes"] == 8
@@ -0,0 +1,116 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.log import Log
+
+
+@pytest.mark.asyncio
+async def test_subscription_wakes_on_update_from_another_thread():
+    log = Log()
+    log.log(type="info", content="before")
+    with log.subscribe(cursor=len(log.updates)) as subscription:
+        assert subscription.pending == 0
+        assert await subscription.wait(0.05) is False
+
+        threading.Timer(0.05, lambda: log.log(type="info", content="pushed")).start()
+        started = time.monotonic()
+        assert await subscription.wait(5) is True
+        assert time.monotonic() - started < 1
+
+        output = subscription.read()
+        assert [item["content"] for item in output.items] == ["pushed"]
+        assert subscription.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_resumes_from_cursor_and_pages_with_limit():
+    log = Log()
+    for idx in range(5):
+        log.log(type="info", content=f"item {idx}")
+
+    subscription = log.subscribe(cursor=2)
+    try:
+        first = subscription.read(limit=2)
+        assert [item["content"] for item in first.items] == ["item 2", "item 3"]
+        assert subscription.cursor == 4
+        second = subscription.read()
+        assert [item["content"] for item in second.items] == ["item 4"]
+        assert subscription.read().items == []
+    finally:
+        subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_burst_of_updates_schedules_one_wakeup():
+    log = Log()
+    subscription = log.subscribe()
+    loop = asyncio.get_running_loop()
+    scheduled = []
+    original = loop.call_soon_threadsafe
+
+    def counting(callback, *args, **kwargs):
+        scheduled.append(callback)
+        return original(callback, *args, **kwargs)
+
+    loop.call_soon_threadsafe = counting  # type: ignore[method-assign]
+    try:
+        item = log.log(type="response", content="")
+        for idx in range(200):
+            item.stream(content=f"{idx} ")
+        assert len(scheduled) == 1
+        assert await subscription.wait(1)
+        assert len(subscription.read().items) == 1
+    finally:
+        loop.call_soon_threadsafe = original  # type: ignore[method-assign]
+        subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_reset_restarts_cursor_and_close_releases_waiter():
+    log = Log()
+    log.log(type="info", content="old")
+    subscription = log.subscribe(cursor=len(log.updates))
+
+    log.reset()
+    log.log(type="info", content="new")
+    assert await subscription.wait(1)
+    output = subscription.read()
+    assert subscription.reset
+    assert [item["content"] for item in output.items] == ["new"]
+
+    waiter = asyncio.create_task(subscription.wait())
+    await asyncio.sleep(0.01)
+    subscription.close()
+    assert await asyncio.wait_for(waiter, 1) is False
+    assert log._subscribers == []
+
+
+@pytest.mark.asyncio
+async def test_connector_stream_yields_pushed_events_without_polling_delay(monkeypatch):
+    from agent import AgentContext
+    from plugins._a0_connector.helpers import event_bridge
+
+    log = Log()
+    context = SimpleNamespace(id="ctx", log=log)
+    monkeypatch.setattr(AgentContext, "get", staticmethod(lambda ctx_id: context))
+
+    stream = event_bridge.stream_context_events("ctx", poll_interval=10, timeout=5)
+    threading.Timer(0.05, lambda: log.log(type="response", content="hello")).start()
+    started = time.monotonic()
+    event = await asyncio.wait_for(stream.__anext__(), 5)
+    await stream.aclose()
+
+    assert event["event"] == event_bridge.EVENT_ASSISTANT_MESSAGE
+    assert event["data"]["text"] == "hello"
+    assert time.monotonic() - started < 1
+    assert log._subscribers == []
@@ -0,0 +1,153 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import loop_monitor
+from helpers.extension import Extension
+from helpers.loop_monitor import LoopMonitor
+from helpers.tool import Tool
+
+
+BLOCK_SECONDS = 0.6
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class _BlockingExtension(Extension):
+    async def execute(self, **kwargs):
+        # synchronous work inside an async extension holds the loop
+        _busy(BLOCK_SECONDS)
+
+
+class _BlockingTool(Tool):
+    def __init__(self):
+        pass
+
+    async def execute(self, **kwargs):
+        await _BlockingExtension(agent=None).execute()
+
+
+@pytest.fixture
+def watched_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    name = f"test-loop-{id(loop)}"
+    watch = loop_monitor.watch_loop(name, loop, thread_id=thread.ident)
+    yield name, loop
+    loop_monitor.unwatch_loop(name, watch)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def _run(loop, coro, timeout=5):
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=timeout)
+
+
+def _wait_for(predicate, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_stall_is_attributed_to_tool_and_extension(watched_loop):
+    name, loop = watched_loop
+    time.sleep(loop_monitor.PROBE_INTERVAL * 2)
+
+    _run(loop, _BlockingTool().execute())
+
+    assert _wait_for(lambda: any(s["finished"] for s in loop_monitor.get_stalls(loop=name)))
+    stall = loop_monitor.get_stalls(loop=name)[0]
+    assert stall["extension"].endswith("_BlockingExtension")
+    assert stall["tool"].endswith("_BlockingTool")
+    assert stall["handler"] is None
+    assert stall["location"].startswith("tests/test_loop_monitor.py")
+    assert stall["duration_ms"] >= BLOCK_SECONDS * 1000 * 0.8
+    assert stall["stack"]
+
+    loops = {entry["loop"]: entry for entry in loop_monitor.get_report()["loops"]}
+    assert loops[name]["lag_max_ms"] >= BLOCK_SECONDS * 1000 * 0.8
+    assert not loops[name]["stalled"]
+
+
+def test_responsive_loop_records_lag_without_stalls(watched_loop):
+    name, loop = watched_loop
+
+    async def cooperative():
+        for _ in range(10):
+            await asyncio.sleep(0.02)
+
+    _run(loop, cooperative())
+    time.sleep(loop_monitor.PROBE_INTERVAL * 3)
+
+    assert loop_monitor.get_stalls(loop=name) == []
+    loops = {entry["loop"]: entry for entry in loop_monitor.get_report()["loops"]}
+    assert loops[name]["samples"] >= 2
+
+
+def test_stall_ring_buffer_is_bounded(monkeypatch):
+    monkeypatch.setattr(loop_monitor, "STALL_THRESHOLD", 0.0)
+    monitor = LoopMonitor(max_stalls=3)
+    loop = asyncio.new_event_loop()
+    try:
+        watch = loop_monitor.LoopWatch(monitor, "ring", loop, threading.get_ident())
+        monitor._watches["ring"] = watch
+        for index in range(5):
+            watch.due = time.monotonic() - 1
+            monitor.sample()
+            monitor._finish_stall(watch, 1.0 + index)
+
+        stalls = monitor.stalls()
+        assert len(stalls) == 3
+        assert [stall["duration_ms"] for stall in stalls] == [5000.0, 4000.0, 3000.0]
+        assert all(stall["finished"] for stall in stalls)
+        assert monitor.stalls(limit=1)[0]["duration_ms"] == 5000.0
+
+        monitor.clear()
+        assert monitor.stalls() == []
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("limit", ["many", -3, None, 10_000])
+def test_api_limit_is_coerced_and_capped(monkeypatch, limit):
+    from api.loop_monitor_get import DEFAULT_LIMIT, GetLoopMonitor
+
+    calls = []
+    monkeypatch.setattr(loop_monitor, "get_report", lambda limit, loop: calls.append(limit) or {})
+    handler = GetLoopMonitor(None, threading.Lock())  # type: ignore[arg-type]
+
+    asyncio.run(handler.process({"limit": limit}, SimpleNamespace(method="GET")))  # type: ignore[arg-type]
+
+    assert calls == [loop_monitor.MAX_STALLS if limit == 10_000 else DEFAULT_LIMIT]
+
+
+def test_api_clears_stalls_only_on_post(monkeypatch):
+    from api.loop_monitor_get import GetLoopMonitor
+
+    cleared = []
+    monkeypatch.setattr(loop_monitor, "get_report", lambda limit, loop: {})
+    monkeypatch.setattr(loop_monitor, "clear_stalls", lambda: cleared.append(True))
+    handler = GetLoopMonitor(None, threading.Lock())  # type: ignore[arg-type]
+
+    asyncio.run(handler.process({"clear": True}, SimpleNamespace(method="GET")))  # type: ignore[arg-type]
+    assert cleared == []
+    asyncio.run(handler.process({"clear": True}, SimpleNamespace(method="POST")))  # type: ignore[arg-type]
+    assert cleared == [True]
@@ -57,9 +57,10 @@ def _copy_extension_fixture(plugin_dir: Path, relative_path: str) -> None:
 
 
 def _clear_runtime_caches():
-    from helpers import cache, modules
+    from helpers import cache, extension, modules
 
     cache.clear("*(extensions)*")
+    extension.clear_function_points()
     cache.clear("*(plugins)*")
     modules.purge_namespace("usr.plugins")
 
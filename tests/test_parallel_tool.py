@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import time
 import sys
 from types import SimpleNamespace
@@ -348,6 +350,9 @@ async def test_parallel_subordinate_jobs_are_visible_child_logs_not_scheduler_ta
         def is_alive(self):
             return True
 
+        def add_done_callback(self, callback):
+            pass
+
         def kill(self):
             pass
 
@@ -400,6 +405,9 @@ async def test_parallel_direct_tool_jobs_fallback_to_generic_tool_log_type(monke
         def is_alive(self):
             return True
 
+        def add_done_callback(self, callback):
+            pass
+
         def kill(self):
             pass
 
@@ -443,6 +451,9 @@ async def test_parallel_code_execution_child_uses_code_exe_log_type(monkeypatch)
         def is_alive(self):
             return True
 
+        def add_done_callback(self, callback):
+            pass
+
         def kill(self):
             pass
 
@@ -510,6 +521,9 @@ async def test_parallel_wait_child_uses_wait_log_type(monkeypatch) -> None:
         def is_alive(self):
             return True
 
+        def add_done_callback(self, callback):
+            pass
+
         def kill(self):
             pass
 
@@ -704,3 +718,77 @@ def test_chats_sidebar_projects_parallel_children_as_indented_accordion() -> Non
     assert "padding-left: 24px" in html
     assert "color: var(--color-text-muted)" in html
     assert "padding: 8px;" in html
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("job_count", [1, 10, 100])
+async def test_parallel_await_fan_in_latency(job_count: int) -> None:
+    agent = _FakeAgent()
+    jobs = [
+        parallel_tools.ParallelJob(
+            id=f"job-{index}",
+            parent_context_id="ctx",
+            index=index,
+            tool_name="wait",
+            tool_args={},
+            kind="tool",
+            state="running",
+        )
+        for index in range(job_count)
+    ]
+    agent.context.set_data(parallel_tools.PARALLEL_JOBS_KEY, {job.id: job for job in jobs})
+    finished_at: list[float] = []
+
+    def finish_all() -> None:
+        # jobs complete on a worker thread, like the background DeferredTask loop
+        for job in jobs:
+            time.sleep(0.001)
+            parallel_tools._finish_job(job, "success", result=job.id)
+        finished_at.append(time.perf_counter())
+
+    worker = threading.Thread(target=finish_all)
+    worker.start()
+    results = await parallel_tools.await_parallel_jobs(  # type: ignore[arg-type]
+        agent,
+        [job.id for job in jobs],
+        timeout=30,
+    )
+    fan_in_latency = time.perf_counter() - finished_at[0]
+    worker.join()
+
+    assert [result["state"] for result in results] == ["success"] * job_count
+    assert [result["result"] for result in results] == [job.id for job in jobs]
+    assert fan_in_latency < 0.1
+    assert all(not job.waiters for job in jobs)
+    assert agent.context.get_data(parallel_tools.PARALLEL_JOBS_KEY) == {}
+
+
+@pytest.mark.asyncio
+async def test_await_wakes_when_job_is_killed_before_it_runs(monkeypatch) -> None:
+    from helpers.defer import DeferredTask
+
+    gate = threading.Event()
+
+    async def run_after_gate(*_args):
+        # stands in for a job whose body has not started yet
+        await asyncio.get_running_loop().run_in_executor(None, gate.wait, 30)
+
+    monkeypatch.setattr(parallel_tools, "_run_parallel_job", run_after_gate)
+    monkeypatch.setattr(parallel_tools, "_resolve_parallel_tool", lambda *_args, **_kwargs: None)
+    agent = _FakeAgent()
+    jobs = await parallel_tools.start_parallel_jobs(
+        agent,  # type: ignore[arg-type]
+        [parallel_tools.NormalizedToolCall(index=0, tool_name="wait", tool_args={"seconds": 1})],
+    )
+    task = jobs[0].deferred_task
+    assert isinstance(task, DeferredTask)
+
+    threading.Timer(0.2, task.kill).start()
+    started = time.perf_counter()
+    results = await parallel_tools.await_parallel_jobs(  # type: ignore[arg-type]
+        agent, [jobs[0].id], timeout=30, collect=False
+    )
+    gate.set()
+
+    assert time.perf_counter() - started < 2
+    assert results[0]["state"] == "cancelled"
@@ -0,0 +1,182 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from agent import AgentConfig, AgentContext, AgentContextType
+from helpers import persist_chat, runtime
+
+
+def _config(override_settings=None):
+    profile = (override_settings or {}).get("agent_profile") or "agent0"
+    return AgentConfig(profile=profile, mcp_servers='{"mcpServers": {}}')
+
+
+@pytest.fixture
+def chats_folder(tmp_path, monkeypatch):
+    old_args = dict(runtime.args)
+    runtime.args.clear()
+    runtime.args["dockerized"] = "true"
+    monkeypatch.setattr(persist_chat, "CHATS_FOLDER", str(tmp_path / "chats"))
+    monkeypatch.setattr(persist_chat, "initialize_agent", _config)
+    loaded: list[str] = []
+    try:
+        yield loaded
+    finally:
+        for ctxid in loaded:
+            AgentContext.remove(ctxid)
+        runtime.args.clear()
+        runtime.args.update(old_args)
+
+
+def _chat_payload(messages: int = 10, log_items: int = 20) -> dict:
+    ctx = AgentContext(config=_config(), name="template", type=AgentContextType.USER)
+    try:
+        for idx in range(messages):
+            ctx.agent0.history.add_message(ai=bool(idx % 2), content=f"message {idx} " + "lorem ipsum " * 20)
+        for idx in range(log_items):
+            ctx.log.log(type="agent", heading=f"step {idx}", content="x" * 200, id=f"item-{idx}")
+        ctx.data["project"] = "demo"
+        return persist_chat._serialize_context(ctx)
+    finally:
+        AgentContext.remove(ctx.id)
+
+
+def _write_chats(folder: Path, payload: dict, count: int, legacy: bool = False) -> None:
+    for idx in range(count):
+        chat = dict(payload, id=f"chat{idx:04d}", name=f"chat {idx}")
+        if legacy:
+            # old field order: agents and log before data
+            chat = {key: chat[key] for key in ("id", "name", "created_at", "type", "last_message", "agents",
+                                                "streaming_agent", "agent_profile", "log", "data", "output_data")}
+        path = folder / chat["id"] / persist_chat.CHAT_FILE_NAME
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(chat), encoding="utf-8")
+
+
+@pytest.mark.parametrize("legacy", [False, True])
+def test_chats_load_headers_and_hydrate_on_first_use(chats_folder, tmp_path, monkeypatch, legacy):
+    payload = _chat_payload()
+    _write_chats(tmp_path / "chats", payload, 3, legacy=legacy)
+    # small reads exercise headers split across chunks
+    monkeypatch.setattr(persist_chat, "HEADER_READ_SIZE", 7)
+
+    chats_folder.extend(persist_chat.load_tmp_chats())
+    assert sorted(chats_folder) == ["chat0000", "chat0001", "chat0002"]
+
+    ctx = AgentContext.get("chat0001")
+    assert not ctx.hydrated
+    output = ctx.output()
+    assert output["name"] == "chat 1"
+    assert AgentContext.find(data={"project": "demo"})
+    assert not ctx.hydrated
+
+    history = ctx.agent0.history.serialize()
+    assert ctx.hydrated
+    assert history == payload["agents"][0]["history"]
+    assert [item.id for item in ctx.log.logs] == [item["id"] for item in payload["log"]["logs"]]
+    assert ctx.log.context is ctx
+    assert ctx.get_agent() is ctx.agent0
+    assert not AgentContext.get("chat0002").hydrated
+
+
+def test_saving_unhydrated_chat_keeps_agents_and_log(chats_folder, tmp_path):
+    payload = _chat_payload()
+    _write_chats(tmp_path / "chats", payload, 1)
+    chats_folder.extend(persist_chat.load_tmp_chats())
+
+    ctx = AgentContext.get("chat0000")
+    ctx.name = "renamed"
+    ctx.data["project"] = "other"
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("the saved body is copied, not parsed")
+
+    # the body is copied from the file as it is, also after a second save
+    loads = persist_chat.json.loads
+    persist_chat.json.loads = no_parsing
+    try:
+        persist_chat.save_tmp_chat(ctx)
+        ctx.name = "renamed \u00e9"
+        persist_chat.save_tmp_chat(ctx)
+    finally:
+        persist_chat.json.loads = loads
+    assert not ctx.hydrated
+
+    path = tmp_path / "chats" / "chat0000" / persist_chat.CHAT_FILE_NAME
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["name"] == "renamed \u00e9"
+    assert saved["data"]["project"] == "other"
+    assert saved["agents"] == payload["agents"]
+    assert saved["log"] == payload["log"]
+    assert list(saved)[-2:] == list(persist_chat.BODY_KEYS)
+
+    # resetting drops the saved history without hydrating it first
+    ctx.reset()
+    assert ctx.hydrated
+    assert not any(item.id == "item-0" for item in ctx.log.logs)
+
+
+def test_chat_that_fails_to_hydrate_is_dropped_once(chats_folder, tmp_path, capsys):
+    payload = _chat_payload()
+    _write_chats(tmp_path / "chats", payload, 2)
+    path = tmp_path / "chats" / "chat0000" / persist_chat.CHAT_FILE_NAME
+    corrupt = path.read_text(encoding="utf-8")[:-200]  # header intact, body cut short
+    path.write_text(corrupt, encoding="utf-8")
+    chats_folder.extend(persist_chat.load_tmp_chats())
+    assert sorted(chats_folder) == ["chat0000", "chat0001"]
+
+    # log_to_all leaves chats nobody opened alone
+    AgentContext.log_to_all(type="info", content="broadcast")
+    assert not AgentContext.get("chat0000").hydrated
+    assert not AgentContext.get("chat0001").hydrated
+
+    ctx = AgentContext.get("chat0000")
+    logs = ctx.log.logs
+    assert not any(item.id == "item-0" for item in logs)
+    assert ctx.agent0 is not None
+    assert AgentContext.get("chat0000") is None
+    assert capsys.readouterr().out.count("Error loading chat chat0000") == 1
+
+    # no second attempt, and the file is not overwritten with the empty chat
+    assert ctx.log.logs is logs
+    persist_chat.save_tmp_chat(ctx)
+    assert "Error loading chat" not in capsys.readouterr().out
+    assert path.read_text(encoding="utf-8") == corrupt
+
+
+@pytest.mark.skipif(not os.getenv("A0_RUN_BENCHMARKS"), reason="wall-clock benchmark; set A0_RUN_BENCHMARKS=1")
+def test_benchmark_1000_chat_startup(chats_folder, tmp_path):
+    payload = _chat_payload(messages=30, log_items=80)
+    _write_chats(tmp_path / "chats", payload, 1000)
+    sample = 50
+
+    started = time.perf_counter()
+    for idx in range(sample):
+        path = tmp_path / "chats" / f"chat{idx:04d}" / persist_chat.CHAT_FILE_NAME
+        eager = persist_chat._deserialize_context(json.loads(path.read_text(encoding="utf-8")))
+        AgentContext.remove(eager.id)
+    eager_seconds = (time.perf_counter() - started) * 1000 / sample
+
+    started = time.perf_counter()
+    chats_folder.extend(persist_chat.load_tmp_chats())
+    lazy_seconds = time.perf_counter() - started
+    assert len(chats_folder) == 1000
+
+    started = time.perf_counter()
+    assert len(AgentContext.get("chat0500").log.logs) == len(payload["log"]["logs"])
+    hydrate_seconds = time.perf_counter() - started
+
+    print(
+        f"\n1000 chat startup: eager {eager_seconds:.2f} s (from {sample} chats), "
+        f"headers {lazy_seconds * 1000:.0f} ms, first open {hydrate_seconds * 1000:.1f} ms"
+    )
+    assert sum(1 for ctxid in chats_folder if AgentContext.get(ctxid).hydrated) == 1
+    assert lazy_seconds * 5 < eager_seconds
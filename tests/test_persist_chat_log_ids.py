@@ -44,14 +44,14 @@ def test_load_tmp_chats_skips_directories_without_chat_json(monkeypatch, capsys)
         lambda path: str(path).endswith("/valid/chat.json"),
     )
     monkeypatch.setattr(
-        persist_chat.files,
-        "read_file",
-        lambda path: json.dumps({"id": "valid"}),
+        persist_chat,
+        "_read_chat_header",
+        lambda path: ({"id": "valid"}, None),
     )
     monkeypatch.setattr(
         persist_chat,
-        "_deserialize_context",
-        lambda data: SimpleNamespace(id=data["id"], data={}),
+        "_deserialize_lazy_context",
+        lambda header, path, configs: SimpleNamespace(id=header["id"], data={}),
     )
 
     assert persist_chat.load_tmp_chats() == ["valid"]
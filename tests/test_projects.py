@@ -185,3 +185,90 @@ def test_agents_md_protocol_excludes_project_root_and_keeps_subdir(
     assert "framework doc" in protocol
     assert "api doc" in protocol
     assert "project root doc" not in protocol
+
+
+def _watch_project_instructions(monkeypatch):
+    from helpers import watchdog
+
+    # restores the flag register_watchdogs() sets
+    monkeypatch.setattr(projects, "_watchdogs_registered", False)
+    projects.register_watchdogs()
+    return lambda: watchdog.remove_watchdog("project_instructions")
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    import time
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_project_instructions_are_cached_until_files_change(monkeypatch, tmp_path):
+    _prepare_project_tree(monkeypatch, tmp_path)
+    projects.create_project("demo", {"title": "Demo"})
+    project_root = tmp_path / "usr" / "projects" / "demo"
+    (project_root / "AGENTS.md").write_text("first rule", encoding="utf-8")
+    for idx in range(50):
+        (project_root / f"module_{idx}.py").write_text("", encoding="utf-8")
+
+    stop = _watch_project_instructions(monkeypatch)
+    try:
+        reads = []
+        original = files.read_text_files_in_dir
+        monkeypatch.setattr(
+            files,
+            "read_text_files_in_dir",
+            lambda *args, **kwargs: reads.append(args) or original(*args, **kwargs),
+        )
+
+        first = projects.build_system_prompt_vars("demo")
+        protocol = projects.build_agents_md_protocol("demo")
+        cold_reads = len(reads)
+        for _ in range(10):
+            assert projects.build_system_prompt_vars("demo") == first
+            assert projects.build_agents_md_protocol("demo") == protocol
+        assert cold_reads > 0
+        assert len(reads) == cold_reads
+
+        # edits outside the API reach the cache through the watchdog
+        (project_root / "AGENTS.md").write_text("second rule", encoding="utf-8")
+        assert _wait_for(
+            lambda: "second rule" in projects.build_system_prompt_vars("demo")["project_instructions"]
+        )
+        (project_root / ".a0proj" / "instructions" / "extra.md").write_text("extra rule", encoding="utf-8")
+        assert _wait_for(
+            lambda: "extra rule" in projects.build_system_prompt_vars("demo")["project_instructions"]
+        )
+
+        # saving the header clears the cache right away
+        data = projects.load_basic_project_data("demo")
+        data["include_agents_md"] = False
+        projects.save_project_header("demo", data)
+        assert "second rule" not in projects.build_system_prompt_vars("demo")["project_instructions"]
+    finally:
+        stop()
+        projects.clear_instructions_cache()
+
+
+def test_agents_md_above_the_project_invalidates_by_stat(monkeypatch, tmp_path):
+    _prepare_project_tree(monkeypatch, tmp_path)
+    prompt_name = "agent.protocol.projects.agents_md.md"
+    prompt_source = Path(__file__).resolve().parents[1] / "prompts" / prompt_name
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "prompts" / prompt_name).write_text(
+        prompt_source.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    projects.create_project("demo", {"title": "Demo"})
+
+    stop = _watch_project_instructions(monkeypatch)
+    try:
+        assert projects.build_agents_md_protocol("demo") == ""
+        (tmp_path / "AGENTS.md").write_text("framework doc", encoding="utf-8")
+        assert "framework doc" in projects.build_agents_md_protocol("demo")
+    finally:
+        stop()
+        projects.clear_instructions_cache()
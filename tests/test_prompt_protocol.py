@@ -107,6 +107,7 @@ async def test_project_prompt_moves_project_instructions_to_protocol(monkeypatch
 
     class FakeAgent:
         context = FakeContext()
+        config = SimpleNamespace(profile="")
 
         def read_prompt(self, prompt_file: str, **kwargs) -> str:
             if prompt_file == "agent.system.projects.main.md":
@@ -154,6 +155,7 @@ async def test_project_prompt_does_not_load_agents_md_without_project(monkeypatc
 
     class FakeAgent:
         context = FakeContext()
+        config = SimpleNamespace(profile="")
 
         def read_prompt(self, prompt_file: str, **kwargs) -> str:
             if prompt_file == "agent.system.projects.main.md":
@@ -122,3 +122,14 @@ def test_notification_payload_and_cursor_are_captured_together():
     assert [item["message"] for item in notifications] == ["first"]
     assert version == 1
     assert [item["message"] for item in manager.output(start=version)] == ["second"]
+
+
+def test_agent_profile_metadata_tolerates_half_initialized_context():
+    from types import SimpleNamespace
+
+    from helpers import state_snapshot
+
+    context_data: dict = {}
+    ctx = SimpleNamespace(config=SimpleNamespace(profile="agent0"))
+    state_snapshot._apply_agent_profile_metadata(context_data, ctx, {"agent0": "Agent 0"})
+    assert context_data == {"agent_profile": "agent0", "agent_profile_label": "Agent 0"}
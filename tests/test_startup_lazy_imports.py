@@ -0,0 +1,161 @@
+import asyncio
+import json
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import lazy_import
+from helpers.server_startup import InitializationGate, StartupMonitor
+
+# generous for slow machines; importing the agent runtime eagerly takes several times longer
+RUN_UI_IMPORT_BUDGET_SECONDS = 10.0
+HEAVY_MODULES = (
+    "agent",
+    "models",
+    "initialize",
+    "litellm",
+    "langchain_core",
+    "mcp_server",
+    "fasta2a_server",
+)
+
+
+def test_run_ui_import_defers_agent_runtime():
+    script = (
+        "import json, sys, time\n"
+        "started = time.monotonic()\n"
+        "import run_ui\n"
+        "elapsed = time.monotonic() - started\n"
+        f"heavy = {list(HEAVY_MODULES)!r}\n"
+        "print(json.dumps({'elapsed': elapsed, 'loaded': [m for m in heavy if m in sys.modules]}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["loaded"] == []
+    assert report["elapsed"] < RUN_UI_IMPORT_BUDGET_SECONDS
+
+
+def test_ui_and_health_answer_while_init_a0_is_still_running():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    script = (
+        "import time\n"
+        "import run_ui\n"
+        "from helpers import dotenv, runtime\n"
+        "def blocking_init_a0():\n"
+        "    print('init_a0 started', flush=True)\n"
+        "    time.sleep(600)\n"
+        "run_ui.init_a0 = blocking_init_a0\n"
+        "runtime.initialize()\n"
+        "dotenv.load_dotenv()\n"
+        "server_runtime, _, _ = run_ui.prepare_web_runtime()\n"
+        f"run_ui.start_web_server(server_runtime, '127.0.0.1', {port})\n"
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    lines: queue.Queue[str] = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(line) for line in proc.stdout], daemon=True).start()  # type: ignore[union-attr]
+    try:
+        deadline = time.monotonic() + 120
+        while True:
+            line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            if "init_a0 started" in line:
+                break
+
+        for path in ("/api/health", "/"):
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as resp:
+                assert resp.status == 200
+        assert proc.poll() is None
+    finally:
+        proc.kill()
+        proc.wait(timeout=10)
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    name = "json.tool"
+    sys.modules.pop(name, None)
+    module = lazy_import.lazy_module(name, "test")
+
+    assert not lazy_import.is_loaded(module)
+    assert name not in sys.modules
+
+    assert callable(module.main)
+    assert lazy_import.is_loaded(module)
+    assert any(
+        timing.name == name and timing.trigger == "test"
+        for timing in lazy_import.get_import_timings()
+    )
+
+
+def test_loaded_attr_does_not_import():
+    sys.modules.pop("json.tool", None)
+
+    assert lazy_import.loaded_attr("json.tool", "main") is None
+    assert "json.tool" not in sys.modules
+
+
+@pytest.mark.asyncio
+async def test_initialization_gate_releases_waiters_from_another_thread():
+    gate = InitializationGate()
+    assert gate.is_open()
+    await asyncio.wait_for(gate.wait(), 0.1)
+
+    gate.begin()
+    waiter = asyncio.create_task(gate.wait())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    threading.Timer(0.05, gate.finish).start()
+    await asyncio.wait_for(waiter, 1)
+    assert gate.is_open()
+
+
+def test_startup_monitor_records_imports_and_ttfb():
+    monitor = StartupMonitor(
+        bind_host="127.0.0.1",
+        probe_host="127.0.0.1",
+        port=0,
+        attempt=1,
+        max_attempts=1,
+        timeout_seconds=10,
+        ttfb_budget_seconds=3600,
+    )
+    try:
+        lazy_import.record_timing("example.before_ready", time.monotonic(), 0.5, "test")
+        with monitor.stage("runtime.prepare"):
+            pass
+        monitor.mark_ready("test")
+        lazy_import.record_timing("example.after_ready", time.monotonic(), 0.5, "test")
+
+        report = monitor.report()
+        assert report["ttfb_seconds"] is not None
+        assert report["stages"]["import.example.before_ready"] == 0.5
+        assert "runtime.prepare" in report["stages"]
+        assert "import.example.after_ready" not in report["stages"]
+    finally:
+        monitor.close()
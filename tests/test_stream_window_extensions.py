@@ -0,0 +1,135 @@
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import extension
+from helpers.extension import Extension
+
+POINT = "response_stream_chunk"
+
+
+def _install(monkeypatch, *classes):
+    monkeypatch.setattr(extension, "_get_extension_classes", lambda point, agent=None, **kw: list(classes))
+
+
+async def _stream(text: str, size: int, loop_data):
+    full = ""
+    for idx in range(0, len(text), size):
+        chunk = text[idx : idx + size]
+        full += chunk
+        await extension.call_stream_extensions(
+            POINT, None, loop_data, stream_data={"chunk": chunk, "full": full}
+        )
+
+
+@pytest.mark.asyncio
+async def test_windowed_extensions_get_joined_deltas_and_a_final_flush(monkeypatch):
+    calls = {"every": [], "sized": []}
+
+    class Mask(Extension):
+        async def execute(self, stream_data=None, **kwargs):
+            stream_data["chunk"] = stream_data["chunk"].upper()
+
+    class Every(Extension):
+        async def execute(self, stream_data=None, **kwargs):
+            calls["every"].append(stream_data["chunk"])
+
+    class Sized(Extension):
+        stream_window_chars = 10
+
+        def execute(self, stream_data=None, **kwargs):
+            calls["sized"].append((stream_data["chunk"], stream_data["full"]))
+            stream_data["chunk"] = "ignored"
+
+    _install(monkeypatch, Mask, Every, Sized)
+    loop_data = SimpleNamespace(params_temporary={})
+    text = "abcdefghijklmnopqrstuvwxyz"
+
+    await _stream(text, 3, loop_data)
+    assert calls["every"] == [text[i : i + 3].upper() for i in range(0, len(text), 3)]
+    # windows close after 4 chunks (12 chars); the rest waits for the flush
+    assert [chunk for chunk, _ in calls["sized"]] == ["ABCDEFGHIJKL", "MNOPQRSTUVWX"]
+
+    await extension.flush_stream_extensions(None, loop_data, POINT)
+    assert "".join(chunk for chunk, _ in calls["sized"]) == text.upper()
+    assert calls["sized"][-1][1] == text
+
+    # nothing pending, nothing to flush
+    await extension.flush_stream_extensions(None, loop_data)
+    assert len(calls["sized"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_time_windows_call_on_the_first_delta_then_once_per_window(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(extension.time, "monotonic", lambda: now[0])
+    received = []
+
+    class Timed(Extension):
+        stream_window_seconds = 1.0
+
+        async def execute(self, stream_data=None, **kwargs):
+            received.append(stream_data["chunk"])
+
+    _install(monkeypatch, Timed)
+    loop_data = SimpleNamespace(params_temporary={})
+    full = ""
+    for idx, chunk in enumerate("abcdefgh"):
+        now[0] = 100.0 + idx * 0.4
+        full += chunk
+        await extension.call_stream_extensions(POINT, None, loop_data, stream_data={"chunk": chunk, "full": full})
+    await extension.flush_stream_extensions(None, loop_data)
+
+    # t=0 a; t=1.2 bcd; t=2.4 efg; flush h
+    assert received == ["a", "bcd", "efg", "h"]
+
+    # a new iteration (params_temporary reset) starts fresh windows
+    loop_data.params_temporary = {}
+    await extension.call_stream_extensions(POINT, None, loop_data, stream_data={"chunk": "x", "full": "x"})
+    assert received[-1] == "x"
+
+
+@pytest.mark.asyncio
+async def test_benchmark_windowed_dispatch_of_10k_deltas(monkeypatch):
+    work = {"calls": 0}
+
+    def collector(**attrs):
+        class Collector(Extension):
+            def execute(self, stream_data=None, **kwargs):
+                work["calls"] += 1
+                # stands in for scanning / forwarding the accumulated text
+                stream_data["full"].count("token")
+
+        for name, value in attrs.items():
+            setattr(Collector, name, value)
+        return Collector
+
+    text = "token " * 10_000
+
+    async def run(*classes):
+        _install(monkeypatch, *classes)
+        work["calls"] = 0
+        loop_data = SimpleNamespace(params_temporary={})
+        started = time.perf_counter()
+        await _stream(text, 6, loop_data)
+        await extension.flush_stream_extensions(None, loop_data)
+        return time.perf_counter() - started, work["calls"]
+
+    per_chunk, per_chunk_calls = await run(collector(), collector())
+    windowed, windowed_calls = await run(
+        collector(stream_window_chars=2000), collector(stream_window_seconds=0.25)
+    )
+
+    print(
+        f"\nstream chunk extensions, 10k deltas: per-chunk {per_chunk * 1000:.1f} ms "
+        f"({per_chunk_calls} calls), windowed {windowed * 1000:.1f} ms ({windowed_calls} calls)"
+    )
+    assert per_chunk_calls == 20_000
+    assert windowed_calls < per_chunk_calls / 10
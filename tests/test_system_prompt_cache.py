@@ -0,0 +1,118 @@
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from agent import AgentConfig, AgentContext, AgentContextType
+from helpers import runtime, system_prompt_cache
+
+
+@pytest.fixture
+def agent_context():
+    old_args = dict(runtime.args)
+    runtime.args.clear()
+    runtime.args["dockerized"] = "true"
+    ctx = AgentContext(
+        config=AgentConfig(
+            profile="agent0",
+            knowledge_subdirs=["custom", "default"],
+            mcp_servers='{"mcpServers": {}}',
+        ),
+        type=AgentContextType.USER,
+        set_current=False,
+    )
+    system_prompt_cache.clear()
+    try:
+        yield ctx
+    finally:
+        AgentContext.remove(ctx.id)
+        runtime.args.clear()
+        runtime.args.update(old_args)
+        system_prompt_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_benchmark_per_iteration_system_prompt_build(agent_context):
+    agent = agent_context.agent0
+    iterations = 20
+
+    started = time.perf_counter()
+    cold = await agent.get_system_prompt(agent.loop_data)
+    cold_seconds = time.perf_counter() - started
+
+    before = system_prompt_cache.get_stats()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        warm = await agent.get_system_prompt(agent.loop_data)
+        assert warm == cold  # byte-identical, so provider prompt caches stay warm
+    warm_seconds = (time.perf_counter() - started) / iterations
+    after = system_prompt_cache.get_stats()
+
+    print(
+        f"\nsystem prompt build: cold {cold_seconds * 1000:.1f} ms, "
+        f"cached {warm_seconds * 1000:.1f} ms per iteration"
+    )
+    assert after["misses"] == before["misses"]
+    assert after["hits"] - before["hits"] >= 5 * iterations
+
+
+@pytest.mark.asyncio
+async def test_section_is_rebuilt_when_inputs_or_prompt_dirs_change(tmp_path, monkeypatch):
+    prompt_dir = tmp_path / "prompts"
+    prompt_dir.mkdir()
+    monkeypatch.setattr(system_prompt_cache.subagents, "get_paths", lambda agent, *sub: [str(prompt_dir)])
+    system_prompt_cache.clear()
+    agent = SimpleNamespace()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return f"build {len(builds)}"
+
+    async def section(value):
+        return await system_prompt_cache.cached_section(agent, "test", [value], build)
+
+    assert await section("a") == "build 1"
+    assert await section("a") == "build 1"
+    assert await section("b") == "build 2"
+
+    # a file added to a prompt directory changes its mtime
+    (prompt_dir / "agent.system.tool.new.md").write_text("new tool")
+    assert await section("b") == "build 3"
+
+    # the watchdog handler clears everything
+    system_prompt_cache.clear()
+    assert await section("b") == "build 4"
+    system_prompt_cache.clear()
+
+
+@pytest.mark.parametrize(
+    ("relative", "expected"),
+    [
+        ("demo/.a0proj/project.json", True),
+        ("demo/.a0proj/instructions/style.md", True),
+        ("demo/.a0proj/skills/review/SKILL.md", True),
+        ("demo/.a0proj/agents/coder/prompts/agent.system.main.role.md", True),
+        ("demo/AGENTS.md", True),
+        ("demo/src/AGENTS.md", True),
+        ("demo/README.md", False),
+        ("demo/package.json", False),
+        ("demo/src/config.yaml", False),
+    ],
+)
+def test_projects_watch_only_files_prompts_read(relative, expected):
+    from helpers import watchdog
+
+    root = "/projects"
+    matcher = watchdog._compile_matcher(
+        root,
+        watchdog._normalize_patterns(system_prompt_cache._project_prompt_patterns()),
+        watchdog._normalize_patterns(None, default=watchdog._DEFAULT_IGNORE_PATTERNS),
+    )
+    assert matcher(f"{root}/{relative}") is expected
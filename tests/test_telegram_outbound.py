@@ -0,0 +1,132 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from plugins._telegram_integration.helpers import outbound
+from plugins._telegram_integration.helpers import telegram_client as tc
+
+TOKEN = "123:stub"
+
+
+class BotApiStub:
+    """Local Bot API server recording calls; optionally answers 429 first."""
+
+    def __init__(self, rate_limit_first: int = 0, delay: float = 0.0):
+        self.calls: list[tuple[str, dict, float]] = []
+        self.peers: set[tuple] = set()
+        self.rate_limit_first = rate_limit_first
+        self.delay = delay
+        self.runner: web.AppRunner | None = None
+        self.base = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        payload = await request.json()
+        self.calls.append((method, payload, time.monotonic()))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.rate_limit_first:
+            self.rate_limit_first -= 1
+            return web.json_response(
+                {"ok": False, "error_code": 429, "parameters": {"retry_after": 0.2}},
+                status=429,
+            )
+        if method == "sendMessage":
+            return web.json_response({"ok": True, "result": {"message_id": len(self.calls)}})
+        return web.json_response({"ok": True, "result": True})
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post(f"/bot{TOKEN}/{{method}}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await outbound.close_outbound(TOKEN)
+        await self.runner.cleanup()
+
+
+def _fast_outbound(stub: BotApiStub, chat_interval: float = 0.0) -> outbound.TelegramOutbound:
+    sender = outbound.get_outbound(TOKEN, stub.base)
+    sender.global_interval = 0.0
+    sender.private_chat_interval = chat_interval
+    sender.group_chat_interval = chat_interval
+    return sender
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_one_pooled_session(monkeypatch):
+    async with BotApiStub() as stub:
+        monkeypatch.setattr(tc, "TELEGRAM_API_BASE", stub.base)
+        sender = _fast_outbound(stub)
+
+        for idx in range(10):
+            assert await tc.raw_send_text(TOKEN, idx, f"hello {idx}") is not None
+
+        assert sender.stats["sessions"] == 1
+        assert sender.stats["requests"] == 10
+        assert len(stub.peers) == 1  # keep-alive: every call on the same connection
+
+
+@pytest.mark.asyncio
+async def test_concurrent_edits_of_one_message_are_coalesced(monkeypatch):
+    async with BotApiStub() as stub:
+        monkeypatch.setattr(tc, "TELEGRAM_API_BASE", stub.base)
+        sender = _fast_outbound(stub, chat_interval=0.2)
+
+        # the first edit takes the chat's slot, the rest wait for the next one
+        results = await asyncio.gather(
+            *(tc.raw_edit_text(TOKEN, 42, 7, f"draft {idx}") for idx in range(6))
+        )
+
+        assert results == [True] * 6
+        texts = [payload["text"] for method, payload, _ in stub.calls]
+        assert texts == ["draft 0", "draft 5"]
+        assert sender.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_calls_to_one_chat_are_spaced(monkeypatch):
+    async with BotApiStub() as stub:
+        monkeypatch.setattr(tc, "TELEGRAM_API_BASE", stub.base)
+        _fast_outbound(stub, chat_interval=0.1)
+
+        await asyncio.gather(
+            *(tc.raw_send_text(TOKEN, 42, f"msg {idx}") for idx in range(3)),
+            tc.raw_send_text(TOKEN, 43, "other chat"),
+        )
+
+        same_chat = [at for _, payload, at in stub.calls if payload["chat_id"] == 42]
+        gaps = [later - earlier for earlier, later in zip(same_chat, same_chat[1:])]
+        assert len(same_chat) == 3
+        assert all(gap >= 0.09 for gap in gaps)
+        # another chat does not wait behind the first one
+        other = next(at for _, payload, at in stub.calls if payload["chat_id"] == 43)
+        assert other - same_chat[0] < 0.09
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_is_retried_after_retry_after(monkeypatch):
+    async with BotApiStub(rate_limit_first=1) as stub:
+        monkeypatch.setattr(tc, "TELEGRAM_API_BASE", stub.base)
+        sender = _fast_outbound(stub)
+
+        message_id = await tc.raw_send_text(TOKEN, 42, "hello")
+
+        assert message_id == 2
+        assert sender.stats["rate_limited"] == 1
+        assert stub.calls[1][2] - stub.calls[0][2] >= 0.19
@@ -0,0 +1,201 @@
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import watchdog
+
+
+class _FakeObserver:
+    def schedule(self, *args, **kwargs):
+        pass
+
+    def unschedule_all(self):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def join(self):
+        pass
+
+    def is_alive(self):
+        return True
+
+
+@pytest.fixture
+def registry():
+    registry = watchdog._WatchRegistry()
+    registry._create_observer = lambda: _FakeObserver()
+    yield registry
+    registry.clear()
+
+
+def _event(event_type: str, path: str, dest: str | None = None, synthetic: bool = False):
+    return SimpleNamespace(event_type=event_type, src_path=path, dest_path=dest, is_synthetic=synthetic)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_index_finds_exactly_the_watches_above_a_path(registry, tmp_path):
+    roots = [
+        tmp_path,
+        tmp_path / "plugins",
+        tmp_path / "plugins" / "a",
+        tmp_path / "plugins" / "ab",
+        tmp_path / "projects" / "demo",
+    ]
+    for idx, root in enumerate(roots):
+        registry.add(f"w{idx}", [str(root)], None, None, "all", 0.01, lambda items: None)
+
+    def linear(path: str) -> set[str]:
+        return {
+            watch.id
+            for watch in registry._watches.values()
+            if path == watch.root or path.startswith(watch.root + os.sep)
+        }
+
+    for relative in ("plugins/a/x.md", "plugins/ab/x.md", "plugins/abc/x.md", "projects/demo", "projects/other/x"):
+        path = str(tmp_path / relative)
+        assert {watch.id for watch in registry._index.lookup(path)} == linear(path)
+
+    registry.remove("w2")
+    assert "w2" not in {watch.id for watch in registry._index.lookup(str(tmp_path / "plugins/a/x.md"))}
+
+
+def test_dispatch_reports_dropped_and_batched_events(registry, tmp_path):
+    batches = []
+    registry.add("docs", [str(tmp_path)], ["*.md"], None, "all", 0.05, batches.append)
+    root = str(tmp_path)
+
+    registry.dispatch(root, _event("modified", str(tmp_path / "a.md")))
+    registry.dispatch(root, _event("modified", str(tmp_path / "a.md")))
+    registry.dispatch(root, _event("created", str(tmp_path / "b.md")))
+    registry.dispatch(root, _event("modified", str(tmp_path / "a.txt")))  # no pattern match
+    registry.dispatch(root, _event("modified", str(tmp_path / "pkg" / "__pycache__" / "x.md")))  # ignored
+    registry.dispatch(root, _event("modified", str(tmp_path / "c.md"), synthetic=True))
+    registry.dispatch(root, _event("opened", str(tmp_path / "c.md")))
+
+    assert _wait_for(lambda: len(batches) == 1)
+    assert sorted(batches[0]) == [[str(tmp_path / "a.md"), "modify"], [str(tmp_path / "b.md"), "create"]]
+    stats = registry.get_stats()
+    assert stats["events"] == 7
+    assert stats["dropped"] == 4
+    assert stats["matched"] == 3
+    assert stats["batched"] == 2
+    assert stats["flushed"] == 1
+    assert stats["pending_batches"] == 0
+
+    # removing a watch discards its pending batch
+    registry.dispatch(root, _event("modified", str(tmp_path / "d.md")))
+    registry.remove("docs")
+    time.sleep(0.1)
+    assert len(batches) == 1
+
+
+def test_handler_errors_do_not_stop_later_batches(registry, tmp_path):
+    delivered = []
+
+    def failing(items):
+        raise RuntimeError("boom")
+
+    registry.add("failing", [str(tmp_path / "a")], None, None, "all", 0.01, failing)
+    registry.add("working", [str(tmp_path / "b")], None, None, "all", 0.01, delivered.append)
+    registry.dispatch(str(tmp_path), _event("modified", str(tmp_path / "a" / "x")))
+    time.sleep(0.05)
+    registry.dispatch(str(tmp_path), _event("modified", str(tmp_path / "b" / "x")))
+
+    assert _wait_for(lambda: delivered == [[[str(tmp_path / "b" / "x"), "modify"]]])
+
+
+def test_slow_handler_does_not_delay_other_watches(registry, tmp_path):
+    import threading
+
+    release = threading.Event()
+    slow_batches = []
+    fast_batches = []
+
+    def slow(items):
+        slow_batches.append(items)
+        assert release.wait(5)
+
+    registry.add("slow", [str(tmp_path / "a")], None, None, "all", 0.01, slow)
+    registry.add("fast", [str(tmp_path / "b")], None, None, "all", 0.01, fast_batches.append)
+    root = str(tmp_path)
+    registry.dispatch(root, _event("modified", str(tmp_path / "a" / "x")))
+    assert _wait_for(lambda: len(slow_batches) == 1)
+
+    registry.dispatch(root, _event("modified", str(tmp_path / "b" / "x")))
+    registry.dispatch(root, _event("modified", str(tmp_path / "a" / "y")))
+    registry.dispatch(root, _event("modified", str(tmp_path / "a" / "z")))
+    assert _wait_for(lambda: len(fast_batches) == 1)
+
+    # the running watch's next batch waits for it and collects the meantime events
+    time.sleep(0.05)
+    assert len(slow_batches) == 1
+    release.set()
+    assert _wait_for(lambda: len(slow_batches) == 2)
+    assert sorted(path for path, _event_type in slow_batches[1]) == [
+        str(tmp_path / "a" / "y"),
+        str(tmp_path / "a" / "z"),
+    ]
+
+
+def test_benchmark_100k_events_across_200_watches(registry, tmp_path):
+    delivered = []
+    roots = []
+    for idx in range(200):
+        root = tmp_path / ("plugins" if idx < 100 else "projects") / f"w{idx}"
+        roots.append(root)
+        patterns = ["*/extensions/**/*", "plugin.yaml"] if idx % 2 else ["*.md", "*.json"]
+        registry.add(f"w{idx}", [str(root)], patterns, None, "all", 0.01, delivered.extend)
+
+    events = []
+    for n in range(100_000):
+        root = roots[n % 200]
+        kind = (n // 200) % 4
+        if kind == 0:
+            path = root / "node_modules" / "pkg" / f"f{n}.js"
+        elif kind == 1:
+            path = root / "src" / "__pycache__" / f"m{n}.md"
+        elif kind == 2:
+            path = root / "docs" / f"readme{n}.md"
+        else:
+            path = root / "ext" / "extensions" / "hook" / f"h{n}.py"
+        events.append(_event("modified", str(path)))
+
+    started = time.perf_counter()
+    for event in events:
+        registry.dispatch(str(tmp_path), event)
+    elapsed = time.perf_counter() - started
+
+    # kind 2 matches the *.md watches, kind 3 the extension watches
+    expected = 25_000 // 2 + 25_000 // 2
+    assert _wait_for(lambda: len(delivered) == expected)
+    stats = registry.get_stats()
+    print(
+        f"\nwatchdog dispatch: {len(events) / elapsed:,.0f} events/s over 200 watches, "
+        f"dropped {stats['dropped']}, batched {stats['batched']}, flushed {stats['flushed']}"
+    )
+    assert stats["events"] == 100_000
+    assert stats["matched"] == expected
+    assert stats["dropped"] == 100_000 - expected
+    assert stats["batched"] + stats["flushed"] == expected
+    assert elapsed < 30
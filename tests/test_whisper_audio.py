@@ -0,0 +1,110 @@
+import io
+import shutil
+import subprocess
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from plugins._whisper_stt.helpers import audio
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def _wav(samples: np.ndarray, rate: int = 16000, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        out.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def _dictation(rate: int = 16000, lead: float = 1.5, speech: float = 1.0, tail: float = 2.0) -> np.ndarray:
+    """Silence, a voiced tone, silence; with a little background noise."""
+    rng = np.random.default_rng(0)
+    total = int(rate * (lead + speech + tail))
+    samples = rng.normal(0, 0.002, total).astype(np.float32)
+    start, end = int(rate * lead), int(rate * (lead + speech))
+    t = np.arange(end - start) / rate
+    samples[start:end] += 0.4 * np.sin(2 * np.pi * 220 * t)
+    return samples
+
+
+def test_wav_is_decoded_in_memory_downmixed_and_resampled():
+    stereo = np.repeat(_dictation(rate=48000), 2)
+    samples = audio.decode(_wav(stereo, rate=48000, channels=2))
+
+    assert samples.dtype == np.float32
+    assert abs(samples.size - 16000 * 4.5) <= 1
+    assert 0.35 < float(np.abs(samples).max()) < 0.45
+
+    assert audio.decode_wav(b"OggS not a wav") is None
+    assert audio.decode_wav(b"RIFF\x00\x00\x00\x00WAVEbroken") is None
+
+
+def test_trim_silence_keeps_speech_with_padding():
+    samples = _dictation()
+    trimmed = audio.trim_silence(samples)
+
+    # 1 s of speech + up to 200 ms padding (and one frame of rounding) on each side
+    assert 1.0 <= trimmed.size / 16000 <= 1.0 + 2 * (0.2 + 0.03)
+    assert trimmed.size < samples.size / 3
+
+    assert audio.trim_silence(np.zeros(16000, dtype=np.float32)).size == 0
+    assert audio.trim_silence(np.zeros(10, dtype=np.float32)).size == 10
+
+
+def test_in_memory_wav_path_avoids_subprocess(monkeypatch):
+    def _no_subprocess(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run for PCM WAV")
+
+    monkeypatch.setattr(audio.subprocess, "run", _no_subprocess)
+    samples = audio.trim_silence(audio.decode(_wav(_dictation())))
+    assert samples.size > 0
+
+
+def _bench(fn, data: bytes, rounds: int = 5) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(data)
+    return (time.perf_counter() - started) / rounds
+
+
+@requires_ffmpeg
+def test_benchmark_in_memory_decode_against_temp_file_ffmpeg():
+    wav = _wav(_dictation())
+    in_memory = _bench(audio.decode, wav)
+    temp_file = _bench(audio._decode_file, wav)
+
+    assert np.allclose(audio.decode(wav), audio._decode_file(wav), atol=1e-3)
+    print(f"\nWAV decode: in memory {in_memory * 1000:.2f} ms, temp file + ffmpeg {temp_file * 1000:.2f} ms")
+    assert in_memory < temp_file
+
+
+@requires_ffmpeg
+def test_benchmark_webm_pipe_against_temp_file_ffmpeg():
+    webm = subprocess.run(
+        ["ffmpeg", "-f", "wav", "-i", "pipe:0", "-c:a", "libopus", "-f", "webm", "-"],
+        input=_wav(_dictation()),
+        capture_output=True,
+    ).stdout
+    if not webm:
+        pytest.skip("ffmpeg without libopus/webm support")
+
+    piped = _bench(audio.decode, webm)
+    temp_file = _bench(audio._decode_file, webm)
+    samples = audio.decode(webm)
+    print(f"\nWebM decode: pipe {piped * 1000:.2f} ms, temp file {temp_file * 1000:.2f} ms")
+
+    assert abs(samples.size - 16000 * 4.5) < 16000 * 0.1
+    trimmed = audio.trim_silence(samples)
+    assert trimmed.size < samples.size / 3
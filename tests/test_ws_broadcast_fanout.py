@@ -0,0 +1,227 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+import socketio
+from engineio.async_socket import AsyncSocket
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers import ws_manager as ws_manager_module
+from helpers.ws_manager import WsManager
+
+NAMESPACE = "/ws"
+SOCKET_COUNT = 200
+BROADCASTS = 50
+# generous for slow CI; 200 sockets x 50 broadcasts takes well under a second locally
+BROADCAST_BUDGET_SECONDS = 5.0
+
+
+class SimulatedClient:
+    """Engine.IO socket registered on a real server, read by a task like a websocket writer."""
+
+    def __init__(self, server: socketio.AsyncServer, index: int, reading: bool = True):
+        self.eio_sid = f"eio-{index}"
+        self.socket = AsyncSocket(server.eio, self.eio_sid)
+        self.socket.connected = True
+        server.eio.sockets[self.eio_sid] = self.socket
+        self.server = server
+        self.sid: str | None = None
+        self.events: list[str] = []
+        self.task = asyncio.create_task(self._read()) if reading else None
+
+    async def connect(self) -> str:
+        self.sid = await self.server.manager.connect(self.eio_sid, NAMESPACE)
+        return self.sid
+
+    async def _read(self) -> None:
+        while True:
+            for pkt in await self.socket.poll():
+                self.events.append(pkt.data)
+
+    def received(self, event_type: str) -> int:
+        marker = f'"{event_type}"'
+        return sum(1 for data in self.events if marker in data)
+
+    def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+
+
+async def _connect_clients(server, manager, count, slow=()):
+    clients = []
+    for index in range(count):
+        client = SimulatedClient(server, index, reading=index not in slow)
+        await manager.handle_connect(NAMESPACE, await client.connect())
+        clients.append(client)
+    # let the lifecycle broadcasts queued by handle_connect finish before measuring
+    await _wait_until(lambda: not manager._lifecycle_tasks)
+    return clients
+
+
+async def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_reaches_200_sockets():
+    server = socketio.AsyncServer(async_mode="asgi")
+    manager = WsManager(server, threading.RLock())
+    clients = await _connect_clients(server, manager, SOCKET_COUNT)
+    try:
+        encodes_before = manager.outbound_metrics()["encodes"]
+        payload = {"items": [{"id": idx, "text": "x" * 64} for idx in range(50)]}
+
+        start = time.perf_counter()
+        for _ in range(BROADCASTS):
+            await manager.broadcast(NAMESPACE, "bench_event", payload)
+        await _wait_until(
+            lambda: all(client.received("bench_event") == BROADCASTS for client in clients)
+        )
+        elapsed = time.perf_counter() - start
+
+        metrics = manager.outbound_metrics()
+        assert metrics["encodes"] - encodes_before == BROADCASTS
+        assert metrics["connections"] == SOCKET_COUNT
+        assert metrics["dropped"] == 0
+        assert elapsed < BROADCAST_BUDGET_SECONDS
+    finally:
+        for client in clients:
+            client.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_queue_is_bounded_for_droppable_events(monkeypatch):
+    monkeypatch.setattr(ws_manager_module, "OUTBOUND_QUEUE_LIMIT", 20)
+    server = socketio.AsyncServer(async_mode="asgi")
+    manager = WsManager(server, threading.RLock())
+    clients = await _connect_clients(server, manager, 10, slow={0})
+    slow, fast = clients[0], clients[1:]
+    try:
+        for idx in range(200):
+            await manager.broadcast(NAMESPACE, "tick_event", {"idx": idx}, droppable=True)
+            await asyncio.sleep(0)  # a real producer yields between events
+        await _wait_until(lambda: all(client.received("tick_event") == 200 for client in fast))
+
+        metrics = manager.outbound_metrics()
+        assert metrics["queue_depth_max"] <= 20
+        assert metrics["dropped"] > 0
+        # the slow socket holds at most the transport high water mark plus our queue
+        assert slow.socket.queue.qsize() <= ws_manager_module.OUTBOUND_TRANSPORT_HIGH_WATER + 1
+    finally:
+        for client in clients:
+            client.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_coalesces_pending_events():
+    server = socketio.AsyncServer(async_mode="asgi")
+    manager = WsManager(server, threading.RLock())
+    clients = await _connect_clients(server, manager, 1, slow={0})
+    slow = clients[0]
+    high_water = ws_manager_module.OUTBOUND_TRANSPORT_HIGH_WATER
+
+    for idx in range(high_water + 5):
+        await manager.emit_to(NAMESPACE, slow.sid, "filler_event", {"idx": idx})
+    coalesced_before = manager.outbound_metrics()["coalesced"]
+    for idx in range(10):
+        await manager.emit_to(
+            NAMESPACE, slow.sid, "progress_event", {"idx": idx}, coalesce_key="progress"
+        )
+    await asyncio.sleep(0.05)
+
+    assert manager.outbound_metrics()["coalesced"] - coalesced_before == 9
+
+    # once the client reads, only the newest coalesced event arrives, after the fillers
+    slow.task = asyncio.create_task(slow._read())
+    try:
+        await _wait_until(lambda: slow.received("progress_event") == 1)
+        await asyncio.sleep(0.05)
+        assert slow.received("progress_event") == 1
+        assert '"idx":9' in [data for data in slow.events if "progress_event" in data][0]
+        assert slow.received("filler_event") == high_water + 5
+    finally:
+        slow.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_is_disconnected_when_ordered_events_overflow(monkeypatch):
+    monkeypatch.setattr(ws_manager_module, "OUTBOUND_QUEUE_LIMIT", 10)
+    server = socketio.AsyncServer(async_mode="asgi")
+    server.disconnect = AsyncMock()
+    manager = WsManager(server, threading.RLock())
+    clients = await _connect_clients(server, manager, 1, slow={0})
+    slow = clients[0]
+
+    for idx in range(ws_manager_module.OUTBOUND_TRANSPORT_HIGH_WATER + 20):
+        await manager.emit_to(NAMESPACE, slow.sid, "state_event", {"idx": idx})
+    await asyncio.sleep(0.05)
+
+    server.disconnect.assert_awaited_once_with(slow.sid, namespace=NAMESPACE)
+    metrics = manager.outbound_metrics()
+    assert metrics["overflow_disconnects"] == 1
+    assert metrics["connections"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconnect_flush_batches_buffered_events_in_order():
+    server = socketio.AsyncServer(async_mode="asgi")
+    manager = WsManager(server, threading.RLock())
+    clients = await _connect_clients(server, manager, 1)
+    client = clients[0]
+    try:
+        await manager.handle_disconnect(NAMESPACE, client.sid)
+        for idx in range(5):
+            await manager.emit_to(NAMESPACE, client.sid, "queued_event", {"idx": idx})
+            await manager.emit_to(
+                NAMESPACE,
+                client.sid,
+                "state_push",
+                {"seq": idx, "snapshot": {"context": "ctx"}},
+            )
+        client.events.clear()
+
+        await manager.handle_connect(NAMESPACE, client.sid)
+        await _wait_until(lambda: client.received("state_push") == 1)
+
+        flushed = [data for data in client.events if "queued_event" in data or "state_push" in data]
+        assert [('"idx":%d' % idx) in flushed[idx] for idx in range(5)] == [True] * 5
+        assert '"seq":4' in flushed[5]
+        assert len(flushed) == 6
+    finally:
+        client.stop()
+
+
+@pytest.mark.asyncio
+async def test_changed_engineio_internals_fall_back_to_public_emit(monkeypatch):
+    server = socketio.AsyncServer(async_mode="asgi")
+    clients = []
+    manager = WsManager(server, threading.RLock())
+    try:
+        clients = await _connect_clients(server, manager, 2)
+        assert manager._use_outbound_queue()
+
+        # e.g. a python-socketio release that renamed the manager lookup
+        monkeypatch.setattr(server.manager, "eio_sid_from_sid", None)
+        manager._outbound_server = None
+        emit = AsyncMock()
+        monkeypatch.setattr(server, "emit", emit)
+
+        assert not manager._use_outbound_queue()
+        await manager.broadcast(NAMESPACE, "fallback_event", {"ok": True})
+
+        emitted = [call for call in emit.await_args_list if call.args[0] == "fallback_event"]
+        assert sorted(call.kwargs["to"] for call in emitted) == sorted(client.sid for client in clients)
+    finally:
+        for client in clients:
+            client.stop()
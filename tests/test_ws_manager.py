@@ -20,6 +20,8 @@ from helpers.ws_manager import (
     DIAGNOSTIC_EVENT,
     LIFECYCLE_CONNECT_EVENT,
     LIFECYCLE_DISCONNECT_EVENT,
+    STATE_PUSH_EVENT,
+    register_buffer_coalescing,
 )
 
 NAMESPACE = "/test"
@@ -396,6 +398,78 @@ async def test_flush_buffer_delivers_and_logs(monkeypatch):
     assert (NAMESPACE, "sid-1") not in manager.buffers
 
 
+def _state_push(context: str, seq: int) -> dict[str, Any]:
+    return {"runtime_epoch": "epoch", "seq": seq, "snapshot": {"context": context}}
+
+
+@pytest.mark.asyncio
+async def test_flush_buffer_keeps_latest_state_push_per_context():
+    socketio = FakeSocketIOServer()
+    manager = WsManager(socketio, threading.RLock())
+    await manager.handle_connect(NAMESPACE, "sid-1")
+    await manager.handle_disconnect(NAMESPACE, "sid-1")
+
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx-a", 1))
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx-b", 2))
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx-a", 3))
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx-a", 4))
+    assert len(manager.buffers[(NAMESPACE, "sid-1")]) == 2
+
+    socketio.emit.reset_mock()
+    await manager.handle_connect(NAMESPACE, "sid-1")
+
+    pushes = [
+        call.args[1]["data"]
+        for call in socketio.emit.await_args_list
+        if call.args[0] == STATE_PUSH_EVENT
+    ]
+    assert [(push["snapshot"]["context"], push["seq"]) for push in pushes] == [
+        ("ctx-b", 2),
+        ("ctx-a", 4),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flush_buffer_preserves_order_of_uncoalesced_events():
+    socketio = FakeSocketIOServer()
+    manager = WsManager(socketio, threading.RLock())
+    await manager.handle_connect(NAMESPACE, "sid-1")
+    await manager.handle_disconnect(NAMESPACE, "sid-1")
+
+    await manager.emit_to(NAMESPACE, "sid-1", "event_one", {"idx": 0})
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx", 1))
+    await manager.emit_to(NAMESPACE, "sid-1", "event_two", {"idx": 1})
+    await manager.emit_to(NAMESPACE, "sid-1", "progress", {"pct": 10}, coalesce_key="job")
+    await manager.emit_to(NAMESPACE, "sid-1", "event_one", {"idx": 2})
+    await manager.emit_to(NAMESPACE, "sid-1", STATE_PUSH_EVENT, _state_push("ctx", 2))
+    await manager.emit_to(NAMESPACE, "sid-1", "progress", {"pct": 90}, coalesce_key="job")
+    await manager.emit_to(NAMESPACE, "sid-1", "event_two", {"idx": 3})
+
+    socketio.emit.reset_mock()
+    await manager.handle_connect(NAMESPACE, "sid-1")
+
+    flushed = [
+        (call.args[0], call.args[1]["data"])
+        for call in socketio.emit.await_args_list
+        if call.kwargs.get("to") == "sid-1" and call.args[0] != LIFECYCLE_CONNECT_EVENT
+    ]
+    # uncoalesced events keep their relative order; superseded ones are gone and the
+    # surviving coalesced event sits where its newest version was emitted
+    assert flushed == [
+        ("event_one", {"idx": 0}),
+        ("event_two", {"idx": 1}),
+        ("event_one", {"idx": 2}),
+        (STATE_PUSH_EVENT, _state_push("ctx", 2)),
+        ("progress", {"pct": 90}),
+        ("event_two", {"idx": 3}),
+    ]
+
+
+def test_register_buffer_coalescing_validates_event_type():
+    with pytest.raises(ValueError):
+        register_buffer_coalescing("Not-Valid")
+
+
 @pytest.mark.asyncio
 async def test_known_sid_expires_after_buffer_ttl(monkeypatch):
     """After BUFFER_TTL, a disconnected sid is swept from _known_sids and emit_to raises."""
@@ -79,9 +79,9 @@ class VisionLoad(Tool):
             return image.data_url
         source = chat_media.infer_source(image.ref, image.display_name)
         category = chat_media.category_for_source(source)
-        saved = chat_media.save_image_base64(
+        saved = chat_media.save_image_bytes(
             context_id=context_id,
-            data=image.data,
+            payload=image.payload,
             mime_type=image.mime,
             category=category,
             source=source,
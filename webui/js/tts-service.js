@@ -236,6 +236,18 @@ class TtsService extends EventTarget {
 
     if (!payload) return;
 
+    if (payload.audioStream) {
+      // parts arrive while earlier ones play (e.g. one clip per sentence)
+      let first = true;
+      for await (const part of payload.audioStream) {
+        if (terminator && terminator()) return;
+        if (!first) await sleep(100);
+        first = false;
+        await this.playAudioBase64(part, payload.mimeType);
+      }
+      return;
+    }
+
     if (Array.isArray(payload.audioParts)) {
       for (const part of payload.audioParts) {
         if (terminator && terminator()) return;